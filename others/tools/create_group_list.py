@@ -1,13 +1,16 @@
 """
-Create group list and group index.
+Create packed group list.
 
-Copy output of this to "multipie/multipie_group_list.py".
+Write "qtdraw/multipie/multipie_group_list.json" (group index and tag are created from name at loading).
 """
 
-import numpy as np
+import json
 import re
+from pathlib import Path
 from multipie import Group
 
+from qtdraw.core.qtdraw_info import __top_dir__
+
 
 def replace_bar(s):
     return re.sub(r"\\bar\{(\d)\}", r"-\1", s).replace("{", "").replace("}", "")
@@ -38,31 +41,23 @@ def create_group_list():
             info = Group(i).info
             tag = f"#{info.tag}: {replace_bar(info.BNS)}"
             dic[c]["MSG"].append((i, tag))
-    dic = {c: {t: np.array(lst, dtype=object).T.tolist() for t, lst in v.items()} for c, v in dic.items()}
     return dic
 
 
 # ==================================================
-def create_group_list_index(group_list):
-    dic = {}
-    for tp in ["PG", "SG", "MPG", "MSG"]:
-        for c, v in group_list.items():
-            for no, i in enumerate(v[tp][1]):
-                gno, g = i.split(" ")[:2]
-                gno = gno[1:-1]
-                if tp in ["PG", "SG"]:
-                    dic[g] = (c, tp, no)
-                if tp == "SG":
-                    dic[int(gno)] = (c, tp, no)
-                dic[f"{tp}:{gno}"] = (c, tp, no)
-
-    return dic
+def write_group_list(group_list, filename):
+    types = ["PG", "SG", "MPG", "MSG"]
+    packed = {
+        "crystal": list(group_list.keys()),
+        "type": types,
+        "name": [[[name for _, name in v[tp]] for tp in types] for v in group_list.values()],
+    }
+    s = json.dumps(packed, ensure_ascii=False, separators=(",", ":"))
+    s = s.replace('"],["', '"],\n["').replace("]],[[", "]],\n[[")  # one line for each group type.
+    with open(filename, mode="w", encoding="utf-8") as f:
+        print(s, file=f)
 
 
 # ==================================================
 group_list = create_group_list()
-group_list_index = create_group_list_index(group_list)
-
-print("group_list =", group_list)
-print()
-print("group_list_index =", group_list_index)
+write_group_list(group_list, Path(__top_dir__) / "qtdraw" / "multipie" / "multipie_group_list.json")
@@ -7,8 +7,7 @@ This module provides about dialog for PyVistaWidget.
 from pathlib import Path
 import sys
 from numpy import __version__ as numpy_ver
-from sympy import __version__ as sympy_ver
-from matplotlib import __version__ as matplot_ver
+from importlib.metadata import version
 from PySide6 import __version__ as pyside6_ver
 import pyvista as pv
 from pyvistaqt import __version__ as pyvistaqt_ver
@@ -61,6 +60,8 @@ class AboutDialog(QDialog):
         indent = " " * 4
         vtk_ver = ".".join(map(str, pv.vtk_version_info))
         pyvista_ver = pv._version.__version__
+        sympy_ver = version("sympy")
+        matplot_ver = version("matplotlib")
         python_ver = sys.version.replace(" [", f"\n{indent+indent}[")
         multipie = "version" in self.pvw._status["multipie"].keys()
 
@@ -124,6 +125,8 @@ def get_version_info():
     indent = " " * 4
     vtk_ver = ".".join(map(str, pv.vtk_version_info))
     pyvista_ver = pv._version.__version__
+    sympy_ver = version("sympy")
+    matplot_ver = version("matplotlib")
     python_ver = sys.version
     cr = f"Versoin {__version__}, Copyright (C) {__date__} by {__author__}"
 
@@ -317,7 +317,6 @@ class PreferenceDialog(QDialog):
         size = self.preference["general"]["size"]
         self.parent().app.setStyleSheet("QWidget { font-family: " + f"{font}" + "; font-size: " + f"{size}" + "pt; }")
 
-        self.widget.refresh()
-        self.widget.redraw()
+        self.widget.apply_preference()
 
         self.parent()._update_panel()
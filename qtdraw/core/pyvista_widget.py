@@ -14,14 +14,17 @@ import numpy as np
 import copy
 from PySide6.QtWidgets import QMainWindow, QMenu, QSizePolicy
 from PySide6.QtGui import QCursor, QMouseEvent
-from PySide6.QtCore import QEvent, Qt, QCoreApplication, Signal, QSize, QObject, QModelIndex
+from PySide6.QtCore import QEvent, Qt, QCoreApplication, Signal, QSize, QObject, QModelIndex, QTimer
 import pyvista as pv
 from pyvistaqt import QtInteractor
+from vtkmodules import vtkRenderingCore
 
 from qtdraw.core.pyvista_widget_setting import (
     default_status,
     default_preference,
+    preference_stage,
     object_default,
+    COLUMN_NAME,
     COLUMN_NAME_CHECK,
     COLUMN_NAME_ACTOR,
     COLUMN_LABEL,
@@ -30,16 +33,17 @@ from qtdraw.core.pyvista_widget_setting import (
     COLUMN_CELL,
     COLUMN_POSITION,
     COLUMN_ISOSURFACE_FILE,
+    APPEARANCE_COLUMN,
+    CHOP,
 )
 from qtdraw.core.pyvista_widget_setting import widget_detail as detail
 from qtdraw.core.qtdraw_info import __version__, __date__, __author__
-from qtdraw.widget.mathjax import MathJaxSVG
+from qtdraw.widget.mathjax import shared_mathjax
 from qtdraw.widget.group_model import GroupModel
 from qtdraw.widget.tab_group_view import TabGroupView
 from qtdraw.widget.qt_event_util import get_qt_application
 from qtdraw.widget.logging_util import LogWidget
 from qtdraw.widget.color_palette import all_colors, custom_colormap, check_color
-from qtdraw.parser.read_material import read_draw
 from qtdraw.parser.xsf import extract_data_xsf
 from qtdraw.parser.converter import convert_version3
 from qtdraw.util.util import text_to_list, apply, read_dict, str_to_sympy, check_multipie
@@ -66,6 +70,7 @@ from qtdraw.util.basic_object import (
     create_ellipsoid,
     create_toroid,
     create_box,
+    create_outline,
     create_polygon,
     create_text3d,
     create_text2d,
@@ -74,8 +79,9 @@ from qtdraw.util.basic_object import (
     create_isosurface,
     create_orbital_data,
     create_stream_data,
+    vector_matrix,
+    rotation_from_x,
 )
-from qtdraw.multipie.multipie_data import MultiPieData
 
 
 # ==================================================
@@ -120,8 +126,12 @@ def convert_str_vector(vector, cell="[0,0,0]", transform=True, A=None):
     Returns:
         - (numpy.ndarray) -- transformed position.
     """
-    cell = str_to_sympy(cell).astype(int)
-    vector = str_to_sympy(vector, rational=False).astype(float)
+    try:  # plain numbers without sympy.
+        cell = np.asarray(ast.literal_eval(cell), dtype=int)
+        vector = np.asarray(ast.literal_eval(vector), dtype=float)
+    except (ValueError, SyntaxError, TypeError):
+        cell = str_to_sympy(cell).astype(int)
+        vector = str_to_sympy(vector, rational=False).astype(float)
 
     vectorT = vector + cell
     if transform:
@@ -297,7 +307,7 @@ class PyVistaWidget(QtInteractor):
                 self.ren_win.SetOffScreenRendering(1)  # rendering window off.
 
         # set mathjax converter.
-        self._mathjax = MathJaxSVG()
+        self._mathjax = shared_mathjax()
 
         # set data model.
         self.init_data_model()
@@ -311,14 +321,14 @@ class PyVistaWidget(QtInteractor):
         self.setMinimumSize(QSize(*detail["minimum_window_size"]))
         self.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
 
-        # set picking actor.
+        # set picking actor (hardware picker reads ID buffer, without testing every actor, VTK >= 9.2).
         if not self._off_screen:
-            self.enable_mesh_picking(
-                self.show_context_menu,
-                use_actor=True,
-                show=False,
-                show_message=False,
-            )
+            option = {"use_actor": True, "show": False, "show_message": False}
+            try:
+                picker = "hardware" if hasattr(vtkRenderingCore, "vtkHardwarePicker") else "cell"
+                self.enable_mesh_picking(self.show_context_menu, picker=picker, **option)
+            except (TypeError, ValueError):  # old pyvista without picker option, use its default cell picker.
+                self.enable_mesh_picking(self.show_context_menu, **option)
 
         # create data view group.
         self._tab_group_view = TabGroupView(self, self._data, mathjax=self._mathjax)
@@ -333,7 +343,7 @@ class PyVistaWidget(QtInteractor):
             model.dataModified.connect(self.plot_data)
             model.dataRemoved.connect(self.remove_data)
             model.checkChanged.connect(self.change_check_state)
-            self._tab_group_view.view[object_type].selectionChanged.connect(self.change_selection)
+        self._tab_group_view.selectionChanged.connect(self.change_selection)
 
         # create signal and connection for objects (row, data).
         self._plot_signal = {}
@@ -383,6 +393,7 @@ class PyVistaWidget(QtInteractor):
         self._status["plus"] = {}  #  for temporaly working purpose.
         self.set_additional_status()
         self._preference = copy.deepcopy(default_preference)
+        self._applied_preference = copy.deepcopy(default_preference)  # preference reflected in scene.
         self._label_counter = 0  # id for label actor.
         self._isosurface_data = {}
         self._backup = None
@@ -1594,6 +1605,8 @@ class PyVistaWidget(QtInteractor):
                 all_data = convert_version3(all_data, ver, widget)  # for old version.
                 widget.close()
         elif file.suffix in detail["ext_material"]:
+            from qtdraw.parser.read_material import read_draw
+
             all_data = read_draw(f, self)
         else:
             raise Exception(f"cannot read {file.suffix} file.")
@@ -1636,10 +1649,12 @@ class PyVistaWidget(QtInteractor):
 
         data = {}
         for object_type, model in self._data.items():
-            lst = np.array(model.tolist(), dtype=object)
+            lst = model.toarray()
             if len(lst) > 0:
                 if home_cell:
                     lst = lst[np.char.strip(lst[:, COLUMN_CELL].astype(str)) == center_cell]
+                else:
+                    lst = lst.copy()
                 lst[:, COLUMN_NAME_ACTOR] = ""
                 lst[:, COLUMN_LABEL_ACTOR] = ""
                 data[object_type] = lst.tolist()
@@ -1783,9 +1798,12 @@ class PyVistaWidget(QtInteractor):
                 for k, v in value.items():
                     self._preference[key][k] = v
 
-        if status is not None or preference is not None:
+        if status is not None:
             self.refresh()
             self.redraw()
+            self._applied_preference = copy.deepcopy(self._preference)
+        elif preference is not None:
+            self.apply_preference()
 
     # ==================================================
     def update_status(self, key, value):
@@ -1814,6 +1832,42 @@ class PyVistaWidget(QtInteractor):
         """
         self.set_property(preference={category: {key: value}})
 
+    # ==================================================
+    def apply_preference(self):
+        """
+        Apply modified preference to scene.
+
+        Note:
+            - only stages affected by modified preferences are updated (see preference_stage).
+
+        :meta private:
+        """
+        stage = set()
+        for category, value in self._preference.items():
+            applied = self._applied_preference.get(category, {})
+            for key, v in value.items():
+                if key not in applied.keys() or applied[key] != v:
+                    stage.update(preference_stage.get(category, {}).get(key, ("all",)))
+        self._applied_preference = copy.deepcopy(self._preference)
+
+        if "all" in stage:
+            self.refresh()
+            self.redraw()
+            return
+
+        if "light" in stage:
+            self.set_light()
+        if "material" in stage:
+            self.set_material()
+        if "cell" in stage:
+            self.set_cell_property()
+        if "axis" in stage:
+            self.set_axis()
+        if "label" in stage:
+            self.redraw_label()
+        if stage:
+            self.render()
+
     # ==================================================
     def refresh(self):
         """
@@ -2034,10 +2088,14 @@ class PyVistaWidget(QtInteractor):
         if cell is not None:
             self._status["cell"].update(cell)
 
+        A0 = self.A_matrix
         self.set_additional_status()
 
         self.set_cell()
-        self.redraw()
+        if detail["lattice_transform"]:
+            self.transform_lattice(A0)
+        else:
+            self.redraw()
 
     # ==================================================
     def set_clip(self, mode=None):
@@ -2071,7 +2129,7 @@ class PyVistaWidget(QtInteractor):
         upper = self._status["upper"]
         for object_type, model in self._data.items():
             if object_type != "text2d":
-                value = np.array(model.tolist(), dtype=object)
+                value = model.toarray()
                 if len(value) > 0:
                     point = "[" + ",".join(value[:, COLUMN_POSITION]) + "]"
                     cell = "[" + ",".join(value[:, COLUMN_CELL]) + "]"
@@ -2126,7 +2184,7 @@ class PyVistaWidget(QtInteractor):
         """
         for object_type, model in self._data.items():
             if object_type != "text2d":
-                value = np.array(model.tolist(), dtype=object)
+                value = model.toarray()
                 if len(value) > 0:
                     name_actor = value[:, COLUMN_NAME_ACTOR]
                     name_actor_check = value[:, COLUMN_NAME_CHECK].astype(bool)
@@ -2173,6 +2231,13 @@ class PyVistaWidget(QtInteractor):
             - if lower/upper is None, default is used.
             - set cell.
         """
+        self._set_range_status(lower, upper)
+
+        self.set_cell()
+        self.set_repeat()
+
+    # ==================================================
+    def _set_range_status(self, lower=None, upper=None):
         if lower is None:
             lower = self._status["lower"]
         else:
@@ -2194,9 +2259,6 @@ class PyVistaWidget(QtInteractor):
 
         self.set_additional_status()
 
-        self.set_cell()
-        self.set_repeat()
-
     # ==================================================
     def set_view(self, view=None):
         """
@@ -2384,9 +2446,12 @@ class PyVistaWidget(QtInteractor):
 
         :meta private:
         """
-        self._selected_actor = {}  # actor selection, {actor_name: property}.
+        self._selected_actor = set()  # selected actor names, highlighted by one overlay actor.
+        self._selection_pending = False
 
         self._actor_object_type = {}  # from actor_name to (object_type).
+        self._stale_actor = set()  # hidden actors whose data have been modified.
+        self._fractional_cache = {}  # parsed crystal coordinates, {object_type: (snapshot, position, direction)}.
         self._data = {}
         for object_type, value in object_default.items():
             self._data[object_type] = GroupModel(self, object_type, value)
@@ -2501,6 +2566,67 @@ class PyVistaWidget(QtInteractor):
         if preference["pbr"]:
             self.add_light(pv.Light(color=color, light_type="headlight", intensity=1.0))
 
+    # ==================================================
+    def set_material(self):
+        """
+        Set material (PBR) property of plotted actors.
+
+        :meta private:
+        """
+        preference = self._preference["light"]
+        if preference["pbr"]:
+            interpolation = "pbr"
+        elif detail["smooth_shading"]:
+            interpolation = "phong"
+        else:
+            interpolation = "flat"
+
+        for actor_name in self._actor_object_type.keys():
+            actor = self.actors.get(actor_name)
+            if isinstance(actor, pv.Actor):
+                actor.prop.interpolation = interpolation
+                actor.prop.metallic = preference["metallic"]
+                actor.prop.roughness = preference["roughness"]
+
+    # ==================================================
+    def set_cell_property(self):
+        """
+        Set property of unit cell.
+
+        :meta private:
+        """
+        actor = self.actors.get("unit_cell")
+        if actor is not None:
+            preference = self._preference["cell"]
+            actor.prop.line_width = preference["line_width"]
+            actor.prop.color = all_colors[preference["color"]][0]  # hex
+            actor.prop.opacity = preference["opacity"]
+
+    # ==================================================
+    def redraw_label(self):
+        """
+        Redraw labels of all objects (meshes are kept).
+
+        :meta private:
+        """
+        for object_type, model in self._data.items():
+            if object_type in ["caption", "text2d"]:
+                continue
+            tag = model.header
+            for index in model.data_index():
+                row_info = dict(zip(tag, model.get_row_data(index)))
+                label_actor = row_info["label_actor"]
+                if label_actor not in self.actors.keys():
+                    continue
+                if not (row_info["name_check"] and row_info["label_check"]):
+                    self._stale_actor.add(label_actor)  # redraw when shown.
+                    continue
+                position = row_info["position"]
+                cell = row_info["cell"]
+                positionT = convert_str_vector(vector=position, cell=cell, A=self.A_matrix)
+                self.plot_label(object_type, index, row_info, positionT)
+                self.clip_actor(position, cell, "", label_actor)
+
     # ==================================================
     def set_latex(self):
         """
@@ -2628,6 +2754,44 @@ class PyVistaWidget(QtInteractor):
         self.add_data(data)
         self.set_clip()
 
+    # ==================================================
+    def expand_supercell(self, lower=None, upper=None):
+        """
+        Expand data in home cell to supercell as non-repeat data.
+
+        Args:
+            lower (list or str, optional): lower bound, [float].
+            upper (list or str, optional): upper bound, [float].
+
+        Note:
+            - if lower/upper is None, default is used.
+            - same as set_range, set_repeat(True), set_nonrepeat(), and set_repeat(False), but data is rebuilt only once.
+        """
+        self._set_range_status(lower, upper)
+        self._status["repeat"] = False
+        self.set_cell()
+
+        ilower, dims = self._status["plus"]["ilower"], self._status["plus"]["dims"]
+        grid = np.stack(np.meshgrid(*[np.arange(i, i + n) for i, n in zip(ilower, dims)], indexing="ij"), axis=-1).reshape(-1, 3)
+
+        data = self.get_data_dict(home_cell=True)
+        for object_type, model in data.items():
+            n = len(model)
+            if object_type not in ["text2d", "caption"] and n > 0:
+                model = np.array(model, dtype=object)
+                pos = np.array([convert_str_vector(i, transform=False) for i in model[:, COLUMN_POSITION]], dtype=float)
+                pos = (grid[:, None, :] + pos[None, :, :]).reshape(-1, 3)
+                model = np.tile(model, (len(grid), 1))
+                model[:, COLUMN_POSITION] = np.array(list(map(str, pos.tolist())), dtype=object)
+                model[:, COLUMN_CELL] = "[0,0,0]"
+                data[object_type] = model.tolist()
+
+        self.screen_off()
+        self.clear_data()
+        self.add_data(data)
+        self.set_clip()
+        self.screen_on()
+
     # ==================================================
     def set_nonrepeat(self):
         """
@@ -2677,10 +2841,9 @@ class PyVistaWidget(QtInteractor):
         if column == COLUMN_NAME_ACTOR:
             self._actor_object_type[actor_name] = object_type
 
-        # set saved property.
-        if actor_name in self._selected_actor.keys():
-            actor = self.actors[actor_name]
-            self._selected_actor[actor_name] = (actor.prop.show_edges, actor.prop.edge_color)
+        # re-plotted actor in selection.
+        if actor_name in self._selected_actor:
+            self.schedule_selection()
 
     # ==================================================
     def delete_actor(self, actor_name):
@@ -2694,6 +2857,10 @@ class PyVistaWidget(QtInteractor):
         """
         if actor_name != "":
             self.remove_actor(actor_name)
+            self._stale_actor.discard(actor_name)
+            if actor_name in self._selected_actor:
+                self._selected_actor.discard(actor_name)
+                self.schedule_selection()
             if actor_name in self._actor_object_type.keys():
                 del self._actor_object_type[actor_name]
 
@@ -2714,7 +2881,10 @@ class PyVistaWidget(QtInteractor):
             state = index.data(Qt.CheckStateRole)
             if state == UNCHECK:
                 self._data[object_type].set_check(index, COLUMN_LABEL, UNCHECK)
-        self.plot_data(object_type, row_data, index)
+        if not self.update_visibility(object_type, row_data, index):
+            self.plot_data(object_type, row_data, index)
+        if row_data[COLUMN_NAME_ACTOR] in self._selected_actor:
+            self.schedule_selection()
 
     # ==================================================
     # internal use (gui interface).
@@ -2765,7 +2935,6 @@ class PyVistaWidget(QtInteractor):
 
         :meta private:
         """
-        self._mathjax.close()
         self._tab_group_view.close()
 
         # restore std err.
@@ -2812,9 +2981,13 @@ class PyVistaWidget(QtInteractor):
 
         Note:
             - connect to open_selected, hide_selected, remove_selected signals are required.
+            - no menu for actor without data (label, spotlight, etc.).
 
         :meta private:
         """
+        if actor is None or not self.find_index(actor)[1].isValid():
+            return
+
         self.select_actor(actor.name)
 
         menu = QMenu(self.window())
@@ -2851,7 +3024,7 @@ class PyVistaWidget(QtInteractor):
         object_type, index = self.find_index(actor)
         self.open_tab_group_view()
         self._tab_group_view.select_tab(object_type)
-        self._tab_group_view.view[object_type].select_row(index)
+        self._tab_group_view.get_view(object_type).select_row(index)
 
     # ==================================================
     def hide_action(self, actor):
@@ -2891,20 +3064,9 @@ class PyVistaWidget(QtInteractor):
 
         :meta private:
         """
-        # already selected.
-        if actor_name in self._selected_actor.keys():
-            return
-
-        actor = self.actors[actor_name]
-
-        # save actor's diffuse color setting.
-        prop = (actor.prop.show_edges, actor.prop.edge_color)
-        self._selected_actor[actor_name] = prop
-
-        # set selected.
-        color = all_colors[detail["spotlight_color"]][0]  # hex
-        actor.prop.show_edges = True
-        actor.prop.edge_color = color
+        if actor_name not in self._selected_actor:
+            self._selected_actor.add(actor_name)
+            self.update_selection()
 
     # ==================================================
     def deselect_actor(self, actor_name):
@@ -2916,12 +3078,9 @@ class PyVistaWidget(QtInteractor):
 
         :meta private:
         """
-        if actor_name in self.actors.keys() and actor_name in self._selected_actor.keys():
-            actor = self.actors[actor_name]
-            prop = self._selected_actor[actor_name]
-            actor.prop.show_edges = prop[0]
-            actor.prop.edge_color = prop[1]
-            del self._selected_actor[actor_name]
+        if actor_name in self._selected_actor:
+            self._selected_actor.discard(actor_name)
+            self.update_selection()
 
     # ==================================================
     def deselect_actor_all(self):
@@ -2930,12 +3089,9 @@ class PyVistaWidget(QtInteractor):
 
         :meta private:
         """
-        for actor_name, prop in self._selected_actor.items():
-            if actor_name in self.actors.keys():
-                actor = self.actors[actor_name]
-                actor.prop.show_edges = prop[0]
-                actor.prop.edge_color = prop[1]
-        self._selected_actor = {}
+        if self._selected_actor:
+            self._selected_actor = set()
+            self.update_selection()
 
     # ==================================================
     def change_selection(self, object_type, deselect, select):
@@ -2953,18 +3109,62 @@ class PyVistaWidget(QtInteractor):
         if object_type in ["caption", "text2d"]:
             return
 
-        # deselected.
-        if deselect:
-            for row in deselect:
-                actor_name = row[COLUMN_NAME_ACTOR]
-                self.deselect_actor(actor_name)
+        selected = self._selected_actor - {row[COLUMN_NAME_ACTOR] for row in deselect}
+        selected |= {row[COLUMN_NAME_ACTOR] for row in select if row[COLUMN_NAME_ACTOR] != ""}
+        if selected != self._selected_actor:
+            self._selected_actor = selected
+            self.update_selection()
 
-        # selected.
-        if select:
-            for row in select:
-                actor_name = row[COLUMN_NAME_ACTOR]
-                if actor_name != "":
-                    self.select_actor(actor_name)
+    # ==================================================
+    def schedule_selection(self):
+        """
+        Update spotlight after pending events (for re-plotted or hidden actors).
+
+        :meta private:
+        """
+        if not self._selection_pending:
+            self._selection_pending = True
+            QTimer.singleShot(0, self.update_selection)
+
+    # ==================================================
+    def update_selection(self, render=True):
+        """
+        Update spotlight, outline of all visible selected actors as one overlay actor.
+
+        Args:
+            render (bool, optional): render at once ?
+
+        Note:
+            - bounds are obtained from actors directly, since access to mapper or property of many actors is slow.
+
+        :meta private:
+        """
+        self._selection_pending = False
+        actors = self.actors
+        bounds = []
+        for actor_name in self._selected_actor:
+            actor = actors.get(actor_name)
+            if actor is None or not hasattr(actor, "GetBounds") or not actor.GetVisibility():
+                continue
+            b = actor.GetBounds()
+            if b[0] <= b[1]:
+                bounds.append(b)
+
+        if not bounds:
+            self.remove_actor("spotlight", render=render)
+            return
+
+        self.add_mesh(
+            create_outline(bounds),
+            color=all_colors[detail["spotlight_color"]][0],  # hex
+            lighting=False,
+            name="spotlight",
+            pickable=False,
+            reset_camera=False,
+            render=False,
+        )
+        if render:
+            self.render()
 
     # ==================================================
     def find_index(self, actor):
@@ -2976,17 +3176,18 @@ class PyVistaWidget(QtInteractor):
             label (bool, optional): label actor ?
 
         Returns:
-            - (str) -- object type.
-            - (QModelIndex) -- index.
+            - (str) -- object type, None for actor without data.
+            - (QModelIndex) -- index, invalid index for actor without data.
 
         :meta private:
         """
-        actor_name = actor.name
-        object_type = self._actor_object_type[actor_name]
-        index = self._data[object_type].find_item(actor_name, COLUMN_NAME_ACTOR)
-        assert len(index) < 3
+        actor_name = getattr(actor, "name", None)
+        object_type = self._actor_object_type.get(actor_name)
+        if object_type is None:  # label, spotlight, etc.
+            return None, QModelIndex()
+
         # when parent=child[0], take child one.
-        index = index[-1].index().siblingAtColumn(0)
+        index = self._data[object_type].find_actor(actor_name)
         return object_type, index
 
     # ==================================================
@@ -3051,14 +3252,214 @@ class PyVistaWidget(QtInteractor):
         tag = self._data[object_type].header
         no_label = object_type in ["caption", "text2d"]
         row_info = dict(zip(tag, row_data))
+        if self.update_property(object_type, tag[index.column()], row_info):
+            return
+
         name_check, label_check = self.check_hide(row_info, no_label)
         position = row_info["position"]
         cell = row_info["cell"]
         positionT = convert_str_vector(vector=position, cell=cell, A=self.A_matrix)
         if name_check:
+            self._stale_actor.discard(row_info["name_actor"])
             self._plot_signal[object_type].plot.emit(index, row_info, positionT)
-        if label_check and not no_label:
-            self.plot_label(object_type, index, row_info, positionT)
+        else:
+            self._stale_actor.add(row_info["name_actor"])
+        if not no_label:
+            if label_check:
+                self._stale_actor.discard(row_info["label_actor"])
+                self.plot_label(object_type, index, row_info, positionT)
+            else:
+                self._stale_actor.add(row_info["label_actor"])
+
+    # ==================================================
+    def update_property(self, object_type, column, row_info):
+        """
+        Update appearance of plotted actor in place (without rebuilding mesh).
+
+        Args:
+            object_type (str): object type.
+            column (str): modified column.
+            row_info (dict): row data, {column: value}.
+
+        Returns:
+            - (bool) -- updated ? (False if mesh should be rebuilt).
+
+        Note:
+            - color given by colormap or twotone bond requires scalars of mesh, so that mesh is rebuilt.
+
+        :meta private:
+        """
+        prop_name = APPEARANCE_COLUMN.get(column)
+        if prop_name is None or object_type in ["caption", "text2d"] or not row_info["name_check"]:
+            return False
+
+        actor = self.actors.get(row_info["name_actor"])
+        if actor is None or actor.mapper is None:
+            return False
+
+        value = row_info[column]
+        if prop_name == "opacity":
+            actor.prop.opacity = float(value)
+            return True
+
+        if not check_color(value) or actor.mapper.GetScalarVisibility():
+            return False
+        if object_type == "bond" and row_info["color"] != row_info["color2"]:
+            return False
+
+        color = all_colors[value][0]  # hex
+        if prop_name == "color":
+            actor.prop.color = color
+        else:
+            actor.prop.edge_color = color
+
+        return True
+
+    # ==================================================
+    def update_visibility(self, object_type, row_data, index):
+        """
+        Update visibility of plotted actors in place (without rebuilding mesh).
+
+        Args:
+            object_type (str): object type.
+            row_data (list): row data.
+            index (QModelIndex): index.
+
+        Returns:
+            - (bool) -- updated ? (False if actor should be plotted).
+
+        :meta private:
+        """
+        if index.column() not in [COLUMN_NAME, COLUMN_LABEL]:
+            return False
+
+        tag = self._data[object_type].header
+        no_label = object_type in ["caption", "text2d"]
+        row_info = dict(zip(tag, row_data))
+        name_check, label_check = self.check_hide(row_info, no_label)
+        label_check = label_check and not no_label
+
+        name_actor = row_info["name_actor"]
+        label_actor = row_info["label_actor"] if label_check else ""
+        for actor_name, check in [(name_actor, name_check), (label_actor, label_check)]:
+            if check and (actor_name not in self.actors.keys() or actor_name in self._stale_actor):
+                return False
+
+        if name_check:
+            self.actors[name_actor].SetVisibility(True)
+        if label_check:
+            self.actors[label_actor].SetVisibility(True)
+        if name_check and not no_label:
+            self.clip_actor(row_info["position"], row_info["cell"], name_actor, label_actor if label_check else None)
+
+        return True
+
+    # ==================================================
+    def transform_lattice(self, A0):
+        """
+        Transform plotted objects for change of lattice (without rebuilding meshes if possible).
+
+        Args:
+            A0 (numpy.ndarray): A matrix before change (4x4).
+
+        Note:
+            - objects depending on lattice only through position are translated by user matrix.
+            - vector and bond in crystal coordinate are re-oriented and scaled by user matrix.
+            - other objects depending on lattice (text3d, caption, polygon, etc.) are redrawn.
+
+        :meta private:
+        """
+        A0 = A0[0:3, 0:3]
+        A1 = self.A_matrix[0:3, 0:3]
+        if np.allclose(A0, A1):
+            return
+
+        rigid_type = ["site", "orbital", "stream", "isosurface"]
+        for object_type, model in self._data.items():
+            if object_type == "text2d":
+                continue
+            value = model.toarray()
+            if len(value) < 1:
+                continue
+
+            tag = model.header
+            position, direction = self.fractional_data(object_type, value)
+            p0 = position @ A0.T
+            p1 = position @ A1.T
+            d0 = direction @ A0.T
+            d1 = direction @ A1.T
+            n0 = np.linalg.norm(d0, axis=1)
+            n1 = np.linalg.norm(d1, axis=1)
+
+            # re-orientation, R(d1).diag(|d1|/|d0|,1,1).R(d0)^T.
+            reorient = (n0 > CHOP) & (n1 > CHOP)
+            m = np.tile(np.eye(3), (len(value), 1, 1))
+            if reorient.any():
+                r0 = rotation_from_x(d0[reorient])
+                r1 = rotation_from_x(d1[reorient])
+                r1[:, :, 0] *= (n1[reorient] / n0[reorient])[:, None]
+                m[reorient] = np.einsum("nij,nkj->nik", r1, r0)
+
+            for no, index in enumerate(model.data_index()):
+                row_info = dict(zip(tag, value[no]))
+                actor = self.actors.get(row_info["name_actor"])
+                if actor is None:
+                    continue
+
+                if object_type in rigid_type or row_info.get("cartesian_check", False):
+                    w = np.eye(4)
+                    w[0:3, 3] = p1[no] - p0[no]
+                elif object_type == "bond" and reorient[no]:
+                    w = np.eye(4)
+                    w[0:3, 0:3] = m[no]
+                    w[0:3, 3] = p1[no] - m[no] @ p0[no]
+                elif object_type == "vector" and reorient[no]:
+                    self.set_user_matrix(actor, p1[no], vector_matrix(d1[no], float(row_info["length"])))
+                    continue
+                else:
+                    self.plot_data(object_type, value[no].tolist(), index)
+                    continue
+
+                actor.user_matrix = w @ actor.user_matrix
+
+        self.redraw_label()
+        if self._selected_actor:
+            self.update_selection(render=False)
+        self.render()
+
+    # ==================================================
+    def fractional_data(self, object_type, value):
+        """
+        Position and direction in crystal coordinate.
+
+        Args:
+            object_type (str): object type.
+            value (numpy.ndarray): data snapshot of the model.
+
+        Returns:
+            - (numpy.ndarray) -- position+cell, (n, 3).
+            - (numpy.ndarray) -- direction (zero for other than vector and bond in crystal coordinate), (n, 3).
+
+        Note:
+            - parsed data are cached until data of the model is changed.
+
+        :meta private:
+        """
+        cache = self._fractional_cache.get(object_type)
+        if cache is not None and cache[0] is value:
+            return cache[1], cache[2]
+
+        tag = self._data[object_type].header
+        position = np.zeros((len(value), 3))
+        direction = np.zeros((len(value), 3))
+        for no, row_data in enumerate(value):
+            row_info = dict(zip(tag, row_data))
+            position[no] = convert_str_vector(vector=row_info["position"], cell=row_info["cell"], transform=False)
+            if object_type in ["vector", "bond"] and not row_info["cartesian_check"]:
+                direction[no] = convert_str_vector(vector=row_info["direction"], transform=False)
+
+        self._fractional_cache[object_type] = (value, position, direction)
+        return position, direction
 
     # ==================================================
     def redraw(self):
@@ -3071,7 +3472,7 @@ class PyVistaWidget(QtInteractor):
             model.emit_update_all()
 
     # ==================================================
-    def common_option(self, actor, positionT, obj):
+    def common_option(self, actor, positionT, obj, shared=False):
         """
         Create common option to plot.
 
@@ -3079,6 +3480,7 @@ class PyVistaWidget(QtInteractor):
             actor (str): actor name.
             positionT (numpy.ndarray): position (transformed).
             obj (vtk.PolyData): object to plot.
+            shared (bool, optional): obj is shared among actors ? (translation is given by user matrix).
 
         Returns:
             - (dict) -- common option.
@@ -3088,8 +3490,11 @@ class PyVistaWidget(QtInteractor):
         if actor == "":
             actor = None
 
-        g = obj.copy()
-        g = g.translate(positionT, inplace=True)
+        if shared:
+            g = obj
+        else:
+            g = obj.copy()
+            g = g.translate(positionT, inplace=True)
 
         option = {
             "mesh": g,
@@ -3103,6 +3508,25 @@ class PyVistaWidget(QtInteractor):
 
         return option
 
+    # ==================================================
+    @staticmethod
+    def set_user_matrix(actor, positionT, matrix=None):
+        """
+        Set user matrix of actor for shared object.
+
+        Args:
+            actor (pyvista.Actor): actor.
+            positionT (numpy.ndarray): position (transformed).
+            matrix (numpy.ndarray, optional): 3x3 linear transformation, None (identity).
+
+        :meta private:
+        """
+        m = np.eye(4)
+        if matrix is not None:
+            m[0:3, 0:3] = matrix
+        m[0:3, 3] = positionT
+        actor.user_matrix = m
+
     # ==================================================
     def label_option(self, positionT, label, margin):
         """
@@ -3189,13 +3613,14 @@ class PyVistaWidget(QtInteractor):
         color = all_colors[data["color"]][0]  # hex
         opacity = float(data["opacity"])
 
-        obj = create_sphere(radius=size)
+        obj = create_sphere(radius=size, shared=True)
         option_add = {"color": color, "opacity": opacity}
 
-        option = self.common_option(actor=actor, positionT=positionT, obj=obj)
+        option = self.common_option(actor=actor, positionT=positionT, obj=obj, shared=True)
         option = option | option_add
 
         actor = self.add_mesh(**option)
+        self.set_user_matrix(actor, positionT)
         self.set_actor("site", index, actor.name)
         self.clip_actor(data["position"], data["cell"], actor.name, data["label_actor"])
 
@@ -3262,21 +3687,26 @@ class PyVistaWidget(QtInteractor):
 
         directionT = convert_str_vector(vector=direction, transform=transform, A=self.A_matrix)
 
+        # arrow along x is shared, and it is rotated and scaled by user matrix.
+        shared = np.linalg.norm(directionT) > CHOP
         obj = create_vector(
-            direction=directionT,
-            length=length,
+            direction=[1.0, 0.0, 0.0] if shared else directionT,
+            length=1.0 if shared else length,
             width=width,
             offset=offset,
             shaft_radius=shaft_radius,
             tip_radius=tip_radius,
             tip_length=tip_length,
+            shared=shared,
         )
         option_add = {"color": color, "opacity": opacity}
 
-        option = self.common_option(actor=actor, positionT=positionT, obj=obj)
+        option = self.common_option(actor=actor, positionT=positionT, obj=obj, shared=shared)
         option = option | option_add
 
         actor = self.add_mesh(**option)
+        if shared:
+            self.set_user_matrix(actor, positionT, vector_matrix(directionT, length))
         self.set_actor("vector", index, actor.name)
         self.clip_actor(data["position"], data["cell"], actor.name, data["label_actor"])
 
@@ -3300,7 +3730,7 @@ class PyVistaWidget(QtInteractor):
         color = data["color"]
         opacity = float(data["opacity"])
 
-        obj = create_orbital(shape=shape, surface=surface, size=size, theta_phi_range=theta_phi_range)
+        obj = create_orbital(shape=shape, surface=surface, size=size, theta_phi_range=theta_phi_range, shared=True)
         if check_color(color):
             option_add = {"color": all_colors[color][0], "opacity": opacity}
         else:
@@ -3321,10 +3751,11 @@ class PyVistaWidget(QtInteractor):
                     "show_scalar_bar": False,
                 }
 
-        option = self.common_option(actor=actor, positionT=positionT, obj=obj)
+        option = self.common_option(actor=actor, positionT=positionT, obj=obj, shared=True)
         option = option | option_add
 
         actor = self.add_mesh(**option)
+        self.set_user_matrix(actor, positionT)
         self.set_actor("orbital", index, actor.name)
         self.clip_actor(data["position"], data["cell"], actor.name, data["label_actor"])
 
@@ -4237,6 +4668,8 @@ class PyVistaWidget(QtInteractor):
         if not check_multipie():
             raise Exception("MultiPie is not installed.")
 
+        from qtdraw.multipie.multipie_data import MultiPieData
+
         self._mp_data = MultiPieData(self)
         self._mp_data.set_status(status, group)
 
@@ -4425,7 +4858,7 @@ class PyVistaWidget(QtInteractor):
         self._mp_data.add_vector_samb(lc, length, width, color, opacity)
 
     # ==================================================
-    def mp_add_vector_samb_modulation(self, modulation_range, length=None, width=None, color=None, opacity=None):
+    def mp_add_vector_samb_modulation(self, modulation_range, length=None, width=None, color=None, opacity=None, animate=False):
         """
         MultiPie: Add vector SAMB with modulation.
 
@@ -4435,8 +4868,9 @@ class PyVistaWidget(QtInteractor):
             width (float, optional): relative width.
             color (str, optional): color.
             opacity (float, optional): opacity.
+            animate (bool, optional): animate in time, k.r => k.r-wt ?
         """
-        self._mp_data.add_vector_samb_modulation(modulation_range, length, width, color, opacity)
+        self._mp_data.add_vector_samb_modulation(modulation_range, length, width, color, opacity, animate=animate)
 
     # ==================================================
     def mp_orbital_samb_list(self, site_bond, type="Q", rank=0):
@@ -4470,7 +4904,7 @@ class PyVistaWidget(QtInteractor):
         self._mp_data.add_orbital_samb(lc, size, color, opacity)
 
     # ==================================================
-    def mp_add_orbital_samb_modulation(self, modulation_range, size=None, color=None, opacity=None):
+    def mp_add_orbital_samb_modulation(self, modulation_range, size=None, color=None, opacity=None, animate=False):
         """
         MultiPie: Add orbital SAMB with modulation.
 
@@ -4479,5 +4913,16 @@ class PyVistaWidget(QtInteractor):
             size (float, optional): relative size.
             color (str, optional): color.
             opacity (float, optional): opacity.
+            animate (bool, optional): animate in time, k.r => k.r-wt ?
+        """
+        self._mp_data.add_orbital_samb_modulation(modulation_range, size, color, opacity, animate=animate)
+
+    # ==================================================
+    def mp_stop_animation(self):
+        """
+        MultiPie: Stop animation of SAMB with modulation.
         """
-        self._mp_data.add_orbital_samb_modulation(modulation_range, size, color, opacity)
+        if self._mp_data is None:
+            return
+
+        self._mp_data.stop_animation()
@@ -68,6 +68,30 @@ default_preference = {
     },
 }
 
+# stages updated by change of each preference, {category: {key: (stage)}}, unknown key => full redraw.
+#   stage: "light", "material" (PBR property of actors), "label", "cell", "axis".
+preference_stage = {
+    "general": {"style": (), "font": (), "size": (), "color_scheme": ()},
+    "light": {
+        "type": ("light",),
+        "intensity": ("light",),
+        "pbr": ("light", "material"),
+        "metallic": ("material",),
+        "roughness": ("material",),
+        "color": ("light",),
+    },
+    "label": {
+        "font": ("label",),
+        "size": ("label",),
+        "bold": ("label",),
+        "italic": ("label",),
+        "color": ("label",),
+        "default_check": (),
+    },
+    "cell": {"line_width": ("cell",), "color": ("cell",), "opacity": ("cell",)},
+    "axis": {"size": ("axis",), "bold": ("axis",), "italic": ("axis",), "label": ("axis",)},
+}
+
 # ==================================================
 #
 # widget detail setting.
@@ -86,6 +110,7 @@ widget_detail = {
     "data_edit_key": "e",
     "prevent_key": ["b", "C", "f", "i", "p", "q", "r", "v", "s", "w"],
     "smooth_shading": True,
+    "lattice_transform": True,  # re-transform plotted objects by user matrix at lattice change (False: redraw all).
     # general.
     "extension": ".qtdw",
     "ext_material": [".vesta", ".cif", ".xsf"],
@@ -154,6 +179,15 @@ COLUMN_POSITION = 7
 COLUMN_CELL = 8
 COLUMN_ISOSURFACE_FILE = 9
 
+# columns changing actor property only (no rebuild of mesh), {column: property}.
+APPEARANCE_COLUMN = {
+    "color": "color",
+    "color2": "color",
+    "opacity": "opacity",
+    "edge_color": "edge_color",
+    "grid_color": "edge_color",
+}
+
 # ==================================================
 #
 # each object: { name : (default value, type, options) }.
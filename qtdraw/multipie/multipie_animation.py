@@ -0,0 +1,239 @@
+"""
+MultiPie animation.
+
+This module provides animation of modulated SAMB, X(t) = X_c cos(wt) + X_s sin(wt).
+Amplitudes are computed once, and each frame updates existing actors in place (no actor is rebuilt).
+
+- vector: user matrix (orientation and length) of each arrow actor.
+- orbital: point coordinates and "surface" scalars of each orbital actor.
+"""
+
+import time
+import numpy as np
+from PySide6.QtCore import QObject, QTimer
+from vtkmodules.vtkCommonMath import vtkMatrix4x4
+
+from qtdraw.core.pyvista_widget_setting import COLUMN_NAME, COLUMN_NAME_ACTOR
+from qtdraw.core.pyvista_widget import get_data_range
+from qtdraw.util.basic_object import create_sphere, rotation_from_x
+
+CHOP = 1e-6
+
+
+# ==================================================
+class SambAnimation(QObject):
+    # ==================================================
+    def __init__(self, pvw, object_type, name, period=2.0, fps=30):
+        """
+        Animation of modulated SAMB (base class).
+
+        Args:
+            pvw (PyVistaWidget): PyVista widget.
+            object_type (str): object type, "vector" or "orbital".
+            name (str): group name of plotted objects.
+            period (float, optional): period [s].
+            fps (int, optional): frames per second.
+
+        Note:
+            - subclass defines update_frame(c, s) to update objects in place for c=cos(wt) and s=sin(wt),
+              and restore() to restore objects at t=0.
+        """
+        super().__init__(pvw)
+        self.pvw = pvw
+        self.period = period
+
+        rows = [row for row in pvw._data[object_type].tolist() if row[COLUMN_NAME] == name]
+        self._actor_name = [row[COLUMN_NAME_ACTOR] for row in rows]
+        self._actor = [pvw.actors.get(i) for i in self._actor_name]
+        self._visible = np.array([i is not None and bool(i.GetVisibility()) for i in self._actor])
+        self._matrix0 = np.array([i.user_matrix if i is not None else np.eye(4) for i in self._actor]).reshape(-1, 4, 4)
+
+        self._timer = QTimer(self)
+        self._timer.setInterval(int(1000 / fps))
+        self._timer.timeout.connect(self._next_frame)
+        self._start = 0.0
+
+    # ==================================================
+    def is_active(self):
+        """
+        Is animation active ?
+
+        Returns:
+            - (bool) -- active ?
+        """
+        return self._timer.isActive()
+
+    # ==================================================
+    def _alive(self):
+        """
+        Are all actors still in the scene ?
+
+        Returns:
+            - (bool) -- alive ?
+
+        :meta private:
+        """
+        actors = self.pvw.actors
+        return all(i is not None and actors.get(name) is i for name, i in zip(self._actor_name, self._actor))
+
+    # ==================================================
+    def start(self):
+        """
+        Start animation.
+        """
+        self._start = time.perf_counter()
+        self._timer.start()
+
+    # ==================================================
+    def stop(self):
+        """
+        Stop animation, and restore objects at t=0.
+        """
+        self._timer.stop()
+        if self._alive():
+            self.restore()
+            self.pvw.render()
+
+    # ==================================================
+    def _next_frame(self):
+        """
+        Update objects for the current time.
+
+        :meta private:
+        """
+        if not self._alive():  # objects have been redrawn or removed.
+            self._timer.stop()
+            return
+
+        wt = 2.0 * np.pi * (time.perf_counter() - self._start) / self.period
+        self.update_frame(np.cos(wt), np.sin(wt))
+        self.pvw.render()
+
+
+# ==================================================
+class VectorSambAnimation(SambAnimation):
+    # ==================================================
+    def __init__(self, pvw, name, position, amp_c, amp_s, reference, period=2.0, fps=30):
+        """
+        Animation of modulated vector SAMB.
+
+        Args:
+            pvw (PyVistaWidget): PyVista widget.
+            name (str): group name of plotted vectors.
+            position (ndarray): positions (cartesian), (n, 3).
+            amp_c (ndarray): amplitude of cos(wt) (cartesian), (n, 3).
+            amp_s (ndarray): amplitude of sin(wt) (cartesian), (n, 3).
+            reference (ndarray): directions of plotted vectors (cartesian), (n, 3).
+            period (float, optional): period [s].
+            fps (int, optional): frames per second.
+
+        Note:
+            - plotted arrow along d is R(d).diag(|d|,1,1) applied to an arrow along x, which gives the user matrix at t.
+            - user matrix at t is given by the one at t=0 (shared arrow) multiplied by transformation from t=0 to t.
+        """
+        super().__init__(pvw, "vector", name, period, fps)
+
+        self._position = position
+        self._amp_c = amp_c
+        self._amp_s = amp_s
+
+        norm = np.linalg.norm(reference, axis=1)
+        self._inverse = np.transpose(rotation_from_x(reference), (0, 2, 1)).copy()
+        self._inverse[:, 0, :] /= norm[:, None]  # diag(1/|d0|,1,1).R0^T.
+        self._matrix = [vtkMatrix4x4() for _ in self._actor]
+
+    # ==================================================
+    def update_frame(self, c, s):
+        d = c * self._amp_c + s * self._amp_s
+        norm = np.linalg.norm(d, axis=1)
+        show = self._visible & (norm > CHOP)
+        d[~show] = [1.0, 0.0, 0.0]
+
+        m = rotation_from_x(d)
+        m[:, :, 0] *= norm[:, None]  # R(d).diag(|d|,1,1).
+        m = np.einsum("nij,njk->nik", m, self._inverse)
+        t = self._position - np.einsum("nij,nj->ni", m, self._position)
+
+        w = np.zeros((len(d), 4, 4))
+        w[:, :3, :3] = m
+        w[:, :3, 3] = t
+        w[:, 3, 3] = 1.0
+        w = np.einsum("nij,njk->nik", w, self._matrix0).reshape(len(d), 16).tolist()
+
+        for actor, matrix, v, wi in zip(self._actor, self._matrix, show.tolist(), w):
+            actor.SetVisibility(v)
+            if v:
+                matrix.DeepCopy(wi)
+                actor.SetUserMatrix(matrix)
+                actor.Modified()
+
+    # ==================================================
+    def restore(self):
+        self.update_frame(1.0, 0.0)  # arrows with vanishing X_c are hidden.
+
+
+# ==================================================
+class OrbitalSambAnimation(SambAnimation):
+    # ==================================================
+    def __init__(self, pvw, name, position, mono, coeff_c, coeff_s, size, period=2.0, fps=30):
+        """
+        Animation of modulated orbital SAMB.
+
+        Args:
+            pvw (PyVistaWidget): PyVista widget.
+            name (str): group name of plotted orbitals.
+            position (ndarray): positions (cartesian), (n, 3).
+            mono (list): monomials of (x,y,z), [(a,b,c)].
+            coeff_c (ndarray): coefficients of cos(wt), (n, monomial).
+            coeff_s (ndarray): coefficients of sin(wt), (n, monomial).
+            size (float): size of orbital.
+            period (float, optional): period [s].
+            fps (int, optional): frames per second.
+
+        Note:
+            - monomials are evaluated on the unit sphere once, and each frame is a linear combination of them.
+            - orbital object may be shared among actors, so that each actor has its own copy during animation.
+        """
+        super().__init__(pvw, "orbital", name, period, fps)
+
+        self._offset = position - self._matrix0[:, 0:3, 3]  # position not given by user matrix.
+        self._coeff_c = coeff_c
+        self._coeff_s = coeff_s
+        self._size = size
+
+        self._unit = np.asarray(create_sphere(1.0).points, dtype=float)
+        self._basis = np.array([np.prod(self._unit**m, axis=1) for m in mono]).reshape(len(mono), -1)
+
+        self._mesh0 = [i.mapper.dataset if i is not None else None for i in self._actor]
+        if any(i is not None and i.n_points != len(self._unit) for i in self._mesh0):  # unexpected mesh.
+            self._actor = [None] * len(self._actor)
+        self._mesh = [i.copy() if i is not None else None for i in self._mesh0]
+
+    # ==================================================
+    def start(self):
+        if self._alive():
+            for actor, mesh in zip(self._actor, self._mesh):
+                actor.mapper.SetInputData(mesh)
+        super().start()
+
+    # ==================================================
+    def update_frame(self, c, s):
+        f = (c * self._coeff_c + s * self._coeff_s) @ self._basis  # (n, points).
+        for actor, mesh, fi, p, v in zip(self._actor, self._mesh, f, self._offset, self._visible):
+            if not v:
+                continue
+            max_f = np.abs(fi).max()
+            mesh.points[:] = (self._size * np.abs(fi))[:, None] * self._unit + p
+            mesh["surface"][:] = fi / max_f if max_f > CHOP else fi
+            mesh.Modified()
+            if actor.mapper.GetScalarVisibility():
+                actor.mapper.scalar_range = get_data_range(mesh["surface"])
+
+    # ==================================================
+    def restore(self):
+        show = self._visible & (np.abs(self._coeff_c).max(axis=1, initial=0) > CHOP)  # X_c at t=0.
+        for actor, mesh0, v in zip(self._actor, self._mesh0, show.tolist()):
+            actor.mapper.SetInputData(mesh0)
+            actor.SetVisibility(v)
+            if actor.mapper.GetScalarVisibility():
+                actor.mapper.scalar_range = get_data_range(mesh0["surface"])
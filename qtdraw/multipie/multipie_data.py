@@ -7,10 +7,14 @@ This module provides a data manager for MultiPie.
 import numpy as np
 import sympy as sp
 import copy
+import threading
+from collections import OrderedDict
+from functools import lru_cache
 
 from multipie import __version__, Group
-from qtdraw.multipie.multipie_group_list import group_list, group_list_index
+from qtdraw.multipie.multipie_group_list import crystal_list, group_list, group_index, group_tag, group_name
 from qtdraw.multipie.multipie_setting import default_status
+from qtdraw.multipie.multipie_setting import setting_detail as detail
 from qtdraw.multipie.multipie_plot import (
     plot_cell_site,
     plot_cell_bond,
@@ -22,7 +26,77 @@ from qtdraw.multipie.multipie_plot import (
     plot_vector_cluster,
     plot_orbital_cluster,
 )
-from qtdraw.multipie.multipie_util import check_linear_combination, convert_vector_object, create_samb_modulation, phase_factor
+from qtdraw.multipie.multipie_util import (
+    CHOP,
+    check_linear_combination,
+    convert_vector_object,
+    create_samb_modulation,
+    create_samb_modulation_amplitude,
+    linear_combination_coefficient,
+    monomial_coefficient,
+    monomial_vector,
+    phase_factor,
+    polynomial_str,
+    stack_monomial_coefficient,
+)
+from qtdraw.multipie.multipie_animation import VectorSambAnimation, OrbitalSambAnimation
+
+_GROUP_CACHE_SIZE = 64
+
+
+# ==================================================
+@lru_cache(maxsize=_GROUP_CACHE_SIZE)
+def _get_group(tag):
+    """
+    Get (cached) group.
+
+    Args:
+        tag (str): group tag.
+
+    Returns:
+        - (Group) -- group, shared in process.
+
+    Note:
+        - point/space/magnetic companions are also cached by their tags.
+    """
+    return Group(tag)
+
+
+# ==================================================
+_SAMB_CACHE_SIZE = 32
+_samb_cache = OrderedDict()  # (group ID, wp or site/bond, type, rank) => SAMB.
+_samb_lock = threading.Lock()
+
+
+# ==================================================
+def _memo_samb(key, func, *args):
+    """
+    Memoized SAMB computation.
+
+    Args:
+        key (tuple): (group ID, wp or site/bond, type, rank).
+        func (function): function to compute SAMB.
+        *args (Any): arguments of func.
+
+    Returns:
+        - (Any) -- result of func.
+
+    Note:
+        - shared in process (thread safe), and bounded by LRU.
+    """
+    with _samb_lock:
+        if key in _samb_cache:
+            _samb_cache.move_to_end(key)
+            return _samb_cache[key]
+
+    value = func(*args)
+
+    with _samb_lock:
+        _samb_cache[key] = value
+        if len(_samb_cache) > _SAMB_CACHE_SIZE:
+            _samb_cache.popitem(last=False)
+
+    return value
 
 
 # ==================================================
@@ -34,18 +108,10 @@ class MultiPieData:
         """
         self.pvw = parent  # PyVista Widget.
 
-        self._crystal_list = {crystal: {tp: i[1] for tp, i in v.items()} for crystal, v in group_list.items()}
-        self._to_tag = {}
-        self._to_name = {}
-        for v in group_list.values():
-            for i in v.values():
-                for a, b in zip(i[0], i[1]):
-                    self._to_tag[b] = a
-                    self._to_name[a] = b
-
         self._crystal = "triclinic"
         self._type = "PG"
         self._idx = 0
+        self._animation = None
 
         self.set_status()
         self.status["version"] = __version__
@@ -55,7 +121,7 @@ class MultiPieData:
     @property
     def group(self):
         if self._group is None:
-            self._group = Group(self.status["group"]["tag"])
+            self._group = _get_group(self.status["group"]["tag"])
 
         return self._group
 
@@ -66,7 +132,7 @@ class MultiPieData:
             return self.group
         if self._ps_group is None:
             ps = self.group.info.PG if self.group.group_type in ["MPG"] else self.group.info.SG
-            self._ps_group = Group(ps)
+            self._ps_group = _get_group(ps)
 
         return self._ps_group
 
@@ -76,7 +142,7 @@ class MultiPieData:
         if self.group.group_type in ["PG"]:
             return self.group
         if self._p_group is None:
-            self._p_group = Group(self.group.info.PG)
+            self._p_group = _get_group(self.group.info.PG)
 
         return self._p_group
 
@@ -86,26 +152,31 @@ class MultiPieData:
         if self.group.group_type in ["MPG"]:
             return self.group
         if self._mp_group is None:
-            self._mp_group = Group(self.group.info.MPG)
+            self._mp_group = _get_group(self.group.info.MPG)
 
         return self._mp_group
 
+    # ==================================================
+    @property
+    def _crystal_list(self):
+        return crystal_list()
+
     # ==================================================
     def _get_group_list(self, crystal=None, tp=None):
         if crystal is None:
             crystal = self._crystal
         if tp is None:
             tp = self._type
-        return self._crystal_list[crystal][tp]
+        return group_list()[crystal][tp][1]
 
     # ==================================================
     def _get_group_name(self):
         info = self.group.info
         name = {
-            "PG": self._to_name[info.PG],
-            "SG": self._to_name[info.SG],
-            "MPG": self._to_name[info.MPG],
-            "MSG": self._to_name[info.MSG],
+            "PG": group_name(info.PG),
+            "SG": group_name(info.SG),
+            "MPG": group_name(info.MPG),
+            "MSG": group_name(info.MSG),
         }
         return name
 
@@ -133,9 +204,9 @@ class MultiPieData:
     # ==================================================
     def set_group(self, group):
         if group.count("#"):
-            group = self._to_tag[group]
+            group = group_tag(group)
 
-        self._crystal, self._type, self._idx = group_list_index[group]
+        self._crystal, self._type, self._idx = group_index(group)
         self.status["group"]["tag"] = group
 
         self._group = None
@@ -169,6 +240,7 @@ class MultiPieData:
 
     # ==================================================
     def clear_data(self):
+        self.stop_animation()
         self.status["counter"] = {}
 
         # basis.
@@ -194,6 +266,7 @@ class MultiPieData:
         self._vector_samb = {}
         self._vector_samb_list = {}
         self._vector_samb_var = {"Q": [], "G": [], "T": [], "M": []}
+        self._vector_basis = {}
 
         self._orbital_list = {"Q": [], "G": [], "T": [], "M": []}
         self._orbital_wp = ""
@@ -203,6 +276,7 @@ class MultiPieData:
         self._orbital_samb = {}
         self._orbital_samb_list = {}
         self._orbital_samb_var = {"Q": [], "G": [], "T": [], "M": []}
+        self._orbital_basis = {}
 
     # ==================================================
     def _set_counter(self, name):
@@ -281,14 +355,38 @@ class MultiPieData:
         plot_bond_definition(self, bonds, wp=wp, label=mp, length=length, width=width, color=color, opacity=opacity)
 
     # ==================================================
-    def site_samb_list(self, site):
-        self.status["basis"]["site"] = site
+    def compute_site_samb(self, site):
+        """
+        Compute site-cluster SAMB (thread safe).
 
+        Args:
+            site (str): representative site.
+
+        Returns:
+            - (tuple) -- (wp, sites, SAMB).
+        """
         group = self.ps_group
+        wp, sites = group.find_wyckoff_site(site)
+        samb = _memo_samb((group.ID, wp, "site", 0), group.cluster_samb, wp)
+
+        return wp, sites, samb
+
+    # ==================================================
+    def set_site_samb(self, site, result):
+        """
+        Set site-cluster SAMB.
 
-        self._site_wp, self._sites = group.find_wyckoff_site(site)
-        self._site_mp = group.wyckoff["site"][self._site_wp]["mapping"]
-        self._site_samb = group.cluster_samb(self._site_wp)
+        Args:
+            site (str): representative site.
+            result (tuple): result of compute_site_samb.
+
+        Returns:
+            - (list) -- SAMB list.
+        """
+        self.status["basis"]["site"] = site
+
+        self._site_wp, self._sites, self._site_samb = result
+        self._site_mp = self.ps_group.wyckoff["site"][self._site_wp]["mapping"]
         if len(self._site_mp) != len(self._sites):
             self._site_mp = self._site_mp * (len(self._sites) // len(self._site_mp))
 
@@ -296,6 +394,10 @@ class MultiPieData:
 
         return self._site_list
 
+    # ==================================================
+    def site_samb_list(self, site):
+        return self.set_site_samb(site, self.compute_site_samb(site))
+
     # ==================================================
     def add_site_samb(self, tag, size=None, p_color=None, n_color=None, z_color=None, z_size=None):
         if tag not in self._site_list:
@@ -320,14 +422,38 @@ class MultiPieData:
         )
 
     # ==================================================
-    def bond_samb_list(self, bond):
-        self.status["basis"]["bond"] = bond
+    def compute_bond_samb(self, bond):
+        """
+        Compute bond-cluster SAMB (thread safe).
 
+        Args:
+            bond (str): representative bond.
+
+        Returns:
+            - (tuple) -- (wp, bonds, SAMB).
+        """
         group = self.ps_group
+        wp, bonds = group.find_wyckoff_bond(bond)
+        samb = _memo_samb((group.ID, wp, "bond", 0), group.cluster_samb, wp, "bond")
+
+        return wp, bonds, samb
 
-        self._bond_wp, self._bonds = group.find_wyckoff_bond(bond)
-        self._bond_mp = group.wyckoff["bond"][self._bond_wp]["mapping"]
-        self._bond_samb = group.cluster_samb(self._bond_wp, "bond")
+    # ==================================================
+    def set_bond_samb(self, bond, result):
+        """
+        Set bond-cluster SAMB.
+
+        Args:
+            bond (str): representative bond.
+            result (tuple): result of compute_bond_samb.
+
+        Returns:
+            - (list) -- SAMB list.
+        """
+        self.status["basis"]["bond"] = bond
+
+        self._bond_wp, self._bonds, self._bond_samb = result
+        self._bond_mp = self.ps_group.wyckoff["bond"][self._bond_wp]["mapping"]
         if len(self._bond_mp) != len(self._bonds):
             self._bond_mp = self._bond_mp * (len(self._bonds) // len(self._bond_mp))
 
@@ -335,6 +461,10 @@ class MultiPieData:
 
         return self._bond_list
 
+    # ==================================================
+    def bond_samb_list(self, bond):
+        return self.set_bond_samb(bond, self.compute_bond_samb(bond))
+
     # ==================================================
     def add_bond_samb(self, tag, width=None, p_color=None, n_color=None, z_color=None, z_width=None, a_size=None):
         if tag not in self._bond_list:
@@ -362,13 +492,41 @@ class MultiPieData:
         )
 
     # ==================================================
-    def vector_samb_list(self, vector, tp="Q"):
+    def compute_vector_samb(self, vector, tp="Q"):
+        """
+        Compute symmetry-adapted vector (thread safe).
+
+        Args:
+            vector (str): representative site/bond.
+            tp (str, optional): vector type, Q/G/T/M.
+
+        Returns:
+            - (tuple) -- (SAMB, wp, sites).
+        """
+        group = self.ps_group
+        result = _memo_samb((group.ID, vector, tp, 1), group.multipole_cluster_samb, tp, 1, vector)
+
+        return result
+
+    # ==================================================
+    def set_vector_samb(self, vector, tp, result):
+        """
+        Set symmetry-adapted vector.
+
+        Args:
+            vector (str): representative site/bond.
+            tp (str): vector type, Q/G/T/M.
+            result (tuple): result of compute_vector_samb.
+
+        Returns:
+            - (dict) -- SAMB list for each type.
+        """
         self.status["basis"]["vector_type"] = tp
         self.status["basis"]["vector"] = vector
 
         group = self.ps_group
 
-        samb, self._vector_wp, self._vector_samb_site = group.multipole_cluster_samb(tp, 1, vector)
+        samb, self._vector_wp, self._vector_samb_site = result
         self._vector_mp = (
             group.wyckoff["bond"][self._vector_wp]["mapping"]
             if "@" in self._vector_wp
@@ -383,6 +541,7 @@ class MultiPieData:
         self._vector_samb = {}
         self._vector_samb_list = {}
         self._vector_samb_var = {}
+        self._vector_basis = {}
         for tp in ["Q", "G", "T", "M"]:
             self._vector_samb[tp] = samb.select(X=tp)
             self._vector_list[tp], self._vector_samb_list[tp] = self._get_index_list(self._vector_samb[tp].keys())
@@ -391,6 +550,70 @@ class MultiPieData:
 
         return self._vector_list
 
+    # ==================================================
+    def vector_samb_list(self, vector, tp="Q"):
+        return self.set_vector_samb(vector, tp, self.compute_vector_samb(vector, tp))
+
+    # ==================================================
+    def _samb_object(self, kind, var):
+        """
+        SAMB object in sympy.
+
+        Args:
+            kind (str): "vector" or "orbital".
+            var (str): basis variable, e.g., "Q01".
+
+        Returns:
+            - (ndarray) -- polynomial of (x,y,z) at each site.
+
+        :meta private:
+        """
+        tp = var[0]
+        idx = int(var[1:]) - 1
+        samb_list = getattr(self, f"_{kind}_samb_list")
+        samb_dict = getattr(self, f"_{kind}_samb")
+        samb, comp = samb_list[tp][idx]
+        samb = samb_dict[tp][samb][0][comp]
+        obj = self.ps_group.combined_object(getattr(self, f"_{kind}_wp"), tp, samb)
+
+        return np.tile(obj, getattr(self, f"_{kind}_n_pset"))
+
+    # ==================================================
+    def _vector_basis_array(self, var):
+        """
+        Vector SAMB in numeric array (cached).
+
+        Args:
+            var (str): basis variable, e.g., "Q01".
+
+        Returns:
+            - (ndarray) -- vector at each site, (site, 3).
+
+        :meta private:
+        """
+        if var not in self._vector_basis:
+            obj = self._samb_object("vector", var)
+            coeff = monomial_coefficient(obj)
+            self._vector_basis[var] = monomial_vector(list(coeff.keys()), np.array(list(coeff.values())).T)
+        return self._vector_basis[var]
+
+    # ==================================================
+    def _orbital_basis_coefficient(self, var):
+        """
+        Orbital SAMB in monomial coefficients (cached).
+
+        Args:
+            var (str): basis variable, e.g., "Q01".
+
+        Returns:
+            - (dict) -- {(a,b,c): exact coefficient at each site (ndarray(object))}.
+
+        :meta private:
+        """
+        if var not in self._orbital_basis:
+            self._orbital_basis[var] = monomial_coefficient(self._samb_object("orbital", var), exact=True)
+        return self._orbital_basis[var]
+
     # ==================================================
     def add_vector_samb(self, lc, length=None, width=None, color=None, opacity=None):
         ex, var = check_linear_combination(lc, self._vector_samb_var)
@@ -404,33 +627,35 @@ class MultiPieData:
         site = self._vector_samb_site
         mp = self._vector_mp
 
-        lc_obj = {}
-        for i in var:
-            tp = i[0]
-            idx = int(i[1:]) - 1
-            samb, comp = self._vector_samb_list[tp][idx]
-            samb = self._vector_samb[tp][samb][0][comp]
-            obj1 = self.ps_group.combined_object(wp, tp, samb)
-            obj1 = np.tile(obj1, self._vector_n_pset)
-            lc_obj[i] = sp.Matrix(convert_vector_object(obj1))
-
-        obj = np.array(ex.subs(lc_obj))
+        var, coeff = linear_combination_coefficient(ex)
+        if coeff is not None:
+            obj = np.tensordot(coeff, np.stack([self._vector_basis_array(i) for i in var]), axes=1)
+        else:  # non-linear combination.
+            lc_obj = {i: sp.Matrix(convert_vector_object(self._samb_object("vector", i))) for i in var}
+            obj = np.array(ex.subs(lc_obj))
 
         plot_vector_cluster(
             self, site, obj, X, wp=lc + " # " + wp, label=mp, length=length, width=width, color=color, opacity=opacity
         )
 
     # ==================================================
-    def add_vector_samb_modulation(self, modulation_range, length=None, width=None, color=None, opacity=None):
+    def add_vector_samb_modulation(
+        self, modulation_range, length=None, width=None, color=None, opacity=None, exact=False, animate=False
+    ):
         modulation, rng = modulation_range.split(":")
         mod_list, is_magnetic = self._parse_modulation(modulation)
         if not mod_list:
             return
 
+        self.stop_animation()
         self.status["basis"]["vector_modulation"] = modulation_range
 
         rng, upper = self._parse_range(rng)
         pset = self.ps_group.symmetry_operation["plus_set"].astype(float)
+        if animate:
+            self._animate_vector_samb_modulation(modulation_range, mod_list, rng, upper, pset, length, width, color, opacity)
+            return
+
         phase_dict, igrid = phase_factor(mod_list, rng, pset)
 
         X = self.status["basis"]["vector_type"]
@@ -438,14 +663,12 @@ class MultiPieData:
         site = self._vector_samb_site
 
         obj, site_idx, full_site = create_samb_modulation(
-            self.ps_group, mod_list, phase_dict, igrid, pset, self._vector_samb, self._vector_samb_list, wp, site
+            self.ps_group, mod_list, phase_dict, igrid, pset, self._vector_samb, self._vector_samb_list, wp, site, True, exact
         )
-        obj = convert_vector_object(obj)
+        if exact:
+            obj = convert_vector_object(obj)
 
-        self.pvw.set_range([0, 0, 0], upper)
-        self.pvw.set_repeat(True)
-        self.pvw.set_nonrepeat()
-        self.pvw.set_repeat(False)
+        self.pvw.expand_supercell([0, 0, 0], upper)
 
         plot_vector_cluster(
             self,
@@ -461,7 +684,38 @@ class MultiPieData:
         )
 
     # ==================================================
-    def orbital_samb_list(self, orbital, tp="Q", rank=0):
+    def compute_orbital_samb(self, orbital, tp="Q", rank=0):
+        """
+        Compute symmetry-adapted orbital (thread safe).
+
+        Args:
+            orbital (str): representative site/bond.
+            tp (str, optional): orbital type, Q/G/T/M.
+            rank (int, optional): rank.
+
+        Returns:
+            - (tuple) -- (SAMB, wp, sites).
+        """
+        rank = int(rank)
+        group = self.ps_group
+        result = _memo_samb((group.ID, orbital, tp, rank), group.multipole_cluster_samb, tp, rank, orbital)
+
+        return result
+
+    # ==================================================
+    def set_orbital_samb(self, orbital, tp, rank, result):
+        """
+        Set symmetry-adapted orbital.
+
+        Args:
+            orbital (str): representative site/bond.
+            tp (str): orbital type, Q/G/T/M.
+            rank (int): rank.
+            result (tuple): result of compute_orbital_samb.
+
+        Returns:
+            - (dict) -- SAMB list for each type.
+        """
         rank = int(rank)
         self.status["basis"]["orbital_type"] = tp
         self.status["basis"]["orbital_rank"] = rank
@@ -469,7 +723,7 @@ class MultiPieData:
 
         group = self.ps_group
 
-        samb, self._orbital_wp, self._orbital_samb_site = group.multipole_cluster_samb(tp, rank, orbital)
+        samb, self._orbital_wp, self._orbital_samb_site = result
         self._orbital_mp = (
             group.wyckoff["bond"][self._orbital_wp]["mapping"]
             if "@" in self._orbital_wp
@@ -484,6 +738,7 @@ class MultiPieData:
         self._orbital_samb = {}
         self._orbital_samb_list = {}
         self._orbital_samb_var = {}
+        self._orbital_basis = {}
         for tp in ["Q", "G", "T", "M"]:
             self._orbital_samb[tp] = samb.select(X=tp)
             self._orbital_list[tp], self._orbital_samb_list[tp] = self._get_index_list(self._orbital_samb[tp].keys())
@@ -492,6 +747,10 @@ class MultiPieData:
 
         return self._orbital_list
 
+    # ==================================================
+    def orbital_samb_list(self, orbital, tp="Q", rank=0):
+        return self.set_orbital_samb(orbital, tp, rank, self.compute_orbital_samb(orbital, tp, rank))
+
     # ==================================================
     def add_orbital_samb(self, lc, size=None, color=None, opacity=None):
         ex, var = check_linear_combination(lc, self._orbital_samb_var)
@@ -505,30 +764,33 @@ class MultiPieData:
         site = self._orbital_samb_site
         mp = self._orbital_mp
 
-        lc_obj = {}
-        for i in var:
-            tp = i[0]
-            idx = int(i[1:]) - 1
-            samb, comp = self._orbital_samb_list[tp][idx]
-            samb = self._orbital_samb[tp][samb][0][comp]
-            obj1 = self.ps_group.combined_object(wp, tp, samb)
-            lc_obj[i] = sp.Matrix(np.tile(obj1, self._orbital_n_pset))
-
-        obj = np.array(ex.subs(lc_obj)).reshape(-1)
+        var, coeff = linear_combination_coefficient(ex, exact=True)
+        if coeff is not None:
+            mono, basis = stack_monomial_coefficient([self._orbital_basis_coefficient(i) for i in var], len(site), object)
+            exact = np.tensordot(coeff, basis, axes=1)  # for shape string.
+            obj = polynomial_str(mono, np.tensordot(coeff.astype(float), basis.astype(float), axes=1), exact)
+        else:  # non-linear combination.
+            lc_obj = {i: sp.Matrix(self._samb_object("orbital", i)) for i in var}
+            obj = np.array(ex.subs(lc_obj)).reshape(-1)
 
         plot_orbital_cluster(self, site, obj, X, wp=lc + " # " + wp, label=mp, size=size, color=color, opacity=opacity)
 
     # ==================================================
-    def add_orbital_samb_modulation(self, modulation_range, size=None, color=None, opacity=None):
+    def add_orbital_samb_modulation(self, modulation_range, size=None, color=None, opacity=None, exact=False, animate=False):
         modulation, rng = modulation_range.split(":")
         mod_list, is_magnetic = self._parse_modulation(modulation)
         if not mod_list:
             return
 
+        self.stop_animation()
         self.status["basis"]["orbital_modulation"] = modulation_range
 
         rng, upper = self._parse_range(rng)
         pset = self.ps_group.symmetry_operation["plus_set"].astype(float)
+        if animate:
+            self._animate_orbital_samb_modulation(modulation_range, mod_list, rng, upper, pset, size, color, opacity)
+            return
+
         phase_dict, igrid = phase_factor(mod_list, rng, pset)
 
         X = self.status["basis"]["orbital_type"]
@@ -536,18 +798,104 @@ class MultiPieData:
         site = self._orbital_samb_site
 
         obj, site_idx, full_site = create_samb_modulation(
-            self.ps_group, mod_list, phase_dict, igrid, pset, self._orbital_samb, self._orbital_samb_list, wp, site
+            self.ps_group, mod_list, phase_dict, igrid, pset, self._orbital_samb, self._orbital_samb_list, wp, site, False, exact
         )
 
-        self.pvw.set_range([0, 0, 0], upper)
-        self.pvw.set_repeat(True)
-        self.pvw.set_nonrepeat()
-        self.pvw.set_repeat(False)
+        self.pvw.expand_supercell([0, 0, 0], upper)
 
         plot_orbital_cluster(
             self, full_site, obj, X, wp=modulation_range + " # " + wp, label=site_idx, size=size, color=color, opacity=opacity
         )
 
+    # ==================================================
+    def _animate_vector_samb_modulation(self, modulation_range, mod_list, rng, upper, pset, length, width, color, opacity):
+        """
+        Plot vector SAMB with modulation, and animate it in time, k.r => k.r-wt.
+
+        :meta private:
+        """
+        X = self.status["basis"]["vector_type"]
+        wp = self._vector_wp
+        site = self._vector_samb_site
+
+        mono, coeff_c, coeff_s, site_idx, full_site = create_samb_modulation_amplitude(
+            self.ps_group, mod_list, rng, pset, self._vector_samb, self._vector_samb_list, wp, site
+        )
+        amp_c = monomial_vector(mono, coeff_c)
+        amp_s = monomial_vector(mono, coeff_s)
+
+        # plot once with nonzero direction, which is updated in each frame.
+        ref = np.where((np.linalg.norm(amp_c, axis=1) > CHOP)[:, None], amp_c, amp_s)
+        idx = np.linalg.norm(ref, axis=1) > CHOP
+        ref, full_site, site_idx = ref[idx], full_site[idx], [i for i, j in zip(site_idx, idx) if j]
+
+        self.pvw.expand_supercell([0, 0, 0], upper)
+        name = plot_vector_cluster(
+            self,
+            full_site,
+            ref,
+            X,
+            wp=modulation_range + " # " + wp,
+            label=site_idx,
+            length=length,
+            width=width,
+            color=color,
+            opacity=opacity,
+        )
+
+        position = full_site.astype(float) @ self.pvw.A_matrix[0:3, 0:3].T
+        self._animation = VectorSambAnimation(self.pvw, name, position, amp_c[idx], amp_s[idx], ref, **self._animation_option)
+        self._animation.start()
+
+    # ==================================================
+    def _animate_orbital_samb_modulation(self, modulation_range, mod_list, rng, upper, pset, size, color, opacity):
+        """
+        Plot orbital SAMB with modulation, and animate it in time, k.r => k.r-wt.
+
+        :meta private:
+        """
+        X = self.status["basis"]["orbital_type"]
+        wp = self._orbital_wp
+        site = self._orbital_samb_site
+        if size is None:
+            size = detail["orbital"]["size"]
+
+        mono, coeff_c, coeff_s, site_idx, full_site = create_samb_modulation_amplitude(
+            self.ps_group, mod_list, rng, pset, self._orbital_samb, self._orbital_samb_list, wp, site
+        )
+
+        # plot once with nonzero polynomial, which is updated in each frame.
+        ref = np.where((np.abs(coeff_c).max(axis=1, initial=0) > CHOP)[:, None], coeff_c, coeff_s)
+        idx = np.abs(ref).max(axis=1, initial=0) > CHOP
+        obj = polynomial_str(mono, ref[idx])
+        full_site, site_idx = full_site[idx], [i for i, j in zip(site_idx, idx) if j]
+
+        self.pvw.expand_supercell([0, 0, 0], upper)
+        name = plot_orbital_cluster(
+            self, full_site, obj, X, wp=modulation_range + " # " + wp, label=site_idx, size=size, color=color, opacity=opacity
+        )
+
+        position = full_site.astype(float) @ self.pvw.A_matrix[0:3, 0:3].T
+        self._animation = OrbitalSambAnimation(
+            self.pvw, name, position, mono, coeff_c[idx], coeff_s[idx], size, **self._animation_option
+        )
+        self._animation.start()
+
+    # ==================================================
+    @property
+    def _animation_option(self):
+        return {"period": detail["animation"]["period"], "fps": detail["animation"]["fps"]}
+
+    # ==================================================
+    def stop_animation(self):
+        """
+        Stop animation of modulated SAMB (objects at t=0 are restored).
+        """
+        if self._animation is not None:
+            self._animation.stop()
+            self._animation.deleteLater()
+            self._animation = None
+
     # ==================================================
     @staticmethod
     def _parse_modulation(s):
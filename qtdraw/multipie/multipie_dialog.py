@@ -57,6 +57,7 @@ class MultiPieDialog(QDialog):
         self.group_changed.connect(self._group_panel.set_wyckoff_list)
         self.group_changed.connect(self._group_panel.set_harm_list)
         self.group_changed.connect(self._sub_panel.set_group_name)
+        self.group_changed.connect(self._basis_panel.cancel_samb)
         self._pvw.data_removed.connect(self.clear_data)
 
         self.set_data()
@@ -85,4 +86,5 @@ class MultiPieDialog(QDialog):
 
     # ==================================================
     def closeEvent(self, event):
+        self._basis_panel.wait_samb()
         super().closeEvent(event)
@@ -1,6790 +1,114 @@
+"""
+Group catalog for MultiPie.
+
+This module provides group list and group index, loaded lazily from the packed table, "multipie_group_list.json".
+
+- crystal: list of crystal types.
+- type: ["PG", "SG", "MPG", "MSG"].
+- name: group names, [crystal][type][no], tag is given by name, e.g., "#1: C1 (1)" => "PG:1".
+"""
+
+import json
+from pathlib import Path
+from functools import cache
+
+_GROUP_LIST_PATH = Path(__file__).parent / "multipie_group_list.json"
+
+
+# ==================================================
+@cache
+def _load_group_list():
+    with open(_GROUP_LIST_PATH, mode="r", encoding="utf-8") as f:
+        packed = json.load(f)
+
+    group_list = {}  # crystal: "PG/SG/MPG/MSG": [tag_list, name_list].
+    group_index = {}  # tag, SG No., or PG/SG name: (crystal, tp, no).
+    to_tag = {}  # name: tag.
+    to_name = {}  # tag: name.
+    for crystal, names in zip(packed["crystal"], packed["name"]):
+        group_list[crystal] = {}
+        for tp, name_list in zip(packed["type"], names):
+            tag_list = []
+            for no, name in enumerate(name_list):
+                gno, g = name.split(" ")[:2]
+                gno = gno[1:-1]
+                tag = f"{tp}:{gno}"
+                tag_list.append(tag)
+                if tp in ["PG", "SG"]:
+                    group_index[g] = (crystal, tp, no)
+                if tp == "SG":
+                    group_index[int(gno)] = (crystal, tp, no)
+                group_index[tag] = (crystal, tp, no)
+                to_tag[name] = tag
+                to_name[tag] = name
+            group_list[crystal][tp] = [tag_list, name_list]
+
+    return group_list, group_index, to_tag, to_name
+
+
+# ==================================================
+def group_list():
+    """
+    Group list.
+
+    Returns:
+        - (dict) -- crystal: "PG/SG/MPG/MSG": [tag_list, name_list].
+    """
+    return _load_group_list()[0]
+
+
 # ==================================================
-group_list = {  # crystal: "PG/SG/MPG/MSG": [tag_list, name_list].
-    "triclinic": {
-        "PG": [["PG:1", "PG:2"], ["#1: C1 (1)", "#2: Ci (-1)"]],
-        "SG": [["SG:1", "SG:2"], ["#1: C1^1 (P1)", "#2: Ci^1 (P-1)"]],
-        "MPG": [
-            ["MPG:1.1.1", "MPG:1.2.2", "MPG:2.1.3", "MPG:2.2.4", "MPG:2.3.5"],
-            ["#1.1.1: 1", "#1.2.2: 11'", "#2.1.3: -1", "#2.2.4: -11'", "#2.3.5: -1'"],
-        ],
-        "MSG": [
-            ["MSG:1.1", "MSG:1.2", "MSG:1.3", "MSG:2.4", "MSG:2.5", "MSG:2.6", "MSG:2.7"],
-            ["#1.1: P1", "#1.2: P11'", "#1.3: P_S1", "#2.4: P-1", "#2.5: P-11'", "#2.6: P-1'", "#2.7: P_S-1"],
-        ],
-    },
-    "monoclinic": {
-        "PG": [["PG:3", "PG:4", "PG:5"], ["#3: C2 (2)", "#4: Cs (m)", "#5: C2h (2/m)"]],
-        "SG": [
-            ["SG:3", "SG:4", "SG:5", "SG:6", "SG:7", "SG:8", "SG:9", "SG:10", "SG:11", "SG:12", "SG:13", "SG:14", "SG:15"],
-            [
-                "#3: C2^1 (P2)",
-                "#4: C2^2 (P2_1)",
-                "#5: C2^3 (C2)",
-                "#6: Cs^1 (Pm)",
-                "#7: Cs^2 (Pc)",
-                "#8: Cs^3 (Cm)",
-                "#9: Cs^4 (Cc)",
-                "#10: C2h^1 (P2/m)",
-                "#11: C2h^2 (P2_1/m)",
-                "#12: C2h^3 (C2/m)",
-                "#13: C2h^4 (P2/c)",
-                "#14: C2h^5 (P2_1/c)",
-                "#15: C2h^6 (C2/c)",
-            ],
-        ],
-        "MPG": [
-            [
-                "MPG:3.1.6",
-                "MPG:3.2.7",
-                "MPG:3.3.8",
-                "MPG:4.1.9",
-                "MPG:4.2.10",
-                "MPG:4.3.11",
-                "MPG:5.1.12",
-                "MPG:5.2.13",
-                "MPG:5.3.14",
-                "MPG:5.4.15",
-                "MPG:5.5.16",
-            ],
-            [
-                "#3.1.6: 2",
-                "#3.2.7: 21'",
-                "#3.3.8: 2'",
-                "#4.1.9: m",
-                "#4.2.10: m1'",
-                "#4.3.11: m'",
-                "#5.1.12: 2/m",
-                "#5.2.13: 2/m1'",
-                "#5.3.14: 2'/m",
-                "#5.4.15: 2/m'",
-                "#5.5.16: 2'/m'",
-            ],
-        ],
-        "MSG": [
-            [
-                "MSG:3.1",
-                "MSG:3.2",
-                "MSG:3.3",
-                "MSG:3.4",
-                "MSG:3.5",
-                "MSG:3.6",
-                "MSG:4.7",
-                "MSG:4.8",
-                "MSG:4.9",
-                "MSG:4.10",
-                "MSG:4.11",
-                "MSG:4.12",
-                "MSG:5.13",
-                "MSG:5.14",
-                "MSG:5.15",
-                "MSG:5.16",
-                "MSG:5.17",
-                "MSG:6.18",
-                "MSG:6.19",
-                "MSG:6.20",
-                "MSG:6.21",
-                "MSG:6.22",
-                "MSG:6.23",
-                "MSG:7.24",
-                "MSG:7.25",
-                "MSG:7.26",
-                "MSG:7.27",
-                "MSG:7.28",
-                "MSG:7.29",
-                "MSG:7.30",
-                "MSG:7.31",
-                "MSG:8.32",
-                "MSG:8.33",
-                "MSG:8.34",
-                "MSG:8.35",
-                "MSG:8.36",
-                "MSG:9.37",
-                "MSG:9.38",
-                "MSG:9.39",
-                "MSG:9.40",
-                "MSG:9.41",
-                "MSG:10.42",
-                "MSG:10.43",
-                "MSG:10.44",
-                "MSG:10.45",
-                "MSG:10.46",
-                "MSG:10.47",
-                "MSG:10.48",
-                "MSG:10.49",
-                "MSG:11.50",
-                "MSG:11.51",
-                "MSG:11.52",
-                "MSG:11.53",
-                "MSG:11.54",
-                "MSG:11.55",
-                "MSG:11.56",
-                "MSG:11.57",
-                "MSG:12.58",
-                "MSG:12.59",
-                "MSG:12.60",
-                "MSG:12.61",
-                "MSG:12.62",
-                "MSG:12.63",
-                "MSG:12.64",
-                "MSG:13.65",
-                "MSG:13.66",
-                "MSG:13.67",
-                "MSG:13.68",
-                "MSG:13.69",
-                "MSG:13.70",
-                "MSG:13.71",
-                "MSG:13.72",
-                "MSG:13.73",
-                "MSG:13.74",
-                "MSG:14.75",
-                "MSG:14.76",
-                "MSG:14.77",
-                "MSG:14.78",
-                "MSG:14.79",
-                "MSG:14.80",
-                "MSG:14.81",
-                "MSG:14.82",
-                "MSG:14.83",
-                "MSG:14.84",
-                "MSG:15.85",
-                "MSG:15.86",
-                "MSG:15.87",
-                "MSG:15.88",
-                "MSG:15.89",
-                "MSG:15.90",
-                "MSG:15.91",
-            ],
-            [
-                "#3.1: P2",
-                "#3.2: P21'",
-                "#3.3: P2'",
-                "#3.4: P_a2",
-                "#3.5: P_b2",
-                "#3.6: P_C2",
-                "#4.7: P2_1",
-                "#4.8: P2_11'",
-                "#4.9: P2_1'",
-                "#4.10: P_a2_1",
-                "#4.11: P_b2_1",
-                "#4.12: P_C2_1",
-                "#5.13: C2",
-                "#5.14: C21'",
-                "#5.15: C2'",
-                "#5.16: C_c2",
-                "#5.17: C_a2",
-                "#6.18: Pm",
-                "#6.19: Pm1'",
-                "#6.20: Pm'",
-                "#6.21: P_am",
-                "#6.22: P_bm",
-                "#6.23: P_Cm",
-                "#7.24: Pc",
-                "#7.25: Pc1'",
-                "#7.26: Pc'",
-                "#7.27: P_ac",
-                "#7.28: P_cc",
-                "#7.29: P_bc",
-                "#7.30: P_Cc",
-                "#7.31: P_Ac",
-                "#8.32: Cm",
-                "#8.33: Cm1'",
-                "#8.34: Cm'",
-                "#8.35: C_cm",
-                "#8.36: C_am",
-                "#9.37: Cc",
-                "#9.38: Cc1'",
-                "#9.39: Cc'",
-                "#9.40: C_cc",
-                "#9.41: C_ac",
-                "#10.42: P2/m",
-                "#10.43: P2/m1'",
-                "#10.44: P2'/m",
-                "#10.45: P2/m'",
-                "#10.46: P2'/m'",
-                "#10.47: P_a2/m",
-                "#10.48: P_b2/m",
-                "#10.49: P_C2/m",
-                "#11.50: P2_1/m",
-                "#11.51: P2_1/m1'",
-                "#11.52: P2_1'/m",
-                "#11.53: P2_1/m'",
-                "#11.54: P2_1'/m'",
-                "#11.55: P_a2_1/m",
-                "#11.56: P_b2_1/m",
-                "#11.57: P_C2_1/m",
-                "#12.58: C2/m",
-                "#12.59: C2/m1'",
-                "#12.60: C2'/m",
-                "#12.61: C2/m'",
-                "#12.62: C2'/m'",
-                "#12.63: C_c2/m",
-                "#12.64: C_a2/m",
-                "#13.65: P2/c",
-                "#13.66: P2/c1'",
-                "#13.67: P2'/c",
-                "#13.68: P2/c'",
-                "#13.69: P2'/c'",
-                "#13.70: P_a2/c",
-                "#13.71: P_b2/c",
-                "#13.72: P_c2/c",
-                "#13.73: P_A2/c",
-                "#13.74: P_C2/c",
-                "#14.75: P2_1/c",
-                "#14.76: P2_1/c1'",
-                "#14.77: P2_1'/c",
-                "#14.78: P2_1/c'",
-                "#14.79: P2_1'/c'",
-                "#14.80: P_a2_1/c",
-                "#14.81: P_b2_1/c",
-                "#14.82: P_c2_1/c",
-                "#14.83: P_A2_1/c",
-                "#14.84: P_C2_1/c",
-                "#15.85: C2/c",
-                "#15.86: C2/c1'",
-                "#15.87: C2'/c",
-                "#15.88: C2/c'",
-                "#15.89: C2'/c'",
-                "#15.90: C_c2/c",
-                "#15.91: C_a2/c",
-            ],
-        ],
-    },
-    "orthorhombic": {
-        "PG": [["PG:6", "PG:7", "PG:8"], ["#6: D2 (222)", "#7: C2v (mm2)", "#8: D2h (mmm)"]],
-        "SG": [
-            [
-                "SG:16",
-                "SG:17",
-                "SG:18",
-                "SG:19",
-                "SG:20",
-                "SG:21",
-                "SG:22",
-                "SG:23",
-                "SG:24",
-                "SG:25",
-                "SG:26",
-                "SG:27",
-                "SG:28",
-                "SG:29",
-                "SG:30",
-                "SG:31",
-                "SG:32",
-                "SG:33",
-                "SG:34",
-                "SG:35",
-                "SG:36",
-                "SG:37",
-                "SG:38",
-                "SG:39",
-                "SG:40",
-                "SG:41",
-                "SG:42",
-                "SG:43",
-                "SG:44",
-                "SG:45",
-                "SG:46",
-                "SG:47",
-                "SG:48",
-                "SG:49",
-                "SG:50",
-                "SG:51",
-                "SG:52",
-                "SG:53",
-                "SG:54",
-                "SG:55",
-                "SG:56",
-                "SG:57",
-                "SG:58",
-                "SG:59",
-                "SG:60",
-                "SG:61",
-                "SG:62",
-                "SG:63",
-                "SG:64",
-                "SG:65",
-                "SG:66",
-                "SG:67",
-                "SG:68",
-                "SG:69",
-                "SG:70",
-                "SG:71",
-                "SG:72",
-                "SG:73",
-                "SG:74",
-            ],
-            [
-                "#16: D2^1 (P222)",
-                "#17: D2^2 (P222_1)",
-                "#18: D2^3 (P2_12_12)",
-                "#19: D2^4 (P2_12_12_1)",
-                "#20: D2^5 (C222_1)",
-                "#21: D2^6 (C222)",
-                "#22: D2^7 (F222)",
-                "#23: D2^8 (I222)",
-                "#24: D2^9 (I2_12_12_1)",
-                "#25: C2v^1 (Pmm2)",
-                "#26: C2v^2 (Pmc2_1)",
-                "#27: C2v^3 (Pcc2)",
-                "#28: C2v^4 (Pma2)",
-                "#29: C2v^5 (Pca2_1)",
-                "#30: C2v^6 (Pnc2)",
-                "#31: C2v^7 (Pmn2_1)",
-                "#32: C2v^8 (Pba2)",
-                "#33: C2v^9 (Pna2_1)",
-                "#34: C2v^10 (Pnn2)",
-                "#35: C2v^11 (Cmm2)",
-                "#36: C2v^12 (Cmc2_1)",
-                "#37: C2v^13 (Ccc2)",
-                "#38: C2v^14 (Amm2)",
-                "#39: C2v^15 (Aem2)",
-                "#40: C2v^16 (Ama2)",
-                "#41: C2v^17 (Aea2)",
-                "#42: C2v^18 (Fmm2)",
-                "#43: C2v^19 (Fdd2)",
-                "#44: C2v^20 (Imm2)",
-                "#45: C2v^21 (Iba2)",
-                "#46: C2v^22 (Ima2)",
-                "#47: D2h^1 (Pmmm)",
-                "#48: D2h^2 (Pnnn)",
-                "#49: D2h^3 (Pccm)",
-                "#50: D2h^4 (Pban)",
-                "#51: D2h^5 (Pmma)",
-                "#52: D2h^6 (Pnna)",
-                "#53: D2h^7 (Pmna)",
-                "#54: D2h^8 (Pcca)",
-                "#55: D2h^9 (Pbam)",
-                "#56: D2h^10 (Pccn)",
-                "#57: D2h^11 (Pbcm)",
-                "#58: D2h^12 (Pnnm)",
-                "#59: D2h^13 (Pmmn)",
-                "#60: D2h^14 (Pbcn)",
-                "#61: D2h^15 (Pbca)",
-                "#62: D2h^16 (Pnma)",
-                "#63: D2h^17 (Cmcm)",
-                "#64: D2h^18 (Cmce)",
-                "#65: D2h^19 (Cmmm)",
-                "#66: D2h^20 (Cccm)",
-                "#67: D2h^21 (Cmme)",
-                "#68: D2h^22 (Ccce)",
-                "#69: D2h^23 (Fmmm)",
-                "#70: D2h^24 (Fddd)",
-                "#71: D2h^25 (Immm)",
-                "#72: D2h^26 (Ibam)",
-                "#73: D2h^27 (Ibca)",
-                "#74: D2h^28 (Imma)",
-            ],
-        ],
-        "MPG": [
-            [
-                "MPG:6.1.17",
-                "MPG:6.2.18",
-                "MPG:6.3.19",
-                "MPG:6.4.123",
-                "MPG:7.1.20",
-                "MPG:7.2.21",
-                "MPG:7.3.22",
-                "MPG:7.4.23",
-                "MPG:7.5.124",
-                "MPG:8.1.24",
-                "MPG:8.2.25",
-                "MPG:8.3.26",
-                "MPG:8.4.27",
-                "MPG:8.5.28",
-                "MPG:8.6.125",
-                "MPG:8.7.126",
-                "MPG:8.8.127",
-                "MPG:8.9.128",
-            ],
-            [
-                "#6.1.17: 222",
-                "#6.2.18: 2221'",
-                "#6.3.19: 2'2'2",
-                "#6.4.123: 2'2'2",
-                "#7.1.20: mm2",
-                "#7.2.21: mm21'",
-                "#7.3.22: m'm2'",
-                "#7.4.23: m'm'2",
-                "#7.5.124: m'm2'",
-                "#8.1.24: mmm",
-                "#8.2.25: mmm1'",
-                "#8.3.26: m'mm",
-                "#8.4.27: m'm'm",
-                "#8.5.28: m'm'm'",
-                "#8.6.125: m'mm",
-                "#8.7.126: m'mm",
-                "#8.8.127: m'm'm",
-                "#8.9.128: m'm'm",
-            ],
-        ],
-        "MSG": [
-            [
-                "MSG:16.1",
-                "MSG:16.2",
-                "MSG:16.3",
-                "MSG:16.4",
-                "MSG:16.5",
-                "MSG:16.6",
-                "MSG:17.7",
-                "MSG:17.8",
-                "MSG:17.9",
-                "MSG:17.10",
-                "MSG:17.11",
-                "MSG:17.12",
-                "MSG:17.13",
-                "MSG:17.14",
-                "MSG:17.15",
-                "MSG:18.16",
-                "MSG:18.17",
-                "MSG:18.18",
-                "MSG:18.19",
-                "MSG:18.20",
-                "MSG:18.21",
-                "MSG:18.22",
-                "MSG:18.23",
-                "MSG:18.24",
-                "MSG:19.25",
-                "MSG:19.26",
-                "MSG:19.27",
-                "MSG:19.28",
-                "MSG:19.29",
-                "MSG:19.30",
-                "MSG:20.31",
-                "MSG:20.32",
-                "MSG:20.33",
-                "MSG:20.34",
-                "MSG:20.35",
-                "MSG:20.36",
-                "MSG:20.37",
-                "MSG:21.38",
-                "MSG:21.39",
-                "MSG:21.40",
-                "MSG:21.41",
-                "MSG:21.42",
-                "MSG:21.43",
-                "MSG:21.44",
-                "MSG:22.45",
-                "MSG:22.46",
-                "MSG:22.47",
-                "MSG:22.48",
-                "MSG:23.49",
-                "MSG:23.50",
-                "MSG:23.51",
-                "MSG:23.52",
-                "MSG:24.53",
-                "MSG:24.54",
-                "MSG:24.55",
-                "MSG:24.56",
-                "MSG:25.57",
-                "MSG:25.58",
-                "MSG:25.59",
-                "MSG:25.60",
-                "MSG:25.61",
-                "MSG:25.62",
-                "MSG:25.63",
-                "MSG:25.64",
-                "MSG:25.65",
-                "MSG:26.66",
-                "MSG:26.67",
-                "MSG:26.68",
-                "MSG:26.69",
-                "MSG:26.70",
-                "MSG:26.71",
-                "MSG:26.72",
-                "MSG:26.73",
-                "MSG:26.74",
-                "MSG:26.75",
-                "MSG:26.76",
-                "MSG:26.77",
-                "MSG:27.78",
-                "MSG:27.79",
-                "MSG:27.80",
-                "MSG:27.81",
-                "MSG:27.82",
-                "MSG:27.83",
-                "MSG:27.84",
-                "MSG:27.85",
-                "MSG:27.86",
-                "MSG:28.87",
-                "MSG:28.88",
-                "MSG:28.89",
-                "MSG:28.90",
-                "MSG:28.91",
-                "MSG:28.92",
-                "MSG:28.93",
-                "MSG:28.94",
-                "MSG:28.95",
-                "MSG:28.96",
-                "MSG:28.97",
-                "MSG:28.98",
-                "MSG:29.99",
-                "MSG:29.100",
-                "MSG:29.101",
-                "MSG:29.102",
-                "MSG:29.103",
-                "MSG:29.104",
-                "MSG:29.105",
-                "MSG:29.106",
-                "MSG:29.107",
-                "MSG:29.108",
-                "MSG:29.109",
-                "MSG:29.110",
-                "MSG:30.111",
-                "MSG:30.112",
-                "MSG:30.113",
-                "MSG:30.114",
-                "MSG:30.115",
-                "MSG:30.116",
-                "MSG:30.117",
-                "MSG:30.118",
-                "MSG:30.119",
-                "MSG:30.120",
-                "MSG:30.121",
-                "MSG:30.122",
-                "MSG:31.123",
-                "MSG:31.124",
-                "MSG:31.125",
-                "MSG:31.126",
-                "MSG:31.127",
-                "MSG:31.128",
-                "MSG:31.129",
-                "MSG:31.130",
-                "MSG:31.131",
-                "MSG:31.132",
-                "MSG:31.133",
-                "MSG:31.134",
-                "MSG:32.135",
-                "MSG:32.136",
-                "MSG:32.137",
-                "MSG:32.138",
-                "MSG:32.139",
-                "MSG:32.140",
-                "MSG:32.141",
-                "MSG:32.142",
-                "MSG:32.143",
-                "MSG:33.144",
-                "MSG:33.145",
-                "MSG:33.146",
-                "MSG:33.147",
-                "MSG:33.148",
-                "MSG:33.149",
-                "MSG:33.150",
-                "MSG:33.151",
-                "MSG:33.152",
-                "MSG:33.153",
-                "MSG:33.154",
-                "MSG:33.155",
-                "MSG:34.156",
-                "MSG:34.157",
-                "MSG:34.158",
-                "MSG:34.159",
-                "MSG:34.160",
-                "MSG:34.161",
-                "MSG:34.162",
-                "MSG:34.163",
-                "MSG:34.164",
-                "MSG:35.165",
-                "MSG:35.166",
-                "MSG:35.167",
-                "MSG:35.168",
-                "MSG:35.169",
-                "MSG:35.170",
-                "MSG:35.171",
-                "MSG:36.172",
-                "MSG:36.173",
-                "MSG:36.174",
-                "MSG:36.175",
-                "MSG:36.176",
-                "MSG:36.177",
-                "MSG:36.178",
-                "MSG:36.179",
-                "MSG:37.180",
-                "MSG:37.181",
-                "MSG:37.182",
-                "MSG:37.183",
-                "MSG:37.184",
-                "MSG:37.185",
-                "MSG:37.186",
-                "MSG:38.187",
-                "MSG:38.188",
-                "MSG:38.189",
-                "MSG:38.190",
-                "MSG:38.191",
-                "MSG:38.192",
-                "MSG:38.193",
-                "MSG:38.194",
-                "MSG:39.195",
-                "MSG:39.196",
-                "MSG:39.197",
-                "MSG:39.198",
-                "MSG:39.199",
-                "MSG:39.200",
-                "MSG:39.201",
-                "MSG:39.202",
-                "MSG:40.203",
-                "MSG:40.204",
-                "MSG:40.205",
-                "MSG:40.206",
-                "MSG:40.207",
-                "MSG:40.208",
-                "MSG:40.209",
-                "MSG:40.210",
-                "MSG:41.211",
-                "MSG:41.212",
-                "MSG:41.213",
-                "MSG:41.214",
-                "MSG:41.215",
-                "MSG:41.216",
-                "MSG:41.217",
-                "MSG:41.218",
-                "MSG:42.219",
-                "MSG:42.220",
-                "MSG:42.221",
-                "MSG:42.222",
-                "MSG:42.223",
-                "MSG:43.224",
-                "MSG:43.225",
-                "MSG:43.226",
-                "MSG:43.227",
-                "MSG:43.228",
-                "MSG:44.229",
-                "MSG:44.230",
-                "MSG:44.231",
-                "MSG:44.232",
-                "MSG:44.233",
-                "MSG:44.234",
-                "MSG:45.235",
-                "MSG:45.236",
-                "MSG:45.237",
-                "MSG:45.238",
-                "MSG:45.239",
-                "MSG:45.240",
-                "MSG:46.241",
-                "MSG:46.242",
-                "MSG:46.243",
-                "MSG:46.244",
-                "MSG:46.245",
-                "MSG:46.246",
-                "MSG:46.247",
-                "MSG:46.248",
-                "MSG:47.249",
-                "MSG:47.250",
-                "MSG:47.251",
-                "MSG:47.252",
-                "MSG:47.253",
-                "MSG:47.254",
-                "MSG:47.255",
-                "MSG:47.256",
-                "MSG:48.257",
-                "MSG:48.258",
-                "MSG:48.259",
-                "MSG:48.260",
-                "MSG:48.261",
-                "MSG:48.262",
-                "MSG:48.263",
-                "MSG:48.264",
-                "MSG:49.265",
-                "MSG:49.266",
-                "MSG:49.267",
-                "MSG:49.268",
-                "MSG:49.269",
-                "MSG:49.270",
-                "MSG:49.271",
-                "MSG:49.272",
-                "MSG:49.273",
-                "MSG:49.274",
-                "MSG:49.275",
-                "MSG:49.276",
-                "MSG:50.277",
-                "MSG:50.278",
-                "MSG:50.279",
-                "MSG:50.280",
-                "MSG:50.281",
-                "MSG:50.282",
-                "MSG:50.283",
-                "MSG:50.284",
-                "MSG:50.285",
-                "MSG:50.286",
-                "MSG:50.287",
-                "MSG:50.288",
-                "MSG:51.289",
-                "MSG:51.290",
-                "MSG:51.291",
-                "MSG:51.292",
-                "MSG:51.293",
-                "MSG:51.294",
-                "MSG:51.295",
-                "MSG:51.296",
-                "MSG:51.297",
-                "MSG:51.298",
-                "MSG:51.299",
-                "MSG:51.300",
-                "MSG:51.301",
-                "MSG:51.302",
-                "MSG:51.303",
-                "MSG:51.304",
-                "MSG:52.305",
-                "MSG:52.306",
-                "MSG:52.307",
-                "MSG:52.308",
-                "MSG:52.309",
-                "MSG:52.310",
-                "MSG:52.311",
-                "MSG:52.312",
-                "MSG:52.313",
-                "MSG:52.314",
-                "MSG:52.315",
-                "MSG:52.316",
-                "MSG:52.317",
-                "MSG:52.318",
-                "MSG:52.319",
-                "MSG:52.320",
-                "MSG:53.321",
-                "MSG:53.322",
-                "MSG:53.323",
-                "MSG:53.324",
-                "MSG:53.325",
-                "MSG:53.326",
-                "MSG:53.327",
-                "MSG:53.328",
-                "MSG:53.329",
-                "MSG:53.330",
-                "MSG:53.331",
-                "MSG:53.332",
-                "MSG:53.333",
-                "MSG:53.334",
-                "MSG:53.335",
-                "MSG:53.336",
-                "MSG:54.337",
-                "MSG:54.338",
-                "MSG:54.339",
-                "MSG:54.340",
-                "MSG:54.341",
-                "MSG:54.342",
-                "MSG:54.343",
-                "MSG:54.344",
-                "MSG:54.345",
-                "MSG:54.346",
-                "MSG:54.347",
-                "MSG:54.348",
-                "MSG:54.349",
-                "MSG:54.350",
-                "MSG:54.351",
-                "MSG:54.352",
-                "MSG:55.353",
-                "MSG:55.354",
-                "MSG:55.355",
-                "MSG:55.356",
-                "MSG:55.357",
-                "MSG:55.358",
-                "MSG:55.359",
-                "MSG:55.360",
-                "MSG:55.361",
-                "MSG:55.362",
-                "MSG:55.363",
-                "MSG:55.364",
-                "MSG:56.365",
-                "MSG:56.366",
-                "MSG:56.367",
-                "MSG:56.368",
-                "MSG:56.369",
-                "MSG:56.370",
-                "MSG:56.371",
-                "MSG:56.372",
-                "MSG:56.373",
-                "MSG:56.374",
-                "MSG:56.375",
-                "MSG:56.376",
-                "MSG:57.377",
-                "MSG:57.378",
-                "MSG:57.379",
-                "MSG:57.380",
-                "MSG:57.381",
-                "MSG:57.382",
-                "MSG:57.383",
-                "MSG:57.384",
-                "MSG:57.385",
-                "MSG:57.386",
-                "MSG:57.387",
-                "MSG:57.388",
-                "MSG:57.389",
-                "MSG:57.390",
-                "MSG:57.391",
-                "MSG:57.392",
-                "MSG:58.393",
-                "MSG:58.394",
-                "MSG:58.395",
-                "MSG:58.396",
-                "MSG:58.397",
-                "MSG:58.398",
-                "MSG:58.399",
-                "MSG:58.400",
-                "MSG:58.401",
-                "MSG:58.402",
-                "MSG:58.403",
-                "MSG:58.404",
-                "MSG:59.405",
-                "MSG:59.406",
-                "MSG:59.407",
-                "MSG:59.408",
-                "MSG:59.409",
-                "MSG:59.410",
-                "MSG:59.411",
-                "MSG:59.412",
-                "MSG:59.413",
-                "MSG:59.414",
-                "MSG:59.415",
-                "MSG:59.416",
-                "MSG:60.417",
-                "MSG:60.418",
-                "MSG:60.419",
-                "MSG:60.420",
-                "MSG:60.421",
-                "MSG:60.422",
-                "MSG:60.423",
-                "MSG:60.424",
-                "MSG:60.425",
-                "MSG:60.426",
-                "MSG:60.427",
-                "MSG:60.428",
-                "MSG:60.429",
-                "MSG:60.430",
-                "MSG:60.431",
-                "MSG:60.432",
-                "MSG:61.433",
-                "MSG:61.434",
-                "MSG:61.435",
-                "MSG:61.436",
-                "MSG:61.437",
-                "MSG:61.438",
-                "MSG:61.439",
-                "MSG:61.440",
-                "MSG:62.441",
-                "MSG:62.442",
-                "MSG:62.443",
-                "MSG:62.444",
-                "MSG:62.445",
-                "MSG:62.446",
-                "MSG:62.447",
-                "MSG:62.448",
-                "MSG:62.449",
-                "MSG:62.450",
-                "MSG:62.451",
-                "MSG:62.452",
-                "MSG:62.453",
-                "MSG:62.454",
-                "MSG:62.455",
-                "MSG:62.456",
-                "MSG:63.457",
-                "MSG:63.458",
-                "MSG:63.459",
-                "MSG:63.460",
-                "MSG:63.461",
-                "MSG:63.462",
-                "MSG:63.463",
-                "MSG:63.464",
-                "MSG:63.465",
-                "MSG:63.466",
-                "MSG:63.467",
-                "MSG:63.468",
-                "MSG:64.469",
-                "MSG:64.470",
-                "MSG:64.471",
-                "MSG:64.472",
-                "MSG:64.473",
-                "MSG:64.474",
-                "MSG:64.475",
-                "MSG:64.476",
-                "MSG:64.477",
-                "MSG:64.478",
-                "MSG:64.479",
-                "MSG:64.480",
-                "MSG:65.481",
-                "MSG:65.482",
-                "MSG:65.483",
-                "MSG:65.484",
-                "MSG:65.485",
-                "MSG:65.486",
-                "MSG:65.487",
-                "MSG:65.488",
-                "MSG:65.489",
-                "MSG:65.490",
-                "MSG:66.491",
-                "MSG:66.492",
-                "MSG:66.493",
-                "MSG:66.494",
-                "MSG:66.495",
-                "MSG:66.496",
-                "MSG:66.497",
-                "MSG:66.498",
-                "MSG:66.499",
-                "MSG:66.500",
-                "MSG:67.501",
-                "MSG:67.502",
-                "MSG:67.503",
-                "MSG:67.504",
-                "MSG:67.505",
-                "MSG:67.506",
-                "MSG:67.507",
-                "MSG:67.508",
-                "MSG:67.509",
-                "MSG:67.510",
-                "MSG:68.511",
-                "MSG:68.512",
-                "MSG:68.513",
-                "MSG:68.514",
-                "MSG:68.515",
-                "MSG:68.516",
-                "MSG:68.517",
-                "MSG:68.518",
-                "MSG:68.519",
-                "MSG:68.520",
-                "MSG:69.521",
-                "MSG:69.522",
-                "MSG:69.523",
-                "MSG:69.524",
-                "MSG:69.525",
-                "MSG:69.526",
-                "MSG:70.527",
-                "MSG:70.528",
-                "MSG:70.529",
-                "MSG:70.530",
-                "MSG:70.531",
-                "MSG:70.532",
-                "MSG:71.533",
-                "MSG:71.534",
-                "MSG:71.535",
-                "MSG:71.536",
-                "MSG:71.537",
-                "MSG:71.538",
-                "MSG:72.539",
-                "MSG:72.540",
-                "MSG:72.541",
-                "MSG:72.542",
-                "MSG:72.543",
-                "MSG:72.544",
-                "MSG:72.545",
-                "MSG:72.546",
-                "MSG:72.547",
-                "MSG:73.548",
-                "MSG:73.549",
-                "MSG:73.550",
-                "MSG:73.551",
-                "MSG:73.552",
-                "MSG:73.553",
-                "MSG:74.554",
-                "MSG:74.555",
-                "MSG:74.556",
-                "MSG:74.557",
-                "MSG:74.558",
-                "MSG:74.559",
-                "MSG:74.560",
-                "MSG:74.561",
-                "MSG:74.562",
-            ],
-            [
-                "#16.1: P222",
-                "#16.2: P2221'",
-                "#16.3: P2'2'2",
-                "#16.4: P_a222",
-                "#16.5: P_C222",
-                "#16.6: P_I222",
-                "#17.7: P222_1",
-                "#17.8: P222_11'",
-                "#17.9: P2'2'2_1",
-                "#17.10: P22'2_1'",
-                "#17.11: P_a222_1",
-                "#17.12: P_c222_1",
-                "#17.13: P_B222_1",
-                "#17.14: P_C222_1",
-                "#17.15: P_I222_1",
-                "#18.16: P2_12_12",
-                "#18.17: P2_12_121'",
-                "#18.18: P2_1'2_1'2",
-                "#18.19: P2_12_1'2'",
-                "#18.20: P_b2_12_12",
-                "#18.21: P_c2_12_12",
-                "#18.22: P_B2_12_12",
-                "#18.23: P_C2_12_12",
-                "#18.24: P_I2_12_12",
-                "#19.25: P2_12_12_1",
-                "#19.26: P2_12_12_11'",
-                "#19.27: P2_1'2_1'2_1",
-                "#19.28: P_c2_12_12_1",
-                "#19.29: P_C2_12_12_1",
-                "#19.30: P_I2_12_12_1",
-                "#20.31: C222_1",
-                "#20.32: C222_11'",
-                "#20.33: C2'2'2_1",
-                "#20.34: C22'2_1'",
-                "#20.35: C_c222_1",
-                "#20.36: C_a222_1",
-                "#20.37: C_A222_1",
-                "#21.38: C222",
-                "#21.39: C2221'",
-                "#21.40: C2'2'2",
-                "#21.41: C22'2'",
-                "#21.42: C_c222",
-                "#21.43: C_a222",
-                "#21.44: C_A222",
-                "#22.45: F222",
-                "#22.46: F2221'",
-                "#22.47: F2'2'2",
-                "#22.48: F_S222",
-                "#23.49: I222",
-                "#23.50: I2221'",
-                "#23.51: I2'2'2",
-                "#23.52: I_c222",
-                "#24.53: I2_12_12_1",
-                "#24.54: I2_12_12_11'",
-                "#24.55: I2_1'2_1'2_1",
-                "#24.56: I_c2_12_12_1",
-                "#25.57: Pmm2",
-                "#25.58: Pmm21'",
-                "#25.59: Pm'm2'",
-                "#25.60: Pm'm'2",
-                "#25.61: P_cmm2",
-                "#25.62: P_amm2",
-                "#25.63: P_Cmm2",
-                "#25.64: P_Amm2",
-                "#25.65: P_Imm2",
-                "#26.66: Pmc2_1",
-                "#26.67: Pmc2_11'",
-                "#26.68: Pm'c2_1'",
-                "#26.69: Pmc'2_1'",
-                "#26.70: Pm'c'2_1",
-                "#26.71: P_amc2_1",
-                "#26.72: P_bmc2_1",
-                "#26.73: P_cmc2_1",
-                "#26.74: P_Amc2_1",
-                "#26.75: P_Bmc2_1",
-                "#26.76: P_Cmc2_1",
-                "#26.77: P_Imc2_1",
-                "#27.78: Pcc2",
-                "#27.79: Pcc21'",
-                "#27.80: Pc'c2'",
-                "#27.81: Pc'c'2",
-                "#27.82: P_ccc2",
-                "#27.83: P_acc2",
-                "#27.84: P_Ccc2",
-                "#27.85: P_Acc2",
-                "#27.86: P_Icc2",
-                "#28.87: Pma2",
-                "#28.88: Pma21'",
-                "#28.89: Pm'a2'",
-                "#28.90: Pma'2'",
-                "#28.91: Pm'a'2",
-                "#28.92: P_ama2",
-                "#28.93: P_bma2",
-                "#28.94: P_cma2",
-                "#28.95: P_Ama2",
-                "#28.96: P_Bma2",
-                "#28.97: P_Cma2",
-                "#28.98: P_Ima2",
-                "#29.99: Pca2_1",
-                "#29.100: Pca2_11'",
-                "#29.101: Pc'a2_1'",
-                "#29.102: Pca'2_1'",
-                "#29.103: Pc'a'2_1",
-                "#29.104: P_aca2_1",
-                "#29.105: P_bca2_1",
-                "#29.106: P_cca2_1",
-                "#29.107: P_Aca2_1",
-                "#29.108: P_Bca2_1",
-                "#29.109: P_Cca2_1",
-                "#29.110: P_Ica2_1",
-                "#30.111: Pnc2",
-                "#30.112: Pnc21'",
-                "#30.113: Pn'c2'",
-                "#30.114: Pnc'2'",
-                "#30.115: Pn'c'2",
-                "#30.116: P_anc2",
-                "#30.117: P_bnc2",
-                "#30.118: P_cnc2",
-                "#30.119: P_Anc2",
-                "#30.120: P_Bnc2",
-                "#30.121: P_Cnc2",
-                "#30.122: P_Inc2",
-                "#31.123: Pmn2_1",
-                "#31.124: Pmn2_11'",
-                "#31.125: Pm'n2_1'",
-                "#31.126: Pmn'2_1'",
-                "#31.127: Pm'n'2_1",
-                "#31.128: P_amn2_1",
-                "#31.129: P_bmn2_1",
-                "#31.130: P_cmn2_1",
-                "#31.131: P_Amn2_1",
-                "#31.132: P_Bmn2_1",
-                "#31.133: P_Cmn2_1",
-                "#31.134: P_Imn2_1",
-                "#32.135: Pba2",
-                "#32.136: Pba21'",
-                "#32.137: Pb'a2'",
-                "#32.138: Pb'a'2",
-                "#32.139: P_cba2",
-                "#32.140: P_bba2",
-                "#32.141: P_Cba2",
-                "#32.142: P_Aba2",
-                "#32.143: P_Iba2",
-                "#33.144: Pna2_1",
-                "#33.145: Pna2_11'",
-                "#33.146: Pn'a2_1'",
-                "#33.147: Pna'2_1'",
-                "#33.148: Pn'a'2_1",
-                "#33.149: P_ana2_1",
-                "#33.150: P_bna2_1",
-                "#33.151: P_cna2_1",
-                "#33.152: P_Ana2_1",
-                "#33.153: P_Bna2_1",
-                "#33.154: P_Cna2_1",
-                "#33.155: P_Ina2_1",
-                "#34.156: Pnn2",
-                "#34.157: Pnn21'",
-                "#34.158: Pn'n2'",
-                "#34.159: Pn'n'2",
-                "#34.160: P_ann2",
-                "#34.161: P_cnn2",
-                "#34.162: P_Ann2",
-                "#34.163: P_Cnn2",
-                "#34.164: P_Inn2",
-                "#35.165: Cmm2",
-                "#35.166: Cmm21'",
-                "#35.167: Cm'm2'",
-                "#35.168: Cm'm'2",
-                "#35.169: C_cmm2",
-                "#35.170: C_amm2",
-                "#35.171: C_Amm2",
-                "#36.172: Cmc2_1",
-                "#36.173: Cmc2_11'",
-                "#36.174: Cm'c2_1'",
-                "#36.175: Cmc'2_1'",
-                "#36.176: Cm'c'2_1",
-                "#36.177: C_cmc2_1",
-                "#36.178: C_amc2_1",
-                "#36.179: C_Amc2_1",
-                "#37.180: Ccc2",
-                "#37.181: Ccc21'",
-                "#37.182: Cc'c2'",
-                "#37.183: Cc'c'2",
-                "#37.184: C_ccc2",
-                "#37.185: C_acc2",
-                "#37.186: C_Acc2",
-                "#38.187: Amm2",
-                "#38.188: Amm21'",
-                "#38.189: Am'm2'",
-                "#38.190: Amm'2'",
-                "#38.191: Am'm'2",
-                "#38.192: A_amm2",
-                "#38.193: A_bmm2",
-                "#38.194: A_Bmm2",
-                "#39.195: Abm2",
-                "#39.196: Abm21'",
-                "#39.197: Ab'm2'",
-                "#39.198: Abm'2'",
-                "#39.199: Ab'm'2",
-                "#39.200: A_abm2",
-                "#39.201: A_bbm2",
-                "#39.202: A_Bbm2",
-                "#40.203: Ama2",
-                "#40.204: Ama21'",
-                "#40.205: Am'a2'",
-                "#40.206: Ama'2'",
-                "#40.207: Am'a'2",
-                "#40.208: A_ama2",
-                "#40.209: A_bma2",
-                "#40.210: A_Bma2",
-                "#41.211: Aba2",
-                "#41.212: Aba21'",
-                "#41.213: Ab'a2'",
-                "#41.214: Aba'2'",
-                "#41.215: Ab'a'2",
-                "#41.216: A_aba2",
-                "#41.217: A_bba2",
-                "#41.218: A_Bba2",
-                "#42.219: Fmm2",
-                "#42.220: Fmm21'",
-                "#42.221: Fm'm2'",
-                "#42.222: Fm'm'2",
-                "#42.223: F_Smm2",
-                "#43.224: Fdd2",
-                "#43.225: Fdd21'",
-                "#43.226: Fd'd2'",
-                "#43.227: Fd'd'2",
-                "#43.228: F_Sdd2",
-                "#44.229: Imm2",
-                "#44.230: Imm21'",
-                "#44.231: Im'm2'",
-                "#44.232: Im'm'2",
-                "#44.233: I_cmm2",
-                "#44.234: I_amm2",
-                "#45.235: Iba2",
-                "#45.236: Iba21'",
-                "#45.237: Ib'a2'",
-                "#45.238: Ib'a'2",
-                "#45.239: I_cba2",
-                "#45.240: I_aba2",
-                "#46.241: Ima2",
-                "#46.242: Ima21'",
-                "#46.243: Im'a2'",
-                "#46.244: Ima'2'",
-                "#46.245: Im'a'2",
-                "#46.246: I_cma2",
-                "#46.247: I_ama2",
-                "#46.248: I_bma2",
-                "#47.249: Pmmm",
-                "#47.250: Pmmm1'",
-                "#47.251: Pm'mm",
-                "#47.252: Pm'm'm",
-                "#47.253: Pm'm'm'",
-                "#47.254: P_ammm",
-                "#47.255: P_Cmmm",
-                "#47.256: P_Immm",
-                "#48.257: Pnnn",
-                "#48.258: Pnnn1'",
-                "#48.259: Pn'nn",
-                "#48.260: Pn'n'n",
-                "#48.261: Pn'n'n'",
-                "#48.262: P_cnnn",
-                "#48.263: P_Cnnn",
-                "#48.264: P_Innn",
-                "#49.265: Pccm",
-                "#49.266: Pccm1'",
-                "#49.267: Pc'cm",
-                "#49.268: Pccm'",
-                "#49.269: Pc'c'm",
-                "#49.270: Pc'cm'",
-                "#49.271: Pc'c'm'",
-                "#49.272: P_accm",
-                "#49.273: P_cccm",
-                "#49.274: P_Bccm",
-                "#49.275: P_Cccm",
-                "#49.276: P_Iccm",
-                "#50.277: Pban",
-                "#50.278: Pban1'",
-                "#50.279: Pb'an",
-                "#50.280: Pban'",
-                "#50.281: Pb'a'n",
-                "#50.282: Pb'an'",
-                "#50.283: Pb'a'n'",
-                "#50.284: P_aban",
-                "#50.285: P_cban",
-                "#50.286: P_Aban",
-                "#50.287: P_Cban",
-                "#50.288: P_Iban",
-                "#51.289: Pmma",
-                "#51.290: Pmma1'",
-                "#51.291: Pm'ma",
-                "#51.292: Pmm'a",
-                "#51.293: Pmma'",
-                "#51.294: Pm'm'a",
-                "#51.295: Pmm'a'",
-                "#51.296: Pm'ma'",
-                "#51.297: Pm'm'a'",
-                "#51.298: P_amma",
-                "#51.299: P_bmma",
-                "#51.300: P_cmma",
-                "#51.301: P_Amma",
-                "#51.302: P_Bmma",
-                "#51.303: P_Cmma",
-                "#51.304: P_Imma",
-                "#52.305: Pnna",
-                "#52.306: Pnna1'",
-                "#52.307: Pn'na",
-                "#52.308: Pnn'a",
-                "#52.309: Pnna'",
-                "#52.310: Pn'n'a",
-                "#52.311: Pnn'a'",
-                "#52.312: Pn'na'",
-                "#52.313: Pn'n'a'",
-                "#52.314: P_anna",
-                "#52.315: P_bnna",
-                "#52.316: P_cnna",
-                "#52.317: P_Anna",
-                "#52.318: P_Bnna",
-                "#52.319: P_Cnna",
-                "#52.320: P_Inna",
-                "#53.321: Pmna",
-                "#53.322: Pmna1'",
-                "#53.323: Pm'na",
-                "#53.324: Pmn'a",
-                "#53.325: Pmna'",
-                "#53.326: Pm'n'a",
-                "#53.327: Pmn'a'",
-                "#53.328: Pm'na'",
-                "#53.329: Pm'n'a'",
-                "#53.330: P_amna",
-                "#53.331: P_bmna",
-                "#53.332: P_cmna",
-                "#53.333: P_Amna",
-                "#53.334: P_Bmna",
-                "#53.335: P_Cmna",
-                "#53.336: P_Imna",
-                "#54.337: Pcca",
-                "#54.338: Pcca1'",
-                "#54.339: Pc'ca",
-                "#54.340: Pcc'a",
-                "#54.341: Pcca'",
-                "#54.342: Pc'c'a",
-                "#54.343: Pcc'a'",
-                "#54.344: Pc'ca'",
-                "#54.345: Pc'c'a'",
-                "#54.346: P_acca",
-                "#54.347: P_bcca",
-                "#54.348: P_ccca",
-                "#54.349: P_Acca",
-                "#54.350: P_Bcca",
-                "#54.351: P_Ccca",
-                "#54.352: P_Icca",
-                "#55.353: Pbam",
-                "#55.354: Pbam1'",
-                "#55.355: Pb'am",
-                "#55.356: Pbam'",
-                "#55.357: Pb'a'm",
-                "#55.358: Pb'am'",
-                "#55.359: Pb'a'm'",
-                "#55.360: P_abam",
-                "#55.361: P_cbam",
-                "#55.362: P_Abam",
-                "#55.363: P_Cbam",
-                "#55.364: P_Ibam",
-                "#56.365: Pccn",
-                "#56.366: Pccn1'",
-                "#56.367: Pc'cn",
-                "#56.368: Pccn'",
-                "#56.369: Pc'c'n",
-                "#56.370: Pc'cn'",
-                "#56.371: Pc'c'n'",
-                "#56.372: P_bccn",
-                "#56.373: P_cccn",
-                "#56.374: P_Accn",
-                "#56.375: P_Cccn",
-                "#56.376: P_Iccn",
-                "#57.377: Pbcm",
-                "#57.378: Pbcm1'",
-                "#57.379: Pb'cm",
-                "#57.380: Pbc'm",
-                "#57.381: Pbcm'",
-                "#57.382: Pb'c'm",
-                "#57.383: Pbc'm'",
-                "#57.384: Pb'cm'",
-                "#57.385: Pb'c'm'",
-                "#57.386: P_abcm",
-                "#57.387: P_bbcm",
-                "#57.388: P_cbcm",
-                "#57.389: P_Abcm",
-                "#57.390: P_Bbcm",
-                "#57.391: P_Cbcm",
-                "#57.392: P_Ibcm",
-                "#58.393: Pnnm",
-                "#58.394: Pnnm1'",
-                "#58.395: Pn'nm",
-                "#58.396: Pnnm'",
-                "#58.397: Pn'n'm",
-                "#58.398: Pnn'm'",
-                "#58.399: Pn'n'm'",
-                "#58.400: P_annm",
-                "#58.401: P_cnnm",
-                "#58.402: P_Bnnm",
-                "#58.403: P_Cnnm",
-                "#58.404: P_Innm",
-                "#59.405: Pmmn",
-                "#59.406: Pmmn1'",
-                "#59.407: Pm'mn",
-                "#59.408: Pmmn'",
-                "#59.409: Pm'm'n",
-                "#59.410: Pmm'n'",
-                "#59.411: Pm'm'n'",
-                "#59.412: P_bmmn",
-                "#59.413: P_cmmn",
-                "#59.414: P_Bmmn",
-                "#59.415: P_Cmmn",
-                "#59.416: P_Immn",
-                "#60.417: Pbcn",
-                "#60.418: Pbcn1'",
-                "#60.419: Pb'cn",
-                "#60.420: Pbc'n",
-                "#60.421: Pbcn'",
-                "#60.422: Pb'c'n",
-                "#60.423: Pbc'n'",
-                "#60.424: Pb'cn'",
-                "#60.425: Pb'c'n'",
-                "#60.426: P_abcn",
-                "#60.427: P_bbcn",
-                "#60.428: P_cbcn",
-                "#60.429: P_Abcn",
-                "#60.430: P_Bbcn",
-                "#60.431: P_Cbcn",
-                "#60.432: P_Ibcn",
-                "#61.433: Pbca",
-                "#61.434: Pbca1'",
-                "#61.435: Pb'ca",
-                "#61.436: Pb'c'a",
-                "#61.437: Pb'c'a'",
-                "#61.438: P_abca",
-                "#61.439: P_Cbca",
-                "#61.440: P_Ibca",
-                "#62.441: Pnma",
-                "#62.442: Pnma1'",
-                "#62.443: Pn'ma",
-                "#62.444: Pnm'a",
-                "#62.445: Pnma'",
-                "#62.446: Pn'm'a",
-                "#62.447: Pnm'a'",
-                "#62.448: Pn'ma'",
-                "#62.449: Pn'm'a'",
-                "#62.450: P_anma",
-                "#62.451: P_bnma",
-                "#62.452: P_cnma",
-                "#62.453: P_Anma",
-                "#62.454: P_Bnma",
-                "#62.455: P_Cnma",
-                "#62.456: P_Inma",
-                "#63.457: Cmcm",
-                "#63.458: Cmcm1'",
-                "#63.459: Cm'cm",
-                "#63.460: Cmc'm",
-                "#63.461: Cmcm'",
-                "#63.462: Cm'c'm",
-                "#63.463: Cmc'm'",
-                "#63.464: Cm'cm'",
-                "#63.465: Cm'c'm'",
-                "#63.466: C_cmcm",
-                "#63.467: C_amcm",
-                "#63.468: C_Amcm",
-                "#64.469: Cmca",
-                "#64.470: Cmca1'",
-                "#64.471: Cm'ca",
-                "#64.472: Cmc'a",
-                "#64.473: Cmca'",
-                "#64.474: Cm'c'a",
-                "#64.475: Cmc'a'",
-                "#64.476: Cm'ca'",
-                "#64.477: Cm'c'a'",
-                "#64.478: C_cmca",
-                "#64.479: C_amca",
-                "#64.480: C_Amca",
-                "#65.481: Cmmm",
-                "#65.482: Cmmm1'",
-                "#65.483: Cm'mm",
-                "#65.484: Cmmm'",
-                "#65.485: Cm'm'm",
-                "#65.486: Cmm'm'",
-                "#65.487: Cm'm'm'",
-                "#65.488: C_cmmm",
-                "#65.489: C_ammm",
-                "#65.490: C_Ammm",
-                "#66.491: Cccm",
-                "#66.492: Cccm1'",
-                "#66.493: Cc'cm",
-                "#66.494: Cccm'",
-                "#66.495: Cc'c'm",
-                "#66.496: Ccc'm'",
-                "#66.497: Cc'c'm'",
-                "#66.498: C_cccm",
-                "#66.499: C_accm",
-                "#66.500: C_Accm",
-                "#67.501: Cmma",
-                "#67.502: Cmma1'",
-                "#67.503: Cm'ma",
-                "#67.504: Cmma'",
-                "#67.505: Cm'm'a",
-                "#67.506: Cmm'a'",
-                "#67.507: Cm'm'a'",
-                "#67.508: C_cmma",
-                "#67.509: C_amma",
-                "#67.510: C_Amma",
-                "#68.511: Ccca",
-                "#68.512: Ccca1'",
-                "#68.513: Cc'ca",
-                "#68.514: Ccca'",
-                "#68.515: Cc'c'a",
-                "#68.516: Ccc'a'",
-                "#68.517: Cc'c'a'",
-                "#68.518: C_ccca",
-                "#68.519: C_acca",
-                "#68.520: C_Acca",
-                "#69.521: Fmmm",
-                "#69.522: Fmmm1'",
-                "#69.523: Fm'mm",
-                "#69.524: Fm'm'm",
-                "#69.525: Fm'm'm'",
-                "#69.526: F_Smmm",
-                "#70.527: Fddd",
-                "#70.528: Fddd1'",
-                "#70.529: Fd'dd",
-                "#70.530: Fd'd'd",
-                "#70.531: Fd'd'd'",
-                "#70.532: F_Sddd",
-                "#71.533: Immm",
-                "#71.534: Immm1'",
-                "#71.535: Im'mm",
-                "#71.536: Im'm'm",
-                "#71.537: Im'm'm'",
-                "#71.538: I_cmmm",
-                "#72.539: Ibam",
-                "#72.540: Ibam1'",
-                "#72.541: Ib'am",
-                "#72.542: Ibam'",
-                "#72.543: Ib'a'm",
-                "#72.544: Iba'm'",
-                "#72.545: Ib'a'm'",
-                "#72.546: I_cbam",
-                "#72.547: I_bbam",
-                "#73.548: Ibca",
-                "#73.549: Ibca1'",
-                "#73.550: Ib'ca",
-                "#73.551: Ib'c'a",
-                "#73.552: Ib'c'a'",
-                "#73.553: I_cbca",
-                "#74.554: Imma",
-                "#74.555: Imma1'",
-                "#74.556: Im'ma",
-                "#74.557: Imma'",
-                "#74.558: Im'm'a",
-                "#74.559: Imm'a'",
-                "#74.560: Im'm'a'",
-                "#74.561: I_cmma",
-                "#74.562: I_bmma",
-            ],
-        ],
-    },
-    "tetragonal": {
-        "PG": [
-            ["PG:9", "PG:10", "PG:11", "PG:12", "PG:13", "PG:14", "PG:15", "PG:33"],
-            [
-                "#9: C4 (4)",
-                "#10: S4 (-4)",
-                "#11: C4h (4/m)",
-                "#12: D4 (422)",
-                "#13: C4v (4mm)",
-                "#14: D2d (-42m)",
-                "#15: D4h (4/mmm)",
-                "#33: D2d-1 (-42m)",
-            ],
-        ],
-        "SG": [
-            [
-                "SG:75",
-                "SG:76",
-                "SG:77",
-                "SG:78",
-                "SG:79",
-                "SG:80",
-                "SG:81",
-                "SG:82",
-                "SG:83",
-                "SG:84",
-                "SG:85",
-                "SG:86",
-                "SG:87",
-                "SG:88",
-                "SG:89",
-                "SG:90",
-                "SG:91",
-                "SG:92",
-                "SG:93",
-                "SG:94",
-                "SG:95",
-                "SG:96",
-                "SG:97",
-                "SG:98",
-                "SG:99",
-                "SG:100",
-                "SG:101",
-                "SG:102",
-                "SG:103",
-                "SG:104",
-                "SG:105",
-                "SG:106",
-                "SG:107",
-                "SG:108",
-                "SG:109",
-                "SG:110",
-                "SG:111",
-                "SG:112",
-                "SG:113",
-                "SG:114",
-                "SG:115",
-                "SG:116",
-                "SG:117",
-                "SG:118",
-                "SG:119",
-                "SG:120",
-                "SG:121",
-                "SG:122",
-                "SG:123",
-                "SG:124",
-                "SG:125",
-                "SG:126",
-                "SG:127",
-                "SG:128",
-                "SG:129",
-                "SG:130",
-                "SG:131",
-                "SG:132",
-                "SG:133",
-                "SG:134",
-                "SG:135",
-                "SG:136",
-                "SG:137",
-                "SG:138",
-                "SG:139",
-                "SG:140",
-                "SG:141",
-                "SG:142",
-            ],
-            [
-                "#75: C4^1 (P4)",
-                "#76: C4^2 (P4_1)",
-                "#77: C4^3 (P4_2)",
-                "#78: C4^4 (P4_3)",
-                "#79: C4^5 (I4)",
-                "#80: C4^6 (I4_1)",
-                "#81: S4^1 (P-4)",
-                "#82: S4^2 (I-4)",
-                "#83: C4h^1 (P4/m)",
-                "#84: C4h^2 (P4_2/m)",
-                "#85: C4h^3 (P4/n)",
-                "#86: C4h^4 (P4_2/n)",
-                "#87: C4h^5 (I4/m)",
-                "#88: C4h^6 (I4_1/a)",
-                "#89: D4^1 (P422)",
-                "#90: D4^2 (P42_12)",
-                "#91: D4^3 (P4_122)",
-                "#92: D4^4 (P4_12_12)",
-                "#93: D4^5 (P4_222)",
-                "#94: D4^6 (P4_22_12)",
-                "#95: D4^7 (P4_322)",
-                "#96: D4^8 (P4_32_12)",
-                "#97: D4^9 (I422)",
-                "#98: D4^10 (I4_122)",
-                "#99: C4v^1 (P4mm)",
-                "#100: C4v^2 (P4bm)",
-                "#101: C4v^3 (P4_2cm)",
-                "#102: C4v^4 (P4_2nm)",
-                "#103: C4v^5 (P4cc)",
-                "#104: C4v^6 (P4nc)",
-                "#105: C4v^7 (P4_2mc)",
-                "#106: C4v^8 (P4_2bc)",
-                "#107: C4v^9 (I4mm)",
-                "#108: C4v^10 (I4cm)",
-                "#109: C4v^11 (I4_1md)",
-                "#110: C4v^12 (I4_1cd)",
-                "#111: D2d^1 (P-42m)",
-                "#112: D2d^2 (P-42c)",
-                "#113: D2d^3 (P-42_1m)",
-                "#114: D2d^4 (P-42_1c)",
-                "#115: D2d^5 (P-4m2)",
-                "#116: D2d^6 (P-4c2)",
-                "#117: D2d^7 (P-4b2)",
-                "#118: D2d^8 (P-4n2)",
-                "#119: D2d^9 (I-4m2)",
-                "#120: D2d^10 (I-4c2)",
-                "#121: D2d^11 (I-42m)",
-                "#122: D2d^12 (I-42d)",
-                "#123: D4h^1 (P4/mmm)",
-                "#124: D4h^2 (P4/mcc)",
-                "#125: D4h^3 (P4/nbm)",
-                "#126: D4h^4 (P4/nnc)",
-                "#127: D4h^5 (P4/mbm)",
-                "#128: D4h^6 (P4/mnc)",
-                "#129: D4h^7 (P4/nmm)",
-                "#130: D4h^8 (P4/ncc)",
-                "#131: D4h^9 (P4_2/mmc)",
-                "#132: D4h^10 (P4_2/mcm)",
-                "#133: D4h^11 (P4_2/nbc)",
-                "#134: D4h^12 (P4_2/nnm)",
-                "#135: D4h^13 (P4_2/mbc)",
-                "#136: D4h^14 (P4_2/mnm)",
-                "#137: D4h^15 (P4_2/nmc)",
-                "#138: D4h^16 (P4_2/ncm)",
-                "#139: D4h^17 (I4/mmm)",
-                "#140: D4h^18 (I4/mcm)",
-                "#141: D4h^19 (I4_1/amd)",
-                "#142: D4h^20 (I4_1/acd)",
-            ],
-        ],
-        "MPG": [
-            [
-                "MPG:9.1.29",
-                "MPG:9.2.30",
-                "MPG:9.3.31",
-                "MPG:10.1.32",
-                "MPG:10.2.33",
-                "MPG:10.3.34",
-                "MPG:11.1.35",
-                "MPG:11.2.36",
-                "MPG:11.3.37",
-                "MPG:11.4.38",
-                "MPG:11.5.39",
-                "MPG:12.1.40",
-                "MPG:12.2.41",
-                "MPG:12.3.42",
-                "MPG:12.4.43",
-                "MPG:12.5.129",
-                "MPG:13.1.44",
-                "MPG:13.2.45",
-                "MPG:13.3.46",
-                "MPG:13.4.47",
-                "MPG:13.5.130",
-                "MPG:14.1.48",
-                "MPG:14.2.49",
-                "MPG:14.3.50",
-                "MPG:14.4.51",
-                "MPG:14.5.52",
-                "MPG:15.1.53",
-                "MPG:15.2.54",
-                "MPG:15.3.55",
-                "MPG:15.4.56",
-                "MPG:15.5.57",
-                "MPG:15.6.58",
-                "MPG:15.7.59",
-                "MPG:15.8.136",
-                "MPG:15.9.137",
-                "MPG:33.1.131",
-                "MPG:33.2.132",
-                "MPG:33.3.133",
-                "MPG:33.4.134",
-                "MPG:33.5.135",
-            ],
-            [
-                "#9.1.29: 4",
-                "#9.2.30: 41'",
-                "#9.3.31: 4'",
-                "#10.1.32: -4",
-                "#10.2.33: -41'",
-                "#10.3.34: -4'",
-                "#11.1.35: 4/m",
-                "#11.2.36: 4/m1'",
-                "#11.3.37: 4'/m",
-                "#11.4.38: 4/m'",
-                "#11.5.39: 4'/m'",
-                "#12.1.40: 422",
-                "#12.2.41: 4221'",
-                "#12.3.42: 4'22'",
-                "#12.4.43: 42'2'",
-                "#12.5.129: 4'22'",
-                "#13.1.44: 4mm",
-                "#13.2.45: 4mm1'",
-                "#13.3.46: 4'm'm",
-                "#13.4.47: 4m'm'",
-                "#13.5.130: 4'm'm",
-                "#14.1.48: -42m",
-                "#14.2.49: -42m1'",
-                "#14.3.50: -4'2'm",
-                "#14.4.51: -4'2m'",
-                "#14.5.52: -42'm'",
-                "#15.1.53: 4/mmm",
-                "#15.2.54: 4/mmm1'",
-                "#15.3.55: 4/m'mm",
-                "#15.4.56: 4'/mm'm",
-                "#15.5.57: 4'/m'm'm",
-                "#15.6.58: 4/mm'm'",
-                "#15.7.59: 4/m'm'm'",
-                "#15.8.136: 4'/mm'm",
-                "#15.9.137: 4'/m'm'm",
-                "#33.1.131: -42m",
-                "#33.2.132: -42m1'",
-                "#33.3.133: -4'2'm",
-                "#33.4.134: -4'2m'",
-                "#33.5.135: -42'm'",
-            ],
-        ],
-        "MSG": [
-            [
-                "MSG:75.1",
-                "MSG:75.2",
-                "MSG:75.3",
-                "MSG:75.4",
-                "MSG:75.5",
-                "MSG:75.6",
-                "MSG:76.7",
-                "MSG:76.8",
-                "MSG:76.9",
-                "MSG:76.10",
-                "MSG:76.11",
-                "MSG:76.12",
-                "MSG:77.13",
-                "MSG:77.14",
-                "MSG:77.15",
-                "MSG:77.16",
-                "MSG:77.17",
-                "MSG:77.18",
-                "MSG:78.19",
-                "MSG:78.20",
-                "MSG:78.21",
-                "MSG:78.22",
-                "MSG:78.23",
-                "MSG:78.24",
-                "MSG:79.25",
-                "MSG:79.26",
-                "MSG:79.27",
-                "MSG:79.28",
-                "MSG:80.29",
-                "MSG:80.30",
-                "MSG:80.31",
-                "MSG:80.32",
-                "MSG:81.33",
-                "MSG:81.34",
-                "MSG:81.35",
-                "MSG:81.36",
-                "MSG:81.37",
-                "MSG:81.38",
-                "MSG:82.39",
-                "MSG:82.40",
-                "MSG:82.41",
-                "MSG:82.42",
-                "MSG:83.43",
-                "MSG:83.44",
-                "MSG:83.45",
-                "MSG:83.46",
-                "MSG:83.47",
-                "MSG:83.48",
-                "MSG:83.49",
-                "MSG:83.50",
-                "MSG:84.51",
-                "MSG:84.52",
-                "MSG:84.53",
-                "MSG:84.54",
-                "MSG:84.55",
-                "MSG:84.56",
-                "MSG:84.57",
-                "MSG:84.58",
-                "MSG:85.59",
-                "MSG:85.60",
-                "MSG:85.61",
-                "MSG:85.62",
-                "MSG:85.63",
-                "MSG:85.64",
-                "MSG:85.65",
-                "MSG:85.66",
-                "MSG:86.67",
-                "MSG:86.68",
-                "MSG:86.69",
-                "MSG:86.70",
-                "MSG:86.71",
-                "MSG:86.72",
-                "MSG:86.73",
-                "MSG:86.74",
-                "MSG:87.75",
-                "MSG:87.76",
-                "MSG:87.77",
-                "MSG:87.78",
-                "MSG:87.79",
-                "MSG:87.80",
-                "MSG:88.81",
-                "MSG:88.82",
-                "MSG:88.83",
-                "MSG:88.84",
-                "MSG:88.85",
-                "MSG:88.86",
-                "MSG:89.87",
-                "MSG:89.88",
-                "MSG:89.89",
-                "MSG:89.90",
-                "MSG:89.91",
-                "MSG:89.92",
-                "MSG:89.93",
-                "MSG:89.94",
-                "MSG:90.95",
-                "MSG:90.96",
-                "MSG:90.97",
-                "MSG:90.98",
-                "MSG:90.99",
-                "MSG:90.100",
-                "MSG:90.101",
-                "MSG:90.102",
-                "MSG:91.103",
-                "MSG:91.104",
-                "MSG:91.105",
-                "MSG:91.106",
-                "MSG:91.107",
-                "MSG:91.108",
-                "MSG:91.109",
-                "MSG:91.110",
-                "MSG:92.111",
-                "MSG:92.112",
-                "MSG:92.113",
-                "MSG:92.114",
-                "MSG:92.115",
-                "MSG:92.116",
-                "MSG:92.117",
-                "MSG:92.118",
-                "MSG:93.119",
-                "MSG:93.120",
-                "MSG:93.121",
-                "MSG:93.122",
-                "MSG:93.123",
-                "MSG:93.124",
-                "MSG:93.125",
-                "MSG:93.126",
-                "MSG:94.127",
-                "MSG:94.128",
-                "MSG:94.129",
-                "MSG:94.130",
-                "MSG:94.131",
-                "MSG:94.132",
-                "MSG:94.133",
-                "MSG:94.134",
-                "MSG:95.135",
-                "MSG:95.136",
-                "MSG:95.137",
-                "MSG:95.138",
-                "MSG:95.139",
-                "MSG:95.140",
-                "MSG:95.141",
-                "MSG:95.142",
-                "MSG:96.143",
-                "MSG:96.144",
-                "MSG:96.145",
-                "MSG:96.146",
-                "MSG:96.147",
-                "MSG:96.148",
-                "MSG:96.149",
-                "MSG:96.150",
-                "MSG:97.151",
-                "MSG:97.152",
-                "MSG:97.153",
-                "MSG:97.154",
-                "MSG:97.155",
-                "MSG:97.156",
-                "MSG:98.157",
-                "MSG:98.158",
-                "MSG:98.159",
-                "MSG:98.160",
-                "MSG:98.161",
-                "MSG:98.162",
-                "MSG:99.163",
-                "MSG:99.164",
-                "MSG:99.165",
-                "MSG:99.166",
-                "MSG:99.167",
-                "MSG:99.168",
-                "MSG:99.169",
-                "MSG:99.170",
-                "MSG:100.171",
-                "MSG:100.172",
-                "MSG:100.173",
-                "MSG:100.174",
-                "MSG:100.175",
-                "MSG:100.176",
-                "MSG:100.177",
-                "MSG:100.178",
-                "MSG:101.179",
-                "MSG:101.180",
-                "MSG:101.181",
-                "MSG:101.182",
-                "MSG:101.183",
-                "MSG:101.184",
-                "MSG:101.185",
-                "MSG:101.186",
-                "MSG:102.187",
-                "MSG:102.188",
-                "MSG:102.189",
-                "MSG:102.190",
-                "MSG:102.191",
-                "MSG:102.192",
-                "MSG:102.193",
-                "MSG:102.194",
-                "MSG:103.195",
-                "MSG:103.196",
-                "MSG:103.197",
-                "MSG:103.198",
-                "MSG:103.199",
-                "MSG:103.200",
-                "MSG:103.201",
-                "MSG:103.202",
-                "MSG:104.203",
-                "MSG:104.204",
-                "MSG:104.205",
-                "MSG:104.206",
-                "MSG:104.207",
-                "MSG:104.208",
-                "MSG:104.209",
-                "MSG:104.210",
-                "MSG:105.211",
-                "MSG:105.212",
-                "MSG:105.213",
-                "MSG:105.214",
-                "MSG:105.215",
-                "MSG:105.216",
-                "MSG:105.217",
-                "MSG:105.218",
-                "MSG:106.219",
-                "MSG:106.220",
-                "MSG:106.221",
-                "MSG:106.222",
-                "MSG:106.223",
-                "MSG:106.224",
-                "MSG:106.225",
-                "MSG:106.226",
-                "MSG:107.227",
-                "MSG:107.228",
-                "MSG:107.229",
-                "MSG:107.230",
-                "MSG:107.231",
-                "MSG:107.232",
-                "MSG:108.233",
-                "MSG:108.234",
-                "MSG:108.235",
-                "MSG:108.236",
-                "MSG:108.237",
-                "MSG:108.238",
-                "MSG:109.239",
-                "MSG:109.240",
-                "MSG:109.241",
-                "MSG:109.242",
-                "MSG:109.243",
-                "MSG:109.244",
-                "MSG:110.245",
-                "MSG:110.246",
-                "MSG:110.247",
-                "MSG:110.248",
-                "MSG:110.249",
-                "MSG:110.250",
-                "MSG:111.251",
-                "MSG:111.252",
-                "MSG:111.253",
-                "MSG:111.254",
-                "MSG:111.255",
-                "MSG:111.256",
-                "MSG:111.257",
-                "MSG:111.258",
-                "MSG:112.259",
-                "MSG:112.260",
-                "MSG:112.261",
-                "MSG:112.262",
-                "MSG:112.263",
-                "MSG:112.264",
-                "MSG:112.265",
-                "MSG:112.266",
-                "MSG:113.267",
-                "MSG:113.268",
-                "MSG:113.269",
-                "MSG:113.270",
-                "MSG:113.271",
-                "MSG:113.272",
-                "MSG:113.273",
-                "MSG:113.274",
-                "MSG:114.275",
-                "MSG:114.276",
-                "MSG:114.277",
-                "MSG:114.278",
-                "MSG:114.279",
-                "MSG:114.280",
-                "MSG:114.281",
-                "MSG:114.282",
-                "MSG:115.283",
-                "MSG:115.284",
-                "MSG:115.285",
-                "MSG:115.286",
-                "MSG:115.287",
-                "MSG:115.288",
-                "MSG:115.289",
-                "MSG:115.290",
-                "MSG:116.291",
-                "MSG:116.292",
-                "MSG:116.293",
-                "MSG:116.294",
-                "MSG:116.295",
-                "MSG:116.296",
-                "MSG:116.297",
-                "MSG:116.298",
-                "MSG:117.299",
-                "MSG:117.300",
-                "MSG:117.301",
-                "MSG:117.302",
-                "MSG:117.303",
-                "MSG:117.304",
-                "MSG:117.305",
-                "MSG:117.306",
-                "MSG:118.307",
-                "MSG:118.308",
-                "MSG:118.309",
-                "MSG:118.310",
-                "MSG:118.311",
-                "MSG:118.312",
-                "MSG:118.313",
-                "MSG:118.314",
-                "MSG:119.315",
-                "MSG:119.316",
-                "MSG:119.317",
-                "MSG:119.318",
-                "MSG:119.319",
-                "MSG:119.320",
-                "MSG:120.321",
-                "MSG:120.322",
-                "MSG:120.323",
-                "MSG:120.324",
-                "MSG:120.325",
-                "MSG:120.326",
-                "MSG:121.327",
-                "MSG:121.328",
-                "MSG:121.329",
-                "MSG:121.330",
-                "MSG:121.331",
-                "MSG:121.332",
-                "MSG:122.333",
-                "MSG:122.334",
-                "MSG:122.335",
-                "MSG:122.336",
-                "MSG:122.337",
-                "MSG:122.338",
-                "MSG:123.339",
-                "MSG:123.340",
-                "MSG:123.341",
-                "MSG:123.342",
-                "MSG:123.343",
-                "MSG:123.344",
-                "MSG:123.345",
-                "MSG:123.346",
-                "MSG:123.347",
-                "MSG:123.348",
-                "MSG:123.349",
-                "MSG:123.350",
-                "MSG:124.351",
-                "MSG:124.352",
-                "MSG:124.353",
-                "MSG:124.354",
-                "MSG:124.355",
-                "MSG:124.356",
-                "MSG:124.357",
-                "MSG:124.358",
-                "MSG:124.359",
-                "MSG:124.360",
-                "MSG:124.361",
-                "MSG:124.362",
-                "MSG:125.363",
-                "MSG:125.364",
-                "MSG:125.365",
-                "MSG:125.366",
-                "MSG:125.367",
-                "MSG:125.368",
-                "MSG:125.369",
-                "MSG:125.370",
-                "MSG:125.371",
-                "MSG:125.372",
-                "MSG:125.373",
-                "MSG:125.374",
-                "MSG:126.375",
-                "MSG:126.376",
-                "MSG:126.377",
-                "MSG:126.378",
-                "MSG:126.379",
-                "MSG:126.380",
-                "MSG:126.381",
-                "MSG:126.382",
-                "MSG:126.383",
-                "MSG:126.384",
-                "MSG:126.385",
-                "MSG:126.386",
-                "MSG:127.387",
-                "MSG:127.388",
-                "MSG:127.389",
-                "MSG:127.390",
-                "MSG:127.391",
-                "MSG:127.392",
-                "MSG:127.393",
-                "MSG:127.394",
-                "MSG:127.395",
-                "MSG:127.396",
-                "MSG:127.397",
-                "MSG:127.398",
-                "MSG:128.399",
-                "MSG:128.400",
-                "MSG:128.401",
-                "MSG:128.402",
-                "MSG:128.403",
-                "MSG:128.404",
-                "MSG:128.405",
-                "MSG:128.406",
-                "MSG:128.407",
-                "MSG:128.408",
-                "MSG:128.409",
-                "MSG:128.410",
-                "MSG:129.411",
-                "MSG:129.412",
-                "MSG:129.413",
-                "MSG:129.414",
-                "MSG:129.415",
-                "MSG:129.416",
-                "MSG:129.417",
-                "MSG:129.418",
-                "MSG:129.419",
-                "MSG:129.420",
-                "MSG:129.421",
-                "MSG:129.422",
-                "MSG:130.423",
-                "MSG:130.424",
-                "MSG:130.425",
-                "MSG:130.426",
-                "MSG:130.427",
-                "MSG:130.428",
-                "MSG:130.429",
-                "MSG:130.430",
-                "MSG:130.431",
-                "MSG:130.432",
-                "MSG:130.433",
-                "MSG:130.434",
-                "MSG:131.435",
-                "MSG:131.436",
-                "MSG:131.437",
-                "MSG:131.438",
-                "MSG:131.439",
-                "MSG:131.440",
-                "MSG:131.441",
-                "MSG:131.442",
-                "MSG:131.443",
-                "MSG:131.444",
-                "MSG:131.445",
-                "MSG:131.446",
-                "MSG:132.447",
-                "MSG:132.448",
-                "MSG:132.449",
-                "MSG:132.450",
-                "MSG:132.451",
-                "MSG:132.452",
-                "MSG:132.453",
-                "MSG:132.454",
-                "MSG:132.455",
-                "MSG:132.456",
-                "MSG:132.457",
-                "MSG:132.458",
-                "MSG:133.459",
-                "MSG:133.460",
-                "MSG:133.461",
-                "MSG:133.462",
-                "MSG:133.463",
-                "MSG:133.464",
-                "MSG:133.465",
-                "MSG:133.466",
-                "MSG:133.467",
-                "MSG:133.468",
-                "MSG:133.469",
-                "MSG:133.470",
-                "MSG:134.471",
-                "MSG:134.472",
-                "MSG:134.473",
-                "MSG:134.474",
-                "MSG:134.475",
-                "MSG:134.476",
-                "MSG:134.477",
-                "MSG:134.478",
-                "MSG:134.479",
-                "MSG:134.480",
-                "MSG:134.481",
-                "MSG:134.482",
-                "MSG:135.483",
-                "MSG:135.484",
-                "MSG:135.485",
-                "MSG:135.486",
-                "MSG:135.487",
-                "MSG:135.488",
-                "MSG:135.489",
-                "MSG:135.490",
-                "MSG:135.491",
-                "MSG:135.492",
-                "MSG:135.493",
-                "MSG:135.494",
-                "MSG:136.495",
-                "MSG:136.496",
-                "MSG:136.497",
-                "MSG:136.498",
-                "MSG:136.499",
-                "MSG:136.500",
-                "MSG:136.501",
-                "MSG:136.502",
-                "MSG:136.503",
-                "MSG:136.504",
-                "MSG:136.505",
-                "MSG:136.506",
-                "MSG:137.507",
-                "MSG:137.508",
-                "MSG:137.509",
-                "MSG:137.510",
-                "MSG:137.511",
-                "MSG:137.512",
-                "MSG:137.513",
-                "MSG:137.514",
-                "MSG:137.515",
-                "MSG:137.516",
-                "MSG:137.517",
-                "MSG:137.518",
-                "MSG:138.519",
-                "MSG:138.520",
-                "MSG:138.521",
-                "MSG:138.522",
-                "MSG:138.523",
-                "MSG:138.524",
-                "MSG:138.525",
-                "MSG:138.526",
-                "MSG:138.527",
-                "MSG:138.528",
-                "MSG:138.529",
-                "MSG:138.530",
-                "MSG:139.531",
-                "MSG:139.532",
-                "MSG:139.533",
-                "MSG:139.534",
-                "MSG:139.535",
-                "MSG:139.536",
-                "MSG:139.537",
-                "MSG:139.538",
-                "MSG:139.539",
-                "MSG:139.540",
-                "MSG:140.541",
-                "MSG:140.542",
-                "MSG:140.543",
-                "MSG:140.544",
-                "MSG:140.545",
-                "MSG:140.546",
-                "MSG:140.547",
-                "MSG:140.548",
-                "MSG:140.549",
-                "MSG:140.550",
-                "MSG:141.551",
-                "MSG:141.552",
-                "MSG:141.553",
-                "MSG:141.554",
-                "MSG:141.555",
-                "MSG:141.556",
-                "MSG:141.557",
-                "MSG:141.558",
-                "MSG:141.559",
-                "MSG:141.560",
-                "MSG:142.561",
-                "MSG:142.562",
-                "MSG:142.563",
-                "MSG:142.564",
-                "MSG:142.565",
-                "MSG:142.566",
-                "MSG:142.567",
-                "MSG:142.568",
-                "MSG:142.569",
-                "MSG:142.570",
-            ],
-            [
-                "#75.1: P4",
-                "#75.2: P41'",
-                "#75.3: P4'",
-                "#75.4: P_c4",
-                "#75.5: P_C4",
-                "#75.6: P_I4",
-                "#76.7: P4_1",
-                "#76.8: P4_11'",
-                "#76.9: P4_1'",
-                "#76.10: P_c4_1",
-                "#76.11: P_C4_1",
-                "#76.12: P_I4_1",
-                "#77.13: P4_2",
-                "#77.14: P4_21'",
-                "#77.15: P4_2'",
-                "#77.16: P_c4_2",
-                "#77.17: P_C4_2",
-                "#77.18: P_I4_2",
-                "#78.19: P4_3",
-                "#78.20: P4_31'",
-                "#78.21: P4_3'",
-                "#78.22: P_c4_3",
-                "#78.23: P_C4_3",
-                "#78.24: P_I4_3",
-                "#79.25: I4",
-                "#79.26: I41'",
-                "#79.27: I4'",
-                "#79.28: I_c4",
-                "#80.29: I4_1",
-                "#80.30: I4_11'",
-                "#80.31: I4_1'",
-                "#80.32: I_c4_1",
-                "#81.33: P-4",
-                "#81.34: P-41'",
-                "#81.35: P-4'",
-                "#81.36: P_c-4",
-                "#81.37: P_C-4",
-                "#81.38: P_I-4",
-                "#82.39: I-4",
-                "#82.40: I-41'",
-                "#82.41: I-4'",
-                "#82.42: I_c-4",
-                "#83.43: P4/m",
-                "#83.44: P4/m1'",
-                "#83.45: P4'/m",
-                "#83.46: P4/m'",
-                "#83.47: P4'/m'",
-                "#83.48: P_c4/m",
-                "#83.49: P_C4/m",
-                "#83.50: P_I4/m",
-                "#84.51: P4_2/m",
-                "#84.52: P4_2/m1'",
-                "#84.53: P4_2'/m",
-                "#84.54: P4_2/m'",
-                "#84.55: P4_2'/m'",
-                "#84.56: P_c4_2/m",
-                "#84.57: P_C4_2/m",
-                "#84.58: P_I4_2/m",
-                "#85.59: P4/n",
-                "#85.60: P4/n1'",
-                "#85.61: P4'/n",
-                "#85.62: P4/n'",
-                "#85.63: P4'/n'",
-                "#85.64: P_c4/n",
-                "#85.65: P_C4/n",
-                "#85.66: P_I4/n",
-                "#86.67: P4_2/n",
-                "#86.68: P4_2/n1'",
-                "#86.69: P4_2'/n",
-                "#86.70: P4_2/n'",
-                "#86.71: P4_2'/n'",
-                "#86.72: P_c4_2/n",
-                "#86.73: P_C4_2/n",
-                "#86.74: P_I4_2/n",
-                "#87.75: I4/m",
-                "#87.76: I4/m1'",
-                "#87.77: I4'/m",
-                "#87.78: I4/m'",
-                "#87.79: I4'/m'",
-                "#87.80: I_c4/m",
-                "#88.81: I4_1/a",
-                "#88.82: I4_1/a1'",
-                "#88.83: I4_1'/a",
-                "#88.84: I4_1/a'",
-                "#88.85: I4_1'/a'",
-                "#88.86: I_c4_1/a",
-                "#89.87: P422",
-                "#89.88: P4221'",
-                "#89.89: P4'22'",
-                "#89.90: P42'2'",
-                "#89.91: P4'2'2",
-                "#89.92: P_c422",
-                "#89.93: P_C422",
-                "#89.94: P_I422",
-                "#90.95: P42_12",
-                "#90.96: P42_121'",
-                "#90.97: P4'2_12'",
-                "#90.98: P42_1'2'",
-                "#90.99: P4'2_1'2",
-                "#90.100: P_c42_12",
-                "#90.101: P_C42_12",
-                "#90.102: P_I42_12",
-                "#91.103: P4_122",
-                "#91.104: P4_1221'",
-                "#91.105: P4_1'22'",
-                "#91.106: P4_12'2'",
-                "#91.107: P4_1'2'2",
-                "#91.108: P_c4_122",
-                "#91.109: P_C4_122",
-                "#91.110: P_I4_122",
-                "#92.111: P4_12_12",
-                "#92.112: P4_12_121'",
-                "#92.113: P4_1'2_12'",
-                "#92.114: P4_12_1'2'",
-                "#92.115: P4_1'2_1'2",
-                "#92.116: P_c4_12_12",
-                "#92.117: P_C4_12_12",
-                "#92.118: P_I4_12_12",
-                "#93.119: P4_222",
-                "#93.120: P4_2221'",
-                "#93.121: P4_2'22'",
-                "#93.122: P4_22'2'",
-                "#93.123: P4_2'2'2",
-                "#93.124: P_c4_222",
-                "#93.125: P_C4_222",
-                "#93.126: P_I4_222",
-                "#94.127: P4_22_12",
-                "#94.128: P4_22_121'",
-                "#94.129: P4_2'2_12'",
-                "#94.130: P4_22_1'2'",
-                "#94.131: P4_2'2_1'2",
-                "#94.132: P_c4_22_12",
-                "#94.133: P_C4_22_12",
-                "#94.134: P_I4_22_12",
-                "#95.135: P4_322",
-                "#95.136: P4_3221'",
-                "#95.137: P4_3'22'",
-                "#95.138: P4_32'2'",
-                "#95.139: P4_3'2'2",
-                "#95.140: P_c4_322",
-                "#95.141: P_C4_322",
-                "#95.142: P_I4_322",
-                "#96.143: P4_32_12",
-                "#96.144: P4_32_121'",
-                "#96.145: P4_3'2_12'",
-                "#96.146: P4_32_1'2'",
-                "#96.147: P4_3'2_1'2",
-                "#96.148: P_c4_32_12",
-                "#96.149: P_C4_32_12",
-                "#96.150: P_I4_32_12",
-                "#97.151: I422",
-                "#97.152: I4221'",
-                "#97.153: I4'22'",
-                "#97.154: I42'2'",
-                "#97.155: I4'2'2",
-                "#97.156: I_c422",
-                "#98.157: I4_122",
-                "#98.158: I4_1221'",
-                "#98.159: I4_1'22'",
-                "#98.160: I4_12'2'",
-                "#98.161: I4_1'2'2",
-                "#98.162: I_c4_122",
-                "#99.163: P4mm",
-                "#99.164: P4mm1'",
-                "#99.165: P4'm'm",
-                "#99.166: P4'mm'",
-                "#99.167: P4m'm'",
-                "#99.168: P_c4mm",
-                "#99.169: P_C4mm",
-                "#99.170: P_I4mm",
-                "#100.171: P4bm",
-                "#100.172: P4bm1'",
-                "#100.173: P4'b'm",
-                "#100.174: P4'bm'",
-                "#100.175: P4b'm'",
-                "#100.176: P_c4bm",
-                "#100.177: P_C4bm",
-                "#100.178: P_I4bm",
-                "#101.179: P4_2cm",
-                "#101.180: P4_2cm1'",
-                "#101.181: P4_2'c'm",
-                "#101.182: P4_2'cm'",
-                "#101.183: P4_2c'm'",
-                "#101.184: P_c4_2cm",
-                "#101.185: P_C4_2cm",
-                "#101.186: P_I4_2cm",
-                "#102.187: P4_2nm",
-                "#102.188: P4_2nm1'",
-                "#102.189: P4_2'n'm",
-                "#102.190: P4_2'nm'",
-                "#102.191: P4_2n'm'",
-                "#102.192: P_c4_2nm",
-                "#102.193: P_C4_2nm",
-                "#102.194: P_I4_2nm",
-                "#103.195: P4cc",
-                "#103.196: P4cc1'",
-                "#103.197: P4'c'c",
-                "#103.198: P4'cc'",
-                "#103.199: P4c'c'",
-                "#103.200: P_c4cc",
-                "#103.201: P_C4cc",
-                "#103.202: P_I4cc",
-                "#104.203: P4nc",
-                "#104.204: P4nc1'",
-                "#104.205: P4'n'c",
-                "#104.206: P4'nc'",
-                "#104.207: P4n'c'",
-                "#104.208: P_c4nc",
-                "#104.209: P_C4nc",
-                "#104.210: P_I4nc",
-                "#105.211: P4_2mc",
-                "#105.212: P4_2mc1'",
-                "#105.213: P4_2'm'c",
-                "#105.214: P4_2'mc'",
-                "#105.215: P4_2m'c'",
-                "#105.216: P_c4_2mc",
-                "#105.217: P_C4_2mc",
-                "#105.218: P_I4_2mc",
-                "#106.219: P4_2bc",
-                "#106.220: P4_2bc1'",
-                "#106.221: P4_2'b'c",
-                "#106.222: P4_2'bc'",
-                "#106.223: P4_2b'c'",
-                "#106.224: P_c4_2bc",
-                "#106.225: P_C4_2bc",
-                "#106.226: P_I4_2bc",
-                "#107.227: I4mm",
-                "#107.228: I4mm1'",
-                "#107.229: I4'm'm",
-                "#107.230: I4'mm'",
-                "#107.231: I4m'm'",
-                "#107.232: I_c4mm",
-                "#108.233: I4cm",
-                "#108.234: I4cm1'",
-                "#108.235: I4'c'm",
-                "#108.236: I4'cm'",
-                "#108.237: I4c'm'",
-                "#108.238: I_c4cm",
-                "#109.239: I4_1md",
-                "#109.240: I4_1md1'",
-                "#109.241: I4_1'm'd",
-                "#109.242: I4_1'md'",
-                "#109.243: I4_1m'd'",
-                "#109.244: I_c4_1md",
-                "#110.245: I4_1cd",
-                "#110.246: I4_1cd1'",
-                "#110.247: I4_1'c'd",
-                "#110.248: I4_1'cd'",
-                "#110.249: I4_1c'd'",
-                "#110.250: I_c4_1cd",
-                "#111.251: P-42m",
-                "#111.252: P-42m1'",
-                "#111.253: P-4'2'm",
-                "#111.254: P-4'2m'",
-                "#111.255: P-42'm'",
-                "#111.256: P_c-42m",
-                "#111.257: P_C-42m",
-                "#111.258: P_I-42m",
-                "#112.259: P-42c",
-                "#112.260: P-42c1'",
-                "#112.261: P-4'2'c",
-                "#112.262: P-4'2c'",
-                "#112.263: P-42'c'",
-                "#112.264: P_c-42c",
-                "#112.265: P_C-42c",
-                "#112.266: P_I-42c",
-                "#113.267: P-42_1m",
-                "#113.268: P-42_1m1'",
-                "#113.269: P-4'2_1'm",
-                "#113.270: P-4'2_1m'",
-                "#113.271: P-42_1'm'",
-                "#113.272: P_c-42_1m",
-                "#113.273: P_C-42_1m",
-                "#113.274: P_I-42_1m",
-                "#114.275: P-42_1c",
-                "#114.276: P-42_1c1'",
-                "#114.277: P-4'2_1'c",
-                "#114.278: P-4'2_1c'",
-                "#114.279: P-42_1'c'",
-                "#114.280: P_c-42_1c",
-                "#114.281: P_C-42_1c",
-                "#114.282: P_I-42_1c",
-                "#115.283: P-4m2",
-                "#115.284: P-4m21'",
-                "#115.285: P-4'm'2",
-                "#115.286: P-4'm2'",
-                "#115.287: P-4m'2'",
-                "#115.288: P_c-4m2",
-                "#115.289: P_C-4m2",
-                "#115.290: P_I-4m2",
-                "#116.291: P-4c2",
-                "#116.292: P-4c21'",
-                "#116.293: P-4'c'2",
-                "#116.294: P-4'c2'",
-                "#116.295: P-4c'2'",
-                "#116.296: P_c-4c2",
-                "#116.297: P_C-4c2",
-                "#116.298: P_I-4c2",
-                "#117.299: P-4b2",
-                "#117.300: P-4b21'",
-                "#117.301: P-4'b'2",
-                "#117.302: P-4'b2'",
-                "#117.303: P-4b'2'",
-                "#117.304: P_c-4b2",
-                "#117.305: P_C-4b2",
-                "#117.306: P_I-4b2",
-                "#118.307: P-4n2",
-                "#118.308: P-4n21'",
-                "#118.309: P-4'n'2",
-                "#118.310: P-4'n2'",
-                "#118.311: P-4n'2'",
-                "#118.312: P_c-4n2",
-                "#118.313: P_C-4n2",
-                "#118.314: P_I-4n2",
-                "#119.315: I-4m2",
-                "#119.316: I-4m21'",
-                "#119.317: I-4'm'2",
-                "#119.318: I-4'm2'",
-                "#119.319: I-4m'2'",
-                "#119.320: I_c-4m2",
-                "#120.321: I-4c2",
-                "#120.322: I-4c21'",
-                "#120.323: I-4'c'2",
-                "#120.324: I-4'c2'",
-                "#120.325: I-4c'2'",
-                "#120.326: I_c-4c2",
-                "#121.327: I-42m",
-                "#121.328: I-42m1'",
-                "#121.329: I-4'2'm",
-                "#121.330: I-4'2m'",
-                "#121.331: I-42'm'",
-                "#121.332: I_c-42m",
-                "#122.333: I-42d",
-                "#122.334: I-42d1'",
-                "#122.335: I-4'2'd",
-                "#122.336: I-4'2d'",
-                "#122.337: I-42'd'",
-                "#122.338: I_c-42d",
-                "#123.339: P4/mmm",
-                "#123.340: P4/mmm1'",
-                "#123.341: P4/m'mm",
-                "#123.342: P4'/mm'm",
-                "#123.343: P4'/mmm'",
-                "#123.344: P4'/m'm'm",
-                "#123.345: P4/mm'm'",
-                "#123.346: P4'/m'mm'",
-                "#123.347: P4/m'm'm'",
-                "#123.348: P_c4/mmm",
-                "#123.349: P_C4/mmm",
-                "#123.350: P_I4/mmm",
-                "#124.351: P4/mcc",
-                "#124.352: P4/mcc1'",
-                "#124.353: P4/m'cc",
-                "#124.354: P4'/mc'c",
-                "#124.355: P4'/mcc'",
-                "#124.356: P4'/m'c'c",
-                "#124.357: P4/mc'c'",
-                "#124.358: P4'/m'cc'",
-                "#124.359: P4/m'c'c'",
-                "#124.360: P_c4/mcc",
-                "#124.361: P_C4/mcc",
-                "#124.362: P_I4/mcc",
-                "#125.363: P4/nbm",
-                "#125.364: P4/nbm1'",
-                "#125.365: P4/n'bm",
-                "#125.366: P4'/nb'm",
-                "#125.367: P4'/nbm'",
-                "#125.368: P4'/n'b'm",
-                "#125.369: P4/nb'm'",
-                "#125.370: P4'/n'bm'",
-                "#125.371: P4/n'b'm'",
-                "#125.372: P_c4/nbm",
-                "#125.373: P_C4/nbm",
-                "#125.374: P_I4/nbm",
-                "#126.375: P4/nnc",
-                "#126.376: P4/nnc1'",
-                "#126.377: P4/n'nc",
-                "#126.378: P4'/nn'c",
-                "#126.379: P4'/nnc'",
-                "#126.380: P4'/n'n'c",
-                "#126.381: P4/nn'c'",
-                "#126.382: P4'/n'nc'",
-                "#126.383: P4/n'n'c'",
-                "#126.384: P_c4/nnc",
-                "#126.385: P_C4/nnc",
-                "#126.386: P_I4/nnc",
-                "#127.387: P4/mbm",
-                "#127.388: P4/mbm1'",
-                "#127.389: P4/m'bm",
-                "#127.390: P4'/mb'm",
-                "#127.391: P4'/mbm'",
-                "#127.392: P4'/m'b'm",
-                "#127.393: P4/mb'm'",
-                "#127.394: P4'/m'bm'",
-                "#127.395: P4/m'b'm'",
-                "#127.396: P_c4/mbm",
-                "#127.397: P_C4/mbm",
-                "#127.398: P_I4/mbm",
-                "#128.399: P4/mnc",
-                "#128.400: P4/mnc1'",
-                "#128.401: P4/m'nc",
-                "#128.402: P4'/mn'c",
-                "#128.403: P4'/mnc'",
-                "#128.404: P4'/m'n'c",
-                "#128.405: P4/mn'c'",
-                "#128.406: P4'/m'nc'",
-                "#128.407: P4/m'n'c'",
-                "#128.408: P_c4/mnc",
-                "#128.409: P_C4/mnc",
-                "#128.410: P_I4/mnc",
-                "#129.411: P4/nmm",
-                "#129.412: P4/nmm1'",
-                "#129.413: P4/n'mm",
-                "#129.414: P4'/nm'm",
-                "#129.415: P4'/nmm'",
-                "#129.416: P4'/n'm'm",
-                "#129.417: P4/nm'm'",
-                "#129.418: P4'/n'mm'",
-                "#129.419: P4/n'm'm'",
-                "#129.420: P_c4/nmm",
-                "#129.421: P_C4/nmm",
-                "#129.422: P_I4/nmm",
-                "#130.423: P4/ncc",
-                "#130.424: P4/ncc1'",
-                "#130.425: P4/n'cc",
-                "#130.426: P4'/nc'c",
-                "#130.427: P4'/ncc'",
-                "#130.428: P4'/n'c'c",
-                "#130.429: P4/nc'c'",
-                "#130.430: P4'/n'cc'",
-                "#130.431: P4/n'c'c'",
-                "#130.432: P_c4/ncc",
-                "#130.433: P_C4/ncc",
-                "#130.434: P_I4/ncc",
-                "#131.435: P4_2/mmc",
-                "#131.436: P4_2/mmc1'",
-                "#131.437: P4_2/m'mc",
-                "#131.438: P4_2'/mm'c",
-                "#131.439: P4_2'/mmc'",
-                "#131.440: P4_2'/m'm'c",
-                "#131.441: P4_2/mm'c'",
-                "#131.442: P4_2'/m'mc'",
-                "#131.443: P4_2/m'm'c'",
-                "#131.444: P_c4_2/mmc",
-                "#131.445: P_C4_2/mmc",
-                "#131.446: P_I4_2/mmc",
-                "#132.447: P4_2/mcm",
-                "#132.448: P4_2/mcm1'",
-                "#132.449: P4_2/m'cm",
-                "#132.450: P4_2'/mc'm",
-                "#132.451: P4_2'/mcm'",
-                "#132.452: P4_2'/m'c'm",
-                "#132.453: P4_2/mc'm'",
-                "#132.454: P4_2'/m'cm'",
-                "#132.455: P4_2/m'c'm'",
-                "#132.456: P_c4_2/mcm",
-                "#132.457: P_C4_2/mcm",
-                "#132.458: P_I4_2/mcm",
-                "#133.459: P4_2/nbc",
-                "#133.460: P4_2/nbc1'",
-                "#133.461: P4_2/n'bc",
-                "#133.462: P4_2'/nb'c",
-                "#133.463: P4_2'/nbc'",
-                "#133.464: P4_2'/n'b'c",
-                "#133.465: P4_2/nb'c'",
-                "#133.466: P4_2'/n'bc'",
-                "#133.467: P4_2/n'b'c'",
-                "#133.468: P_c4_2/nbc",
-                "#133.469: P_C4_2/nbc",
-                "#133.470: P_I4_2/nbc",
-                "#134.471: P4_2/nnm",
-                "#134.472: P4_2/nnm1'",
-                "#134.473: P4_2/n'nm",
-                "#134.474: P4_2'/nn'm",
-                "#134.475: P4_2'/nnm'",
-                "#134.476: P4_2'/n'n'm",
-                "#134.477: P4_2/nn'm'",
-                "#134.478: P4_2'/n'nm'",
-                "#134.479: P4_2/n'n'm'",
-                "#134.480: P_c4_2/nnm",
-                "#134.481: P_C4_2/nnm",
-                "#134.482: P_I4_2/nnm",
-                "#135.483: P4_2/mbc",
-                "#135.484: P4_2/mbc1'",
-                "#135.485: P4_2/m'bc",
-                "#135.486: P4_2'/mb'c",
-                "#135.487: P4_2'/mbc'",
-                "#135.488: P4_2'/m'b'c",
-                "#135.489: P4_2/mb'c'",
-                "#135.490: P4_2'/m'bc'",
-                "#135.491: P4_2/m'b'c'",
-                "#135.492: P_c4_2/mbc",
-                "#135.493: P_C4_2/mbc",
-                "#135.494: P_I4_2/mbc",
-                "#136.495: P4_2/mnm",
-                "#136.496: P4_2/mnm1'",
-                "#136.497: P4_2/m'nm",
-                "#136.498: P4_2'/mn'm",
-                "#136.499: P4_2'/mnm'",
-                "#136.500: P4_2'/m'n'm",
-                "#136.501: P4_2/mn'm'",
-                "#136.502: P4_2'/m'nm'",
-                "#136.503: P4_2/m'n'm'",
-                "#136.504: P_c4_2/mnm",
-                "#136.505: P_C4_2/mnm",
-                "#136.506: P_I4_2/mnm",
-                "#137.507: P4_2/nmc",
-                "#137.508: P4_2/nmc1'",
-                "#137.509: P4_2/n'mc",
-                "#137.510: P4_2'/nm'c",
-                "#137.511: P4_2'/nmc'",
-                "#137.512: P4_2'/n'm'c",
-                "#137.513: P4_2/nm'c'",
-                "#137.514: P4_2'/n'mc'",
-                "#137.515: P4_2/n'm'c'",
-                "#137.516: P_c4_2/nmc",
-                "#137.517: P_C4_2/nmc",
-                "#137.518: P_I4_2/nmc",
-                "#138.519: P4_2/ncm",
-                "#138.520: P4_2/ncm1'",
-                "#138.521: P4_2/n'cm",
-                "#138.522: P4_2'/nc'm",
-                "#138.523: P4_2'/ncm'",
-                "#138.524: P4_2'/n'c'm",
-                "#138.525: P4_2/nc'm'",
-                "#138.526: P4_2'/n'cm'",
-                "#138.527: P4_2/n'c'm'",
-                "#138.528: P_c4_2/ncm",
-                "#138.529: P_C4_2/ncm",
-                "#138.530: P_I4_2/ncm",
-                "#139.531: I4/mmm",
-                "#139.532: I4/mmm1'",
-                "#139.533: I4/m'mm",
-                "#139.534: I4'/mm'm",
-                "#139.535: I4'/mmm'",
-                "#139.536: I4'/m'm'm",
-                "#139.537: I4/mm'm'",
-                "#139.538: I4'/m'mm'",
-                "#139.539: I4/m'm'm'",
-                "#139.540: I_c4/mmm",
-                "#140.541: I4/mcm",
-                "#140.542: I4/mcm1'",
-                "#140.543: I4/m'cm",
-                "#140.544: I4'/mc'm",
-                "#140.545: I4'/mcm'",
-                "#140.546: I4'/m'c'm",
-                "#140.547: I4/mc'm'",
-                "#140.548: I4'/m'cm'",
-                "#140.549: I4/m'c'm'",
-                "#140.550: I_c4/mcm",
-                "#141.551: I4_1/amd",
-                "#141.552: I4_1/amd1'",
-                "#141.553: I4_1/a'md",
-                "#141.554: I4_1'/am'd",
-                "#141.555: I4_1'/amd'",
-                "#141.556: I4_1'/a'm'd",
-                "#141.557: I4_1/am'd'",
-                "#141.558: I4_1'/a'md'",
-                "#141.559: I4_1/a'm'd'",
-                "#141.560: I_c4_1/amd",
-                "#142.561: I4_1/acd",
-                "#142.562: I4_1/acd1'",
-                "#142.563: I4_1/a'cd",
-                "#142.564: I4_1'/ac'd",
-                "#142.565: I4_1'/acd'",
-                "#142.566: I4_1'/a'c'd",
-                "#142.567: I4_1/ac'd'",
-                "#142.568: I4_1'/a'cd'",
-                "#142.569: I4_1/a'c'd'",
-                "#142.570: I_c4_1/acd",
-            ],
-        ],
-    },
-    "trigonal": {
-        "PG": [
-            ["PG:16", "PG:17", "PG:18", "PG:19", "PG:20", "PG:34", "PG:35", "PG:36"],
-            [
-                "#16: C3 (3)",
-                "#17: C3i (-3)",
-                "#18: D3 (32)",
-                "#19: C3v (3m)",
-                "#20: D3d (-3m)",
-                "#34: D3-1 (32)",
-                "#35: C3v-1 (3m)",
-                "#36: D3d-1 (-3m)",
-            ],
-        ],
-        "SG": [
-            [
-                "SG:143",
-                "SG:144",
-                "SG:145",
-                "SG:146",
-                "SG:147",
-                "SG:148",
-                "SG:149",
-                "SG:150",
-                "SG:151",
-                "SG:152",
-                "SG:153",
-                "SG:154",
-                "SG:155",
-                "SG:156",
-                "SG:157",
-                "SG:158",
-                "SG:159",
-                "SG:160",
-                "SG:161",
-                "SG:162",
-                "SG:163",
-                "SG:164",
-                "SG:165",
-                "SG:166",
-                "SG:167",
-            ],
-            [
-                "#143: C3^1 (P3)",
-                "#144: C3^2 (P3_1)",
-                "#145: C3^3 (P3_2)",
-                "#146: C3^4 (R3)",
-                "#147: C3i^1 (P-3)",
-                "#148: C3i^2 (R-3)",
-                "#149: D3^1 (P312)",
-                "#150: D3^2 (P321)",
-                "#151: D3^3 (P3_112)",
-                "#152: D3^4 (P3_121)",
-                "#153: D3^5 (P3_212)",
-                "#154: D3^6 (P3_221)",
-                "#155: D3^7 (R32)",
-                "#156: C3v^1 (P3m1)",
-                "#157: C3v^2 (P31m)",
-                "#158: C3v^3 (P3c1)",
-                "#159: C3v^4 (P31c)",
-                "#160: C3v^5 (R3m)",
-                "#161: C3v^6 (R3c)",
-                "#162: D3d^1 (P-31m)",
-                "#163: D3d^2 (P-31c)",
-                "#164: D3d^3 (P-3m1)",
-                "#165: D3d^4 (P-3c1)",
-                "#166: D3d^5 (R-3m)",
-                "#167: D3d^6 (R-3c)",
-            ],
-        ],
-        "MPG": [
-            [
-                "MPG:16.1.60",
-                "MPG:16.2.61",
-                "MPG:17.1.62",
-                "MPG:17.2.63",
-                "MPG:17.3.64",
-                "MPG:18.1.65",
-                "MPG:18.2.66",
-                "MPG:18.3.67",
-                "MPG:19.1.68",
-                "MPG:19.2.69",
-                "MPG:19.3.70",
-                "MPG:20.1.71",
-                "MPG:20.2.72",
-                "MPG:20.3.73",
-                "MPG:20.4.74",
-                "MPG:20.5.75",
-                "MPG:34.1.138",
-                "MPG:34.2.139",
-                "MPG:34.3.140",
-                "MPG:35.1.141",
-                "MPG:35.2.142",
-                "MPG:35.3.143",
-                "MPG:36.1.144",
-                "MPG:36.2.145",
-                "MPG:36.3.146",
-                "MPG:36.4.147",
-                "MPG:36.5.148",
-            ],
-            [
-                "#16.1.60: 3",
-                "#16.2.61: 31'",
-                "#17.1.62: -3",
-                "#17.2.63: -31'",
-                "#17.3.64: -3'",
-                "#18.1.65: 32",
-                "#18.2.66: 321'",
-                "#18.3.67: 32'",
-                "#19.1.68: 3m",
-                "#19.2.69: 3m1'",
-                "#19.3.70: 3m'",
-                "#20.1.71: -3m",
-                "#20.2.72: -3m1'",
-                "#20.3.73: -3'm",
-                "#20.4.74: -3'm'",
-                "#20.5.75: -3m'",
-                "#34.1.138: 32",
-                "#34.2.139: 321'",
-                "#34.3.140: 32'",
-                "#35.1.141: 3m",
-                "#35.2.142: 3m1'",
-                "#35.3.143: 3m'",
-                "#36.1.144: -3m",
-                "#36.2.145: -3m1'",
-                "#36.3.146: -3'm",
-                "#36.4.147: -3'm'",
-                "#36.5.148: -3m'",
-            ],
-        ],
-        "MSG": [
-            [
-                "MSG:143.1",
-                "MSG:143.2",
-                "MSG:143.3",
-                "MSG:144.4",
-                "MSG:144.5",
-                "MSG:144.6",
-                "MSG:145.7",
-                "MSG:145.8",
-                "MSG:145.9",
-                "MSG:146.10",
-                "MSG:146.11",
-                "MSG:146.12",
-                "MSG:147.13",
-                "MSG:147.14",
-                "MSG:147.15",
-                "MSG:147.16",
-                "MSG:148.17",
-                "MSG:148.18",
-                "MSG:148.19",
-                "MSG:148.20",
-                "MSG:149.21",
-                "MSG:149.22",
-                "MSG:149.23",
-                "MSG:149.24",
-                "MSG:150.25",
-                "MSG:150.26",
-                "MSG:150.27",
-                "MSG:150.28",
-                "MSG:151.29",
-                "MSG:151.30",
-                "MSG:151.31",
-                "MSG:151.32",
-                "MSG:152.33",
-                "MSG:152.34",
-                "MSG:152.35",
-                "MSG:152.36",
-                "MSG:153.37",
-                "MSG:153.38",
-                "MSG:153.39",
-                "MSG:153.40",
-                "MSG:154.41",
-                "MSG:154.42",
-                "MSG:154.43",
-                "MSG:154.44",
-                "MSG:155.45",
-                "MSG:155.46",
-                "MSG:155.47",
-                "MSG:155.48",
-                "MSG:156.49",
-                "MSG:156.50",
-                "MSG:156.51",
-                "MSG:156.52",
-                "MSG:157.53",
-                "MSG:157.54",
-                "MSG:157.55",
-                "MSG:157.56",
-                "MSG:158.57",
-                "MSG:158.58",
-                "MSG:158.59",
-                "MSG:158.60",
-                "MSG:159.61",
-                "MSG:159.62",
-                "MSG:159.63",
-                "MSG:159.64",
-                "MSG:160.65",
-                "MSG:160.66",
-                "MSG:160.67",
-                "MSG:160.68",
-                "MSG:161.69",
-                "MSG:161.70",
-                "MSG:161.71",
-                "MSG:161.72",
-                "MSG:162.73",
-                "MSG:162.74",
-                "MSG:162.75",
-                "MSG:162.76",
-                "MSG:162.77",
-                "MSG:162.78",
-                "MSG:163.79",
-                "MSG:163.80",
-                "MSG:163.81",
-                "MSG:163.82",
-                "MSG:163.83",
-                "MSG:163.84",
-                "MSG:164.85",
-                "MSG:164.86",
-                "MSG:164.87",
-                "MSG:164.88",
-                "MSG:164.89",
-                "MSG:164.90",
-                "MSG:165.91",
-                "MSG:165.92",
-                "MSG:165.93",
-                "MSG:165.94",
-                "MSG:165.95",
-                "MSG:165.96",
-                "MSG:166.97",
-                "MSG:166.98",
-                "MSG:166.99",
-                "MSG:166.100",
-                "MSG:166.101",
-                "MSG:166.102",
-                "MSG:167.103",
-                "MSG:167.104",
-                "MSG:167.105",
-                "MSG:167.106",
-                "MSG:167.107",
-                "MSG:167.108",
-            ],
-            [
-                "#143.1: P3",
-                "#143.2: P31'",
-                "#143.3: P_c3",
-                "#144.4: P3_1",
-                "#144.5: P3_11'",
-                "#144.6: P_c3_1",
-                "#145.7: P3_2",
-                "#145.8: P3_21'",
-                "#145.9: P_c3_2",
-                "#146.10: R3",
-                "#146.11: R31'",
-                "#146.12: R_I3",
-                "#147.13: P-3",
-                "#147.14: P-31'",
-                "#147.15: P-3'",
-                "#147.16: P_c-3",
-                "#148.17: R-3",
-                "#148.18: R-31'",
-                "#148.19: R-3'",
-                "#148.20: R_I-3",
-                "#149.21: P312",
-                "#149.22: P3121'",
-                "#149.23: P312'",
-                "#149.24: P_c312",
-                "#150.25: P321",
-                "#150.26: P3211'",
-                "#150.27: P32'1",
-                "#150.28: P_c321",
-                "#151.29: P3_112",
-                "#151.30: P3_1121'",
-                "#151.31: P3_112'",
-                "#151.32: P_c3_112",
-                "#152.33: P3_121",
-                "#152.34: P3_1211'",
-                "#152.35: P3_12'1",
-                "#152.36: P_c3_121",
-                "#153.37: P3_212",
-                "#153.38: P3_2121'",
-                "#153.39: P3_212'",
-                "#153.40: P_c3_212",
-                "#154.41: P3_221",
-                "#154.42: P3_2211'",
-                "#154.43: P3_22'1",
-                "#154.44: P_c3_221",
-                "#155.45: R32",
-                "#155.46: R321'",
-                "#155.47: R32'",
-                "#155.48: R_I32",
-                "#156.49: P3m1",
-                "#156.50: P3m11'",
-                "#156.51: P3m'1",
-                "#156.52: P_c3m1",
-                "#157.53: P31m",
-                "#157.54: P31m1'",
-                "#157.55: P31m'",
-                "#157.56: P_c31m",
-                "#158.57: P3c1",
-                "#158.58: P3c11'",
-                "#158.59: P3c'1",
-                "#158.60: P_c3c1",
-                "#159.61: P31c",
-                "#159.62: P31c1'",
-                "#159.63: P31c'",
-                "#159.64: P_c31c",
-                "#160.65: R3m",
-                "#160.66: R3m1'",
-                "#160.67: R3m'",
-                "#160.68: R_I3m",
-                "#161.69: R3c",
-                "#161.70: R3c1'",
-                "#161.71: R3c'",
-                "#161.72: R_I3c",
-                "#162.73: P-31m",
-                "#162.74: P-31m1'",
-                "#162.75: P-3'1m",
-                "#162.76: P-3'1m'",
-                "#162.77: P-31m'",
-                "#162.78: P_c-31m",
-                "#163.79: P-31c",
-                "#163.80: P-31c1'",
-                "#163.81: P-3'1c",
-                "#163.82: P-3'1c'",
-                "#163.83: P-31c'",
-                "#163.84: P_c-31c",
-                "#164.85: P-3m1",
-                "#164.86: P-3m11'",
-                "#164.87: P-3'm1",
-                "#164.88: P-3'm'1",
-                "#164.89: P-3m'1",
-                "#164.90: P_c-3m1",
-                "#165.91: P-3c1",
-                "#165.92: P-3c11'",
-                "#165.93: P-3'c1",
-                "#165.94: P-3'c'1",
-                "#165.95: P-3c'1",
-                "#165.96: P_c-3c1",
-                "#166.97: R-3m",
-                "#166.98: R-3m1'",
-                "#166.99: R-3'm",
-                "#166.100: R-3'm'",
-                "#166.101: R-3m'",
-                "#166.102: R_I-3m",
-                "#167.103: R-3c",
-                "#167.104: R-3c1'",
-                "#167.105: R-3'c",
-                "#167.106: R-3'c'",
-                "#167.107: R-3c'",
-                "#167.108: R_I-3c",
-            ],
-        ],
-    },
-    "hexagonal": {
-        "PG": [
-            ["PG:21", "PG:22", "PG:23", "PG:24", "PG:25", "PG:26", "PG:27", "PG:37"],
-            [
-                "#21: C6 (6)",
-                "#22: C3h (-6)",
-                "#23: C6h (6/m)",
-                "#24: D6 (622)",
-                "#25: C6v (6mm)",
-                "#26: D3h (-6m2)",
-                "#27: D6h (6/mmm)",
-                "#37: D3h-1 (-6m2)",
-            ],
-        ],
-        "SG": [
-            [
-                "SG:168",
-                "SG:169",
-                "SG:170",
-                "SG:171",
-                "SG:172",
-                "SG:173",
-                "SG:174",
-                "SG:175",
-                "SG:176",
-                "SG:177",
-                "SG:178",
-                "SG:179",
-                "SG:180",
-                "SG:181",
-                "SG:182",
-                "SG:183",
-                "SG:184",
-                "SG:185",
-                "SG:186",
-                "SG:187",
-                "SG:188",
-                "SG:189",
-                "SG:190",
-                "SG:191",
-                "SG:192",
-                "SG:193",
-                "SG:194",
-            ],
-            [
-                "#168: C6^1 (P6)",
-                "#169: C6^2 (P6_1)",
-                "#170: C6^3 (P6_5)",
-                "#171: C6^4 (P6_2)",
-                "#172: C6^5 (P6_4)",
-                "#173: C6^6 (P6_3)",
-                "#174: C3h^1 (P-6)",
-                "#175: C6h^1 (P6/m)",
-                "#176: C6h^2 (P6_3/m)",
-                "#177: D6^1 (P622)",
-                "#178: D6^2 (P6_122)",
-                "#179: D6^3 (P6_522)",
-                "#180: D6^4 (P6_222)",
-                "#181: D6^5 (P6_422)",
-                "#182: D6^6 (P6_322)",
-                "#183: C6v^1 (P6mm)",
-                "#184: C6v^2 (P6cc)",
-                "#185: C6v^3 (P6_3cm)",
-                "#186: C6v^4 (P6_3mc)",
-                "#187: D3h^1 (P-6m2)",
-                "#188: D3h^2 (P-6c2)",
-                "#189: D3h^3 (P-62m)",
-                "#190: D3h^4 (P-62c)",
-                "#191: D6h^1 (P6/mmm)",
-                "#192: D6h^2 (P6/mcc)",
-                "#193: D6h^3 (P6_3/mcm)",
-                "#194: D6h^4 (P6_3/mmc)",
-            ],
-        ],
-        "MPG": [
-            [
-                "MPG:21.1.76",
-                "MPG:21.2.77",
-                "MPG:21.3.78",
-                "MPG:22.1.79",
-                "MPG:22.2.80",
-                "MPG:22.3.81",
-                "MPG:23.1.82",
-                "MPG:23.2.83",
-                "MPG:23.3.84",
-                "MPG:23.4.85",
-                "MPG:23.5.86",
-                "MPG:24.1.87",
-                "MPG:24.2.88",
-                "MPG:24.3.89",
-                "MPG:24.4.90",
-                "MPG:24.5.149",
-                "MPG:25.1.91",
-                "MPG:25.2.92",
-                "MPG:25.3.93",
-                "MPG:25.4.94",
-                "MPG:25.5.150",
-                "MPG:26.1.95",
-                "MPG:26.2.96",
-                "MPG:26.3.97",
-                "MPG:26.4.98",
-                "MPG:26.5.99",
-                "MPG:27.1.100",
-                "MPG:27.2.101",
-                "MPG:27.3.102",
-                "MPG:27.4.103",
-                "MPG:27.5.104",
-                "MPG:27.6.105",
-                "MPG:27.7.106",
-                "MPG:27.8.156",
-                "MPG:27.9.157",
-                "MPG:37.1.151",
-                "MPG:37.2.152",
-                "MPG:37.3.153",
-                "MPG:37.4.154",
-                "MPG:37.5.155",
-            ],
-            [
-                "#21.1.76: 6",
-                "#21.2.77: 61'",
-                "#21.3.78: 6'",
-                "#22.1.79: -6",
-                "#22.2.80: -61'",
-                "#22.3.81: -6'",
-                "#23.1.82: 6/m",
-                "#23.2.83: 6/m1'",
-                "#23.3.84: 6'/m",
-                "#23.4.85: 6/m'",
-                "#23.5.86: 6'/m'",
-                "#24.1.87: 622",
-                "#24.2.88: 6221'",
-                "#24.3.89: 6'22'",
-                "#24.4.90: 62'2'",
-                "#24.5.149: 6'22'",
-                "#25.1.91: 6mm",
-                "#25.2.92: 6mm1'",
-                "#25.3.93: 6'mm'",
-                "#25.4.94: 6m'm'",
-                "#25.5.150: 6'mm'",
-                "#26.1.95: -6m2",
-                "#26.2.96: -6m21'",
-                "#26.3.97: -6'm'2",
-                "#26.4.98: -6'm2'",
-                "#26.5.99: -6m'2'",
-                "#27.1.100: 6/mmm",
-                "#27.2.101: 6/mmm1'",
-                "#27.3.102: 6/m'mm",
-                "#27.4.103: 6'/mmm'",
-                "#27.5.104: 6'/m'mm'",
-                "#27.6.105: 6/mm'm'",
-                "#27.7.106: 6/m'm'm'",
-                "#27.8.156: 6'/mmm'",
-                "#27.9.157: 6'/m'mm'",
-                "#37.1.151: -6m2",
-                "#37.2.152: -6m21'",
-                "#37.3.153: -6'm'2",
-                "#37.4.154: -6'm2'",
-                "#37.5.155: -6m'2'",
-            ],
-        ],
-        "MSG": [
-            [
-                "MSG:168.109",
-                "MSG:168.110",
-                "MSG:168.111",
-                "MSG:168.112",
-                "MSG:169.113",
-                "MSG:169.114",
-                "MSG:169.115",
-                "MSG:169.116",
-                "MSG:170.117",
-                "MSG:170.118",
-                "MSG:170.119",
-                "MSG:170.120",
-                "MSG:171.121",
-                "MSG:171.122",
-                "MSG:171.123",
-                "MSG:171.124",
-                "MSG:172.125",
-                "MSG:172.126",
-                "MSG:172.127",
-                "MSG:172.128",
-                "MSG:173.129",
-                "MSG:173.130",
-                "MSG:173.131",
-                "MSG:173.132",
-                "MSG:174.133",
-                "MSG:174.134",
-                "MSG:174.135",
-                "MSG:174.136",
-                "MSG:175.137",
-                "MSG:175.138",
-                "MSG:175.139",
-                "MSG:175.140",
-                "MSG:175.141",
-                "MSG:175.142",
-                "MSG:176.143",
-                "MSG:176.144",
-                "MSG:176.145",
-                "MSG:176.146",
-                "MSG:176.147",
-                "MSG:176.148",
-                "MSG:177.149",
-                "MSG:177.150",
-                "MSG:177.151",
-                "MSG:177.152",
-                "MSG:177.153",
-                "MSG:177.154",
-                "MSG:178.155",
-                "MSG:178.156",
-                "MSG:178.157",
-                "MSG:178.158",
-                "MSG:178.159",
-                "MSG:178.160",
-                "MSG:179.161",
-                "MSG:179.162",
-                "MSG:179.163",
-                "MSG:179.164",
-                "MSG:179.165",
-                "MSG:179.166",
-                "MSG:180.167",
-                "MSG:180.168",
-                "MSG:180.169",
-                "MSG:180.170",
-                "MSG:180.171",
-                "MSG:180.172",
-                "MSG:181.173",
-                "MSG:181.174",
-                "MSG:181.175",
-                "MSG:181.176",
-                "MSG:181.177",
-                "MSG:181.178",
-                "MSG:182.179",
-                "MSG:182.180",
-                "MSG:182.181",
-                "MSG:182.182",
-                "MSG:182.183",
-                "MSG:182.184",
-                "MSG:183.185",
-                "MSG:183.186",
-                "MSG:183.187",
-                "MSG:183.188",
-                "MSG:183.189",
-                "MSG:183.190",
-                "MSG:184.191",
-                "MSG:184.192",
-                "MSG:184.193",
-                "MSG:184.194",
-                "MSG:184.195",
-                "MSG:184.196",
-                "MSG:185.197",
-                "MSG:185.198",
-                "MSG:185.199",
-                "MSG:185.200",
-                "MSG:185.201",
-                "MSG:185.202",
-                "MSG:186.203",
-                "MSG:186.204",
-                "MSG:186.205",
-                "MSG:186.206",
-                "MSG:186.207",
-                "MSG:186.208",
-                "MSG:187.209",
-                "MSG:187.210",
-                "MSG:187.211",
-                "MSG:187.212",
-                "MSG:187.213",
-                "MSG:187.214",
-                "MSG:188.215",
-                "MSG:188.216",
-                "MSG:188.217",
-                "MSG:188.218",
-                "MSG:188.219",
-                "MSG:188.220",
-                "MSG:189.221",
-                "MSG:189.222",
-                "MSG:189.223",
-                "MSG:189.224",
-                "MSG:189.225",
-                "MSG:189.226",
-                "MSG:190.227",
-                "MSG:190.228",
-                "MSG:190.229",
-                "MSG:190.230",
-                "MSG:190.231",
-                "MSG:190.232",
-                "MSG:191.233",
-                "MSG:191.234",
-                "MSG:191.235",
-                "MSG:191.236",
-                "MSG:191.237",
-                "MSG:191.238",
-                "MSG:191.239",
-                "MSG:191.240",
-                "MSG:191.241",
-                "MSG:191.242",
-                "MSG:192.243",
-                "MSG:192.244",
-                "MSG:192.245",
-                "MSG:192.246",
-                "MSG:192.247",
-                "MSG:192.248",
-                "MSG:192.249",
-                "MSG:192.250",
-                "MSG:192.251",
-                "MSG:192.252",
-                "MSG:193.253",
-                "MSG:193.254",
-                "MSG:193.255",
-                "MSG:193.256",
-                "MSG:193.257",
-                "MSG:193.258",
-                "MSG:193.259",
-                "MSG:193.260",
-                "MSG:193.261",
-                "MSG:193.262",
-                "MSG:194.263",
-                "MSG:194.264",
-                "MSG:194.265",
-                "MSG:194.266",
-                "MSG:194.267",
-                "MSG:194.268",
-                "MSG:194.269",
-                "MSG:194.270",
-                "MSG:194.271",
-                "MSG:194.272",
-            ],
-            [
-                "#168.109: P6",
-                "#168.110: P61'",
-                "#168.111: P6'",
-                "#168.112: P_c6",
-                "#169.113: P6_1",
-                "#169.114: P6_11'",
-                "#169.115: P6_1'",
-                "#169.116: P_c6_1",
-                "#170.117: P6_5",
-                "#170.118: P6_51'",
-                "#170.119: P6_5'",
-                "#170.120: P_c6_5",
-                "#171.121: P6_2",
-                "#171.122: P6_21'",
-                "#171.123: P6_2'",
-                "#171.124: P_c6_2",
-                "#172.125: P6_4",
-                "#172.126: P6_41'",
-                "#172.127: P6_4'",
-                "#172.128: P_c6_4",
-                "#173.129: P6_3",
-                "#173.130: P6_31'",
-                "#173.131: P6_3'",
-                "#173.132: P_c6_3",
-                "#174.133: P-6",
-                "#174.134: P-61'",
-                "#174.135: P-6'",
-                "#174.136: P_c-6",
-                "#175.137: P6/m",
-                "#175.138: P6/m1'",
-                "#175.139: P6'/m",
-                "#175.140: P6/m'",
-                "#175.141: P6'/m'",
-                "#175.142: P_c6/m",
-                "#176.143: P6_3/m",
-                "#176.144: P6_3/m1'",
-                "#176.145: P6_3'/m",
-                "#176.146: P6_3/m'",
-                "#176.147: P6_3'/m'",
-                "#176.148: P_c6_3/m",
-                "#177.149: P622",
-                "#177.150: P6221'",
-                "#177.151: P6'2'2",
-                "#177.152: P6'22'",
-                "#177.153: P62'2'",
-                "#177.154: P_c622",
-                "#178.155: P6_122",
-                "#178.156: P6_1221'",
-                "#178.157: P6_1'2'2",
-                "#178.158: P6_1'22'",
-                "#178.159: P6_12'2'",
-                "#178.160: P_c6_122",
-                "#179.161: P6_522",
-                "#179.162: P6_5221'",
-                "#179.163: P6_5'2'2",
-                "#179.164: P6_5'22'",
-                "#179.165: P6_52'2'",
-                "#179.166: P_c6_522",
-                "#180.167: P6_222",
-                "#180.168: P6_2221'",
-                "#180.169: P6_2'2'2",
-                "#180.170: P6_2'22'",
-                "#180.171: P6_22'2'",
-                "#180.172: P_c6_222",
-                "#181.173: P6_422",
-                "#181.174: P6_4221'",
-                "#181.175: P6_4'2'2",
-                "#181.176: P6_4'22'",
-                "#181.177: P6_42'2'",
-                "#181.178: P_c6_422",
-                "#182.179: P6_322",
-                "#182.180: P6_3221'",
-                "#182.181: P6_3'2'2",
-                "#182.182: P6_3'22'",
-                "#182.183: P6_32'2'",
-                "#182.184: P_c6_322",
-                "#183.185: P6mm",
-                "#183.186: P6mm1'",
-                "#183.187: P6'm'm",
-                "#183.188: P6'mm'",
-                "#183.189: P6m'm'",
-                "#183.190: P_c6mm",
-                "#184.191: P6cc",
-                "#184.192: P6cc1'",
-                "#184.193: P6'c'c",
-                "#184.194: P6'cc'",
-                "#184.195: P6c'c'",
-                "#184.196: P_c6cc",
-                "#185.197: P6_3cm",
-                "#185.198: P6_3cm1'",
-                "#185.199: P6_3'c'm",
-                "#185.200: P6_3'cm'",
-                "#185.201: P6_3c'm'",
-                "#185.202: P_c6_3cm",
-                "#186.203: P6_3mc",
-                "#186.204: P6_3mc1'",
-                "#186.205: P6_3'm'c",
-                "#186.206: P6_3'mc'",
-                "#186.207: P6_3m'c'",
-                "#186.208: P_c6_3mc",
-                "#187.209: P-6m2",
-                "#187.210: P-6m21'",
-                "#187.211: P-6'm'2",
-                "#187.212: P-6'm2'",
-                "#187.213: P-6m'2'",
-                "#187.214: P_c-6m2",
-                "#188.215: P-6c2",
-                "#188.216: P-6c21'",
-                "#188.217: P-6'c'2",
-                "#188.218: P-6'c2'",
-                "#188.219: P-6c'2'",
-                "#188.220: P_c-6c2",
-                "#189.221: P-62m",
-                "#189.222: P-62m1'",
-                "#189.223: P-6'2'm",
-                "#189.224: P-6'2m'",
-                "#189.225: P-62'm'",
-                "#189.226: P_c-62m",
-                "#190.227: P-62c",
-                "#190.228: P-62c1'",
-                "#190.229: P-6'2'c",
-                "#190.230: P-6'2c'",
-                "#190.231: P-62'c'",
-                "#190.232: P_c-62c",
-                "#191.233: P6/mmm",
-                "#191.234: P6/mmm1'",
-                "#191.235: P6/m'mm",
-                "#191.236: P6'/mm'm",
-                "#191.237: P6'/mmm'",
-                "#191.238: P6'/m'm'm",
-                "#191.239: P6'/m'mm'",
-                "#191.240: P6/mm'm'",
-                "#191.241: P6/m'm'm'",
-                "#191.242: P_c6/mmm",
-                "#192.243: P6/mcc",
-                "#192.244: P6/mcc1'",
-                "#192.245: P6/m'cc",
-                "#192.246: P6'/mc'c",
-                "#192.247: P6'/mcc'",
-                "#192.248: P6'/m'c'c",
-                "#192.249: P6'/m'cc'",
-                "#192.250: P6/mc'c'",
-                "#192.251: P6/m'c'c'",
-                "#192.252: P_c6/mcc",
-                "#193.253: P6_3/mcm",
-                "#193.254: P6_3/mcm1'",
-                "#193.255: P6_3/m'cm",
-                "#193.256: P6_3'/mc'm",
-                "#193.257: P6_3'/mcm'",
-                "#193.258: P6_3'/m'c'm",
-                "#193.259: P6_3'/m'cm'",
-                "#193.260: P6_3/mc'm'",
-                "#193.261: P6_3/m'c'm'",
-                "#193.262: P_c6_3/mcm",
-                "#194.263: P6_3/mmc",
-                "#194.264: P6_3/mmc1'",
-                "#194.265: P6_3/m'mc",
-                "#194.266: P6_3'/mm'c",
-                "#194.267: P6_3'/mmc'",
-                "#194.268: P6_3'/m'm'c",
-                "#194.269: P6_3'/m'mc'",
-                "#194.270: P6_3/mm'c'",
-                "#194.271: P6_3/m'm'c'",
-                "#194.272: P_c6_3/mmc",
-            ],
-        ],
-    },
-    "cubic": {
-        "PG": [
-            ["PG:28", "PG:29", "PG:30", "PG:31", "PG:32"],
-            ["#28: T (23)", "#29: Th (m-3)", "#30: O (432)", "#31: Td (-43m)", "#32: Oh (m-3m)"],
-        ],
-        "SG": [
-            [
-                "SG:195",
-                "SG:196",
-                "SG:197",
-                "SG:198",
-                "SG:199",
-                "SG:200",
-                "SG:201",
-                "SG:202",
-                "SG:203",
-                "SG:204",
-                "SG:205",
-                "SG:206",
-                "SG:207",
-                "SG:208",
-                "SG:209",
-                "SG:210",
-                "SG:211",
-                "SG:212",
-                "SG:213",
-                "SG:214",
-                "SG:215",
-                "SG:216",
-                "SG:217",
-                "SG:218",
-                "SG:219",
-                "SG:220",
-                "SG:221",
-                "SG:222",
-                "SG:223",
-                "SG:224",
-                "SG:225",
-                "SG:226",
-                "SG:227",
-                "SG:228",
-                "SG:229",
-                "SG:230",
-            ],
-            [
-                "#195: T^1 (P23)",
-                "#196: T^2 (F23)",
-                "#197: T^3 (I23)",
-                "#198: T^4 (P2_13)",
-                "#199: T^5 (I2_13)",
-                "#200: Th^1 (Pm-3)",
-                "#201: Th^2 (Pn-3)",
-                "#202: Th^3 (Fm-3)",
-                "#203: Th^4 (Fd-3)",
-                "#204: Th^5 (Im-3)",
-                "#205: Th^6 (Pa-3)",
-                "#206: Th^7 (Ia-3)",
-                "#207: O^1 (P432)",
-                "#208: O^2 (P4_232)",
-                "#209: O^3 (F432)",
-                "#210: O^4 (F4_132)",
-                "#211: O^5 (I432)",
-                "#212: O^6 (P4_332)",
-                "#213: O^7 (P4_132)",
-                "#214: O^8 (I4_132)",
-                "#215: Td^1 (P-43m)",
-                "#216: Td^2 (F-43m)",
-                "#217: Td^3 (I-43m)",
-                "#218: Td^4 (P-43n)",
-                "#219: Td^5 (F-43c)",
-                "#220: Td^6 (I-43d)",
-                "#221: Oh^1 (Pm-3m)",
-                "#222: Oh^2 (Pn-3n)",
-                "#223: Oh^3 (Pm-3n)",
-                "#224: Oh^4 (Pn-3m)",
-                "#225: Oh^5 (Fm-3m)",
-                "#226: Oh^6 (Fm-3c)",
-                "#227: Oh^7 (Fd-3m)",
-                "#228: Oh^8 (Fd-3c)",
-                "#229: Oh^9 (Im-3m)",
-                "#230: Oh^10 (Ia-3d)",
-            ],
-        ],
-        "MPG": [
-            [
-                "MPG:28.1.107",
-                "MPG:28.2.108",
-                "MPG:29.1.109",
-                "MPG:29.2.110",
-                "MPG:29.3.111",
-                "MPG:30.1.112",
-                "MPG:30.2.113",
-                "MPG:30.3.114",
-                "MPG:31.1.115",
-                "MPG:31.2.116",
-                "MPG:31.3.117",
-                "MPG:32.1.118",
-                "MPG:32.2.119",
-                "MPG:32.3.120",
-                "MPG:32.4.121",
-                "MPG:32.5.122",
-            ],
-            [
-                "#28.1.107: 23",
-                "#28.2.108: 231'",
-                "#29.1.109: m-3",
-                "#29.2.110: m-31'",
-                "#29.3.111: m'-3'",
-                "#30.1.112: 432",
-                "#30.2.113: 4321'",
-                "#30.3.114: 4'32'",
-                "#31.1.115: -43m",
-                "#31.2.116: -43m1'",
-                "#31.3.117: -4'3m'",
-                "#32.1.118: m-3m",
-                "#32.2.119: m-3m1'",
-                "#32.3.120: m'-3'm",
-                "#32.4.121: m-3m'",
-                "#32.5.122: m'-3'm'",
-            ],
-        ],
-        "MSG": [
-            [
-                "MSG:195.1",
-                "MSG:195.2",
-                "MSG:195.3",
-                "MSG:196.4",
-                "MSG:196.5",
-                "MSG:196.6",
-                "MSG:197.7",
-                "MSG:197.8",
-                "MSG:198.9",
-                "MSG:198.10",
-                "MSG:198.11",
-                "MSG:199.12",
-                "MSG:199.13",
-                "MSG:200.14",
-                "MSG:200.15",
-                "MSG:200.16",
-                "MSG:200.17",
-                "MSG:201.18",
-                "MSG:201.19",
-                "MSG:201.20",
-                "MSG:201.21",
-                "MSG:202.22",
-                "MSG:202.23",
-                "MSG:202.24",
-                "MSG:202.25",
-                "MSG:203.26",
-                "MSG:203.27",
-                "MSG:203.28",
-                "MSG:203.29",
-                "MSG:204.30",
-                "MSG:204.31",
-                "MSG:204.32",
-                "MSG:205.33",
-                "MSG:205.34",
-                "MSG:205.35",
-                "MSG:205.36",
-                "MSG:206.37",
-                "MSG:206.38",
-                "MSG:206.39",
-                "MSG:207.40",
-                "MSG:207.41",
-                "MSG:207.42",
-                "MSG:207.43",
-                "MSG:208.44",
-                "MSG:208.45",
-                "MSG:208.46",
-                "MSG:208.47",
-                "MSG:209.48",
-                "MSG:209.49",
-                "MSG:209.50",
-                "MSG:209.51",
-                "MSG:210.52",
-                "MSG:210.53",
-                "MSG:210.54",
-                "MSG:210.55",
-                "MSG:211.56",
-                "MSG:211.57",
-                "MSG:211.58",
-                "MSG:212.59",
-                "MSG:212.60",
-                "MSG:212.61",
-                "MSG:212.62",
-                "MSG:213.63",
-                "MSG:213.64",
-                "MSG:213.65",
-                "MSG:213.66",
-                "MSG:214.67",
-                "MSG:214.68",
-                "MSG:214.69",
-                "MSG:215.70",
-                "MSG:215.71",
-                "MSG:215.72",
-                "MSG:215.73",
-                "MSG:216.74",
-                "MSG:216.75",
-                "MSG:216.76",
-                "MSG:216.77",
-                "MSG:217.78",
-                "MSG:217.79",
-                "MSG:217.80",
-                "MSG:218.81",
-                "MSG:218.82",
-                "MSG:218.83",
-                "MSG:218.84",
-                "MSG:219.85",
-                "MSG:219.86",
-                "MSG:219.87",
-                "MSG:219.88",
-                "MSG:220.89",
-                "MSG:220.90",
-                "MSG:220.91",
-                "MSG:221.92",
-                "MSG:221.93",
-                "MSG:221.94",
-                "MSG:221.95",
-                "MSG:221.96",
-                "MSG:221.97",
-                "MSG:222.98",
-                "MSG:222.99",
-                "MSG:222.100",
-                "MSG:222.101",
-                "MSG:222.102",
-                "MSG:222.103",
-                "MSG:223.104",
-                "MSG:223.105",
-                "MSG:223.106",
-                "MSG:223.107",
-                "MSG:223.108",
-                "MSG:223.109",
-                "MSG:224.110",
-                "MSG:224.111",
-                "MSG:224.112",
-                "MSG:224.113",
-                "MSG:224.114",
-                "MSG:224.115",
-                "MSG:225.116",
-                "MSG:225.117",
-                "MSG:225.118",
-                "MSG:225.119",
-                "MSG:225.120",
-                "MSG:225.121",
-                "MSG:226.122",
-                "MSG:226.123",
-                "MSG:226.124",
-                "MSG:226.125",
-                "MSG:226.126",
-                "MSG:226.127",
-                "MSG:227.128",
-                "MSG:227.129",
-                "MSG:227.130",
-                "MSG:227.131",
-                "MSG:227.132",
-                "MSG:227.133",
-                "MSG:228.134",
-                "MSG:228.135",
-                "MSG:228.136",
-                "MSG:228.137",
-                "MSG:228.138",
-                "MSG:228.139",
-                "MSG:229.140",
-                "MSG:229.141",
-                "MSG:229.142",
-                "MSG:229.143",
-                "MSG:229.144",
-                "MSG:230.145",
-                "MSG:230.146",
-                "MSG:230.147",
-                "MSG:230.148",
-                "MSG:230.149",
-            ],
-            [
-                "#195.1: P23",
-                "#195.2: P231'",
-                "#195.3: P_I23",
-                "#196.4: F23",
-                "#196.5: F231'",
-                "#196.6: F_S23",
-                "#197.7: I23",
-                "#197.8: I231'",
-                "#198.9: P2_13",
-                "#198.10: P2_131'",
-                "#198.11: P_I2_13",
-                "#199.12: I2_13",
-                "#199.13: I2_131'",
-                "#200.14: Pm-3",
-                "#200.15: Pm-31'",
-                "#200.16: Pm'-3'",
-                "#200.17: P_Im-3",
-                "#201.18: Pn-3",
-                "#201.19: Pn-31'",
-                "#201.20: Pn'-3'",
-                "#201.21: P_In-3",
-                "#202.22: Fm-3",
-                "#202.23: Fm-31'",
-                "#202.24: Fm'-3'",
-                "#202.25: F_Sm-3",
-                "#203.26: Fd-3",
-                "#203.27: Fd-31'",
-                "#203.28: Fd'-3'",
-                "#203.29: F_Sd-3",
-                "#204.30: Im-3",
-                "#204.31: Im-31'",
-                "#204.32: Im'-3'",
-                "#205.33: Pa-3",
-                "#205.34: Pa-31'",
-                "#205.35: Pa'-3'",
-                "#205.36: P_Ia-3",
-                "#206.37: Ia-3",
-                "#206.38: Ia-31'",
-                "#206.39: Ia'-3'",
-                "#207.40: P432",
-                "#207.41: P4321'",
-                "#207.42: P4'32'",
-                "#207.43: P_I432",
-                "#208.44: P4_232",
-                "#208.45: P4_2321'",
-                "#208.46: P4_2'32'",
-                "#208.47: P_I4_232",
-                "#209.48: F432",
-                "#209.49: F4321'",
-                "#209.50: F4'32'",
-                "#209.51: F_S432",
-                "#210.52: F4_132",
-                "#210.53: F4_1321'",
-                "#210.54: F4_1'32'",
-                "#210.55: F_S4_132",
-                "#211.56: I432",
-                "#211.57: I4321'",
-                "#211.58: I4'32'",
-                "#212.59: P4_332",
-                "#212.60: P4_3321'",
-                "#212.61: P4_3'32'",
-                "#212.62: P_I4_332",
-                "#213.63: P4_132",
-                "#213.64: P4_1321'",
-                "#213.65: P4_1'32'",
-                "#213.66: P_I4_132",
-                "#214.67: I4_132",
-                "#214.68: I4_1321'",
-                "#214.69: I4_1'32'",
-                "#215.70: P-43m",
-                "#215.71: P-43m1'",
-                "#215.72: P-4'3m'",
-                "#215.73: P_I-43m",
-                "#216.74: F-43m",
-                "#216.75: F-43m1'",
-                "#216.76: F-4'3m'",
-                "#216.77: F_S-43m",
-                "#217.78: I-43m",
-                "#217.79: I-43m1'",
-                "#217.80: I-4'3m'",
-                "#218.81: P-43n",
-                "#218.82: P-43n1'",
-                "#218.83: P-4'3n'",
-                "#218.84: P_I-43n",
-                "#219.85: F-43c",
-                "#219.86: F-43c1'",
-                "#219.87: F-4'3c'",
-                "#219.88: F_S-43c",
-                "#220.89: I-43d",
-                "#220.90: I-43d1'",
-                "#220.91: I-4'3d'",
-                "#221.92: Pm-3m",
-                "#221.93: Pm-3m1'",
-                "#221.94: Pm'-3'm",
-                "#221.95: Pm-3m'",
-                "#221.96: Pm'-3'm'",
-                "#221.97: P_Im-3m",
-                "#222.98: Pn-3n",
-                "#222.99: Pn-3n1'",
-                "#222.100: Pn'-3'n",
-                "#222.101: Pn-3n'",
-                "#222.102: Pn'-3'n'",
-                "#222.103: P_In-3n",
-                "#223.104: Pm-3n",
-                "#223.105: Pm-3n1'",
-                "#223.106: Pm'-3'n",
-                "#223.107: Pm-3n'",
-                "#223.108: Pm'-3'n'",
-                "#223.109: P_Im-3n",
-                "#224.110: Pn-3m",
-                "#224.111: Pn-3m1'",
-                "#224.112: Pn'-3'm",
-                "#224.113: Pn-3m'",
-                "#224.114: Pn'-3'm'",
-                "#224.115: P_In-3m",
-                "#225.116: Fm-3m",
-                "#225.117: Fm-3m1'",
-                "#225.118: Fm'-3'm",
-                "#225.119: Fm-3m'",
-                "#225.120: Fm'-3'm'",
-                "#225.121: F_Sm-3m",
-                "#226.122: Fm-3c",
-                "#226.123: Fm-3c1'",
-                "#226.124: Fm'-3'c",
-                "#226.125: Fm-3c'",
-                "#226.126: Fm'-3'c'",
-                "#226.127: F_Sm-3c",
-                "#227.128: Fd-3m",
-                "#227.129: Fd-3m1'",
-                "#227.130: Fd'-3'm",
-                "#227.131: Fd-3m'",
-                "#227.132: Fd'-3'm'",
-                "#227.133: F_Sd-3m",
-                "#228.134: Fd-3c",
-                "#228.135: Fd-3c1'",
-                "#228.136: Fd'-3'c",
-                "#228.137: Fd-3c'",
-                "#228.138: Fd'-3'c'",
-                "#228.139: F_Sd-3c",
-                "#229.140: Im-3m",
-                "#229.141: Im-3m1'",
-                "#229.142: Im'-3'm",
-                "#229.143: Im-3m'",
-                "#229.144: Im'-3'm'",
-                "#230.145: Ia-3d",
-                "#230.146: Ia-3d1'",
-                "#230.147: Ia'-3'd",
-                "#230.148: Ia-3d'",
-                "#230.149: Ia'-3'd'",
-            ],
-        ],
-    },
-}
+@cache
+def crystal_list():
+    """
+    Group name list for each crystal.
+
+    Returns:
+        - (dict) -- crystal: "PG/SG/MPG/MSG": name_list.
+
+    Note:
+        - derived from group list once, and shared in process.
+    """
+    return {crystal: {tp: i[1] for tp, i in v.items()} for crystal, v in group_list().items()}
+
+
+# ==================================================
+def group_index(key):
+    """
+    Index of group.
+
+    Args:
+        key (str or int): group tag, SG No., or PG/SG name (w/o No.), e.g., "SG:221", 221, "Oh^1".
+
+    Returns:
+        - (tuple) -- (crystal, type, no).
+    """
+    return _load_group_list()[1][key]
+
 
 # ==================================================
-group_list_index = {  # tag: (crystal, type, index).
-    "C1": ("triclinic", "PG", 0),
-    "PG:1": ("triclinic", "PG", 0),
-    "Ci": ("triclinic", "PG", 1),
-    "PG:2": ("triclinic", "PG", 1),
-    "C2": ("monoclinic", "PG", 0),
-    "PG:3": ("monoclinic", "PG", 0),
-    "Cs": ("monoclinic", "PG", 1),
-    "PG:4": ("monoclinic", "PG", 1),
-    "C2h": ("monoclinic", "PG", 2),
-    "PG:5": ("monoclinic", "PG", 2),
-    "D2": ("orthorhombic", "PG", 0),
-    "PG:6": ("orthorhombic", "PG", 0),
-    "C2v": ("orthorhombic", "PG", 1),
-    "PG:7": ("orthorhombic", "PG", 1),
-    "D2h": ("orthorhombic", "PG", 2),
-    "PG:8": ("orthorhombic", "PG", 2),
-    "C4": ("tetragonal", "PG", 0),
-    "PG:9": ("tetragonal", "PG", 0),
-    "S4": ("tetragonal", "PG", 1),
-    "PG:10": ("tetragonal", "PG", 1),
-    "C4h": ("tetragonal", "PG", 2),
-    "PG:11": ("tetragonal", "PG", 2),
-    "D4": ("tetragonal", "PG", 3),
-    "PG:12": ("tetragonal", "PG", 3),
-    "C4v": ("tetragonal", "PG", 4),
-    "PG:13": ("tetragonal", "PG", 4),
-    "D2d": ("tetragonal", "PG", 5),
-    "PG:14": ("tetragonal", "PG", 5),
-    "D4h": ("tetragonal", "PG", 6),
-    "PG:15": ("tetragonal", "PG", 6),
-    "D2d-1": ("tetragonal", "PG", 7),
-    "PG:33": ("tetragonal", "PG", 7),
-    "C3": ("trigonal", "PG", 0),
-    "PG:16": ("trigonal", "PG", 0),
-    "C3i": ("trigonal", "PG", 1),
-    "PG:17": ("trigonal", "PG", 1),
-    "D3": ("trigonal", "PG", 2),
-    "PG:18": ("trigonal", "PG", 2),
-    "C3v": ("trigonal", "PG", 3),
-    "PG:19": ("trigonal", "PG", 3),
-    "D3d": ("trigonal", "PG", 4),
-    "PG:20": ("trigonal", "PG", 4),
-    "D3-1": ("trigonal", "PG", 5),
-    "PG:34": ("trigonal", "PG", 5),
-    "C3v-1": ("trigonal", "PG", 6),
-    "PG:35": ("trigonal", "PG", 6),
-    "D3d-1": ("trigonal", "PG", 7),
-    "PG:36": ("trigonal", "PG", 7),
-    "C6": ("hexagonal", "PG", 0),
-    "PG:21": ("hexagonal", "PG", 0),
-    "C3h": ("hexagonal", "PG", 1),
-    "PG:22": ("hexagonal", "PG", 1),
-    "C6h": ("hexagonal", "PG", 2),
-    "PG:23": ("hexagonal", "PG", 2),
-    "D6": ("hexagonal", "PG", 3),
-    "PG:24": ("hexagonal", "PG", 3),
-    "C6v": ("hexagonal", "PG", 4),
-    "PG:25": ("hexagonal", "PG", 4),
-    "D3h": ("hexagonal", "PG", 5),
-    "PG:26": ("hexagonal", "PG", 5),
-    "D6h": ("hexagonal", "PG", 6),
-    "PG:27": ("hexagonal", "PG", 6),
-    "D3h-1": ("hexagonal", "PG", 7),
-    "PG:37": ("hexagonal", "PG", 7),
-    "T": ("cubic", "PG", 0),
-    "PG:28": ("cubic", "PG", 0),
-    "Th": ("cubic", "PG", 1),
-    "PG:29": ("cubic", "PG", 1),
-    "O": ("cubic", "PG", 2),
-    "PG:30": ("cubic", "PG", 2),
-    "Td": ("cubic", "PG", 3),
-    "PG:31": ("cubic", "PG", 3),
-    "Oh": ("cubic", "PG", 4),
-    "PG:32": ("cubic", "PG", 4),
-    "C1^1": ("triclinic", "SG", 0),
-    1: ("triclinic", "SG", 0),
-    "SG:1": ("triclinic", "SG", 0),
-    "Ci^1": ("triclinic", "SG", 1),
-    2: ("triclinic", "SG", 1),
-    "SG:2": ("triclinic", "SG", 1),
-    "C2^1": ("monoclinic", "SG", 0),
-    3: ("monoclinic", "SG", 0),
-    "SG:3": ("monoclinic", "SG", 0),
-    "C2^2": ("monoclinic", "SG", 1),
-    4: ("monoclinic", "SG", 1),
-    "SG:4": ("monoclinic", "SG", 1),
-    "C2^3": ("monoclinic", "SG", 2),
-    5: ("monoclinic", "SG", 2),
-    "SG:5": ("monoclinic", "SG", 2),
-    "Cs^1": ("monoclinic", "SG", 3),
-    6: ("monoclinic", "SG", 3),
-    "SG:6": ("monoclinic", "SG", 3),
-    "Cs^2": ("monoclinic", "SG", 4),
-    7: ("monoclinic", "SG", 4),
-    "SG:7": ("monoclinic", "SG", 4),
-    "Cs^3": ("monoclinic", "SG", 5),
-    8: ("monoclinic", "SG", 5),
-    "SG:8": ("monoclinic", "SG", 5),
-    "Cs^4": ("monoclinic", "SG", 6),
-    9: ("monoclinic", "SG", 6),
-    "SG:9": ("monoclinic", "SG", 6),
-    "C2h^1": ("monoclinic", "SG", 7),
-    10: ("monoclinic", "SG", 7),
-    "SG:10": ("monoclinic", "SG", 7),
-    "C2h^2": ("monoclinic", "SG", 8),
-    11: ("monoclinic", "SG", 8),
-    "SG:11": ("monoclinic", "SG", 8),
-    "C2h^3": ("monoclinic", "SG", 9),
-    12: ("monoclinic", "SG", 9),
-    "SG:12": ("monoclinic", "SG", 9),
-    "C2h^4": ("monoclinic", "SG", 10),
-    13: ("monoclinic", "SG", 10),
-    "SG:13": ("monoclinic", "SG", 10),
-    "C2h^5": ("monoclinic", "SG", 11),
-    14: ("monoclinic", "SG", 11),
-    "SG:14": ("monoclinic", "SG", 11),
-    "C2h^6": ("monoclinic", "SG", 12),
-    15: ("monoclinic", "SG", 12),
-    "SG:15": ("monoclinic", "SG", 12),
-    "D2^1": ("orthorhombic", "SG", 0),
-    16: ("orthorhombic", "SG", 0),
-    "SG:16": ("orthorhombic", "SG", 0),
-    "D2^2": ("orthorhombic", "SG", 1),
-    17: ("orthorhombic", "SG", 1),
-    "SG:17": ("orthorhombic", "SG", 1),
-    "D2^3": ("orthorhombic", "SG", 2),
-    18: ("orthorhombic", "SG", 2),
-    "SG:18": ("orthorhombic", "SG", 2),
-    "D2^4": ("orthorhombic", "SG", 3),
-    19: ("orthorhombic", "SG", 3),
-    "SG:19": ("orthorhombic", "SG", 3),
-    "D2^5": ("orthorhombic", "SG", 4),
-    20: ("orthorhombic", "SG", 4),
-    "SG:20": ("orthorhombic", "SG", 4),
-    "D2^6": ("orthorhombic", "SG", 5),
-    21: ("orthorhombic", "SG", 5),
-    "SG:21": ("orthorhombic", "SG", 5),
-    "D2^7": ("orthorhombic", "SG", 6),
-    22: ("orthorhombic", "SG", 6),
-    "SG:22": ("orthorhombic", "SG", 6),
-    "D2^8": ("orthorhombic", "SG", 7),
-    23: ("orthorhombic", "SG", 7),
-    "SG:23": ("orthorhombic", "SG", 7),
-    "D2^9": ("orthorhombic", "SG", 8),
-    24: ("orthorhombic", "SG", 8),
-    "SG:24": ("orthorhombic", "SG", 8),
-    "C2v^1": ("orthorhombic", "SG", 9),
-    25: ("orthorhombic", "SG", 9),
-    "SG:25": ("orthorhombic", "SG", 9),
-    "C2v^2": ("orthorhombic", "SG", 10),
-    26: ("orthorhombic", "SG", 10),
-    "SG:26": ("orthorhombic", "SG", 10),
-    "C2v^3": ("orthorhombic", "SG", 11),
-    27: ("orthorhombic", "SG", 11),
-    "SG:27": ("orthorhombic", "SG", 11),
-    "C2v^4": ("orthorhombic", "SG", 12),
-    28: ("orthorhombic", "SG", 12),
-    "SG:28": ("orthorhombic", "SG", 12),
-    "C2v^5": ("orthorhombic", "SG", 13),
-    29: ("orthorhombic", "SG", 13),
-    "SG:29": ("orthorhombic", "SG", 13),
-    "C2v^6": ("orthorhombic", "SG", 14),
-    30: ("orthorhombic", "SG", 14),
-    "SG:30": ("orthorhombic", "SG", 14),
-    "C2v^7": ("orthorhombic", "SG", 15),
-    31: ("orthorhombic", "SG", 15),
-    "SG:31": ("orthorhombic", "SG", 15),
-    "C2v^8": ("orthorhombic", "SG", 16),
-    32: ("orthorhombic", "SG", 16),
-    "SG:32": ("orthorhombic", "SG", 16),
-    "C2v^9": ("orthorhombic", "SG", 17),
-    33: ("orthorhombic", "SG", 17),
-    "SG:33": ("orthorhombic", "SG", 17),
-    "C2v^10": ("orthorhombic", "SG", 18),
-    34: ("orthorhombic", "SG", 18),
-    "SG:34": ("orthorhombic", "SG", 18),
-    "C2v^11": ("orthorhombic", "SG", 19),
-    35: ("orthorhombic", "SG", 19),
-    "SG:35": ("orthorhombic", "SG", 19),
-    "C2v^12": ("orthorhombic", "SG", 20),
-    36: ("orthorhombic", "SG", 20),
-    "SG:36": ("orthorhombic", "SG", 20),
-    "C2v^13": ("orthorhombic", "SG", 21),
-    37: ("orthorhombic", "SG", 21),
-    "SG:37": ("orthorhombic", "SG", 21),
-    "C2v^14": ("orthorhombic", "SG", 22),
-    38: ("orthorhombic", "SG", 22),
-    "SG:38": ("orthorhombic", "SG", 22),
-    "C2v^15": ("orthorhombic", "SG", 23),
-    39: ("orthorhombic", "SG", 23),
-    "SG:39": ("orthorhombic", "SG", 23),
-    "C2v^16": ("orthorhombic", "SG", 24),
-    40: ("orthorhombic", "SG", 24),
-    "SG:40": ("orthorhombic", "SG", 24),
-    "C2v^17": ("orthorhombic", "SG", 25),
-    41: ("orthorhombic", "SG", 25),
-    "SG:41": ("orthorhombic", "SG", 25),
-    "C2v^18": ("orthorhombic", "SG", 26),
-    42: ("orthorhombic", "SG", 26),
-    "SG:42": ("orthorhombic", "SG", 26),
-    "C2v^19": ("orthorhombic", "SG", 27),
-    43: ("orthorhombic", "SG", 27),
-    "SG:43": ("orthorhombic", "SG", 27),
-    "C2v^20": ("orthorhombic", "SG", 28),
-    44: ("orthorhombic", "SG", 28),
-    "SG:44": ("orthorhombic", "SG", 28),
-    "C2v^21": ("orthorhombic", "SG", 29),
-    45: ("orthorhombic", "SG", 29),
-    "SG:45": ("orthorhombic", "SG", 29),
-    "C2v^22": ("orthorhombic", "SG", 30),
-    46: ("orthorhombic", "SG", 30),
-    "SG:46": ("orthorhombic", "SG", 30),
-    "D2h^1": ("orthorhombic", "SG", 31),
-    47: ("orthorhombic", "SG", 31),
-    "SG:47": ("orthorhombic", "SG", 31),
-    "D2h^2": ("orthorhombic", "SG", 32),
-    48: ("orthorhombic", "SG", 32),
-    "SG:48": ("orthorhombic", "SG", 32),
-    "D2h^3": ("orthorhombic", "SG", 33),
-    49: ("orthorhombic", "SG", 33),
-    "SG:49": ("orthorhombic", "SG", 33),
-    "D2h^4": ("orthorhombic", "SG", 34),
-    50: ("orthorhombic", "SG", 34),
-    "SG:50": ("orthorhombic", "SG", 34),
-    "D2h^5": ("orthorhombic", "SG", 35),
-    51: ("orthorhombic", "SG", 35),
-    "SG:51": ("orthorhombic", "SG", 35),
-    "D2h^6": ("orthorhombic", "SG", 36),
-    52: ("orthorhombic", "SG", 36),
-    "SG:52": ("orthorhombic", "SG", 36),
-    "D2h^7": ("orthorhombic", "SG", 37),
-    53: ("orthorhombic", "SG", 37),
-    "SG:53": ("orthorhombic", "SG", 37),
-    "D2h^8": ("orthorhombic", "SG", 38),
-    54: ("orthorhombic", "SG", 38),
-    "SG:54": ("orthorhombic", "SG", 38),
-    "D2h^9": ("orthorhombic", "SG", 39),
-    55: ("orthorhombic", "SG", 39),
-    "SG:55": ("orthorhombic", "SG", 39),
-    "D2h^10": ("orthorhombic", "SG", 40),
-    56: ("orthorhombic", "SG", 40),
-    "SG:56": ("orthorhombic", "SG", 40),
-    "D2h^11": ("orthorhombic", "SG", 41),
-    57: ("orthorhombic", "SG", 41),
-    "SG:57": ("orthorhombic", "SG", 41),
-    "D2h^12": ("orthorhombic", "SG", 42),
-    58: ("orthorhombic", "SG", 42),
-    "SG:58": ("orthorhombic", "SG", 42),
-    "D2h^13": ("orthorhombic", "SG", 43),
-    59: ("orthorhombic", "SG", 43),
-    "SG:59": ("orthorhombic", "SG", 43),
-    "D2h^14": ("orthorhombic", "SG", 44),
-    60: ("orthorhombic", "SG", 44),
-    "SG:60": ("orthorhombic", "SG", 44),
-    "D2h^15": ("orthorhombic", "SG", 45),
-    61: ("orthorhombic", "SG", 45),
-    "SG:61": ("orthorhombic", "SG", 45),
-    "D2h^16": ("orthorhombic", "SG", 46),
-    62: ("orthorhombic", "SG", 46),
-    "SG:62": ("orthorhombic", "SG", 46),
-    "D2h^17": ("orthorhombic", "SG", 47),
-    63: ("orthorhombic", "SG", 47),
-    "SG:63": ("orthorhombic", "SG", 47),
-    "D2h^18": ("orthorhombic", "SG", 48),
-    64: ("orthorhombic", "SG", 48),
-    "SG:64": ("orthorhombic", "SG", 48),
-    "D2h^19": ("orthorhombic", "SG", 49),
-    65: ("orthorhombic", "SG", 49),
-    "SG:65": ("orthorhombic", "SG", 49),
-    "D2h^20": ("orthorhombic", "SG", 50),
-    66: ("orthorhombic", "SG", 50),
-    "SG:66": ("orthorhombic", "SG", 50),
-    "D2h^21": ("orthorhombic", "SG", 51),
-    67: ("orthorhombic", "SG", 51),
-    "SG:67": ("orthorhombic", "SG", 51),
-    "D2h^22": ("orthorhombic", "SG", 52),
-    68: ("orthorhombic", "SG", 52),
-    "SG:68": ("orthorhombic", "SG", 52),
-    "D2h^23": ("orthorhombic", "SG", 53),
-    69: ("orthorhombic", "SG", 53),
-    "SG:69": ("orthorhombic", "SG", 53),
-    "D2h^24": ("orthorhombic", "SG", 54),
-    70: ("orthorhombic", "SG", 54),
-    "SG:70": ("orthorhombic", "SG", 54),
-    "D2h^25": ("orthorhombic", "SG", 55),
-    71: ("orthorhombic", "SG", 55),
-    "SG:71": ("orthorhombic", "SG", 55),
-    "D2h^26": ("orthorhombic", "SG", 56),
-    72: ("orthorhombic", "SG", 56),
-    "SG:72": ("orthorhombic", "SG", 56),
-    "D2h^27": ("orthorhombic", "SG", 57),
-    73: ("orthorhombic", "SG", 57),
-    "SG:73": ("orthorhombic", "SG", 57),
-    "D2h^28": ("orthorhombic", "SG", 58),
-    74: ("orthorhombic", "SG", 58),
-    "SG:74": ("orthorhombic", "SG", 58),
-    "C4^1": ("tetragonal", "SG", 0),
-    75: ("tetragonal", "SG", 0),
-    "SG:75": ("tetragonal", "SG", 0),
-    "C4^2": ("tetragonal", "SG", 1),
-    76: ("tetragonal", "SG", 1),
-    "SG:76": ("tetragonal", "SG", 1),
-    "C4^3": ("tetragonal", "SG", 2),
-    77: ("tetragonal", "SG", 2),
-    "SG:77": ("tetragonal", "SG", 2),
-    "C4^4": ("tetragonal", "SG", 3),
-    78: ("tetragonal", "SG", 3),
-    "SG:78": ("tetragonal", "SG", 3),
-    "C4^5": ("tetragonal", "SG", 4),
-    79: ("tetragonal", "SG", 4),
-    "SG:79": ("tetragonal", "SG", 4),
-    "C4^6": ("tetragonal", "SG", 5),
-    80: ("tetragonal", "SG", 5),
-    "SG:80": ("tetragonal", "SG", 5),
-    "S4^1": ("tetragonal", "SG", 6),
-    81: ("tetragonal", "SG", 6),
-    "SG:81": ("tetragonal", "SG", 6),
-    "S4^2": ("tetragonal", "SG", 7),
-    82: ("tetragonal", "SG", 7),
-    "SG:82": ("tetragonal", "SG", 7),
-    "C4h^1": ("tetragonal", "SG", 8),
-    83: ("tetragonal", "SG", 8),
-    "SG:83": ("tetragonal", "SG", 8),
-    "C4h^2": ("tetragonal", "SG", 9),
-    84: ("tetragonal", "SG", 9),
-    "SG:84": ("tetragonal", "SG", 9),
-    "C4h^3": ("tetragonal", "SG", 10),
-    85: ("tetragonal", "SG", 10),
-    "SG:85": ("tetragonal", "SG", 10),
-    "C4h^4": ("tetragonal", "SG", 11),
-    86: ("tetragonal", "SG", 11),
-    "SG:86": ("tetragonal", "SG", 11),
-    "C4h^5": ("tetragonal", "SG", 12),
-    87: ("tetragonal", "SG", 12),
-    "SG:87": ("tetragonal", "SG", 12),
-    "C4h^6": ("tetragonal", "SG", 13),
-    88: ("tetragonal", "SG", 13),
-    "SG:88": ("tetragonal", "SG", 13),
-    "D4^1": ("tetragonal", "SG", 14),
-    89: ("tetragonal", "SG", 14),
-    "SG:89": ("tetragonal", "SG", 14),
-    "D4^2": ("tetragonal", "SG", 15),
-    90: ("tetragonal", "SG", 15),
-    "SG:90": ("tetragonal", "SG", 15),
-    "D4^3": ("tetragonal", "SG", 16),
-    91: ("tetragonal", "SG", 16),
-    "SG:91": ("tetragonal", "SG", 16),
-    "D4^4": ("tetragonal", "SG", 17),
-    92: ("tetragonal", "SG", 17),
-    "SG:92": ("tetragonal", "SG", 17),
-    "D4^5": ("tetragonal", "SG", 18),
-    93: ("tetragonal", "SG", 18),
-    "SG:93": ("tetragonal", "SG", 18),
-    "D4^6": ("tetragonal", "SG", 19),
-    94: ("tetragonal", "SG", 19),
-    "SG:94": ("tetragonal", "SG", 19),
-    "D4^7": ("tetragonal", "SG", 20),
-    95: ("tetragonal", "SG", 20),
-    "SG:95": ("tetragonal", "SG", 20),
-    "D4^8": ("tetragonal", "SG", 21),
-    96: ("tetragonal", "SG", 21),
-    "SG:96": ("tetragonal", "SG", 21),
-    "D4^9": ("tetragonal", "SG", 22),
-    97: ("tetragonal", "SG", 22),
-    "SG:97": ("tetragonal", "SG", 22),
-    "D4^10": ("tetragonal", "SG", 23),
-    98: ("tetragonal", "SG", 23),
-    "SG:98": ("tetragonal", "SG", 23),
-    "C4v^1": ("tetragonal", "SG", 24),
-    99: ("tetragonal", "SG", 24),
-    "SG:99": ("tetragonal", "SG", 24),
-    "C4v^2": ("tetragonal", "SG", 25),
-    100: ("tetragonal", "SG", 25),
-    "SG:100": ("tetragonal", "SG", 25),
-    "C4v^3": ("tetragonal", "SG", 26),
-    101: ("tetragonal", "SG", 26),
-    "SG:101": ("tetragonal", "SG", 26),
-    "C4v^4": ("tetragonal", "SG", 27),
-    102: ("tetragonal", "SG", 27),
-    "SG:102": ("tetragonal", "SG", 27),
-    "C4v^5": ("tetragonal", "SG", 28),
-    103: ("tetragonal", "SG", 28),
-    "SG:103": ("tetragonal", "SG", 28),
-    "C4v^6": ("tetragonal", "SG", 29),
-    104: ("tetragonal", "SG", 29),
-    "SG:104": ("tetragonal", "SG", 29),
-    "C4v^7": ("tetragonal", "SG", 30),
-    105: ("tetragonal", "SG", 30),
-    "SG:105": ("tetragonal", "SG", 30),
-    "C4v^8": ("tetragonal", "SG", 31),
-    106: ("tetragonal", "SG", 31),
-    "SG:106": ("tetragonal", "SG", 31),
-    "C4v^9": ("tetragonal", "SG", 32),
-    107: ("tetragonal", "SG", 32),
-    "SG:107": ("tetragonal", "SG", 32),
-    "C4v^10": ("tetragonal", "SG", 33),
-    108: ("tetragonal", "SG", 33),
-    "SG:108": ("tetragonal", "SG", 33),
-    "C4v^11": ("tetragonal", "SG", 34),
-    109: ("tetragonal", "SG", 34),
-    "SG:109": ("tetragonal", "SG", 34),
-    "C4v^12": ("tetragonal", "SG", 35),
-    110: ("tetragonal", "SG", 35),
-    "SG:110": ("tetragonal", "SG", 35),
-    "D2d^1": ("tetragonal", "SG", 36),
-    111: ("tetragonal", "SG", 36),
-    "SG:111": ("tetragonal", "SG", 36),
-    "D2d^2": ("tetragonal", "SG", 37),
-    112: ("tetragonal", "SG", 37),
-    "SG:112": ("tetragonal", "SG", 37),
-    "D2d^3": ("tetragonal", "SG", 38),
-    113: ("tetragonal", "SG", 38),
-    "SG:113": ("tetragonal", "SG", 38),
-    "D2d^4": ("tetragonal", "SG", 39),
-    114: ("tetragonal", "SG", 39),
-    "SG:114": ("tetragonal", "SG", 39),
-    "D2d^5": ("tetragonal", "SG", 40),
-    115: ("tetragonal", "SG", 40),
-    "SG:115": ("tetragonal", "SG", 40),
-    "D2d^6": ("tetragonal", "SG", 41),
-    116: ("tetragonal", "SG", 41),
-    "SG:116": ("tetragonal", "SG", 41),
-    "D2d^7": ("tetragonal", "SG", 42),
-    117: ("tetragonal", "SG", 42),
-    "SG:117": ("tetragonal", "SG", 42),
-    "D2d^8": ("tetragonal", "SG", 43),
-    118: ("tetragonal", "SG", 43),
-    "SG:118": ("tetragonal", "SG", 43),
-    "D2d^9": ("tetragonal", "SG", 44),
-    119: ("tetragonal", "SG", 44),
-    "SG:119": ("tetragonal", "SG", 44),
-    "D2d^10": ("tetragonal", "SG", 45),
-    120: ("tetragonal", "SG", 45),
-    "SG:120": ("tetragonal", "SG", 45),
-    "D2d^11": ("tetragonal", "SG", 46),
-    121: ("tetragonal", "SG", 46),
-    "SG:121": ("tetragonal", "SG", 46),
-    "D2d^12": ("tetragonal", "SG", 47),
-    122: ("tetragonal", "SG", 47),
-    "SG:122": ("tetragonal", "SG", 47),
-    "D4h^1": ("tetragonal", "SG", 48),
-    123: ("tetragonal", "SG", 48),
-    "SG:123": ("tetragonal", "SG", 48),
-    "D4h^2": ("tetragonal", "SG", 49),
-    124: ("tetragonal", "SG", 49),
-    "SG:124": ("tetragonal", "SG", 49),
-    "D4h^3": ("tetragonal", "SG", 50),
-    125: ("tetragonal", "SG", 50),
-    "SG:125": ("tetragonal", "SG", 50),
-    "D4h^4": ("tetragonal", "SG", 51),
-    126: ("tetragonal", "SG", 51),
-    "SG:126": ("tetragonal", "SG", 51),
-    "D4h^5": ("tetragonal", "SG", 52),
-    127: ("tetragonal", "SG", 52),
-    "SG:127": ("tetragonal", "SG", 52),
-    "D4h^6": ("tetragonal", "SG", 53),
-    128: ("tetragonal", "SG", 53),
-    "SG:128": ("tetragonal", "SG", 53),
-    "D4h^7": ("tetragonal", "SG", 54),
-    129: ("tetragonal", "SG", 54),
-    "SG:129": ("tetragonal", "SG", 54),
-    "D4h^8": ("tetragonal", "SG", 55),
-    130: ("tetragonal", "SG", 55),
-    "SG:130": ("tetragonal", "SG", 55),
-    "D4h^9": ("tetragonal", "SG", 56),
-    131: ("tetragonal", "SG", 56),
-    "SG:131": ("tetragonal", "SG", 56),
-    "D4h^10": ("tetragonal", "SG", 57),
-    132: ("tetragonal", "SG", 57),
-    "SG:132": ("tetragonal", "SG", 57),
-    "D4h^11": ("tetragonal", "SG", 58),
-    133: ("tetragonal", "SG", 58),
-    "SG:133": ("tetragonal", "SG", 58),
-    "D4h^12": ("tetragonal", "SG", 59),
-    134: ("tetragonal", "SG", 59),
-    "SG:134": ("tetragonal", "SG", 59),
-    "D4h^13": ("tetragonal", "SG", 60),
-    135: ("tetragonal", "SG", 60),
-    "SG:135": ("tetragonal", "SG", 60),
-    "D4h^14": ("tetragonal", "SG", 61),
-    136: ("tetragonal", "SG", 61),
-    "SG:136": ("tetragonal", "SG", 61),
-    "D4h^15": ("tetragonal", "SG", 62),
-    137: ("tetragonal", "SG", 62),
-    "SG:137": ("tetragonal", "SG", 62),
-    "D4h^16": ("tetragonal", "SG", 63),
-    138: ("tetragonal", "SG", 63),
-    "SG:138": ("tetragonal", "SG", 63),
-    "D4h^17": ("tetragonal", "SG", 64),
-    139: ("tetragonal", "SG", 64),
-    "SG:139": ("tetragonal", "SG", 64),
-    "D4h^18": ("tetragonal", "SG", 65),
-    140: ("tetragonal", "SG", 65),
-    "SG:140": ("tetragonal", "SG", 65),
-    "D4h^19": ("tetragonal", "SG", 66),
-    141: ("tetragonal", "SG", 66),
-    "SG:141": ("tetragonal", "SG", 66),
-    "D4h^20": ("tetragonal", "SG", 67),
-    142: ("tetragonal", "SG", 67),
-    "SG:142": ("tetragonal", "SG", 67),
-    "C3^1": ("trigonal", "SG", 0),
-    143: ("trigonal", "SG", 0),
-    "SG:143": ("trigonal", "SG", 0),
-    "C3^2": ("trigonal", "SG", 1),
-    144: ("trigonal", "SG", 1),
-    "SG:144": ("trigonal", "SG", 1),
-    "C3^3": ("trigonal", "SG", 2),
-    145: ("trigonal", "SG", 2),
-    "SG:145": ("trigonal", "SG", 2),
-    "C3^4": ("trigonal", "SG", 3),
-    146: ("trigonal", "SG", 3),
-    "SG:146": ("trigonal", "SG", 3),
-    "C3i^1": ("trigonal", "SG", 4),
-    147: ("trigonal", "SG", 4),
-    "SG:147": ("trigonal", "SG", 4),
-    "C3i^2": ("trigonal", "SG", 5),
-    148: ("trigonal", "SG", 5),
-    "SG:148": ("trigonal", "SG", 5),
-    "D3^1": ("trigonal", "SG", 6),
-    149: ("trigonal", "SG", 6),
-    "SG:149": ("trigonal", "SG", 6),
-    "D3^2": ("trigonal", "SG", 7),
-    150: ("trigonal", "SG", 7),
-    "SG:150": ("trigonal", "SG", 7),
-    "D3^3": ("trigonal", "SG", 8),
-    151: ("trigonal", "SG", 8),
-    "SG:151": ("trigonal", "SG", 8),
-    "D3^4": ("trigonal", "SG", 9),
-    152: ("trigonal", "SG", 9),
-    "SG:152": ("trigonal", "SG", 9),
-    "D3^5": ("trigonal", "SG", 10),
-    153: ("trigonal", "SG", 10),
-    "SG:153": ("trigonal", "SG", 10),
-    "D3^6": ("trigonal", "SG", 11),
-    154: ("trigonal", "SG", 11),
-    "SG:154": ("trigonal", "SG", 11),
-    "D3^7": ("trigonal", "SG", 12),
-    155: ("trigonal", "SG", 12),
-    "SG:155": ("trigonal", "SG", 12),
-    "C3v^1": ("trigonal", "SG", 13),
-    156: ("trigonal", "SG", 13),
-    "SG:156": ("trigonal", "SG", 13),
-    "C3v^2": ("trigonal", "SG", 14),
-    157: ("trigonal", "SG", 14),
-    "SG:157": ("trigonal", "SG", 14),
-    "C3v^3": ("trigonal", "SG", 15),
-    158: ("trigonal", "SG", 15),
-    "SG:158": ("trigonal", "SG", 15),
-    "C3v^4": ("trigonal", "SG", 16),
-    159: ("trigonal", "SG", 16),
-    "SG:159": ("trigonal", "SG", 16),
-    "C3v^5": ("trigonal", "SG", 17),
-    160: ("trigonal", "SG", 17),
-    "SG:160": ("trigonal", "SG", 17),
-    "C3v^6": ("trigonal", "SG", 18),
-    161: ("trigonal", "SG", 18),
-    "SG:161": ("trigonal", "SG", 18),
-    "D3d^1": ("trigonal", "SG", 19),
-    162: ("trigonal", "SG", 19),
-    "SG:162": ("trigonal", "SG", 19),
-    "D3d^2": ("trigonal", "SG", 20),
-    163: ("trigonal", "SG", 20),
-    "SG:163": ("trigonal", "SG", 20),
-    "D3d^3": ("trigonal", "SG", 21),
-    164: ("trigonal", "SG", 21),
-    "SG:164": ("trigonal", "SG", 21),
-    "D3d^4": ("trigonal", "SG", 22),
-    165: ("trigonal", "SG", 22),
-    "SG:165": ("trigonal", "SG", 22),
-    "D3d^5": ("trigonal", "SG", 23),
-    166: ("trigonal", "SG", 23),
-    "SG:166": ("trigonal", "SG", 23),
-    "D3d^6": ("trigonal", "SG", 24),
-    167: ("trigonal", "SG", 24),
-    "SG:167": ("trigonal", "SG", 24),
-    "C6^1": ("hexagonal", "SG", 0),
-    168: ("hexagonal", "SG", 0),
-    "SG:168": ("hexagonal", "SG", 0),
-    "C6^2": ("hexagonal", "SG", 1),
-    169: ("hexagonal", "SG", 1),
-    "SG:169": ("hexagonal", "SG", 1),
-    "C6^3": ("hexagonal", "SG", 2),
-    170: ("hexagonal", "SG", 2),
-    "SG:170": ("hexagonal", "SG", 2),
-    "C6^4": ("hexagonal", "SG", 3),
-    171: ("hexagonal", "SG", 3),
-    "SG:171": ("hexagonal", "SG", 3),
-    "C6^5": ("hexagonal", "SG", 4),
-    172: ("hexagonal", "SG", 4),
-    "SG:172": ("hexagonal", "SG", 4),
-    "C6^6": ("hexagonal", "SG", 5),
-    173: ("hexagonal", "SG", 5),
-    "SG:173": ("hexagonal", "SG", 5),
-    "C3h^1": ("hexagonal", "SG", 6),
-    174: ("hexagonal", "SG", 6),
-    "SG:174": ("hexagonal", "SG", 6),
-    "C6h^1": ("hexagonal", "SG", 7),
-    175: ("hexagonal", "SG", 7),
-    "SG:175": ("hexagonal", "SG", 7),
-    "C6h^2": ("hexagonal", "SG", 8),
-    176: ("hexagonal", "SG", 8),
-    "SG:176": ("hexagonal", "SG", 8),
-    "D6^1": ("hexagonal", "SG", 9),
-    177: ("hexagonal", "SG", 9),
-    "SG:177": ("hexagonal", "SG", 9),
-    "D6^2": ("hexagonal", "SG", 10),
-    178: ("hexagonal", "SG", 10),
-    "SG:178": ("hexagonal", "SG", 10),
-    "D6^3": ("hexagonal", "SG", 11),
-    179: ("hexagonal", "SG", 11),
-    "SG:179": ("hexagonal", "SG", 11),
-    "D6^4": ("hexagonal", "SG", 12),
-    180: ("hexagonal", "SG", 12),
-    "SG:180": ("hexagonal", "SG", 12),
-    "D6^5": ("hexagonal", "SG", 13),
-    181: ("hexagonal", "SG", 13),
-    "SG:181": ("hexagonal", "SG", 13),
-    "D6^6": ("hexagonal", "SG", 14),
-    182: ("hexagonal", "SG", 14),
-    "SG:182": ("hexagonal", "SG", 14),
-    "C6v^1": ("hexagonal", "SG", 15),
-    183: ("hexagonal", "SG", 15),
-    "SG:183": ("hexagonal", "SG", 15),
-    "C6v^2": ("hexagonal", "SG", 16),
-    184: ("hexagonal", "SG", 16),
-    "SG:184": ("hexagonal", "SG", 16),
-    "C6v^3": ("hexagonal", "SG", 17),
-    185: ("hexagonal", "SG", 17),
-    "SG:185": ("hexagonal", "SG", 17),
-    "C6v^4": ("hexagonal", "SG", 18),
-    186: ("hexagonal", "SG", 18),
-    "SG:186": ("hexagonal", "SG", 18),
-    "D3h^1": ("hexagonal", "SG", 19),
-    187: ("hexagonal", "SG", 19),
-    "SG:187": ("hexagonal", "SG", 19),
-    "D3h^2": ("hexagonal", "SG", 20),
-    188: ("hexagonal", "SG", 20),
-    "SG:188": ("hexagonal", "SG", 20),
-    "D3h^3": ("hexagonal", "SG", 21),
-    189: ("hexagonal", "SG", 21),
-    "SG:189": ("hexagonal", "SG", 21),
-    "D3h^4": ("hexagonal", "SG", 22),
-    190: ("hexagonal", "SG", 22),
-    "SG:190": ("hexagonal", "SG", 22),
-    "D6h^1": ("hexagonal", "SG", 23),
-    191: ("hexagonal", "SG", 23),
-    "SG:191": ("hexagonal", "SG", 23),
-    "D6h^2": ("hexagonal", "SG", 24),
-    192: ("hexagonal", "SG", 24),
-    "SG:192": ("hexagonal", "SG", 24),
-    "D6h^3": ("hexagonal", "SG", 25),
-    193: ("hexagonal", "SG", 25),
-    "SG:193": ("hexagonal", "SG", 25),
-    "D6h^4": ("hexagonal", "SG", 26),
-    194: ("hexagonal", "SG", 26),
-    "SG:194": ("hexagonal", "SG", 26),
-    "T^1": ("cubic", "SG", 0),
-    195: ("cubic", "SG", 0),
-    "SG:195": ("cubic", "SG", 0),
-    "T^2": ("cubic", "SG", 1),
-    196: ("cubic", "SG", 1),
-    "SG:196": ("cubic", "SG", 1),
-    "T^3": ("cubic", "SG", 2),
-    197: ("cubic", "SG", 2),
-    "SG:197": ("cubic", "SG", 2),
-    "T^4": ("cubic", "SG", 3),
-    198: ("cubic", "SG", 3),
-    "SG:198": ("cubic", "SG", 3),
-    "T^5": ("cubic", "SG", 4),
-    199: ("cubic", "SG", 4),
-    "SG:199": ("cubic", "SG", 4),
-    "Th^1": ("cubic", "SG", 5),
-    200: ("cubic", "SG", 5),
-    "SG:200": ("cubic", "SG", 5),
-    "Th^2": ("cubic", "SG", 6),
-    201: ("cubic", "SG", 6),
-    "SG:201": ("cubic", "SG", 6),
-    "Th^3": ("cubic", "SG", 7),
-    202: ("cubic", "SG", 7),
-    "SG:202": ("cubic", "SG", 7),
-    "Th^4": ("cubic", "SG", 8),
-    203: ("cubic", "SG", 8),
-    "SG:203": ("cubic", "SG", 8),
-    "Th^5": ("cubic", "SG", 9),
-    204: ("cubic", "SG", 9),
-    "SG:204": ("cubic", "SG", 9),
-    "Th^6": ("cubic", "SG", 10),
-    205: ("cubic", "SG", 10),
-    "SG:205": ("cubic", "SG", 10),
-    "Th^7": ("cubic", "SG", 11),
-    206: ("cubic", "SG", 11),
-    "SG:206": ("cubic", "SG", 11),
-    "O^1": ("cubic", "SG", 12),
-    207: ("cubic", "SG", 12),
-    "SG:207": ("cubic", "SG", 12),
-    "O^2": ("cubic", "SG", 13),
-    208: ("cubic", "SG", 13),
-    "SG:208": ("cubic", "SG", 13),
-    "O^3": ("cubic", "SG", 14),
-    209: ("cubic", "SG", 14),
-    "SG:209": ("cubic", "SG", 14),
-    "O^4": ("cubic", "SG", 15),
-    210: ("cubic", "SG", 15),
-    "SG:210": ("cubic", "SG", 15),
-    "O^5": ("cubic", "SG", 16),
-    211: ("cubic", "SG", 16),
-    "SG:211": ("cubic", "SG", 16),
-    "O^6": ("cubic", "SG", 17),
-    212: ("cubic", "SG", 17),
-    "SG:212": ("cubic", "SG", 17),
-    "O^7": ("cubic", "SG", 18),
-    213: ("cubic", "SG", 18),
-    "SG:213": ("cubic", "SG", 18),
-    "O^8": ("cubic", "SG", 19),
-    214: ("cubic", "SG", 19),
-    "SG:214": ("cubic", "SG", 19),
-    "Td^1": ("cubic", "SG", 20),
-    215: ("cubic", "SG", 20),
-    "SG:215": ("cubic", "SG", 20),
-    "Td^2": ("cubic", "SG", 21),
-    216: ("cubic", "SG", 21),
-    "SG:216": ("cubic", "SG", 21),
-    "Td^3": ("cubic", "SG", 22),
-    217: ("cubic", "SG", 22),
-    "SG:217": ("cubic", "SG", 22),
-    "Td^4": ("cubic", "SG", 23),
-    218: ("cubic", "SG", 23),
-    "SG:218": ("cubic", "SG", 23),
-    "Td^5": ("cubic", "SG", 24),
-    219: ("cubic", "SG", 24),
-    "SG:219": ("cubic", "SG", 24),
-    "Td^6": ("cubic", "SG", 25),
-    220: ("cubic", "SG", 25),
-    "SG:220": ("cubic", "SG", 25),
-    "Oh^1": ("cubic", "SG", 26),
-    221: ("cubic", "SG", 26),
-    "SG:221": ("cubic", "SG", 26),
-    "Oh^2": ("cubic", "SG", 27),
-    222: ("cubic", "SG", 27),
-    "SG:222": ("cubic", "SG", 27),
-    "Oh^3": ("cubic", "SG", 28),
-    223: ("cubic", "SG", 28),
-    "SG:223": ("cubic", "SG", 28),
-    "Oh^4": ("cubic", "SG", 29),
-    224: ("cubic", "SG", 29),
-    "SG:224": ("cubic", "SG", 29),
-    "Oh^5": ("cubic", "SG", 30),
-    225: ("cubic", "SG", 30),
-    "SG:225": ("cubic", "SG", 30),
-    "Oh^6": ("cubic", "SG", 31),
-    226: ("cubic", "SG", 31),
-    "SG:226": ("cubic", "SG", 31),
-    "Oh^7": ("cubic", "SG", 32),
-    227: ("cubic", "SG", 32),
-    "SG:227": ("cubic", "SG", 32),
-    "Oh^8": ("cubic", "SG", 33),
-    228: ("cubic", "SG", 33),
-    "SG:228": ("cubic", "SG", 33),
-    "Oh^9": ("cubic", "SG", 34),
-    229: ("cubic", "SG", 34),
-    "SG:229": ("cubic", "SG", 34),
-    "Oh^10": ("cubic", "SG", 35),
-    230: ("cubic", "SG", 35),
-    "SG:230": ("cubic", "SG", 35),
-    "MPG:1.1.1": ("triclinic", "MPG", 0),
-    "MPG:1.2.2": ("triclinic", "MPG", 1),
-    "MPG:2.1.3": ("triclinic", "MPG", 2),
-    "MPG:2.2.4": ("triclinic", "MPG", 3),
-    "MPG:2.3.5": ("triclinic", "MPG", 4),
-    "MPG:3.1.6": ("monoclinic", "MPG", 0),
-    "MPG:3.2.7": ("monoclinic", "MPG", 1),
-    "MPG:3.3.8": ("monoclinic", "MPG", 2),
-    "MPG:4.1.9": ("monoclinic", "MPG", 3),
-    "MPG:4.2.10": ("monoclinic", "MPG", 4),
-    "MPG:4.3.11": ("monoclinic", "MPG", 5),
-    "MPG:5.1.12": ("monoclinic", "MPG", 6),
-    "MPG:5.2.13": ("monoclinic", "MPG", 7),
-    "MPG:5.3.14": ("monoclinic", "MPG", 8),
-    "MPG:5.4.15": ("monoclinic", "MPG", 9),
-    "MPG:5.5.16": ("monoclinic", "MPG", 10),
-    "MPG:6.1.17": ("orthorhombic", "MPG", 0),
-    "MPG:6.2.18": ("orthorhombic", "MPG", 1),
-    "MPG:6.3.19": ("orthorhombic", "MPG", 2),
-    "MPG:6.4.123": ("orthorhombic", "MPG", 3),
-    "MPG:7.1.20": ("orthorhombic", "MPG", 4),
-    "MPG:7.2.21": ("orthorhombic", "MPG", 5),
-    "MPG:7.3.22": ("orthorhombic", "MPG", 6),
-    "MPG:7.4.23": ("orthorhombic", "MPG", 7),
-    "MPG:7.5.124": ("orthorhombic", "MPG", 8),
-    "MPG:8.1.24": ("orthorhombic", "MPG", 9),
-    "MPG:8.2.25": ("orthorhombic", "MPG", 10),
-    "MPG:8.3.26": ("orthorhombic", "MPG", 11),
-    "MPG:8.4.27": ("orthorhombic", "MPG", 12),
-    "MPG:8.5.28": ("orthorhombic", "MPG", 13),
-    "MPG:8.6.125": ("orthorhombic", "MPG", 14),
-    "MPG:8.7.126": ("orthorhombic", "MPG", 15),
-    "MPG:8.8.127": ("orthorhombic", "MPG", 16),
-    "MPG:8.9.128": ("orthorhombic", "MPG", 17),
-    "MPG:9.1.29": ("tetragonal", "MPG", 0),
-    "MPG:9.2.30": ("tetragonal", "MPG", 1),
-    "MPG:9.3.31": ("tetragonal", "MPG", 2),
-    "MPG:10.1.32": ("tetragonal", "MPG", 3),
-    "MPG:10.2.33": ("tetragonal", "MPG", 4),
-    "MPG:10.3.34": ("tetragonal", "MPG", 5),
-    "MPG:11.1.35": ("tetragonal", "MPG", 6),
-    "MPG:11.2.36": ("tetragonal", "MPG", 7),
-    "MPG:11.3.37": ("tetragonal", "MPG", 8),
-    "MPG:11.4.38": ("tetragonal", "MPG", 9),
-    "MPG:11.5.39": ("tetragonal", "MPG", 10),
-    "MPG:12.1.40": ("tetragonal", "MPG", 11),
-    "MPG:12.2.41": ("tetragonal", "MPG", 12),
-    "MPG:12.3.42": ("tetragonal", "MPG", 13),
-    "MPG:12.4.43": ("tetragonal", "MPG", 14),
-    "MPG:12.5.129": ("tetragonal", "MPG", 15),
-    "MPG:13.1.44": ("tetragonal", "MPG", 16),
-    "MPG:13.2.45": ("tetragonal", "MPG", 17),
-    "MPG:13.3.46": ("tetragonal", "MPG", 18),
-    "MPG:13.4.47": ("tetragonal", "MPG", 19),
-    "MPG:13.5.130": ("tetragonal", "MPG", 20),
-    "MPG:14.1.48": ("tetragonal", "MPG", 21),
-    "MPG:14.2.49": ("tetragonal", "MPG", 22),
-    "MPG:14.3.50": ("tetragonal", "MPG", 23),
-    "MPG:14.4.51": ("tetragonal", "MPG", 24),
-    "MPG:14.5.52": ("tetragonal", "MPG", 25),
-    "MPG:15.1.53": ("tetragonal", "MPG", 26),
-    "MPG:15.2.54": ("tetragonal", "MPG", 27),
-    "MPG:15.3.55": ("tetragonal", "MPG", 28),
-    "MPG:15.4.56": ("tetragonal", "MPG", 29),
-    "MPG:15.5.57": ("tetragonal", "MPG", 30),
-    "MPG:15.6.58": ("tetragonal", "MPG", 31),
-    "MPG:15.7.59": ("tetragonal", "MPG", 32),
-    "MPG:15.8.136": ("tetragonal", "MPG", 33),
-    "MPG:15.9.137": ("tetragonal", "MPG", 34),
-    "MPG:33.1.131": ("tetragonal", "MPG", 35),
-    "MPG:33.2.132": ("tetragonal", "MPG", 36),
-    "MPG:33.3.133": ("tetragonal", "MPG", 37),
-    "MPG:33.4.134": ("tetragonal", "MPG", 38),
-    "MPG:33.5.135": ("tetragonal", "MPG", 39),
-    "MPG:16.1.60": ("trigonal", "MPG", 0),
-    "MPG:16.2.61": ("trigonal", "MPG", 1),
-    "MPG:17.1.62": ("trigonal", "MPG", 2),
-    "MPG:17.2.63": ("trigonal", "MPG", 3),
-    "MPG:17.3.64": ("trigonal", "MPG", 4),
-    "MPG:18.1.65": ("trigonal", "MPG", 5),
-    "MPG:18.2.66": ("trigonal", "MPG", 6),
-    "MPG:18.3.67": ("trigonal", "MPG", 7),
-    "MPG:19.1.68": ("trigonal", "MPG", 8),
-    "MPG:19.2.69": ("trigonal", "MPG", 9),
-    "MPG:19.3.70": ("trigonal", "MPG", 10),
-    "MPG:20.1.71": ("trigonal", "MPG", 11),
-    "MPG:20.2.72": ("trigonal", "MPG", 12),
-    "MPG:20.3.73": ("trigonal", "MPG", 13),
-    "MPG:20.4.74": ("trigonal", "MPG", 14),
-    "MPG:20.5.75": ("trigonal", "MPG", 15),
-    "MPG:34.1.138": ("trigonal", "MPG", 16),
-    "MPG:34.2.139": ("trigonal", "MPG", 17),
-    "MPG:34.3.140": ("trigonal", "MPG", 18),
-    "MPG:35.1.141": ("trigonal", "MPG", 19),
-    "MPG:35.2.142": ("trigonal", "MPG", 20),
-    "MPG:35.3.143": ("trigonal", "MPG", 21),
-    "MPG:36.1.144": ("trigonal", "MPG", 22),
-    "MPG:36.2.145": ("trigonal", "MPG", 23),
-    "MPG:36.3.146": ("trigonal", "MPG", 24),
-    "MPG:36.4.147": ("trigonal", "MPG", 25),
-    "MPG:36.5.148": ("trigonal", "MPG", 26),
-    "MPG:21.1.76": ("hexagonal", "MPG", 0),
-    "MPG:21.2.77": ("hexagonal", "MPG", 1),
-    "MPG:21.3.78": ("hexagonal", "MPG", 2),
-    "MPG:22.1.79": ("hexagonal", "MPG", 3),
-    "MPG:22.2.80": ("hexagonal", "MPG", 4),
-    "MPG:22.3.81": ("hexagonal", "MPG", 5),
-    "MPG:23.1.82": ("hexagonal", "MPG", 6),
-    "MPG:23.2.83": ("hexagonal", "MPG", 7),
-    "MPG:23.3.84": ("hexagonal", "MPG", 8),
-    "MPG:23.4.85": ("hexagonal", "MPG", 9),
-    "MPG:23.5.86": ("hexagonal", "MPG", 10),
-    "MPG:24.1.87": ("hexagonal", "MPG", 11),
-    "MPG:24.2.88": ("hexagonal", "MPG", 12),
-    "MPG:24.3.89": ("hexagonal", "MPG", 13),
-    "MPG:24.4.90": ("hexagonal", "MPG", 14),
-    "MPG:24.5.149": ("hexagonal", "MPG", 15),
-    "MPG:25.1.91": ("hexagonal", "MPG", 16),
-    "MPG:25.2.92": ("hexagonal", "MPG", 17),
-    "MPG:25.3.93": ("hexagonal", "MPG", 18),
-    "MPG:25.4.94": ("hexagonal", "MPG", 19),
-    "MPG:25.5.150": ("hexagonal", "MPG", 20),
-    "MPG:26.1.95": ("hexagonal", "MPG", 21),
-    "MPG:26.2.96": ("hexagonal", "MPG", 22),
-    "MPG:26.3.97": ("hexagonal", "MPG", 23),
-    "MPG:26.4.98": ("hexagonal", "MPG", 24),
-    "MPG:26.5.99": ("hexagonal", "MPG", 25),
-    "MPG:27.1.100": ("hexagonal", "MPG", 26),
-    "MPG:27.2.101": ("hexagonal", "MPG", 27),
-    "MPG:27.3.102": ("hexagonal", "MPG", 28),
-    "MPG:27.4.103": ("hexagonal", "MPG", 29),
-    "MPG:27.5.104": ("hexagonal", "MPG", 30),
-    "MPG:27.6.105": ("hexagonal", "MPG", 31),
-    "MPG:27.7.106": ("hexagonal", "MPG", 32),
-    "MPG:27.8.156": ("hexagonal", "MPG", 33),
-    "MPG:27.9.157": ("hexagonal", "MPG", 34),
-    "MPG:37.1.151": ("hexagonal", "MPG", 35),
-    "MPG:37.2.152": ("hexagonal", "MPG", 36),
-    "MPG:37.3.153": ("hexagonal", "MPG", 37),
-    "MPG:37.4.154": ("hexagonal", "MPG", 38),
-    "MPG:37.5.155": ("hexagonal", "MPG", 39),
-    "MPG:28.1.107": ("cubic", "MPG", 0),
-    "MPG:28.2.108": ("cubic", "MPG", 1),
-    "MPG:29.1.109": ("cubic", "MPG", 2),
-    "MPG:29.2.110": ("cubic", "MPG", 3),
-    "MPG:29.3.111": ("cubic", "MPG", 4),
-    "MPG:30.1.112": ("cubic", "MPG", 5),
-    "MPG:30.2.113": ("cubic", "MPG", 6),
-    "MPG:30.3.114": ("cubic", "MPG", 7),
-    "MPG:31.1.115": ("cubic", "MPG", 8),
-    "MPG:31.2.116": ("cubic", "MPG", 9),
-    "MPG:31.3.117": ("cubic", "MPG", 10),
-    "MPG:32.1.118": ("cubic", "MPG", 11),
-    "MPG:32.2.119": ("cubic", "MPG", 12),
-    "MPG:32.3.120": ("cubic", "MPG", 13),
-    "MPG:32.4.121": ("cubic", "MPG", 14),
-    "MPG:32.5.122": ("cubic", "MPG", 15),
-    "MSG:1.1": ("triclinic", "MSG", 0),
-    "MSG:1.2": ("triclinic", "MSG", 1),
-    "MSG:1.3": ("triclinic", "MSG", 2),
-    "MSG:2.4": ("triclinic", "MSG", 3),
-    "MSG:2.5": ("triclinic", "MSG", 4),
-    "MSG:2.6": ("triclinic", "MSG", 5),
-    "MSG:2.7": ("triclinic", "MSG", 6),
-    "MSG:3.1": ("monoclinic", "MSG", 0),
-    "MSG:3.2": ("monoclinic", "MSG", 1),
-    "MSG:3.3": ("monoclinic", "MSG", 2),
-    "MSG:3.4": ("monoclinic", "MSG", 3),
-    "MSG:3.5": ("monoclinic", "MSG", 4),
-    "MSG:3.6": ("monoclinic", "MSG", 5),
-    "MSG:4.7": ("monoclinic", "MSG", 6),
-    "MSG:4.8": ("monoclinic", "MSG", 7),
-    "MSG:4.9": ("monoclinic", "MSG", 8),
-    "MSG:4.10": ("monoclinic", "MSG", 9),
-    "MSG:4.11": ("monoclinic", "MSG", 10),
-    "MSG:4.12": ("monoclinic", "MSG", 11),
-    "MSG:5.13": ("monoclinic", "MSG", 12),
-    "MSG:5.14": ("monoclinic", "MSG", 13),
-    "MSG:5.15": ("monoclinic", "MSG", 14),
-    "MSG:5.16": ("monoclinic", "MSG", 15),
-    "MSG:5.17": ("monoclinic", "MSG", 16),
-    "MSG:6.18": ("monoclinic", "MSG", 17),
-    "MSG:6.19": ("monoclinic", "MSG", 18),
-    "MSG:6.20": ("monoclinic", "MSG", 19),
-    "MSG:6.21": ("monoclinic", "MSG", 20),
-    "MSG:6.22": ("monoclinic", "MSG", 21),
-    "MSG:6.23": ("monoclinic", "MSG", 22),
-    "MSG:7.24": ("monoclinic", "MSG", 23),
-    "MSG:7.25": ("monoclinic", "MSG", 24),
-    "MSG:7.26": ("monoclinic", "MSG", 25),
-    "MSG:7.27": ("monoclinic", "MSG", 26),
-    "MSG:7.28": ("monoclinic", "MSG", 27),
-    "MSG:7.29": ("monoclinic", "MSG", 28),
-    "MSG:7.30": ("monoclinic", "MSG", 29),
-    "MSG:7.31": ("monoclinic", "MSG", 30),
-    "MSG:8.32": ("monoclinic", "MSG", 31),
-    "MSG:8.33": ("monoclinic", "MSG", 32),
-    "MSG:8.34": ("monoclinic", "MSG", 33),
-    "MSG:8.35": ("monoclinic", "MSG", 34),
-    "MSG:8.36": ("monoclinic", "MSG", 35),
-    "MSG:9.37": ("monoclinic", "MSG", 36),
-    "MSG:9.38": ("monoclinic", "MSG", 37),
-    "MSG:9.39": ("monoclinic", "MSG", 38),
-    "MSG:9.40": ("monoclinic", "MSG", 39),
-    "MSG:9.41": ("monoclinic", "MSG", 40),
-    "MSG:10.42": ("monoclinic", "MSG", 41),
-    "MSG:10.43": ("monoclinic", "MSG", 42),
-    "MSG:10.44": ("monoclinic", "MSG", 43),
-    "MSG:10.45": ("monoclinic", "MSG", 44),
-    "MSG:10.46": ("monoclinic", "MSG", 45),
-    "MSG:10.47": ("monoclinic", "MSG", 46),
-    "MSG:10.48": ("monoclinic", "MSG", 47),
-    "MSG:10.49": ("monoclinic", "MSG", 48),
-    "MSG:11.50": ("monoclinic", "MSG", 49),
-    "MSG:11.51": ("monoclinic", "MSG", 50),
-    "MSG:11.52": ("monoclinic", "MSG", 51),
-    "MSG:11.53": ("monoclinic", "MSG", 52),
-    "MSG:11.54": ("monoclinic", "MSG", 53),
-    "MSG:11.55": ("monoclinic", "MSG", 54),
-    "MSG:11.56": ("monoclinic", "MSG", 55),
-    "MSG:11.57": ("monoclinic", "MSG", 56),
-    "MSG:12.58": ("monoclinic", "MSG", 57),
-    "MSG:12.59": ("monoclinic", "MSG", 58),
-    "MSG:12.60": ("monoclinic", "MSG", 59),
-    "MSG:12.61": ("monoclinic", "MSG", 60),
-    "MSG:12.62": ("monoclinic", "MSG", 61),
-    "MSG:12.63": ("monoclinic", "MSG", 62),
-    "MSG:12.64": ("monoclinic", "MSG", 63),
-    "MSG:13.65": ("monoclinic", "MSG", 64),
-    "MSG:13.66": ("monoclinic", "MSG", 65),
-    "MSG:13.67": ("monoclinic", "MSG", 66),
-    "MSG:13.68": ("monoclinic", "MSG", 67),
-    "MSG:13.69": ("monoclinic", "MSG", 68),
-    "MSG:13.70": ("monoclinic", "MSG", 69),
-    "MSG:13.71": ("monoclinic", "MSG", 70),
-    "MSG:13.72": ("monoclinic", "MSG", 71),
-    "MSG:13.73": ("monoclinic", "MSG", 72),
-    "MSG:13.74": ("monoclinic", "MSG", 73),
-    "MSG:14.75": ("monoclinic", "MSG", 74),
-    "MSG:14.76": ("monoclinic", "MSG", 75),
-    "MSG:14.77": ("monoclinic", "MSG", 76),
-    "MSG:14.78": ("monoclinic", "MSG", 77),
-    "MSG:14.79": ("monoclinic", "MSG", 78),
-    "MSG:14.80": ("monoclinic", "MSG", 79),
-    "MSG:14.81": ("monoclinic", "MSG", 80),
-    "MSG:14.82": ("monoclinic", "MSG", 81),
-    "MSG:14.83": ("monoclinic", "MSG", 82),
-    "MSG:14.84": ("monoclinic", "MSG", 83),
-    "MSG:15.85": ("monoclinic", "MSG", 84),
-    "MSG:15.86": ("monoclinic", "MSG", 85),
-    "MSG:15.87": ("monoclinic", "MSG", 86),
-    "MSG:15.88": ("monoclinic", "MSG", 87),
-    "MSG:15.89": ("monoclinic", "MSG", 88),
-    "MSG:15.90": ("monoclinic", "MSG", 89),
-    "MSG:15.91": ("monoclinic", "MSG", 90),
-    "MSG:16.1": ("orthorhombic", "MSG", 0),
-    "MSG:16.2": ("orthorhombic", "MSG", 1),
-    "MSG:16.3": ("orthorhombic", "MSG", 2),
-    "MSG:16.4": ("orthorhombic", "MSG", 3),
-    "MSG:16.5": ("orthorhombic", "MSG", 4),
-    "MSG:16.6": ("orthorhombic", "MSG", 5),
-    "MSG:17.7": ("orthorhombic", "MSG", 6),
-    "MSG:17.8": ("orthorhombic", "MSG", 7),
-    "MSG:17.9": ("orthorhombic", "MSG", 8),
-    "MSG:17.10": ("orthorhombic", "MSG", 9),
-    "MSG:17.11": ("orthorhombic", "MSG", 10),
-    "MSG:17.12": ("orthorhombic", "MSG", 11),
-    "MSG:17.13": ("orthorhombic", "MSG", 12),
-    "MSG:17.14": ("orthorhombic", "MSG", 13),
-    "MSG:17.15": ("orthorhombic", "MSG", 14),
-    "MSG:18.16": ("orthorhombic", "MSG", 15),
-    "MSG:18.17": ("orthorhombic", "MSG", 16),
-    "MSG:18.18": ("orthorhombic", "MSG", 17),
-    "MSG:18.19": ("orthorhombic", "MSG", 18),
-    "MSG:18.20": ("orthorhombic", "MSG", 19),
-    "MSG:18.21": ("orthorhombic", "MSG", 20),
-    "MSG:18.22": ("orthorhombic", "MSG", 21),
-    "MSG:18.23": ("orthorhombic", "MSG", 22),
-    "MSG:18.24": ("orthorhombic", "MSG", 23),
-    "MSG:19.25": ("orthorhombic", "MSG", 24),
-    "MSG:19.26": ("orthorhombic", "MSG", 25),
-    "MSG:19.27": ("orthorhombic", "MSG", 26),
-    "MSG:19.28": ("orthorhombic", "MSG", 27),
-    "MSG:19.29": ("orthorhombic", "MSG", 28),
-    "MSG:19.30": ("orthorhombic", "MSG", 29),
-    "MSG:20.31": ("orthorhombic", "MSG", 30),
-    "MSG:20.32": ("orthorhombic", "MSG", 31),
-    "MSG:20.33": ("orthorhombic", "MSG", 32),
-    "MSG:20.34": ("orthorhombic", "MSG", 33),
-    "MSG:20.35": ("orthorhombic", "MSG", 34),
-    "MSG:20.36": ("orthorhombic", "MSG", 35),
-    "MSG:20.37": ("orthorhombic", "MSG", 36),
-    "MSG:21.38": ("orthorhombic", "MSG", 37),
-    "MSG:21.39": ("orthorhombic", "MSG", 38),
-    "MSG:21.40": ("orthorhombic", "MSG", 39),
-    "MSG:21.41": ("orthorhombic", "MSG", 40),
-    "MSG:21.42": ("orthorhombic", "MSG", 41),
-    "MSG:21.43": ("orthorhombic", "MSG", 42),
-    "MSG:21.44": ("orthorhombic", "MSG", 43),
-    "MSG:22.45": ("orthorhombic", "MSG", 44),
-    "MSG:22.46": ("orthorhombic", "MSG", 45),
-    "MSG:22.47": ("orthorhombic", "MSG", 46),
-    "MSG:22.48": ("orthorhombic", "MSG", 47),
-    "MSG:23.49": ("orthorhombic", "MSG", 48),
-    "MSG:23.50": ("orthorhombic", "MSG", 49),
-    "MSG:23.51": ("orthorhombic", "MSG", 50),
-    "MSG:23.52": ("orthorhombic", "MSG", 51),
-    "MSG:24.53": ("orthorhombic", "MSG", 52),
-    "MSG:24.54": ("orthorhombic", "MSG", 53),
-    "MSG:24.55": ("orthorhombic", "MSG", 54),
-    "MSG:24.56": ("orthorhombic", "MSG", 55),
-    "MSG:25.57": ("orthorhombic", "MSG", 56),
-    "MSG:25.58": ("orthorhombic", "MSG", 57),
-    "MSG:25.59": ("orthorhombic", "MSG", 58),
-    "MSG:25.60": ("orthorhombic", "MSG", 59),
-    "MSG:25.61": ("orthorhombic", "MSG", 60),
-    "MSG:25.62": ("orthorhombic", "MSG", 61),
-    "MSG:25.63": ("orthorhombic", "MSG", 62),
-    "MSG:25.64": ("orthorhombic", "MSG", 63),
-    "MSG:25.65": ("orthorhombic", "MSG", 64),
-    "MSG:26.66": ("orthorhombic", "MSG", 65),
-    "MSG:26.67": ("orthorhombic", "MSG", 66),
-    "MSG:26.68": ("orthorhombic", "MSG", 67),
-    "MSG:26.69": ("orthorhombic", "MSG", 68),
-    "MSG:26.70": ("orthorhombic", "MSG", 69),
-    "MSG:26.71": ("orthorhombic", "MSG", 70),
-    "MSG:26.72": ("orthorhombic", "MSG", 71),
-    "MSG:26.73": ("orthorhombic", "MSG", 72),
-    "MSG:26.74": ("orthorhombic", "MSG", 73),
-    "MSG:26.75": ("orthorhombic", "MSG", 74),
-    "MSG:26.76": ("orthorhombic", "MSG", 75),
-    "MSG:26.77": ("orthorhombic", "MSG", 76),
-    "MSG:27.78": ("orthorhombic", "MSG", 77),
-    "MSG:27.79": ("orthorhombic", "MSG", 78),
-    "MSG:27.80": ("orthorhombic", "MSG", 79),
-    "MSG:27.81": ("orthorhombic", "MSG", 80),
-    "MSG:27.82": ("orthorhombic", "MSG", 81),
-    "MSG:27.83": ("orthorhombic", "MSG", 82),
-    "MSG:27.84": ("orthorhombic", "MSG", 83),
-    "MSG:27.85": ("orthorhombic", "MSG", 84),
-    "MSG:27.86": ("orthorhombic", "MSG", 85),
-    "MSG:28.87": ("orthorhombic", "MSG", 86),
-    "MSG:28.88": ("orthorhombic", "MSG", 87),
-    "MSG:28.89": ("orthorhombic", "MSG", 88),
-    "MSG:28.90": ("orthorhombic", "MSG", 89),
-    "MSG:28.91": ("orthorhombic", "MSG", 90),
-    "MSG:28.92": ("orthorhombic", "MSG", 91),
-    "MSG:28.93": ("orthorhombic", "MSG", 92),
-    "MSG:28.94": ("orthorhombic", "MSG", 93),
-    "MSG:28.95": ("orthorhombic", "MSG", 94),
-    "MSG:28.96": ("orthorhombic", "MSG", 95),
-    "MSG:28.97": ("orthorhombic", "MSG", 96),
-    "MSG:28.98": ("orthorhombic", "MSG", 97),
-    "MSG:29.99": ("orthorhombic", "MSG", 98),
-    "MSG:29.100": ("orthorhombic", "MSG", 99),
-    "MSG:29.101": ("orthorhombic", "MSG", 100),
-    "MSG:29.102": ("orthorhombic", "MSG", 101),
-    "MSG:29.103": ("orthorhombic", "MSG", 102),
-    "MSG:29.104": ("orthorhombic", "MSG", 103),
-    "MSG:29.105": ("orthorhombic", "MSG", 104),
-    "MSG:29.106": ("orthorhombic", "MSG", 105),
-    "MSG:29.107": ("orthorhombic", "MSG", 106),
-    "MSG:29.108": ("orthorhombic", "MSG", 107),
-    "MSG:29.109": ("orthorhombic", "MSG", 108),
-    "MSG:29.110": ("orthorhombic", "MSG", 109),
-    "MSG:30.111": ("orthorhombic", "MSG", 110),
-    "MSG:30.112": ("orthorhombic", "MSG", 111),
-    "MSG:30.113": ("orthorhombic", "MSG", 112),
-    "MSG:30.114": ("orthorhombic", "MSG", 113),
-    "MSG:30.115": ("orthorhombic", "MSG", 114),
-    "MSG:30.116": ("orthorhombic", "MSG", 115),
-    "MSG:30.117": ("orthorhombic", "MSG", 116),
-    "MSG:30.118": ("orthorhombic", "MSG", 117),
-    "MSG:30.119": ("orthorhombic", "MSG", 118),
-    "MSG:30.120": ("orthorhombic", "MSG", 119),
-    "MSG:30.121": ("orthorhombic", "MSG", 120),
-    "MSG:30.122": ("orthorhombic", "MSG", 121),
-    "MSG:31.123": ("orthorhombic", "MSG", 122),
-    "MSG:31.124": ("orthorhombic", "MSG", 123),
-    "MSG:31.125": ("orthorhombic", "MSG", 124),
-    "MSG:31.126": ("orthorhombic", "MSG", 125),
-    "MSG:31.127": ("orthorhombic", "MSG", 126),
-    "MSG:31.128": ("orthorhombic", "MSG", 127),
-    "MSG:31.129": ("orthorhombic", "MSG", 128),
-    "MSG:31.130": ("orthorhombic", "MSG", 129),
-    "MSG:31.131": ("orthorhombic", "MSG", 130),
-    "MSG:31.132": ("orthorhombic", "MSG", 131),
-    "MSG:31.133": ("orthorhombic", "MSG", 132),
-    "MSG:31.134": ("orthorhombic", "MSG", 133),
-    "MSG:32.135": ("orthorhombic", "MSG", 134),
-    "MSG:32.136": ("orthorhombic", "MSG", 135),
-    "MSG:32.137": ("orthorhombic", "MSG", 136),
-    "MSG:32.138": ("orthorhombic", "MSG", 137),
-    "MSG:32.139": ("orthorhombic", "MSG", 138),
-    "MSG:32.140": ("orthorhombic", "MSG", 139),
-    "MSG:32.141": ("orthorhombic", "MSG", 140),
-    "MSG:32.142": ("orthorhombic", "MSG", 141),
-    "MSG:32.143": ("orthorhombic", "MSG", 142),
-    "MSG:33.144": ("orthorhombic", "MSG", 143),
-    "MSG:33.145": ("orthorhombic", "MSG", 144),
-    "MSG:33.146": ("orthorhombic", "MSG", 145),
-    "MSG:33.147": ("orthorhombic", "MSG", 146),
-    "MSG:33.148": ("orthorhombic", "MSG", 147),
-    "MSG:33.149": ("orthorhombic", "MSG", 148),
-    "MSG:33.150": ("orthorhombic", "MSG", 149),
-    "MSG:33.151": ("orthorhombic", "MSG", 150),
-    "MSG:33.152": ("orthorhombic", "MSG", 151),
-    "MSG:33.153": ("orthorhombic", "MSG", 152),
-    "MSG:33.154": ("orthorhombic", "MSG", 153),
-    "MSG:33.155": ("orthorhombic", "MSG", 154),
-    "MSG:34.156": ("orthorhombic", "MSG", 155),
-    "MSG:34.157": ("orthorhombic", "MSG", 156),
-    "MSG:34.158": ("orthorhombic", "MSG", 157),
-    "MSG:34.159": ("orthorhombic", "MSG", 158),
-    "MSG:34.160": ("orthorhombic", "MSG", 159),
-    "MSG:34.161": ("orthorhombic", "MSG", 160),
-    "MSG:34.162": ("orthorhombic", "MSG", 161),
-    "MSG:34.163": ("orthorhombic", "MSG", 162),
-    "MSG:34.164": ("orthorhombic", "MSG", 163),
-    "MSG:35.165": ("orthorhombic", "MSG", 164),
-    "MSG:35.166": ("orthorhombic", "MSG", 165),
-    "MSG:35.167": ("orthorhombic", "MSG", 166),
-    "MSG:35.168": ("orthorhombic", "MSG", 167),
-    "MSG:35.169": ("orthorhombic", "MSG", 168),
-    "MSG:35.170": ("orthorhombic", "MSG", 169),
-    "MSG:35.171": ("orthorhombic", "MSG", 170),
-    "MSG:36.172": ("orthorhombic", "MSG", 171),
-    "MSG:36.173": ("orthorhombic", "MSG", 172),
-    "MSG:36.174": ("orthorhombic", "MSG", 173),
-    "MSG:36.175": ("orthorhombic", "MSG", 174),
-    "MSG:36.176": ("orthorhombic", "MSG", 175),
-    "MSG:36.177": ("orthorhombic", "MSG", 176),
-    "MSG:36.178": ("orthorhombic", "MSG", 177),
-    "MSG:36.179": ("orthorhombic", "MSG", 178),
-    "MSG:37.180": ("orthorhombic", "MSG", 179),
-    "MSG:37.181": ("orthorhombic", "MSG", 180),
-    "MSG:37.182": ("orthorhombic", "MSG", 181),
-    "MSG:37.183": ("orthorhombic", "MSG", 182),
-    "MSG:37.184": ("orthorhombic", "MSG", 183),
-    "MSG:37.185": ("orthorhombic", "MSG", 184),
-    "MSG:37.186": ("orthorhombic", "MSG", 185),
-    "MSG:38.187": ("orthorhombic", "MSG", 186),
-    "MSG:38.188": ("orthorhombic", "MSG", 187),
-    "MSG:38.189": ("orthorhombic", "MSG", 188),
-    "MSG:38.190": ("orthorhombic", "MSG", 189),
-    "MSG:38.191": ("orthorhombic", "MSG", 190),
-    "MSG:38.192": ("orthorhombic", "MSG", 191),
-    "MSG:38.193": ("orthorhombic", "MSG", 192),
-    "MSG:38.194": ("orthorhombic", "MSG", 193),
-    "MSG:39.195": ("orthorhombic", "MSG", 194),
-    "MSG:39.196": ("orthorhombic", "MSG", 195),
-    "MSG:39.197": ("orthorhombic", "MSG", 196),
-    "MSG:39.198": ("orthorhombic", "MSG", 197),
-    "MSG:39.199": ("orthorhombic", "MSG", 198),
-    "MSG:39.200": ("orthorhombic", "MSG", 199),
-    "MSG:39.201": ("orthorhombic", "MSG", 200),
-    "MSG:39.202": ("orthorhombic", "MSG", 201),
-    "MSG:40.203": ("orthorhombic", "MSG", 202),
-    "MSG:40.204": ("orthorhombic", "MSG", 203),
-    "MSG:40.205": ("orthorhombic", "MSG", 204),
-    "MSG:40.206": ("orthorhombic", "MSG", 205),
-    "MSG:40.207": ("orthorhombic", "MSG", 206),
-    "MSG:40.208": ("orthorhombic", "MSG", 207),
-    "MSG:40.209": ("orthorhombic", "MSG", 208),
-    "MSG:40.210": ("orthorhombic", "MSG", 209),
-    "MSG:41.211": ("orthorhombic", "MSG", 210),
-    "MSG:41.212": ("orthorhombic", "MSG", 211),
-    "MSG:41.213": ("orthorhombic", "MSG", 212),
-    "MSG:41.214": ("orthorhombic", "MSG", 213),
-    "MSG:41.215": ("orthorhombic", "MSG", 214),
-    "MSG:41.216": ("orthorhombic", "MSG", 215),
-    "MSG:41.217": ("orthorhombic", "MSG", 216),
-    "MSG:41.218": ("orthorhombic", "MSG", 217),
-    "MSG:42.219": ("orthorhombic", "MSG", 218),
-    "MSG:42.220": ("orthorhombic", "MSG", 219),
-    "MSG:42.221": ("orthorhombic", "MSG", 220),
-    "MSG:42.222": ("orthorhombic", "MSG", 221),
-    "MSG:42.223": ("orthorhombic", "MSG", 222),
-    "MSG:43.224": ("orthorhombic", "MSG", 223),
-    "MSG:43.225": ("orthorhombic", "MSG", 224),
-    "MSG:43.226": ("orthorhombic", "MSG", 225),
-    "MSG:43.227": ("orthorhombic", "MSG", 226),
-    "MSG:43.228": ("orthorhombic", "MSG", 227),
-    "MSG:44.229": ("orthorhombic", "MSG", 228),
-    "MSG:44.230": ("orthorhombic", "MSG", 229),
-    "MSG:44.231": ("orthorhombic", "MSG", 230),
-    "MSG:44.232": ("orthorhombic", "MSG", 231),
-    "MSG:44.233": ("orthorhombic", "MSG", 232),
-    "MSG:44.234": ("orthorhombic", "MSG", 233),
-    "MSG:45.235": ("orthorhombic", "MSG", 234),
-    "MSG:45.236": ("orthorhombic", "MSG", 235),
-    "MSG:45.237": ("orthorhombic", "MSG", 236),
-    "MSG:45.238": ("orthorhombic", "MSG", 237),
-    "MSG:45.239": ("orthorhombic", "MSG", 238),
-    "MSG:45.240": ("orthorhombic", "MSG", 239),
-    "MSG:46.241": ("orthorhombic", "MSG", 240),
-    "MSG:46.242": ("orthorhombic", "MSG", 241),
-    "MSG:46.243": ("orthorhombic", "MSG", 242),
-    "MSG:46.244": ("orthorhombic", "MSG", 243),
-    "MSG:46.245": ("orthorhombic", "MSG", 244),
-    "MSG:46.246": ("orthorhombic", "MSG", 245),
-    "MSG:46.247": ("orthorhombic", "MSG", 246),
-    "MSG:46.248": ("orthorhombic", "MSG", 247),
-    "MSG:47.249": ("orthorhombic", "MSG", 248),
-    "MSG:47.250": ("orthorhombic", "MSG", 249),
-    "MSG:47.251": ("orthorhombic", "MSG", 250),
-    "MSG:47.252": ("orthorhombic", "MSG", 251),
-    "MSG:47.253": ("orthorhombic", "MSG", 252),
-    "MSG:47.254": ("orthorhombic", "MSG", 253),
-    "MSG:47.255": ("orthorhombic", "MSG", 254),
-    "MSG:47.256": ("orthorhombic", "MSG", 255),
-    "MSG:48.257": ("orthorhombic", "MSG", 256),
-    "MSG:48.258": ("orthorhombic", "MSG", 257),
-    "MSG:48.259": ("orthorhombic", "MSG", 258),
-    "MSG:48.260": ("orthorhombic", "MSG", 259),
-    "MSG:48.261": ("orthorhombic", "MSG", 260),
-    "MSG:48.262": ("orthorhombic", "MSG", 261),
-    "MSG:48.263": ("orthorhombic", "MSG", 262),
-    "MSG:48.264": ("orthorhombic", "MSG", 263),
-    "MSG:49.265": ("orthorhombic", "MSG", 264),
-    "MSG:49.266": ("orthorhombic", "MSG", 265),
-    "MSG:49.267": ("orthorhombic", "MSG", 266),
-    "MSG:49.268": ("orthorhombic", "MSG", 267),
-    "MSG:49.269": ("orthorhombic", "MSG", 268),
-    "MSG:49.270": ("orthorhombic", "MSG", 269),
-    "MSG:49.271": ("orthorhombic", "MSG", 270),
-    "MSG:49.272": ("orthorhombic", "MSG", 271),
-    "MSG:49.273": ("orthorhombic", "MSG", 272),
-    "MSG:49.274": ("orthorhombic", "MSG", 273),
-    "MSG:49.275": ("orthorhombic", "MSG", 274),
-    "MSG:49.276": ("orthorhombic", "MSG", 275),
-    "MSG:50.277": ("orthorhombic", "MSG", 276),
-    "MSG:50.278": ("orthorhombic", "MSG", 277),
-    "MSG:50.279": ("orthorhombic", "MSG", 278),
-    "MSG:50.280": ("orthorhombic", "MSG", 279),
-    "MSG:50.281": ("orthorhombic", "MSG", 280),
-    "MSG:50.282": ("orthorhombic", "MSG", 281),
-    "MSG:50.283": ("orthorhombic", "MSG", 282),
-    "MSG:50.284": ("orthorhombic", "MSG", 283),
-    "MSG:50.285": ("orthorhombic", "MSG", 284),
-    "MSG:50.286": ("orthorhombic", "MSG", 285),
-    "MSG:50.287": ("orthorhombic", "MSG", 286),
-    "MSG:50.288": ("orthorhombic", "MSG", 287),
-    "MSG:51.289": ("orthorhombic", "MSG", 288),
-    "MSG:51.290": ("orthorhombic", "MSG", 289),
-    "MSG:51.291": ("orthorhombic", "MSG", 290),
-    "MSG:51.292": ("orthorhombic", "MSG", 291),
-    "MSG:51.293": ("orthorhombic", "MSG", 292),
-    "MSG:51.294": ("orthorhombic", "MSG", 293),
-    "MSG:51.295": ("orthorhombic", "MSG", 294),
-    "MSG:51.296": ("orthorhombic", "MSG", 295),
-    "MSG:51.297": ("orthorhombic", "MSG", 296),
-    "MSG:51.298": ("orthorhombic", "MSG", 297),
-    "MSG:51.299": ("orthorhombic", "MSG", 298),
-    "MSG:51.300": ("orthorhombic", "MSG", 299),
-    "MSG:51.301": ("orthorhombic", "MSG", 300),
-    "MSG:51.302": ("orthorhombic", "MSG", 301),
-    "MSG:51.303": ("orthorhombic", "MSG", 302),
-    "MSG:51.304": ("orthorhombic", "MSG", 303),
-    "MSG:52.305": ("orthorhombic", "MSG", 304),
-    "MSG:52.306": ("orthorhombic", "MSG", 305),
-    "MSG:52.307": ("orthorhombic", "MSG", 306),
-    "MSG:52.308": ("orthorhombic", "MSG", 307),
-    "MSG:52.309": ("orthorhombic", "MSG", 308),
-    "MSG:52.310": ("orthorhombic", "MSG", 309),
-    "MSG:52.311": ("orthorhombic", "MSG", 310),
-    "MSG:52.312": ("orthorhombic", "MSG", 311),
-    "MSG:52.313": ("orthorhombic", "MSG", 312),
-    "MSG:52.314": ("orthorhombic", "MSG", 313),
-    "MSG:52.315": ("orthorhombic", "MSG", 314),
-    "MSG:52.316": ("orthorhombic", "MSG", 315),
-    "MSG:52.317": ("orthorhombic", "MSG", 316),
-    "MSG:52.318": ("orthorhombic", "MSG", 317),
-    "MSG:52.319": ("orthorhombic", "MSG", 318),
-    "MSG:52.320": ("orthorhombic", "MSG", 319),
-    "MSG:53.321": ("orthorhombic", "MSG", 320),
-    "MSG:53.322": ("orthorhombic", "MSG", 321),
-    "MSG:53.323": ("orthorhombic", "MSG", 322),
-    "MSG:53.324": ("orthorhombic", "MSG", 323),
-    "MSG:53.325": ("orthorhombic", "MSG", 324),
-    "MSG:53.326": ("orthorhombic", "MSG", 325),
-    "MSG:53.327": ("orthorhombic", "MSG", 326),
-    "MSG:53.328": ("orthorhombic", "MSG", 327),
-    "MSG:53.329": ("orthorhombic", "MSG", 328),
-    "MSG:53.330": ("orthorhombic", "MSG", 329),
-    "MSG:53.331": ("orthorhombic", "MSG", 330),
-    "MSG:53.332": ("orthorhombic", "MSG", 331),
-    "MSG:53.333": ("orthorhombic", "MSG", 332),
-    "MSG:53.334": ("orthorhombic", "MSG", 333),
-    "MSG:53.335": ("orthorhombic", "MSG", 334),
-    "MSG:53.336": ("orthorhombic", "MSG", 335),
-    "MSG:54.337": ("orthorhombic", "MSG", 336),
-    "MSG:54.338": ("orthorhombic", "MSG", 337),
-    "MSG:54.339": ("orthorhombic", "MSG", 338),
-    "MSG:54.340": ("orthorhombic", "MSG", 339),
-    "MSG:54.341": ("orthorhombic", "MSG", 340),
-    "MSG:54.342": ("orthorhombic", "MSG", 341),
-    "MSG:54.343": ("orthorhombic", "MSG", 342),
-    "MSG:54.344": ("orthorhombic", "MSG", 343),
-    "MSG:54.345": ("orthorhombic", "MSG", 344),
-    "MSG:54.346": ("orthorhombic", "MSG", 345),
-    "MSG:54.347": ("orthorhombic", "MSG", 346),
-    "MSG:54.348": ("orthorhombic", "MSG", 347),
-    "MSG:54.349": ("orthorhombic", "MSG", 348),
-    "MSG:54.350": ("orthorhombic", "MSG", 349),
-    "MSG:54.351": ("orthorhombic", "MSG", 350),
-    "MSG:54.352": ("orthorhombic", "MSG", 351),
-    "MSG:55.353": ("orthorhombic", "MSG", 352),
-    "MSG:55.354": ("orthorhombic", "MSG", 353),
-    "MSG:55.355": ("orthorhombic", "MSG", 354),
-    "MSG:55.356": ("orthorhombic", "MSG", 355),
-    "MSG:55.357": ("orthorhombic", "MSG", 356),
-    "MSG:55.358": ("orthorhombic", "MSG", 357),
-    "MSG:55.359": ("orthorhombic", "MSG", 358),
-    "MSG:55.360": ("orthorhombic", "MSG", 359),
-    "MSG:55.361": ("orthorhombic", "MSG", 360),
-    "MSG:55.362": ("orthorhombic", "MSG", 361),
-    "MSG:55.363": ("orthorhombic", "MSG", 362),
-    "MSG:55.364": ("orthorhombic", "MSG", 363),
-    "MSG:56.365": ("orthorhombic", "MSG", 364),
-    "MSG:56.366": ("orthorhombic", "MSG", 365),
-    "MSG:56.367": ("orthorhombic", "MSG", 366),
-    "MSG:56.368": ("orthorhombic", "MSG", 367),
-    "MSG:56.369": ("orthorhombic", "MSG", 368),
-    "MSG:56.370": ("orthorhombic", "MSG", 369),
-    "MSG:56.371": ("orthorhombic", "MSG", 370),
-    "MSG:56.372": ("orthorhombic", "MSG", 371),
-    "MSG:56.373": ("orthorhombic", "MSG", 372),
-    "MSG:56.374": ("orthorhombic", "MSG", 373),
-    "MSG:56.375": ("orthorhombic", "MSG", 374),
-    "MSG:56.376": ("orthorhombic", "MSG", 375),
-    "MSG:57.377": ("orthorhombic", "MSG", 376),
-    "MSG:57.378": ("orthorhombic", "MSG", 377),
-    "MSG:57.379": ("orthorhombic", "MSG", 378),
-    "MSG:57.380": ("orthorhombic", "MSG", 379),
-    "MSG:57.381": ("orthorhombic", "MSG", 380),
-    "MSG:57.382": ("orthorhombic", "MSG", 381),
-    "MSG:57.383": ("orthorhombic", "MSG", 382),
-    "MSG:57.384": ("orthorhombic", "MSG", 383),
-    "MSG:57.385": ("orthorhombic", "MSG", 384),
-    "MSG:57.386": ("orthorhombic", "MSG", 385),
-    "MSG:57.387": ("orthorhombic", "MSG", 386),
-    "MSG:57.388": ("orthorhombic", "MSG", 387),
-    "MSG:57.389": ("orthorhombic", "MSG", 388),
-    "MSG:57.390": ("orthorhombic", "MSG", 389),
-    "MSG:57.391": ("orthorhombic", "MSG", 390),
-    "MSG:57.392": ("orthorhombic", "MSG", 391),
-    "MSG:58.393": ("orthorhombic", "MSG", 392),
-    "MSG:58.394": ("orthorhombic", "MSG", 393),
-    "MSG:58.395": ("orthorhombic", "MSG", 394),
-    "MSG:58.396": ("orthorhombic", "MSG", 395),
-    "MSG:58.397": ("orthorhombic", "MSG", 396),
-    "MSG:58.398": ("orthorhombic", "MSG", 397),
-    "MSG:58.399": ("orthorhombic", "MSG", 398),
-    "MSG:58.400": ("orthorhombic", "MSG", 399),
-    "MSG:58.401": ("orthorhombic", "MSG", 400),
-    "MSG:58.402": ("orthorhombic", "MSG", 401),
-    "MSG:58.403": ("orthorhombic", "MSG", 402),
-    "MSG:58.404": ("orthorhombic", "MSG", 403),
-    "MSG:59.405": ("orthorhombic", "MSG", 404),
-    "MSG:59.406": ("orthorhombic", "MSG", 405),
-    "MSG:59.407": ("orthorhombic", "MSG", 406),
-    "MSG:59.408": ("orthorhombic", "MSG", 407),
-    "MSG:59.409": ("orthorhombic", "MSG", 408),
-    "MSG:59.410": ("orthorhombic", "MSG", 409),
-    "MSG:59.411": ("orthorhombic", "MSG", 410),
-    "MSG:59.412": ("orthorhombic", "MSG", 411),
-    "MSG:59.413": ("orthorhombic", "MSG", 412),
-    "MSG:59.414": ("orthorhombic", "MSG", 413),
-    "MSG:59.415": ("orthorhombic", "MSG", 414),
-    "MSG:59.416": ("orthorhombic", "MSG", 415),
-    "MSG:60.417": ("orthorhombic", "MSG", 416),
-    "MSG:60.418": ("orthorhombic", "MSG", 417),
-    "MSG:60.419": ("orthorhombic", "MSG", 418),
-    "MSG:60.420": ("orthorhombic", "MSG", 419),
-    "MSG:60.421": ("orthorhombic", "MSG", 420),
-    "MSG:60.422": ("orthorhombic", "MSG", 421),
-    "MSG:60.423": ("orthorhombic", "MSG", 422),
-    "MSG:60.424": ("orthorhombic", "MSG", 423),
-    "MSG:60.425": ("orthorhombic", "MSG", 424),
-    "MSG:60.426": ("orthorhombic", "MSG", 425),
-    "MSG:60.427": ("orthorhombic", "MSG", 426),
-    "MSG:60.428": ("orthorhombic", "MSG", 427),
-    "MSG:60.429": ("orthorhombic", "MSG", 428),
-    "MSG:60.430": ("orthorhombic", "MSG", 429),
-    "MSG:60.431": ("orthorhombic", "MSG", 430),
-    "MSG:60.432": ("orthorhombic", "MSG", 431),
-    "MSG:61.433": ("orthorhombic", "MSG", 432),
-    "MSG:61.434": ("orthorhombic", "MSG", 433),
-    "MSG:61.435": ("orthorhombic", "MSG", 434),
-    "MSG:61.436": ("orthorhombic", "MSG", 435),
-    "MSG:61.437": ("orthorhombic", "MSG", 436),
-    "MSG:61.438": ("orthorhombic", "MSG", 437),
-    "MSG:61.439": ("orthorhombic", "MSG", 438),
-    "MSG:61.440": ("orthorhombic", "MSG", 439),
-    "MSG:62.441": ("orthorhombic", "MSG", 440),
-    "MSG:62.442": ("orthorhombic", "MSG", 441),
-    "MSG:62.443": ("orthorhombic", "MSG", 442),
-    "MSG:62.444": ("orthorhombic", "MSG", 443),
-    "MSG:62.445": ("orthorhombic", "MSG", 444),
-    "MSG:62.446": ("orthorhombic", "MSG", 445),
-    "MSG:62.447": ("orthorhombic", "MSG", 446),
-    "MSG:62.448": ("orthorhombic", "MSG", 447),
-    "MSG:62.449": ("orthorhombic", "MSG", 448),
-    "MSG:62.450": ("orthorhombic", "MSG", 449),
-    "MSG:62.451": ("orthorhombic", "MSG", 450),
-    "MSG:62.452": ("orthorhombic", "MSG", 451),
-    "MSG:62.453": ("orthorhombic", "MSG", 452),
-    "MSG:62.454": ("orthorhombic", "MSG", 453),
-    "MSG:62.455": ("orthorhombic", "MSG", 454),
-    "MSG:62.456": ("orthorhombic", "MSG", 455),
-    "MSG:63.457": ("orthorhombic", "MSG", 456),
-    "MSG:63.458": ("orthorhombic", "MSG", 457),
-    "MSG:63.459": ("orthorhombic", "MSG", 458),
-    "MSG:63.460": ("orthorhombic", "MSG", 459),
-    "MSG:63.461": ("orthorhombic", "MSG", 460),
-    "MSG:63.462": ("orthorhombic", "MSG", 461),
-    "MSG:63.463": ("orthorhombic", "MSG", 462),
-    "MSG:63.464": ("orthorhombic", "MSG", 463),
-    "MSG:63.465": ("orthorhombic", "MSG", 464),
-    "MSG:63.466": ("orthorhombic", "MSG", 465),
-    "MSG:63.467": ("orthorhombic", "MSG", 466),
-    "MSG:63.468": ("orthorhombic", "MSG", 467),
-    "MSG:64.469": ("orthorhombic", "MSG", 468),
-    "MSG:64.470": ("orthorhombic", "MSG", 469),
-    "MSG:64.471": ("orthorhombic", "MSG", 470),
-    "MSG:64.472": ("orthorhombic", "MSG", 471),
-    "MSG:64.473": ("orthorhombic", "MSG", 472),
-    "MSG:64.474": ("orthorhombic", "MSG", 473),
-    "MSG:64.475": ("orthorhombic", "MSG", 474),
-    "MSG:64.476": ("orthorhombic", "MSG", 475),
-    "MSG:64.477": ("orthorhombic", "MSG", 476),
-    "MSG:64.478": ("orthorhombic", "MSG", 477),
-    "MSG:64.479": ("orthorhombic", "MSG", 478),
-    "MSG:64.480": ("orthorhombic", "MSG", 479),
-    "MSG:65.481": ("orthorhombic", "MSG", 480),
-    "MSG:65.482": ("orthorhombic", "MSG", 481),
-    "MSG:65.483": ("orthorhombic", "MSG", 482),
-    "MSG:65.484": ("orthorhombic", "MSG", 483),
-    "MSG:65.485": ("orthorhombic", "MSG", 484),
-    "MSG:65.486": ("orthorhombic", "MSG", 485),
-    "MSG:65.487": ("orthorhombic", "MSG", 486),
-    "MSG:65.488": ("orthorhombic", "MSG", 487),
-    "MSG:65.489": ("orthorhombic", "MSG", 488),
-    "MSG:65.490": ("orthorhombic", "MSG", 489),
-    "MSG:66.491": ("orthorhombic", "MSG", 490),
-    "MSG:66.492": ("orthorhombic", "MSG", 491),
-    "MSG:66.493": ("orthorhombic", "MSG", 492),
-    "MSG:66.494": ("orthorhombic", "MSG", 493),
-    "MSG:66.495": ("orthorhombic", "MSG", 494),
-    "MSG:66.496": ("orthorhombic", "MSG", 495),
-    "MSG:66.497": ("orthorhombic", "MSG", 496),
-    "MSG:66.498": ("orthorhombic", "MSG", 497),
-    "MSG:66.499": ("orthorhombic", "MSG", 498),
-    "MSG:66.500": ("orthorhombic", "MSG", 499),
-    "MSG:67.501": ("orthorhombic", "MSG", 500),
-    "MSG:67.502": ("orthorhombic", "MSG", 501),
-    "MSG:67.503": ("orthorhombic", "MSG", 502),
-    "MSG:67.504": ("orthorhombic", "MSG", 503),
-    "MSG:67.505": ("orthorhombic", "MSG", 504),
-    "MSG:67.506": ("orthorhombic", "MSG", 505),
-    "MSG:67.507": ("orthorhombic", "MSG", 506),
-    "MSG:67.508": ("orthorhombic", "MSG", 507),
-    "MSG:67.509": ("orthorhombic", "MSG", 508),
-    "MSG:67.510": ("orthorhombic", "MSG", 509),
-    "MSG:68.511": ("orthorhombic", "MSG", 510),
-    "MSG:68.512": ("orthorhombic", "MSG", 511),
-    "MSG:68.513": ("orthorhombic", "MSG", 512),
-    "MSG:68.514": ("orthorhombic", "MSG", 513),
-    "MSG:68.515": ("orthorhombic", "MSG", 514),
-    "MSG:68.516": ("orthorhombic", "MSG", 515),
-    "MSG:68.517": ("orthorhombic", "MSG", 516),
-    "MSG:68.518": ("orthorhombic", "MSG", 517),
-    "MSG:68.519": ("orthorhombic", "MSG", 518),
-    "MSG:68.520": ("orthorhombic", "MSG", 519),
-    "MSG:69.521": ("orthorhombic", "MSG", 520),
-    "MSG:69.522": ("orthorhombic", "MSG", 521),
-    "MSG:69.523": ("orthorhombic", "MSG", 522),
-    "MSG:69.524": ("orthorhombic", "MSG", 523),
-    "MSG:69.525": ("orthorhombic", "MSG", 524),
-    "MSG:69.526": ("orthorhombic", "MSG", 525),
-    "MSG:70.527": ("orthorhombic", "MSG", 526),
-    "MSG:70.528": ("orthorhombic", "MSG", 527),
-    "MSG:70.529": ("orthorhombic", "MSG", 528),
-    "MSG:70.530": ("orthorhombic", "MSG", 529),
-    "MSG:70.531": ("orthorhombic", "MSG", 530),
-    "MSG:70.532": ("orthorhombic", "MSG", 531),
-    "MSG:71.533": ("orthorhombic", "MSG", 532),
-    "MSG:71.534": ("orthorhombic", "MSG", 533),
-    "MSG:71.535": ("orthorhombic", "MSG", 534),
-    "MSG:71.536": ("orthorhombic", "MSG", 535),
-    "MSG:71.537": ("orthorhombic", "MSG", 536),
-    "MSG:71.538": ("orthorhombic", "MSG", 537),
-    "MSG:72.539": ("orthorhombic", "MSG", 538),
-    "MSG:72.540": ("orthorhombic", "MSG", 539),
-    "MSG:72.541": ("orthorhombic", "MSG", 540),
-    "MSG:72.542": ("orthorhombic", "MSG", 541),
-    "MSG:72.543": ("orthorhombic", "MSG", 542),
-    "MSG:72.544": ("orthorhombic", "MSG", 543),
-    "MSG:72.545": ("orthorhombic", "MSG", 544),
-    "MSG:72.546": ("orthorhombic", "MSG", 545),
-    "MSG:72.547": ("orthorhombic", "MSG", 546),
-    "MSG:73.548": ("orthorhombic", "MSG", 547),
-    "MSG:73.549": ("orthorhombic", "MSG", 548),
-    "MSG:73.550": ("orthorhombic", "MSG", 549),
-    "MSG:73.551": ("orthorhombic", "MSG", 550),
-    "MSG:73.552": ("orthorhombic", "MSG", 551),
-    "MSG:73.553": ("orthorhombic", "MSG", 552),
-    "MSG:74.554": ("orthorhombic", "MSG", 553),
-    "MSG:74.555": ("orthorhombic", "MSG", 554),
-    "MSG:74.556": ("orthorhombic", "MSG", 555),
-    "MSG:74.557": ("orthorhombic", "MSG", 556),
-    "MSG:74.558": ("orthorhombic", "MSG", 557),
-    "MSG:74.559": ("orthorhombic", "MSG", 558),
-    "MSG:74.560": ("orthorhombic", "MSG", 559),
-    "MSG:74.561": ("orthorhombic", "MSG", 560),
-    "MSG:74.562": ("orthorhombic", "MSG", 561),
-    "MSG:75.1": ("tetragonal", "MSG", 0),
-    "MSG:75.2": ("tetragonal", "MSG", 1),
-    "MSG:75.3": ("tetragonal", "MSG", 2),
-    "MSG:75.4": ("tetragonal", "MSG", 3),
-    "MSG:75.5": ("tetragonal", "MSG", 4),
-    "MSG:75.6": ("tetragonal", "MSG", 5),
-    "MSG:76.7": ("tetragonal", "MSG", 6),
-    "MSG:76.8": ("tetragonal", "MSG", 7),
-    "MSG:76.9": ("tetragonal", "MSG", 8),
-    "MSG:76.10": ("tetragonal", "MSG", 9),
-    "MSG:76.11": ("tetragonal", "MSG", 10),
-    "MSG:76.12": ("tetragonal", "MSG", 11),
-    "MSG:77.13": ("tetragonal", "MSG", 12),
-    "MSG:77.14": ("tetragonal", "MSG", 13),
-    "MSG:77.15": ("tetragonal", "MSG", 14),
-    "MSG:77.16": ("tetragonal", "MSG", 15),
-    "MSG:77.17": ("tetragonal", "MSG", 16),
-    "MSG:77.18": ("tetragonal", "MSG", 17),
-    "MSG:78.19": ("tetragonal", "MSG", 18),
-    "MSG:78.20": ("tetragonal", "MSG", 19),
-    "MSG:78.21": ("tetragonal", "MSG", 20),
-    "MSG:78.22": ("tetragonal", "MSG", 21),
-    "MSG:78.23": ("tetragonal", "MSG", 22),
-    "MSG:78.24": ("tetragonal", "MSG", 23),
-    "MSG:79.25": ("tetragonal", "MSG", 24),
-    "MSG:79.26": ("tetragonal", "MSG", 25),
-    "MSG:79.27": ("tetragonal", "MSG", 26),
-    "MSG:79.28": ("tetragonal", "MSG", 27),
-    "MSG:80.29": ("tetragonal", "MSG", 28),
-    "MSG:80.30": ("tetragonal", "MSG", 29),
-    "MSG:80.31": ("tetragonal", "MSG", 30),
-    "MSG:80.32": ("tetragonal", "MSG", 31),
-    "MSG:81.33": ("tetragonal", "MSG", 32),
-    "MSG:81.34": ("tetragonal", "MSG", 33),
-    "MSG:81.35": ("tetragonal", "MSG", 34),
-    "MSG:81.36": ("tetragonal", "MSG", 35),
-    "MSG:81.37": ("tetragonal", "MSG", 36),
-    "MSG:81.38": ("tetragonal", "MSG", 37),
-    "MSG:82.39": ("tetragonal", "MSG", 38),
-    "MSG:82.40": ("tetragonal", "MSG", 39),
-    "MSG:82.41": ("tetragonal", "MSG", 40),
-    "MSG:82.42": ("tetragonal", "MSG", 41),
-    "MSG:83.43": ("tetragonal", "MSG", 42),
-    "MSG:83.44": ("tetragonal", "MSG", 43),
-    "MSG:83.45": ("tetragonal", "MSG", 44),
-    "MSG:83.46": ("tetragonal", "MSG", 45),
-    "MSG:83.47": ("tetragonal", "MSG", 46),
-    "MSG:83.48": ("tetragonal", "MSG", 47),
-    "MSG:83.49": ("tetragonal", "MSG", 48),
-    "MSG:83.50": ("tetragonal", "MSG", 49),
-    "MSG:84.51": ("tetragonal", "MSG", 50),
-    "MSG:84.52": ("tetragonal", "MSG", 51),
-    "MSG:84.53": ("tetragonal", "MSG", 52),
-    "MSG:84.54": ("tetragonal", "MSG", 53),
-    "MSG:84.55": ("tetragonal", "MSG", 54),
-    "MSG:84.56": ("tetragonal", "MSG", 55),
-    "MSG:84.57": ("tetragonal", "MSG", 56),
-    "MSG:84.58": ("tetragonal", "MSG", 57),
-    "MSG:85.59": ("tetragonal", "MSG", 58),
-    "MSG:85.60": ("tetragonal", "MSG", 59),
-    "MSG:85.61": ("tetragonal", "MSG", 60),
-    "MSG:85.62": ("tetragonal", "MSG", 61),
-    "MSG:85.63": ("tetragonal", "MSG", 62),
-    "MSG:85.64": ("tetragonal", "MSG", 63),
-    "MSG:85.65": ("tetragonal", "MSG", 64),
-    "MSG:85.66": ("tetragonal", "MSG", 65),
-    "MSG:86.67": ("tetragonal", "MSG", 66),
-    "MSG:86.68": ("tetragonal", "MSG", 67),
-    "MSG:86.69": ("tetragonal", "MSG", 68),
-    "MSG:86.70": ("tetragonal", "MSG", 69),
-    "MSG:86.71": ("tetragonal", "MSG", 70),
-    "MSG:86.72": ("tetragonal", "MSG", 71),
-    "MSG:86.73": ("tetragonal", "MSG", 72),
-    "MSG:86.74": ("tetragonal", "MSG", 73),
-    "MSG:87.75": ("tetragonal", "MSG", 74),
-    "MSG:87.76": ("tetragonal", "MSG", 75),
-    "MSG:87.77": ("tetragonal", "MSG", 76),
-    "MSG:87.78": ("tetragonal", "MSG", 77),
-    "MSG:87.79": ("tetragonal", "MSG", 78),
-    "MSG:87.80": ("tetragonal", "MSG", 79),
-    "MSG:88.81": ("tetragonal", "MSG", 80),
-    "MSG:88.82": ("tetragonal", "MSG", 81),
-    "MSG:88.83": ("tetragonal", "MSG", 82),
-    "MSG:88.84": ("tetragonal", "MSG", 83),
-    "MSG:88.85": ("tetragonal", "MSG", 84),
-    "MSG:88.86": ("tetragonal", "MSG", 85),
-    "MSG:89.87": ("tetragonal", "MSG", 86),
-    "MSG:89.88": ("tetragonal", "MSG", 87),
-    "MSG:89.89": ("tetragonal", "MSG", 88),
-    "MSG:89.90": ("tetragonal", "MSG", 89),
-    "MSG:89.91": ("tetragonal", "MSG", 90),
-    "MSG:89.92": ("tetragonal", "MSG", 91),
-    "MSG:89.93": ("tetragonal", "MSG", 92),
-    "MSG:89.94": ("tetragonal", "MSG", 93),
-    "MSG:90.95": ("tetragonal", "MSG", 94),
-    "MSG:90.96": ("tetragonal", "MSG", 95),
-    "MSG:90.97": ("tetragonal", "MSG", 96),
-    "MSG:90.98": ("tetragonal", "MSG", 97),
-    "MSG:90.99": ("tetragonal", "MSG", 98),
-    "MSG:90.100": ("tetragonal", "MSG", 99),
-    "MSG:90.101": ("tetragonal", "MSG", 100),
-    "MSG:90.102": ("tetragonal", "MSG", 101),
-    "MSG:91.103": ("tetragonal", "MSG", 102),
-    "MSG:91.104": ("tetragonal", "MSG", 103),
-    "MSG:91.105": ("tetragonal", "MSG", 104),
-    "MSG:91.106": ("tetragonal", "MSG", 105),
-    "MSG:91.107": ("tetragonal", "MSG", 106),
-    "MSG:91.108": ("tetragonal", "MSG", 107),
-    "MSG:91.109": ("tetragonal", "MSG", 108),
-    "MSG:91.110": ("tetragonal", "MSG", 109),
-    "MSG:92.111": ("tetragonal", "MSG", 110),
-    "MSG:92.112": ("tetragonal", "MSG", 111),
-    "MSG:92.113": ("tetragonal", "MSG", 112),
-    "MSG:92.114": ("tetragonal", "MSG", 113),
-    "MSG:92.115": ("tetragonal", "MSG", 114),
-    "MSG:92.116": ("tetragonal", "MSG", 115),
-    "MSG:92.117": ("tetragonal", "MSG", 116),
-    "MSG:92.118": ("tetragonal", "MSG", 117),
-    "MSG:93.119": ("tetragonal", "MSG", 118),
-    "MSG:93.120": ("tetragonal", "MSG", 119),
-    "MSG:93.121": ("tetragonal", "MSG", 120),
-    "MSG:93.122": ("tetragonal", "MSG", 121),
-    "MSG:93.123": ("tetragonal", "MSG", 122),
-    "MSG:93.124": ("tetragonal", "MSG", 123),
-    "MSG:93.125": ("tetragonal", "MSG", 124),
-    "MSG:93.126": ("tetragonal", "MSG", 125),
-    "MSG:94.127": ("tetragonal", "MSG", 126),
-    "MSG:94.128": ("tetragonal", "MSG", 127),
-    "MSG:94.129": ("tetragonal", "MSG", 128),
-    "MSG:94.130": ("tetragonal", "MSG", 129),
-    "MSG:94.131": ("tetragonal", "MSG", 130),
-    "MSG:94.132": ("tetragonal", "MSG", 131),
-    "MSG:94.133": ("tetragonal", "MSG", 132),
-    "MSG:94.134": ("tetragonal", "MSG", 133),
-    "MSG:95.135": ("tetragonal", "MSG", 134),
-    "MSG:95.136": ("tetragonal", "MSG", 135),
-    "MSG:95.137": ("tetragonal", "MSG", 136),
-    "MSG:95.138": ("tetragonal", "MSG", 137),
-    "MSG:95.139": ("tetragonal", "MSG", 138),
-    "MSG:95.140": ("tetragonal", "MSG", 139),
-    "MSG:95.141": ("tetragonal", "MSG", 140),
-    "MSG:95.142": ("tetragonal", "MSG", 141),
-    "MSG:96.143": ("tetragonal", "MSG", 142),
-    "MSG:96.144": ("tetragonal", "MSG", 143),
-    "MSG:96.145": ("tetragonal", "MSG", 144),
-    "MSG:96.146": ("tetragonal", "MSG", 145),
-    "MSG:96.147": ("tetragonal", "MSG", 146),
-    "MSG:96.148": ("tetragonal", "MSG", 147),
-    "MSG:96.149": ("tetragonal", "MSG", 148),
-    "MSG:96.150": ("tetragonal", "MSG", 149),
-    "MSG:97.151": ("tetragonal", "MSG", 150),
-    "MSG:97.152": ("tetragonal", "MSG", 151),
-    "MSG:97.153": ("tetragonal", "MSG", 152),
-    "MSG:97.154": ("tetragonal", "MSG", 153),
-    "MSG:97.155": ("tetragonal", "MSG", 154),
-    "MSG:97.156": ("tetragonal", "MSG", 155),
-    "MSG:98.157": ("tetragonal", "MSG", 156),
-    "MSG:98.158": ("tetragonal", "MSG", 157),
-    "MSG:98.159": ("tetragonal", "MSG", 158),
-    "MSG:98.160": ("tetragonal", "MSG", 159),
-    "MSG:98.161": ("tetragonal", "MSG", 160),
-    "MSG:98.162": ("tetragonal", "MSG", 161),
-    "MSG:99.163": ("tetragonal", "MSG", 162),
-    "MSG:99.164": ("tetragonal", "MSG", 163),
-    "MSG:99.165": ("tetragonal", "MSG", 164),
-    "MSG:99.166": ("tetragonal", "MSG", 165),
-    "MSG:99.167": ("tetragonal", "MSG", 166),
-    "MSG:99.168": ("tetragonal", "MSG", 167),
-    "MSG:99.169": ("tetragonal", "MSG", 168),
-    "MSG:99.170": ("tetragonal", "MSG", 169),
-    "MSG:100.171": ("tetragonal", "MSG", 170),
-    "MSG:100.172": ("tetragonal", "MSG", 171),
-    "MSG:100.173": ("tetragonal", "MSG", 172),
-    "MSG:100.174": ("tetragonal", "MSG", 173),
-    "MSG:100.175": ("tetragonal", "MSG", 174),
-    "MSG:100.176": ("tetragonal", "MSG", 175),
-    "MSG:100.177": ("tetragonal", "MSG", 176),
-    "MSG:100.178": ("tetragonal", "MSG", 177),
-    "MSG:101.179": ("tetragonal", "MSG", 178),
-    "MSG:101.180": ("tetragonal", "MSG", 179),
-    "MSG:101.181": ("tetragonal", "MSG", 180),
-    "MSG:101.182": ("tetragonal", "MSG", 181),
-    "MSG:101.183": ("tetragonal", "MSG", 182),
-    "MSG:101.184": ("tetragonal", "MSG", 183),
-    "MSG:101.185": ("tetragonal", "MSG", 184),
-    "MSG:101.186": ("tetragonal", "MSG", 185),
-    "MSG:102.187": ("tetragonal", "MSG", 186),
-    "MSG:102.188": ("tetragonal", "MSG", 187),
-    "MSG:102.189": ("tetragonal", "MSG", 188),
-    "MSG:102.190": ("tetragonal", "MSG", 189),
-    "MSG:102.191": ("tetragonal", "MSG", 190),
-    "MSG:102.192": ("tetragonal", "MSG", 191),
-    "MSG:102.193": ("tetragonal", "MSG", 192),
-    "MSG:102.194": ("tetragonal", "MSG", 193),
-    "MSG:103.195": ("tetragonal", "MSG", 194),
-    "MSG:103.196": ("tetragonal", "MSG", 195),
-    "MSG:103.197": ("tetragonal", "MSG", 196),
-    "MSG:103.198": ("tetragonal", "MSG", 197),
-    "MSG:103.199": ("tetragonal", "MSG", 198),
-    "MSG:103.200": ("tetragonal", "MSG", 199),
-    "MSG:103.201": ("tetragonal", "MSG", 200),
-    "MSG:103.202": ("tetragonal", "MSG", 201),
-    "MSG:104.203": ("tetragonal", "MSG", 202),
-    "MSG:104.204": ("tetragonal", "MSG", 203),
-    "MSG:104.205": ("tetragonal", "MSG", 204),
-    "MSG:104.206": ("tetragonal", "MSG", 205),
-    "MSG:104.207": ("tetragonal", "MSG", 206),
-    "MSG:104.208": ("tetragonal", "MSG", 207),
-    "MSG:104.209": ("tetragonal", "MSG", 208),
-    "MSG:104.210": ("tetragonal", "MSG", 209),
-    "MSG:105.211": ("tetragonal", "MSG", 210),
-    "MSG:105.212": ("tetragonal", "MSG", 211),
-    "MSG:105.213": ("tetragonal", "MSG", 212),
-    "MSG:105.214": ("tetragonal", "MSG", 213),
-    "MSG:105.215": ("tetragonal", "MSG", 214),
-    "MSG:105.216": ("tetragonal", "MSG", 215),
-    "MSG:105.217": ("tetragonal", "MSG", 216),
-    "MSG:105.218": ("tetragonal", "MSG", 217),
-    "MSG:106.219": ("tetragonal", "MSG", 218),
-    "MSG:106.220": ("tetragonal", "MSG", 219),
-    "MSG:106.221": ("tetragonal", "MSG", 220),
-    "MSG:106.222": ("tetragonal", "MSG", 221),
-    "MSG:106.223": ("tetragonal", "MSG", 222),
-    "MSG:106.224": ("tetragonal", "MSG", 223),
-    "MSG:106.225": ("tetragonal", "MSG", 224),
-    "MSG:106.226": ("tetragonal", "MSG", 225),
-    "MSG:107.227": ("tetragonal", "MSG", 226),
-    "MSG:107.228": ("tetragonal", "MSG", 227),
-    "MSG:107.229": ("tetragonal", "MSG", 228),
-    "MSG:107.230": ("tetragonal", "MSG", 229),
-    "MSG:107.231": ("tetragonal", "MSG", 230),
-    "MSG:107.232": ("tetragonal", "MSG", 231),
-    "MSG:108.233": ("tetragonal", "MSG", 232),
-    "MSG:108.234": ("tetragonal", "MSG", 233),
-    "MSG:108.235": ("tetragonal", "MSG", 234),
-    "MSG:108.236": ("tetragonal", "MSG", 235),
-    "MSG:108.237": ("tetragonal", "MSG", 236),
-    "MSG:108.238": ("tetragonal", "MSG", 237),
-    "MSG:109.239": ("tetragonal", "MSG", 238),
-    "MSG:109.240": ("tetragonal", "MSG", 239),
-    "MSG:109.241": ("tetragonal", "MSG", 240),
-    "MSG:109.242": ("tetragonal", "MSG", 241),
-    "MSG:109.243": ("tetragonal", "MSG", 242),
-    "MSG:109.244": ("tetragonal", "MSG", 243),
-    "MSG:110.245": ("tetragonal", "MSG", 244),
-    "MSG:110.246": ("tetragonal", "MSG", 245),
-    "MSG:110.247": ("tetragonal", "MSG", 246),
-    "MSG:110.248": ("tetragonal", "MSG", 247),
-    "MSG:110.249": ("tetragonal", "MSG", 248),
-    "MSG:110.250": ("tetragonal", "MSG", 249),
-    "MSG:111.251": ("tetragonal", "MSG", 250),
-    "MSG:111.252": ("tetragonal", "MSG", 251),
-    "MSG:111.253": ("tetragonal", "MSG", 252),
-    "MSG:111.254": ("tetragonal", "MSG", 253),
-    "MSG:111.255": ("tetragonal", "MSG", 254),
-    "MSG:111.256": ("tetragonal", "MSG", 255),
-    "MSG:111.257": ("tetragonal", "MSG", 256),
-    "MSG:111.258": ("tetragonal", "MSG", 257),
-    "MSG:112.259": ("tetragonal", "MSG", 258),
-    "MSG:112.260": ("tetragonal", "MSG", 259),
-    "MSG:112.261": ("tetragonal", "MSG", 260),
-    "MSG:112.262": ("tetragonal", "MSG", 261),
-    "MSG:112.263": ("tetragonal", "MSG", 262),
-    "MSG:112.264": ("tetragonal", "MSG", 263),
-    "MSG:112.265": ("tetragonal", "MSG", 264),
-    "MSG:112.266": ("tetragonal", "MSG", 265),
-    "MSG:113.267": ("tetragonal", "MSG", 266),
-    "MSG:113.268": ("tetragonal", "MSG", 267),
-    "MSG:113.269": ("tetragonal", "MSG", 268),
-    "MSG:113.270": ("tetragonal", "MSG", 269),
-    "MSG:113.271": ("tetragonal", "MSG", 270),
-    "MSG:113.272": ("tetragonal", "MSG", 271),
-    "MSG:113.273": ("tetragonal", "MSG", 272),
-    "MSG:113.274": ("tetragonal", "MSG", 273),
-    "MSG:114.275": ("tetragonal", "MSG", 274),
-    "MSG:114.276": ("tetragonal", "MSG", 275),
-    "MSG:114.277": ("tetragonal", "MSG", 276),
-    "MSG:114.278": ("tetragonal", "MSG", 277),
-    "MSG:114.279": ("tetragonal", "MSG", 278),
-    "MSG:114.280": ("tetragonal", "MSG", 279),
-    "MSG:114.281": ("tetragonal", "MSG", 280),
-    "MSG:114.282": ("tetragonal", "MSG", 281),
-    "MSG:115.283": ("tetragonal", "MSG", 282),
-    "MSG:115.284": ("tetragonal", "MSG", 283),
-    "MSG:115.285": ("tetragonal", "MSG", 284),
-    "MSG:115.286": ("tetragonal", "MSG", 285),
-    "MSG:115.287": ("tetragonal", "MSG", 286),
-    "MSG:115.288": ("tetragonal", "MSG", 287),
-    "MSG:115.289": ("tetragonal", "MSG", 288),
-    "MSG:115.290": ("tetragonal", "MSG", 289),
-    "MSG:116.291": ("tetragonal", "MSG", 290),
-    "MSG:116.292": ("tetragonal", "MSG", 291),
-    "MSG:116.293": ("tetragonal", "MSG", 292),
-    "MSG:116.294": ("tetragonal", "MSG", 293),
-    "MSG:116.295": ("tetragonal", "MSG", 294),
-    "MSG:116.296": ("tetragonal", "MSG", 295),
-    "MSG:116.297": ("tetragonal", "MSG", 296),
-    "MSG:116.298": ("tetragonal", "MSG", 297),
-    "MSG:117.299": ("tetragonal", "MSG", 298),
-    "MSG:117.300": ("tetragonal", "MSG", 299),
-    "MSG:117.301": ("tetragonal", "MSG", 300),
-    "MSG:117.302": ("tetragonal", "MSG", 301),
-    "MSG:117.303": ("tetragonal", "MSG", 302),
-    "MSG:117.304": ("tetragonal", "MSG", 303),
-    "MSG:117.305": ("tetragonal", "MSG", 304),
-    "MSG:117.306": ("tetragonal", "MSG", 305),
-    "MSG:118.307": ("tetragonal", "MSG", 306),
-    "MSG:118.308": ("tetragonal", "MSG", 307),
-    "MSG:118.309": ("tetragonal", "MSG", 308),
-    "MSG:118.310": ("tetragonal", "MSG", 309),
-    "MSG:118.311": ("tetragonal", "MSG", 310),
-    "MSG:118.312": ("tetragonal", "MSG", 311),
-    "MSG:118.313": ("tetragonal", "MSG", 312),
-    "MSG:118.314": ("tetragonal", "MSG", 313),
-    "MSG:119.315": ("tetragonal", "MSG", 314),
-    "MSG:119.316": ("tetragonal", "MSG", 315),
-    "MSG:119.317": ("tetragonal", "MSG", 316),
-    "MSG:119.318": ("tetragonal", "MSG", 317),
-    "MSG:119.319": ("tetragonal", "MSG", 318),
-    "MSG:119.320": ("tetragonal", "MSG", 319),
-    "MSG:120.321": ("tetragonal", "MSG", 320),
-    "MSG:120.322": ("tetragonal", "MSG", 321),
-    "MSG:120.323": ("tetragonal", "MSG", 322),
-    "MSG:120.324": ("tetragonal", "MSG", 323),
-    "MSG:120.325": ("tetragonal", "MSG", 324),
-    "MSG:120.326": ("tetragonal", "MSG", 325),
-    "MSG:121.327": ("tetragonal", "MSG", 326),
-    "MSG:121.328": ("tetragonal", "MSG", 327),
-    "MSG:121.329": ("tetragonal", "MSG", 328),
-    "MSG:121.330": ("tetragonal", "MSG", 329),
-    "MSG:121.331": ("tetragonal", "MSG", 330),
-    "MSG:121.332": ("tetragonal", "MSG", 331),
-    "MSG:122.333": ("tetragonal", "MSG", 332),
-    "MSG:122.334": ("tetragonal", "MSG", 333),
-    "MSG:122.335": ("tetragonal", "MSG", 334),
-    "MSG:122.336": ("tetragonal", "MSG", 335),
-    "MSG:122.337": ("tetragonal", "MSG", 336),
-    "MSG:122.338": ("tetragonal", "MSG", 337),
-    "MSG:123.339": ("tetragonal", "MSG", 338),
-    "MSG:123.340": ("tetragonal", "MSG", 339),
-    "MSG:123.341": ("tetragonal", "MSG", 340),
-    "MSG:123.342": ("tetragonal", "MSG", 341),
-    "MSG:123.343": ("tetragonal", "MSG", 342),
-    "MSG:123.344": ("tetragonal", "MSG", 343),
-    "MSG:123.345": ("tetragonal", "MSG", 344),
-    "MSG:123.346": ("tetragonal", "MSG", 345),
-    "MSG:123.347": ("tetragonal", "MSG", 346),
-    "MSG:123.348": ("tetragonal", "MSG", 347),
-    "MSG:123.349": ("tetragonal", "MSG", 348),
-    "MSG:123.350": ("tetragonal", "MSG", 349),
-    "MSG:124.351": ("tetragonal", "MSG", 350),
-    "MSG:124.352": ("tetragonal", "MSG", 351),
-    "MSG:124.353": ("tetragonal", "MSG", 352),
-    "MSG:124.354": ("tetragonal", "MSG", 353),
-    "MSG:124.355": ("tetragonal", "MSG", 354),
-    "MSG:124.356": ("tetragonal", "MSG", 355),
-    "MSG:124.357": ("tetragonal", "MSG", 356),
-    "MSG:124.358": ("tetragonal", "MSG", 357),
-    "MSG:124.359": ("tetragonal", "MSG", 358),
-    "MSG:124.360": ("tetragonal", "MSG", 359),
-    "MSG:124.361": ("tetragonal", "MSG", 360),
-    "MSG:124.362": ("tetragonal", "MSG", 361),
-    "MSG:125.363": ("tetragonal", "MSG", 362),
-    "MSG:125.364": ("tetragonal", "MSG", 363),
-    "MSG:125.365": ("tetragonal", "MSG", 364),
-    "MSG:125.366": ("tetragonal", "MSG", 365),
-    "MSG:125.367": ("tetragonal", "MSG", 366),
-    "MSG:125.368": ("tetragonal", "MSG", 367),
-    "MSG:125.369": ("tetragonal", "MSG", 368),
-    "MSG:125.370": ("tetragonal", "MSG", 369),
-    "MSG:125.371": ("tetragonal", "MSG", 370),
-    "MSG:125.372": ("tetragonal", "MSG", 371),
-    "MSG:125.373": ("tetragonal", "MSG", 372),
-    "MSG:125.374": ("tetragonal", "MSG", 373),
-    "MSG:126.375": ("tetragonal", "MSG", 374),
-    "MSG:126.376": ("tetragonal", "MSG", 375),
-    "MSG:126.377": ("tetragonal", "MSG", 376),
-    "MSG:126.378": ("tetragonal", "MSG", 377),
-    "MSG:126.379": ("tetragonal", "MSG", 378),
-    "MSG:126.380": ("tetragonal", "MSG", 379),
-    "MSG:126.381": ("tetragonal", "MSG", 380),
-    "MSG:126.382": ("tetragonal", "MSG", 381),
-    "MSG:126.383": ("tetragonal", "MSG", 382),
-    "MSG:126.384": ("tetragonal", "MSG", 383),
-    "MSG:126.385": ("tetragonal", "MSG", 384),
-    "MSG:126.386": ("tetragonal", "MSG", 385),
-    "MSG:127.387": ("tetragonal", "MSG", 386),
-    "MSG:127.388": ("tetragonal", "MSG", 387),
-    "MSG:127.389": ("tetragonal", "MSG", 388),
-    "MSG:127.390": ("tetragonal", "MSG", 389),
-    "MSG:127.391": ("tetragonal", "MSG", 390),
-    "MSG:127.392": ("tetragonal", "MSG", 391),
-    "MSG:127.393": ("tetragonal", "MSG", 392),
-    "MSG:127.394": ("tetragonal", "MSG", 393),
-    "MSG:127.395": ("tetragonal", "MSG", 394),
-    "MSG:127.396": ("tetragonal", "MSG", 395),
-    "MSG:127.397": ("tetragonal", "MSG", 396),
-    "MSG:127.398": ("tetragonal", "MSG", 397),
-    "MSG:128.399": ("tetragonal", "MSG", 398),
-    "MSG:128.400": ("tetragonal", "MSG", 399),
-    "MSG:128.401": ("tetragonal", "MSG", 400),
-    "MSG:128.402": ("tetragonal", "MSG", 401),
-    "MSG:128.403": ("tetragonal", "MSG", 402),
-    "MSG:128.404": ("tetragonal", "MSG", 403),
-    "MSG:128.405": ("tetragonal", "MSG", 404),
-    "MSG:128.406": ("tetragonal", "MSG", 405),
-    "MSG:128.407": ("tetragonal", "MSG", 406),
-    "MSG:128.408": ("tetragonal", "MSG", 407),
-    "MSG:128.409": ("tetragonal", "MSG", 408),
-    "MSG:128.410": ("tetragonal", "MSG", 409),
-    "MSG:129.411": ("tetragonal", "MSG", 410),
-    "MSG:129.412": ("tetragonal", "MSG", 411),
-    "MSG:129.413": ("tetragonal", "MSG", 412),
-    "MSG:129.414": ("tetragonal", "MSG", 413),
-    "MSG:129.415": ("tetragonal", "MSG", 414),
-    "MSG:129.416": ("tetragonal", "MSG", 415),
-    "MSG:129.417": ("tetragonal", "MSG", 416),
-    "MSG:129.418": ("tetragonal", "MSG", 417),
-    "MSG:129.419": ("tetragonal", "MSG", 418),
-    "MSG:129.420": ("tetragonal", "MSG", 419),
-    "MSG:129.421": ("tetragonal", "MSG", 420),
-    "MSG:129.422": ("tetragonal", "MSG", 421),
-    "MSG:130.423": ("tetragonal", "MSG", 422),
-    "MSG:130.424": ("tetragonal", "MSG", 423),
-    "MSG:130.425": ("tetragonal", "MSG", 424),
-    "MSG:130.426": ("tetragonal", "MSG", 425),
-    "MSG:130.427": ("tetragonal", "MSG", 426),
-    "MSG:130.428": ("tetragonal", "MSG", 427),
-    "MSG:130.429": ("tetragonal", "MSG", 428),
-    "MSG:130.430": ("tetragonal", "MSG", 429),
-    "MSG:130.431": ("tetragonal", "MSG", 430),
-    "MSG:130.432": ("tetragonal", "MSG", 431),
-    "MSG:130.433": ("tetragonal", "MSG", 432),
-    "MSG:130.434": ("tetragonal", "MSG", 433),
-    "MSG:131.435": ("tetragonal", "MSG", 434),
-    "MSG:131.436": ("tetragonal", "MSG", 435),
-    "MSG:131.437": ("tetragonal", "MSG", 436),
-    "MSG:131.438": ("tetragonal", "MSG", 437),
-    "MSG:131.439": ("tetragonal", "MSG", 438),
-    "MSG:131.440": ("tetragonal", "MSG", 439),
-    "MSG:131.441": ("tetragonal", "MSG", 440),
-    "MSG:131.442": ("tetragonal", "MSG", 441),
-    "MSG:131.443": ("tetragonal", "MSG", 442),
-    "MSG:131.444": ("tetragonal", "MSG", 443),
-    "MSG:131.445": ("tetragonal", "MSG", 444),
-    "MSG:131.446": ("tetragonal", "MSG", 445),
-    "MSG:132.447": ("tetragonal", "MSG", 446),
-    "MSG:132.448": ("tetragonal", "MSG", 447),
-    "MSG:132.449": ("tetragonal", "MSG", 448),
-    "MSG:132.450": ("tetragonal", "MSG", 449),
-    "MSG:132.451": ("tetragonal", "MSG", 450),
-    "MSG:132.452": ("tetragonal", "MSG", 451),
-    "MSG:132.453": ("tetragonal", "MSG", 452),
-    "MSG:132.454": ("tetragonal", "MSG", 453),
-    "MSG:132.455": ("tetragonal", "MSG", 454),
-    "MSG:132.456": ("tetragonal", "MSG", 455),
-    "MSG:132.457": ("tetragonal", "MSG", 456),
-    "MSG:132.458": ("tetragonal", "MSG", 457),
-    "MSG:133.459": ("tetragonal", "MSG", 458),
-    "MSG:133.460": ("tetragonal", "MSG", 459),
-    "MSG:133.461": ("tetragonal", "MSG", 460),
-    "MSG:133.462": ("tetragonal", "MSG", 461),
-    "MSG:133.463": ("tetragonal", "MSG", 462),
-    "MSG:133.464": ("tetragonal", "MSG", 463),
-    "MSG:133.465": ("tetragonal", "MSG", 464),
-    "MSG:133.466": ("tetragonal", "MSG", 465),
-    "MSG:133.467": ("tetragonal", "MSG", 466),
-    "MSG:133.468": ("tetragonal", "MSG", 467),
-    "MSG:133.469": ("tetragonal", "MSG", 468),
-    "MSG:133.470": ("tetragonal", "MSG", 469),
-    "MSG:134.471": ("tetragonal", "MSG", 470),
-    "MSG:134.472": ("tetragonal", "MSG", 471),
-    "MSG:134.473": ("tetragonal", "MSG", 472),
-    "MSG:134.474": ("tetragonal", "MSG", 473),
-    "MSG:134.475": ("tetragonal", "MSG", 474),
-    "MSG:134.476": ("tetragonal", "MSG", 475),
-    "MSG:134.477": ("tetragonal", "MSG", 476),
-    "MSG:134.478": ("tetragonal", "MSG", 477),
-    "MSG:134.479": ("tetragonal", "MSG", 478),
-    "MSG:134.480": ("tetragonal", "MSG", 479),
-    "MSG:134.481": ("tetragonal", "MSG", 480),
-    "MSG:134.482": ("tetragonal", "MSG", 481),
-    "MSG:135.483": ("tetragonal", "MSG", 482),
-    "MSG:135.484": ("tetragonal", "MSG", 483),
-    "MSG:135.485": ("tetragonal", "MSG", 484),
-    "MSG:135.486": ("tetragonal", "MSG", 485),
-    "MSG:135.487": ("tetragonal", "MSG", 486),
-    "MSG:135.488": ("tetragonal", "MSG", 487),
-    "MSG:135.489": ("tetragonal", "MSG", 488),
-    "MSG:135.490": ("tetragonal", "MSG", 489),
-    "MSG:135.491": ("tetragonal", "MSG", 490),
-    "MSG:135.492": ("tetragonal", "MSG", 491),
-    "MSG:135.493": ("tetragonal", "MSG", 492),
-    "MSG:135.494": ("tetragonal", "MSG", 493),
-    "MSG:136.495": ("tetragonal", "MSG", 494),
-    "MSG:136.496": ("tetragonal", "MSG", 495),
-    "MSG:136.497": ("tetragonal", "MSG", 496),
-    "MSG:136.498": ("tetragonal", "MSG", 497),
-    "MSG:136.499": ("tetragonal", "MSG", 498),
-    "MSG:136.500": ("tetragonal", "MSG", 499),
-    "MSG:136.501": ("tetragonal", "MSG", 500),
-    "MSG:136.502": ("tetragonal", "MSG", 501),
-    "MSG:136.503": ("tetragonal", "MSG", 502),
-    "MSG:136.504": ("tetragonal", "MSG", 503),
-    "MSG:136.505": ("tetragonal", "MSG", 504),
-    "MSG:136.506": ("tetragonal", "MSG", 505),
-    "MSG:137.507": ("tetragonal", "MSG", 506),
-    "MSG:137.508": ("tetragonal", "MSG", 507),
-    "MSG:137.509": ("tetragonal", "MSG", 508),
-    "MSG:137.510": ("tetragonal", "MSG", 509),
-    "MSG:137.511": ("tetragonal", "MSG", 510),
-    "MSG:137.512": ("tetragonal", "MSG", 511),
-    "MSG:137.513": ("tetragonal", "MSG", 512),
-    "MSG:137.514": ("tetragonal", "MSG", 513),
-    "MSG:137.515": ("tetragonal", "MSG", 514),
-    "MSG:137.516": ("tetragonal", "MSG", 515),
-    "MSG:137.517": ("tetragonal", "MSG", 516),
-    "MSG:137.518": ("tetragonal", "MSG", 517),
-    "MSG:138.519": ("tetragonal", "MSG", 518),
-    "MSG:138.520": ("tetragonal", "MSG", 519),
-    "MSG:138.521": ("tetragonal", "MSG", 520),
-    "MSG:138.522": ("tetragonal", "MSG", 521),
-    "MSG:138.523": ("tetragonal", "MSG", 522),
-    "MSG:138.524": ("tetragonal", "MSG", 523),
-    "MSG:138.525": ("tetragonal", "MSG", 524),
-    "MSG:138.526": ("tetragonal", "MSG", 525),
-    "MSG:138.527": ("tetragonal", "MSG", 526),
-    "MSG:138.528": ("tetragonal", "MSG", 527),
-    "MSG:138.529": ("tetragonal", "MSG", 528),
-    "MSG:138.530": ("tetragonal", "MSG", 529),
-    "MSG:139.531": ("tetragonal", "MSG", 530),
-    "MSG:139.532": ("tetragonal", "MSG", 531),
-    "MSG:139.533": ("tetragonal", "MSG", 532),
-    "MSG:139.534": ("tetragonal", "MSG", 533),
-    "MSG:139.535": ("tetragonal", "MSG", 534),
-    "MSG:139.536": ("tetragonal", "MSG", 535),
-    "MSG:139.537": ("tetragonal", "MSG", 536),
-    "MSG:139.538": ("tetragonal", "MSG", 537),
-    "MSG:139.539": ("tetragonal", "MSG", 538),
-    "MSG:139.540": ("tetragonal", "MSG", 539),
-    "MSG:140.541": ("tetragonal", "MSG", 540),
-    "MSG:140.542": ("tetragonal", "MSG", 541),
-    "MSG:140.543": ("tetragonal", "MSG", 542),
-    "MSG:140.544": ("tetragonal", "MSG", 543),
-    "MSG:140.545": ("tetragonal", "MSG", 544),
-    "MSG:140.546": ("tetragonal", "MSG", 545),
-    "MSG:140.547": ("tetragonal", "MSG", 546),
-    "MSG:140.548": ("tetragonal", "MSG", 547),
-    "MSG:140.549": ("tetragonal", "MSG", 548),
-    "MSG:140.550": ("tetragonal", "MSG", 549),
-    "MSG:141.551": ("tetragonal", "MSG", 550),
-    "MSG:141.552": ("tetragonal", "MSG", 551),
-    "MSG:141.553": ("tetragonal", "MSG", 552),
-    "MSG:141.554": ("tetragonal", "MSG", 553),
-    "MSG:141.555": ("tetragonal", "MSG", 554),
-    "MSG:141.556": ("tetragonal", "MSG", 555),
-    "MSG:141.557": ("tetragonal", "MSG", 556),
-    "MSG:141.558": ("tetragonal", "MSG", 557),
-    "MSG:141.559": ("tetragonal", "MSG", 558),
-    "MSG:141.560": ("tetragonal", "MSG", 559),
-    "MSG:142.561": ("tetragonal", "MSG", 560),
-    "MSG:142.562": ("tetragonal", "MSG", 561),
-    "MSG:142.563": ("tetragonal", "MSG", 562),
-    "MSG:142.564": ("tetragonal", "MSG", 563),
-    "MSG:142.565": ("tetragonal", "MSG", 564),
-    "MSG:142.566": ("tetragonal", "MSG", 565),
-    "MSG:142.567": ("tetragonal", "MSG", 566),
-    "MSG:142.568": ("tetragonal", "MSG", 567),
-    "MSG:142.569": ("tetragonal", "MSG", 568),
-    "MSG:142.570": ("tetragonal", "MSG", 569),
-    "MSG:143.1": ("trigonal", "MSG", 0),
-    "MSG:143.2": ("trigonal", "MSG", 1),
-    "MSG:143.3": ("trigonal", "MSG", 2),
-    "MSG:144.4": ("trigonal", "MSG", 3),
-    "MSG:144.5": ("trigonal", "MSG", 4),
-    "MSG:144.6": ("trigonal", "MSG", 5),
-    "MSG:145.7": ("trigonal", "MSG", 6),
-    "MSG:145.8": ("trigonal", "MSG", 7),
-    "MSG:145.9": ("trigonal", "MSG", 8),
-    "MSG:146.10": ("trigonal", "MSG", 9),
-    "MSG:146.11": ("trigonal", "MSG", 10),
-    "MSG:146.12": ("trigonal", "MSG", 11),
-    "MSG:147.13": ("trigonal", "MSG", 12),
-    "MSG:147.14": ("trigonal", "MSG", 13),
-    "MSG:147.15": ("trigonal", "MSG", 14),
-    "MSG:147.16": ("trigonal", "MSG", 15),
-    "MSG:148.17": ("trigonal", "MSG", 16),
-    "MSG:148.18": ("trigonal", "MSG", 17),
-    "MSG:148.19": ("trigonal", "MSG", 18),
-    "MSG:148.20": ("trigonal", "MSG", 19),
-    "MSG:149.21": ("trigonal", "MSG", 20),
-    "MSG:149.22": ("trigonal", "MSG", 21),
-    "MSG:149.23": ("trigonal", "MSG", 22),
-    "MSG:149.24": ("trigonal", "MSG", 23),
-    "MSG:150.25": ("trigonal", "MSG", 24),
-    "MSG:150.26": ("trigonal", "MSG", 25),
-    "MSG:150.27": ("trigonal", "MSG", 26),
-    "MSG:150.28": ("trigonal", "MSG", 27),
-    "MSG:151.29": ("trigonal", "MSG", 28),
-    "MSG:151.30": ("trigonal", "MSG", 29),
-    "MSG:151.31": ("trigonal", "MSG", 30),
-    "MSG:151.32": ("trigonal", "MSG", 31),
-    "MSG:152.33": ("trigonal", "MSG", 32),
-    "MSG:152.34": ("trigonal", "MSG", 33),
-    "MSG:152.35": ("trigonal", "MSG", 34),
-    "MSG:152.36": ("trigonal", "MSG", 35),
-    "MSG:153.37": ("trigonal", "MSG", 36),
-    "MSG:153.38": ("trigonal", "MSG", 37),
-    "MSG:153.39": ("trigonal", "MSG", 38),
-    "MSG:153.40": ("trigonal", "MSG", 39),
-    "MSG:154.41": ("trigonal", "MSG", 40),
-    "MSG:154.42": ("trigonal", "MSG", 41),
-    "MSG:154.43": ("trigonal", "MSG", 42),
-    "MSG:154.44": ("trigonal", "MSG", 43),
-    "MSG:155.45": ("trigonal", "MSG", 44),
-    "MSG:155.46": ("trigonal", "MSG", 45),
-    "MSG:155.47": ("trigonal", "MSG", 46),
-    "MSG:155.48": ("trigonal", "MSG", 47),
-    "MSG:156.49": ("trigonal", "MSG", 48),
-    "MSG:156.50": ("trigonal", "MSG", 49),
-    "MSG:156.51": ("trigonal", "MSG", 50),
-    "MSG:156.52": ("trigonal", "MSG", 51),
-    "MSG:157.53": ("trigonal", "MSG", 52),
-    "MSG:157.54": ("trigonal", "MSG", 53),
-    "MSG:157.55": ("trigonal", "MSG", 54),
-    "MSG:157.56": ("trigonal", "MSG", 55),
-    "MSG:158.57": ("trigonal", "MSG", 56),
-    "MSG:158.58": ("trigonal", "MSG", 57),
-    "MSG:158.59": ("trigonal", "MSG", 58),
-    "MSG:158.60": ("trigonal", "MSG", 59),
-    "MSG:159.61": ("trigonal", "MSG", 60),
-    "MSG:159.62": ("trigonal", "MSG", 61),
-    "MSG:159.63": ("trigonal", "MSG", 62),
-    "MSG:159.64": ("trigonal", "MSG", 63),
-    "MSG:160.65": ("trigonal", "MSG", 64),
-    "MSG:160.66": ("trigonal", "MSG", 65),
-    "MSG:160.67": ("trigonal", "MSG", 66),
-    "MSG:160.68": ("trigonal", "MSG", 67),
-    "MSG:161.69": ("trigonal", "MSG", 68),
-    "MSG:161.70": ("trigonal", "MSG", 69),
-    "MSG:161.71": ("trigonal", "MSG", 70),
-    "MSG:161.72": ("trigonal", "MSG", 71),
-    "MSG:162.73": ("trigonal", "MSG", 72),
-    "MSG:162.74": ("trigonal", "MSG", 73),
-    "MSG:162.75": ("trigonal", "MSG", 74),
-    "MSG:162.76": ("trigonal", "MSG", 75),
-    "MSG:162.77": ("trigonal", "MSG", 76),
-    "MSG:162.78": ("trigonal", "MSG", 77),
-    "MSG:163.79": ("trigonal", "MSG", 78),
-    "MSG:163.80": ("trigonal", "MSG", 79),
-    "MSG:163.81": ("trigonal", "MSG", 80),
-    "MSG:163.82": ("trigonal", "MSG", 81),
-    "MSG:163.83": ("trigonal", "MSG", 82),
-    "MSG:163.84": ("trigonal", "MSG", 83),
-    "MSG:164.85": ("trigonal", "MSG", 84),
-    "MSG:164.86": ("trigonal", "MSG", 85),
-    "MSG:164.87": ("trigonal", "MSG", 86),
-    "MSG:164.88": ("trigonal", "MSG", 87),
-    "MSG:164.89": ("trigonal", "MSG", 88),
-    "MSG:164.90": ("trigonal", "MSG", 89),
-    "MSG:165.91": ("trigonal", "MSG", 90),
-    "MSG:165.92": ("trigonal", "MSG", 91),
-    "MSG:165.93": ("trigonal", "MSG", 92),
-    "MSG:165.94": ("trigonal", "MSG", 93),
-    "MSG:165.95": ("trigonal", "MSG", 94),
-    "MSG:165.96": ("trigonal", "MSG", 95),
-    "MSG:166.97": ("trigonal", "MSG", 96),
-    "MSG:166.98": ("trigonal", "MSG", 97),
-    "MSG:166.99": ("trigonal", "MSG", 98),
-    "MSG:166.100": ("trigonal", "MSG", 99),
-    "MSG:166.101": ("trigonal", "MSG", 100),
-    "MSG:166.102": ("trigonal", "MSG", 101),
-    "MSG:167.103": ("trigonal", "MSG", 102),
-    "MSG:167.104": ("trigonal", "MSG", 103),
-    "MSG:167.105": ("trigonal", "MSG", 104),
-    "MSG:167.106": ("trigonal", "MSG", 105),
-    "MSG:167.107": ("trigonal", "MSG", 106),
-    "MSG:167.108": ("trigonal", "MSG", 107),
-    "MSG:168.109": ("hexagonal", "MSG", 0),
-    "MSG:168.110": ("hexagonal", "MSG", 1),
-    "MSG:168.111": ("hexagonal", "MSG", 2),
-    "MSG:168.112": ("hexagonal", "MSG", 3),
-    "MSG:169.113": ("hexagonal", "MSG", 4),
-    "MSG:169.114": ("hexagonal", "MSG", 5),
-    "MSG:169.115": ("hexagonal", "MSG", 6),
-    "MSG:169.116": ("hexagonal", "MSG", 7),
-    "MSG:170.117": ("hexagonal", "MSG", 8),
-    "MSG:170.118": ("hexagonal", "MSG", 9),
-    "MSG:170.119": ("hexagonal", "MSG", 10),
-    "MSG:170.120": ("hexagonal", "MSG", 11),
-    "MSG:171.121": ("hexagonal", "MSG", 12),
-    "MSG:171.122": ("hexagonal", "MSG", 13),
-    "MSG:171.123": ("hexagonal", "MSG", 14),
-    "MSG:171.124": ("hexagonal", "MSG", 15),
-    "MSG:172.125": ("hexagonal", "MSG", 16),
-    "MSG:172.126": ("hexagonal", "MSG", 17),
-    "MSG:172.127": ("hexagonal", "MSG", 18),
-    "MSG:172.128": ("hexagonal", "MSG", 19),
-    "MSG:173.129": ("hexagonal", "MSG", 20),
-    "MSG:173.130": ("hexagonal", "MSG", 21),
-    "MSG:173.131": ("hexagonal", "MSG", 22),
-    "MSG:173.132": ("hexagonal", "MSG", 23),
-    "MSG:174.133": ("hexagonal", "MSG", 24),
-    "MSG:174.134": ("hexagonal", "MSG", 25),
-    "MSG:174.135": ("hexagonal", "MSG", 26),
-    "MSG:174.136": ("hexagonal", "MSG", 27),
-    "MSG:175.137": ("hexagonal", "MSG", 28),
-    "MSG:175.138": ("hexagonal", "MSG", 29),
-    "MSG:175.139": ("hexagonal", "MSG", 30),
-    "MSG:175.140": ("hexagonal", "MSG", 31),
-    "MSG:175.141": ("hexagonal", "MSG", 32),
-    "MSG:175.142": ("hexagonal", "MSG", 33),
-    "MSG:176.143": ("hexagonal", "MSG", 34),
-    "MSG:176.144": ("hexagonal", "MSG", 35),
-    "MSG:176.145": ("hexagonal", "MSG", 36),
-    "MSG:176.146": ("hexagonal", "MSG", 37),
-    "MSG:176.147": ("hexagonal", "MSG", 38),
-    "MSG:176.148": ("hexagonal", "MSG", 39),
-    "MSG:177.149": ("hexagonal", "MSG", 40),
-    "MSG:177.150": ("hexagonal", "MSG", 41),
-    "MSG:177.151": ("hexagonal", "MSG", 42),
-    "MSG:177.152": ("hexagonal", "MSG", 43),
-    "MSG:177.153": ("hexagonal", "MSG", 44),
-    "MSG:177.154": ("hexagonal", "MSG", 45),
-    "MSG:178.155": ("hexagonal", "MSG", 46),
-    "MSG:178.156": ("hexagonal", "MSG", 47),
-    "MSG:178.157": ("hexagonal", "MSG", 48),
-    "MSG:178.158": ("hexagonal", "MSG", 49),
-    "MSG:178.159": ("hexagonal", "MSG", 50),
-    "MSG:178.160": ("hexagonal", "MSG", 51),
-    "MSG:179.161": ("hexagonal", "MSG", 52),
-    "MSG:179.162": ("hexagonal", "MSG", 53),
-    "MSG:179.163": ("hexagonal", "MSG", 54),
-    "MSG:179.164": ("hexagonal", "MSG", 55),
-    "MSG:179.165": ("hexagonal", "MSG", 56),
-    "MSG:179.166": ("hexagonal", "MSG", 57),
-    "MSG:180.167": ("hexagonal", "MSG", 58),
-    "MSG:180.168": ("hexagonal", "MSG", 59),
-    "MSG:180.169": ("hexagonal", "MSG", 60),
-    "MSG:180.170": ("hexagonal", "MSG", 61),
-    "MSG:180.171": ("hexagonal", "MSG", 62),
-    "MSG:180.172": ("hexagonal", "MSG", 63),
-    "MSG:181.173": ("hexagonal", "MSG", 64),
-    "MSG:181.174": ("hexagonal", "MSG", 65),
-    "MSG:181.175": ("hexagonal", "MSG", 66),
-    "MSG:181.176": ("hexagonal", "MSG", 67),
-    "MSG:181.177": ("hexagonal", "MSG", 68),
-    "MSG:181.178": ("hexagonal", "MSG", 69),
-    "MSG:182.179": ("hexagonal", "MSG", 70),
-    "MSG:182.180": ("hexagonal", "MSG", 71),
-    "MSG:182.181": ("hexagonal", "MSG", 72),
-    "MSG:182.182": ("hexagonal", "MSG", 73),
-    "MSG:182.183": ("hexagonal", "MSG", 74),
-    "MSG:182.184": ("hexagonal", "MSG", 75),
-    "MSG:183.185": ("hexagonal", "MSG", 76),
-    "MSG:183.186": ("hexagonal", "MSG", 77),
-    "MSG:183.187": ("hexagonal", "MSG", 78),
-    "MSG:183.188": ("hexagonal", "MSG", 79),
-    "MSG:183.189": ("hexagonal", "MSG", 80),
-    "MSG:183.190": ("hexagonal", "MSG", 81),
-    "MSG:184.191": ("hexagonal", "MSG", 82),
-    "MSG:184.192": ("hexagonal", "MSG", 83),
-    "MSG:184.193": ("hexagonal", "MSG", 84),
-    "MSG:184.194": ("hexagonal", "MSG", 85),
-    "MSG:184.195": ("hexagonal", "MSG", 86),
-    "MSG:184.196": ("hexagonal", "MSG", 87),
-    "MSG:185.197": ("hexagonal", "MSG", 88),
-    "MSG:185.198": ("hexagonal", "MSG", 89),
-    "MSG:185.199": ("hexagonal", "MSG", 90),
-    "MSG:185.200": ("hexagonal", "MSG", 91),
-    "MSG:185.201": ("hexagonal", "MSG", 92),
-    "MSG:185.202": ("hexagonal", "MSG", 93),
-    "MSG:186.203": ("hexagonal", "MSG", 94),
-    "MSG:186.204": ("hexagonal", "MSG", 95),
-    "MSG:186.205": ("hexagonal", "MSG", 96),
-    "MSG:186.206": ("hexagonal", "MSG", 97),
-    "MSG:186.207": ("hexagonal", "MSG", 98),
-    "MSG:186.208": ("hexagonal", "MSG", 99),
-    "MSG:187.209": ("hexagonal", "MSG", 100),
-    "MSG:187.210": ("hexagonal", "MSG", 101),
-    "MSG:187.211": ("hexagonal", "MSG", 102),
-    "MSG:187.212": ("hexagonal", "MSG", 103),
-    "MSG:187.213": ("hexagonal", "MSG", 104),
-    "MSG:187.214": ("hexagonal", "MSG", 105),
-    "MSG:188.215": ("hexagonal", "MSG", 106),
-    "MSG:188.216": ("hexagonal", "MSG", 107),
-    "MSG:188.217": ("hexagonal", "MSG", 108),
-    "MSG:188.218": ("hexagonal", "MSG", 109),
-    "MSG:188.219": ("hexagonal", "MSG", 110),
-    "MSG:188.220": ("hexagonal", "MSG", 111),
-    "MSG:189.221": ("hexagonal", "MSG", 112),
-    "MSG:189.222": ("hexagonal", "MSG", 113),
-    "MSG:189.223": ("hexagonal", "MSG", 114),
-    "MSG:189.224": ("hexagonal", "MSG", 115),
-    "MSG:189.225": ("hexagonal", "MSG", 116),
-    "MSG:189.226": ("hexagonal", "MSG", 117),
-    "MSG:190.227": ("hexagonal", "MSG", 118),
-    "MSG:190.228": ("hexagonal", "MSG", 119),
-    "MSG:190.229": ("hexagonal", "MSG", 120),
-    "MSG:190.230": ("hexagonal", "MSG", 121),
-    "MSG:190.231": ("hexagonal", "MSG", 122),
-    "MSG:190.232": ("hexagonal", "MSG", 123),
-    "MSG:191.233": ("hexagonal", "MSG", 124),
-    "MSG:191.234": ("hexagonal", "MSG", 125),
-    "MSG:191.235": ("hexagonal", "MSG", 126),
-    "MSG:191.236": ("hexagonal", "MSG", 127),
-    "MSG:191.237": ("hexagonal", "MSG", 128),
-    "MSG:191.238": ("hexagonal", "MSG", 129),
-    "MSG:191.239": ("hexagonal", "MSG", 130),
-    "MSG:191.240": ("hexagonal", "MSG", 131),
-    "MSG:191.241": ("hexagonal", "MSG", 132),
-    "MSG:191.242": ("hexagonal", "MSG", 133),
-    "MSG:192.243": ("hexagonal", "MSG", 134),
-    "MSG:192.244": ("hexagonal", "MSG", 135),
-    "MSG:192.245": ("hexagonal", "MSG", 136),
-    "MSG:192.246": ("hexagonal", "MSG", 137),
-    "MSG:192.247": ("hexagonal", "MSG", 138),
-    "MSG:192.248": ("hexagonal", "MSG", 139),
-    "MSG:192.249": ("hexagonal", "MSG", 140),
-    "MSG:192.250": ("hexagonal", "MSG", 141),
-    "MSG:192.251": ("hexagonal", "MSG", 142),
-    "MSG:192.252": ("hexagonal", "MSG", 143),
-    "MSG:193.253": ("hexagonal", "MSG", 144),
-    "MSG:193.254": ("hexagonal", "MSG", 145),
-    "MSG:193.255": ("hexagonal", "MSG", 146),
-    "MSG:193.256": ("hexagonal", "MSG", 147),
-    "MSG:193.257": ("hexagonal", "MSG", 148),
-    "MSG:193.258": ("hexagonal", "MSG", 149),
-    "MSG:193.259": ("hexagonal", "MSG", 150),
-    "MSG:193.260": ("hexagonal", "MSG", 151),
-    "MSG:193.261": ("hexagonal", "MSG", 152),
-    "MSG:193.262": ("hexagonal", "MSG", 153),
-    "MSG:194.263": ("hexagonal", "MSG", 154),
-    "MSG:194.264": ("hexagonal", "MSG", 155),
-    "MSG:194.265": ("hexagonal", "MSG", 156),
-    "MSG:194.266": ("hexagonal", "MSG", 157),
-    "MSG:194.267": ("hexagonal", "MSG", 158),
-    "MSG:194.268": ("hexagonal", "MSG", 159),
-    "MSG:194.269": ("hexagonal", "MSG", 160),
-    "MSG:194.270": ("hexagonal", "MSG", 161),
-    "MSG:194.271": ("hexagonal", "MSG", 162),
-    "MSG:194.272": ("hexagonal", "MSG", 163),
-    "MSG:195.1": ("cubic", "MSG", 0),
-    "MSG:195.2": ("cubic", "MSG", 1),
-    "MSG:195.3": ("cubic", "MSG", 2),
-    "MSG:196.4": ("cubic", "MSG", 3),
-    "MSG:196.5": ("cubic", "MSG", 4),
-    "MSG:196.6": ("cubic", "MSG", 5),
-    "MSG:197.7": ("cubic", "MSG", 6),
-    "MSG:197.8": ("cubic", "MSG", 7),
-    "MSG:198.9": ("cubic", "MSG", 8),
-    "MSG:198.10": ("cubic", "MSG", 9),
-    "MSG:198.11": ("cubic", "MSG", 10),
-    "MSG:199.12": ("cubic", "MSG", 11),
-    "MSG:199.13": ("cubic", "MSG", 12),
-    "MSG:200.14": ("cubic", "MSG", 13),
-    "MSG:200.15": ("cubic", "MSG", 14),
-    "MSG:200.16": ("cubic", "MSG", 15),
-    "MSG:200.17": ("cubic", "MSG", 16),
-    "MSG:201.18": ("cubic", "MSG", 17),
-    "MSG:201.19": ("cubic", "MSG", 18),
-    "MSG:201.20": ("cubic", "MSG", 19),
-    "MSG:201.21": ("cubic", "MSG", 20),
-    "MSG:202.22": ("cubic", "MSG", 21),
-    "MSG:202.23": ("cubic", "MSG", 22),
-    "MSG:202.24": ("cubic", "MSG", 23),
-    "MSG:202.25": ("cubic", "MSG", 24),
-    "MSG:203.26": ("cubic", "MSG", 25),
-    "MSG:203.27": ("cubic", "MSG", 26),
-    "MSG:203.28": ("cubic", "MSG", 27),
-    "MSG:203.29": ("cubic", "MSG", 28),
-    "MSG:204.30": ("cubic", "MSG", 29),
-    "MSG:204.31": ("cubic", "MSG", 30),
-    "MSG:204.32": ("cubic", "MSG", 31),
-    "MSG:205.33": ("cubic", "MSG", 32),
-    "MSG:205.34": ("cubic", "MSG", 33),
-    "MSG:205.35": ("cubic", "MSG", 34),
-    "MSG:205.36": ("cubic", "MSG", 35),
-    "MSG:206.37": ("cubic", "MSG", 36),
-    "MSG:206.38": ("cubic", "MSG", 37),
-    "MSG:206.39": ("cubic", "MSG", 38),
-    "MSG:207.40": ("cubic", "MSG", 39),
-    "MSG:207.41": ("cubic", "MSG", 40),
-    "MSG:207.42": ("cubic", "MSG", 41),
-    "MSG:207.43": ("cubic", "MSG", 42),
-    "MSG:208.44": ("cubic", "MSG", 43),
-    "MSG:208.45": ("cubic", "MSG", 44),
-    "MSG:208.46": ("cubic", "MSG", 45),
-    "MSG:208.47": ("cubic", "MSG", 46),
-    "MSG:209.48": ("cubic", "MSG", 47),
-    "MSG:209.49": ("cubic", "MSG", 48),
-    "MSG:209.50": ("cubic", "MSG", 49),
-    "MSG:209.51": ("cubic", "MSG", 50),
-    "MSG:210.52": ("cubic", "MSG", 51),
-    "MSG:210.53": ("cubic", "MSG", 52),
-    "MSG:210.54": ("cubic", "MSG", 53),
-    "MSG:210.55": ("cubic", "MSG", 54),
-    "MSG:211.56": ("cubic", "MSG", 55),
-    "MSG:211.57": ("cubic", "MSG", 56),
-    "MSG:211.58": ("cubic", "MSG", 57),
-    "MSG:212.59": ("cubic", "MSG", 58),
-    "MSG:212.60": ("cubic", "MSG", 59),
-    "MSG:212.61": ("cubic", "MSG", 60),
-    "MSG:212.62": ("cubic", "MSG", 61),
-    "MSG:213.63": ("cubic", "MSG", 62),
-    "MSG:213.64": ("cubic", "MSG", 63),
-    "MSG:213.65": ("cubic", "MSG", 64),
-    "MSG:213.66": ("cubic", "MSG", 65),
-    "MSG:214.67": ("cubic", "MSG", 66),
-    "MSG:214.68": ("cubic", "MSG", 67),
-    "MSG:214.69": ("cubic", "MSG", 68),
-    "MSG:215.70": ("cubic", "MSG", 69),
-    "MSG:215.71": ("cubic", "MSG", 70),
-    "MSG:215.72": ("cubic", "MSG", 71),
-    "MSG:215.73": ("cubic", "MSG", 72),
-    "MSG:216.74": ("cubic", "MSG", 73),
-    "MSG:216.75": ("cubic", "MSG", 74),
-    "MSG:216.76": ("cubic", "MSG", 75),
-    "MSG:216.77": ("cubic", "MSG", 76),
-    "MSG:217.78": ("cubic", "MSG", 77),
-    "MSG:217.79": ("cubic", "MSG", 78),
-    "MSG:217.80": ("cubic", "MSG", 79),
-    "MSG:218.81": ("cubic", "MSG", 80),
-    "MSG:218.82": ("cubic", "MSG", 81),
-    "MSG:218.83": ("cubic", "MSG", 82),
-    "MSG:218.84": ("cubic", "MSG", 83),
-    "MSG:219.85": ("cubic", "MSG", 84),
-    "MSG:219.86": ("cubic", "MSG", 85),
-    "MSG:219.87": ("cubic", "MSG", 86),
-    "MSG:219.88": ("cubic", "MSG", 87),
-    "MSG:220.89": ("cubic", "MSG", 88),
-    "MSG:220.90": ("cubic", "MSG", 89),
-    "MSG:220.91": ("cubic", "MSG", 90),
-    "MSG:221.92": ("cubic", "MSG", 91),
-    "MSG:221.93": ("cubic", "MSG", 92),
-    "MSG:221.94": ("cubic", "MSG", 93),
-    "MSG:221.95": ("cubic", "MSG", 94),
-    "MSG:221.96": ("cubic", "MSG", 95),
-    "MSG:221.97": ("cubic", "MSG", 96),
-    "MSG:222.98": ("cubic", "MSG", 97),
-    "MSG:222.99": ("cubic", "MSG", 98),
-    "MSG:222.100": ("cubic", "MSG", 99),
-    "MSG:222.101": ("cubic", "MSG", 100),
-    "MSG:222.102": ("cubic", "MSG", 101),
-    "MSG:222.103": ("cubic", "MSG", 102),
-    "MSG:223.104": ("cubic", "MSG", 103),
-    "MSG:223.105": ("cubic", "MSG", 104),
-    "MSG:223.106": ("cubic", "MSG", 105),
-    "MSG:223.107": ("cubic", "MSG", 106),
-    "MSG:223.108": ("cubic", "MSG", 107),
-    "MSG:223.109": ("cubic", "MSG", 108),
-    "MSG:224.110": ("cubic", "MSG", 109),
-    "MSG:224.111": ("cubic", "MSG", 110),
-    "MSG:224.112": ("cubic", "MSG", 111),
-    "MSG:224.113": ("cubic", "MSG", 112),
-    "MSG:224.114": ("cubic", "MSG", 113),
-    "MSG:224.115": ("cubic", "MSG", 114),
-    "MSG:225.116": ("cubic", "MSG", 115),
-    "MSG:225.117": ("cubic", "MSG", 116),
-    "MSG:225.118": ("cubic", "MSG", 117),
-    "MSG:225.119": ("cubic", "MSG", 118),
-    "MSG:225.120": ("cubic", "MSG", 119),
-    "MSG:225.121": ("cubic", "MSG", 120),
-    "MSG:226.122": ("cubic", "MSG", 121),
-    "MSG:226.123": ("cubic", "MSG", 122),
-    "MSG:226.124": ("cubic", "MSG", 123),
-    "MSG:226.125": ("cubic", "MSG", 124),
-    "MSG:226.126": ("cubic", "MSG", 125),
-    "MSG:226.127": ("cubic", "MSG", 126),
-    "MSG:227.128": ("cubic", "MSG", 127),
-    "MSG:227.129": ("cubic", "MSG", 128),
-    "MSG:227.130": ("cubic", "MSG", 129),
-    "MSG:227.131": ("cubic", "MSG", 130),
-    "MSG:227.132": ("cubic", "MSG", 131),
-    "MSG:227.133": ("cubic", "MSG", 132),
-    "MSG:228.134": ("cubic", "MSG", 133),
-    "MSG:228.135": ("cubic", "MSG", 134),
-    "MSG:228.136": ("cubic", "MSG", 135),
-    "MSG:228.137": ("cubic", "MSG", 136),
-    "MSG:228.138": ("cubic", "MSG", 137),
-    "MSG:228.139": ("cubic", "MSG", 138),
-    "MSG:229.140": ("cubic", "MSG", 139),
-    "MSG:229.141": ("cubic", "MSG", 140),
-    "MSG:229.142": ("cubic", "MSG", 141),
-    "MSG:229.143": ("cubic", "MSG", 142),
-    "MSG:229.144": ("cubic", "MSG", 143),
-    "MSG:230.145": ("cubic", "MSG", 144),
-    "MSG:230.146": ("cubic", "MSG", 145),
-    "MSG:230.147": ("cubic", "MSG", 146),
-    "MSG:230.148": ("cubic", "MSG", 147),
-    "MSG:230.149": ("cubic", "MSG", 148),
-}
+def group_tag(name):
+    """
+    Group tag from name.
+
+    Args:
+        name (str): group name, e.g., "#1: C1 (1)".
+
+    Returns:
+        - (str) -- group tag, e.g., "PG:1".
+    """
+    return _load_group_list()[2][name]
+
+
+# ==================================================
+def group_name(tag):
+    """
+    Group name from tag.
+
+    Args:
+        tag (str): group tag, e.g., "PG:1".
+
+    Returns:
+        - (str) -- group name, e.g., "#1: C1 (1)".
+    """
+    return _load_group_list()[3][tag]
@@ -4,6 +4,7 @@ MultiPie information dialog.
 This module provides a dialog for group info. in MultiPie dialog.
 """
 
+from collections import OrderedDict
 import numpy as np
 import sympy as sp
 from PySide6.QtWidgets import QDialog
@@ -14,6 +15,41 @@ from qtdraw.widget.table_view import TableView
 from qtdraw.util.util import to_latex
 from qtdraw.multipie.multipie_util import convert_vector_object
 
+_TABLE_CACHE_SIZE = 64
+_table_cache = OrderedDict()  # (group type, group ID, table, *args) => table data.
+
+
+# ==================================================
+def _memo_table(group, key, func, *args):
+    """
+    Memoized table data.
+
+    Args:
+        group (Group): group.
+        key (tuple): (table, *args), table name and its options.
+        func (function): function to create table data, func(group, *args).
+        *args (Any): arguments of func.
+
+    Returns:
+        - (list) -- list of latex string without "$", [[str]].
+
+    Note:
+        - shared in process, and bounded by LRU.
+        - table data is shared by panels, so that it must not be modified.
+    """
+    key = (group.group_type, group.ID) + key
+    if key in _table_cache:
+        _table_cache.move_to_end(key)
+        return _table_cache[key]
+
+    data = func(group, *args)
+
+    _table_cache[key] = data
+    if len(_table_cache) > _TABLE_CACHE_SIZE:
+        _table_cache.popitem(last=False)
+
+    return data
+
 
 # ==================================================
 class InfoPanel(QDialog):
@@ -28,6 +64,9 @@ class InfoPanel(QDialog):
             header (list): header. None is for no header.
             title (str): title of window.
             vertical (bool): show vertical (sequential number) header ?
+
+        Note:
+            - cells are rendered on demand by TableView, so that open time does not depend on table size.
         """
         super().__init__(parent)
         self._pvw = parent.parent._pvw
@@ -78,11 +117,28 @@ def show_symmetry_operation(group, parent):
     Returns:
         - (InfoPanel) -- symmetry operation panel.
     """
-    g_type = group.group_type
-    SO = group.symmetry_operation
-
     name = "Symmetry Operation"
     header = ["No", "tag", "matrix (polar)", "det", "TR"]
+    data = _memo_table(group, ("symmetry_operation",), _symmetry_operation_table)
+
+    return show_group_info(group, name, header, data, False, parent)
+
+
+# ==================================================
+def _symmetry_operation_table(group):
+    """
+    Symmetry operation table.
+
+    Args:
+        group (Group): all group.
+
+    Returns:
+        - (list) -- list of latex string without "$", [[str]].
+
+    :meta private:
+    """
+    g_type = group.group_type
+    SO = group.symmetry_operation
 
     ops = [group.tag_symmetry_operation(i, True) for i in SO["tag"]]
     if group.is_point_group:
@@ -106,7 +162,7 @@ def show_symmetry_operation(group, parent):
         for no, i in enumerate(zip(ops, mat, det, tr)):
             data.append([str(no + 1)] + list(i))
 
-    return show_group_info(group, name, header, data, False, parent)
+    return data
 
 
 # ==================================================
@@ -121,9 +177,27 @@ def show_character_table(group, parent):
     Returns:
         - (InfoPanel) -- character table panel.
     """
+    name = "Character Table"
+    data = _memo_table(group, ("character",), _character_table)
+
+    return show_group_info(group, name, None, data, False, parent)
+
+
+# ==================================================
+def _character_table(group):
+    """
+    Character table.
+
+    Args:
+        group (Group): point group.
+
+    Returns:
+        - (list) -- list of latex string without "$", [[str]].
+
+    :meta private:
+    """
     character = group.character
 
-    name = "Character Table"
     first = [r"{\rm irrep.}"] + [group.tag_symmetry_operation(i[0], True) + f"({len(i)})" for i in character["conjugacy"]]
     row = [group.tag_irrep(i, True) for i in character["table"].keys()]
 
@@ -131,7 +205,7 @@ def show_character_table(group, parent):
     for r, i in zip(row, character["table"].values()):
         data.append([r] + [sp.latex(c) for c in i])
 
-    return show_group_info(group, name, None, data, False, parent)
+    return data
 
 
 # ==================================================
@@ -146,6 +220,26 @@ def show_wyckoff_site(group, parent):
     Returns:
         - (InfoPanel) -- Wyckoff site panel.
     """
+    name = "Wyckoff Site"
+    header = ["No", "position", "mapping", "", ""]
+    data = _memo_table(group, ("wyckoff_site",), _wyckoff_site_table)
+
+    return show_group_info(group, name, header, data, False, parent)
+
+
+# ==================================================
+def _wyckoff_site_table(group):
+    """
+    Wyckoff position table.
+
+    Args:
+        group (Group): group.
+
+    Returns:
+        - (list) -- list of latex string without "$", [[str]].
+
+    :meta private:
+    """
     g_type = group.group_type
     SO = group.symmetry_operation
     wp = group.wyckoff["site"]
@@ -170,10 +264,7 @@ def show_wyckoff_site(group, parent):
             data.append([f"{no+1}", to_latex(i, "vector"), ms, "", ""])
         data.append(["", "", ""])
 
-    name = "Wyckoff Site"
-    header = ["No", "position", "mapping", "", ""]
-
-    return show_group_info(group, name, header, data, False, parent)
+    return data
 
 
 # ==================================================
@@ -188,6 +279,26 @@ def show_wyckoff_bond(group, parent):
     Returns:
         - (InfoPanel) -- Wyckoff bond panel.
     """
+    name = "Wyckoff Bond"
+    header = ["No", "vector", "center", "mapping", ""]
+    data = _memo_table(group, ("wyckoff_bond",), _wyckoff_bond_table)
+
+    return show_group_info(group, name, header, data, False, parent)
+
+
+# ==================================================
+def _wyckoff_bond_table(group):
+    """
+    Wyckoff bond table.
+
+    Args:
+        group (Group): point/space group.
+
+    Returns:
+        - (list) -- list of latex string without "$", [[str]].
+
+    :meta private:
+    """
     g_type = group.group_type
     SO = group.symmetry_operation
     wp = group.wyckoff["bond"]
@@ -212,10 +323,7 @@ def show_wyckoff_bond(group, parent):
                 ms = str(m)
             data.append([f"{no+1}", to_latex(v, "vector"), to_latex(c, "vector"), ms, ""])
 
-    name = "Wyckoff Bond"
-    header = ["No", "vector", "center", "mapping", ""]
-
-    return show_group_info(group, name, header, data, False, parent)
+    return data
 
 
 # ==================================================
@@ -230,23 +338,40 @@ def show_product_table(group, parent):
     Returns:
         - (InfoPanel) -- product table panel.
     """
+    name = "Product Table"
+    data = _memo_table(group, ("product",), _product_table)
+
+    return show_group_info(group, name, None, data, False, parent)
+
+
+# ==================================================
+def _product_table(group):
+    """
+    Product table.
+
+    Args:
+        group (Group): point group.
+
+    Returns:
+        - (list) -- list of latex string without "$", [[str]].
+
+    :meta private:
+    """
     SO = group.symmetry_operation
+    index = {tag: no for no, tag in enumerate(SO["tag"])}
 
-    name = "Product Table"
     ops = [group.tag_symmetry_operation(i, True) for i in SO["tag"]]
 
     tbl = [["" for _ in range(len(ops))] for _ in range(len(ops))]
     for (i, j), p in SO["product"].items():
-        ni = SO["tag"].index(i)
-        nj = SO["tag"].index(j)
-        tbl[ni][nj] = group.tag_symmetry_operation(p, True)
+        tbl[index[i]][index[j]] = group.tag_symmetry_operation(p, True)
 
     data = []
     data.append([""] + ops)
     for r, t in zip(ops, tbl):
         data.append([r] + t)
 
-    return show_group_info(group, name, None, data, False, parent)
+    return data
 
 
 # ==================================================
@@ -264,11 +389,30 @@ def show_harmonics_decomp(group, basis, rank, head, parent):
     Returns:
         - (InfoPanel) -- harmonics decomposition panel.
     """
-    pg = str(group)
-    decomp = harmonics_decomposition(basis, pg, rank, head)
-
     name = head + "_harmonics decomposition to " + basis
-    header = [pg, basis]
+    header = [str(group), basis]
+    data = _memo_table(group, ("harmonics_decomp", basis, rank, head), _harmonics_decomp_table, basis, rank, head)
+
+    return show_group_info(group, name, header, data, True, parent)
+
+
+# ==================================================
+def _harmonics_decomp_table(group, basis, rank, head):
+    """
+    Harmonics decomposition table.
+
+    Args:
+        group (Group): PG expressed by basis PG.
+        basis (str): basis PG.
+        rank (int): rank.
+        head (str): type, Q/G.
+
+    Returns:
+        - (list) -- list of latex string without "$", [[str]].
+
+    :meta private:
+    """
+    decomp = harmonics_decomposition(basis, str(group), rank, head)
 
     data = []
     for h, d in decomp:
@@ -277,7 +421,7 @@ def show_harmonics_decomp(group, basis, rank, head, parent):
             ex += c * sp.Symbol(b)
         data.append([h, to_latex(ex)])
 
-    return show_group_info(group, name, header, data, True, parent)
+    return data
 
 
 # ==================================================
@@ -295,17 +439,36 @@ def show_harmonics_info(group, head, rank, parent):
     Returns:
         - (InfoPanel) -- harmonics decomposition panel.
     """
-    harmonics = group.harmonics.select(X=head, l=rank)
-
     name = f"Harmonics ({head}, {rank})"
     header = ["symbol", "expression"]
+    data = _memo_table(group, ("harmonics", head, rank), _harmonics_table, head, rank)
+
+    return show_group_info(group, name, header, data, True, parent)
+
+
+# ==================================================
+def _harmonics_table(group, head, rank):
+    """
+    Harmonics table.
+
+    Args:
+        group (Group): PG.
+        head (str): type, Q/G.
+        rank (int): rank.
+
+    Returns:
+        - (list) -- list of latex string without "$", [[str]].
+
+    :meta private:
+    """
+    harmonics = group.harmonics.select(X=head, l=rank)
 
     data = []
     for idx, (ex, u, lc) in harmonics.items():
         for comp, e in enumerate(ex):
             data.append([group.tag_multipole(idx, comp, True), to_latex(e)])
 
-    return show_group_info(group, name, header, data, True, parent)
+    return data
 
 
 # ==================================================
@@ -325,6 +488,32 @@ def show_atomic_multipole(group, bra, ket, head, basis_type, tesseral, parent):
     Returns:
         - (InfoPanel) -- symmetry operation panel.
     """
+    name = "Atomic Multipole"
+    header = ["No", "multipole", "matrix"]
+    key = ("atomic", bra, ket, head, basis_type, tesseral)
+    data = _memo_table(group, key, _atomic_multipole_table, bra, ket, head, basis_type, tesseral)
+
+    return show_group_info(group, name, header, data, False, parent)
+
+
+# ==================================================
+def _atomic_multipole_table(group, bra, ket, head, basis_type, tesseral):
+    """
+    Atomic multipole table.
+
+    Args:
+        group (Group): PG.
+        bra (str): bra basis list.
+        ket (str): ket basis list.
+        head (str): head.
+        basis_type (str): basis type.
+        tesseral (bool): is tesseral basis ?
+
+    Returns:
+        - (list) -- list of latex string without "$", [[str]].
+
+    :meta private:
+    """
     rank_dict = {"s": 0, "p": 1, "d": 2, "f": 3}
     mask_idx = {
         "s : 1/2": [0, 1],
@@ -350,9 +539,6 @@ def show_atomic_multipole(group, bra, ket, head, basis_type, tesseral, parent):
     bra = rank_dict[bra]
     ket = rank_dict[ket]
 
-    name = "Atomic Multipole"
-    header = ["No", "multipole", "matrix"]
-
     samb = group.atomic_samb(basis_type, (bra, ket), mask)
     if head != "":
         samb = samb.select(X=head)
@@ -383,7 +569,7 @@ def show_atomic_multipole(group, bra, ket, head, basis_type, tesseral, parent):
             data.append([str(no), group.tag_multipole(idx, comp, True, "a"), to_latex(m, "matrix")])
             no += 1
 
-    return show_group_info(group, name, header, data, False, parent)
+    return data
 
 
 # ==================================================
@@ -400,6 +586,27 @@ def show_response(group, rank, r_type, parent):
     Returns:
         - (InfoPanel) -- response tensor panel.
     """
+    name = r_type + " Response Tensor"
+    data = _memo_table(group, ("response", rank, r_type), _response_table, rank, r_type)
+
+    return show_group_info(group, name, None, data, False, parent)
+
+
+# ==================================================
+def _response_table(group, rank, r_type):
+    """
+    Response tensor table.
+
+    Args:
+        group (Group): MPG.
+        rank (int): response tensor rank.
+        r_type (str): response tensor type.
+
+    Returns:
+        - (list) -- list of latex string without "$", [[str]].
+
+    :meta private:
+    """
     rank_dict = {0: "s", 1: "p", 2: "d", 3: "f", 4: "g"}
     d = group.response_tensor_all(r_type)
     lst0 = group.active_multipole
@@ -436,9 +643,7 @@ def show_response(group, rank, r_type, parent):
                 data.append([sp.latex(sp.Eq(i, j))])
         data.append([""])
 
-    name = r_type + " Response Tensor"
-
-    return show_group_info(group, name, None, data, False, parent)
+    return data
 
 
 # ==================================================
@@ -45,6 +45,7 @@ class ModulationDialog(QDialog):
         label_repeat = Label(self, text="repeat")
         self.edit_range = LineEdit(self, text="[1,1,1]", validator=("list_int", {"shape": (3,)}))
         self.check_magnetic = Check(self, "magnetic")
+        self.check_animate = Check(self, "animate")
 
         # modulation data.
         if modulation_range.count(":"):
@@ -72,6 +73,7 @@ class ModulationDialog(QDialog):
         self.layout.addWidget(label_repeat, 2, 0, 1, 1, Qt.AlignRight)
         self.layout.addWidget(self.edit_range, 2, 1, 1, 2)
         self.layout.addWidget(button_reset, 2, 3, 1, 1)
+        self.layout.addWidget(self.check_animate, 3, 0, 1, 1)
         self.layout.addWidget(button_cancel, 3, 2, 1, 1)
         self.layout.addWidget(button_ok, 3, 3, 1, 1)
 
@@ -135,10 +137,11 @@ class ModulationDialog(QDialog):
             return
 
         self.reset()
+        animate = self.check_animate.is_checked()
         if self._vec:
-            self.parent.show_vector_samb_modulation(mr)
+            self.parent.show_vector_samb_modulation(mr, animate)
         else:
-            self.parent.show_orbital_samb_modulation(mr)
+            self.parent.show_orbital_samb_modulation(mr, animate)
 
     # ==================================================
     def add_data(self):
@@ -153,7 +156,7 @@ class ModulationDialog(QDialog):
         if len(index) != 0:
             self.view.model().remove_row(index[0])
 
-            data = self.view.model().tolist()
+            data = [list(i) for i in self.view.model().tolist()]
             for row in range(len(data)):
                 data[row][0] = str(row)
 
@@ -171,9 +174,11 @@ class ModulationDialog(QDialog):
 
     # ==================================================
     def reject_data(self):
+        self.parent.data.stop_animation()
         self.parent.parent._pvw.restore()
         super().reject()
 
     # ==================================================
     def reset(self):
+        self.parent.data.stop_animation()
         self.parent.parent._pvw.restore()
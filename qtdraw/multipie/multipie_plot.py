@@ -5,12 +5,35 @@ This module provides plot functions for MultiPie dialog.
 """
 
 import numpy as np
+import sympy as sp
 
 from qtdraw.multipie.multipie_setting import setting_detail as detail
 
 CHOP = 1e-6
 
 
+# ==================================================
+def _canonical_polynomial(v, memo):
+    """
+    Canonical form of polynomial, so that the same polynomials share orbital object.
+
+    Args:
+        v (sympy or str): polynomial.
+        memo (dict): memo for polynomials already converted.
+
+    Returns:
+        - (str) -- expanded polynomial.
+    """
+    if isinstance(v, str):
+        return v
+
+    s = memo.get(v)
+    if s is None:
+        s = str(sp.expand(v)).replace(" ", "")
+        memo[v] = s
+    return s
+
+
 # ==================================================
 def plot_cell_site(mp_data, sites, wp=None, label=None, size=None, color=None, opacity=None, name=None):
     """
@@ -246,11 +269,13 @@ def plot_cell_multipole(
     if opacity is None:
         opacity = default["opacity"]
 
+    memo = {}
     pvw.screen_off()
     if average:
         for no, (v, s, m) in enumerate(zip(multipoles, sites, label)):
             if v == 0:
                 continue
+            v = _canonical_polynomial(v, memo)
             lbl = f"O{no+1}:{m}".replace(" ", "")
             pvw.add_orbital(shape=v, surface=v, size=-size, color=color, opacity=opacity, position=s, name=name, label=lbl)
     else:
@@ -260,6 +285,7 @@ def plot_cell_multipole(
                 no += 1
                 if v == 0:
                     continue
+                v = _canonical_polynomial(v, memo)
                 lbl = f"O{no+1}:[{m}]".replace(" ", "")
                 pvw.add_orbital(shape=v, surface=v, size=-size, color=color, opacity=opacity, position=s, name=name, label=lbl)
     pvw.screen_on()
@@ -497,6 +523,8 @@ def plot_vector_cluster(
         )
     pvw.screen_on()
 
+    return name
+
 
 # ==================================================
 def plot_orbital_cluster(mp_data, site, samb, X="Q", wp=None, label=None, size=None, color=None, opacity=None, name=None):
@@ -521,10 +549,14 @@ def plot_orbital_cluster(mp_data, site, samb, X="Q", wp=None, label=None, size=N
     if label is None:
         label = [""] * len(site)
 
+    memo = {}
     pvw.screen_off()
     for i, (no, v, s) in enumerate(zip(label, samb, site)):
         if v == 0:
             continue
+        v = _canonical_polynomial(v, memo)
         lbl = f"O{i+1}:{no}".replace(" ", "")
         pvw.add_orbital(shape=v, surface=v, size=-size, color=color, opacity=opacity, position=s, name=name, label=lbl)
     pvw.screen_on()
+
+    return name
@@ -48,6 +48,7 @@ setting_detail = {
         "opacity": 1.0,
     },
     "orbital": {"size": 0.2, "color": {"Q": "Wistia", "M": "GnBu", "T": "coolwarm", "G": "PiYG"}, "opacity": 1.0},
+    "animation": {"period": 2.0, "fps": 30},
     "site_samb": {"color": "silver", "color_neg": "aqua", "color_pos": "salmon", "zero_size": 0.5, "size_ratio": 0.2},
     "bond_samb": {
         "length": 0.2,
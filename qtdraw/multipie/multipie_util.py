@@ -6,12 +6,15 @@ This module provides utilities for MultiPie dialog.
 
 import numpy as np
 import sympy as sp
+from functools import lru_cache
 
 from qtdraw.util.util import str_to_sympy, igrid
 
+CHOP = 1e-6
+
 
 # ==================================================
-def phase_factor(modulation, repeat, pset):
+def phase_factor(modulation, repeat, pset, quadrature=False):
     """
     Create phase factor.
 
@@ -19,65 +22,290 @@ def phase_factor(modulation, repeat, pset):
         modulation (list): modulation info. [(basis, coeff, k, n)].
         repeat (list): repeat.
         pset (ndarray): plus_set.
+        quadrature (bool, optional): coefficient of sin(wt) for k.r-wt, i.e., cos => sin, sin => -cos ?
 
     Returns:
-        - (dict) -- {(k(str),n(int),plus_set no(int)): [phase at each grid(float)]}.
+        - (dict) -- {(k(str),n(str)): phase at each (grid,plus_set) (ndarray(float))}.
         - (list) -- cell grid.
     """
     grid = igrid(repeat)
     if pset is None:
-        pset = np.ndarray([[0, 0, 0]])
+        pset = np.array([[0, 0, 0]])
+    pset = np.asarray(pset, dtype=float)
+
+    r = grid[:, None, :] + pset[None, :, :]  # (grid, plus_set, 3).
 
     phase_dict = {}
     for _, _, k, n in modulation:
+        if (k, n) in phase_dict:
+            continue
         kvec = str_to_sympy(k).astype(float)
-        for p_no, p in enumerate(pset):
-            lst = []
-            for i in grid:
-                kr = 2.0 * np.pi * kvec @ (i + p)
-                phase = np.cos(kr) if n == "cos" else np.sin(kr)
-                lst.append(phase)
-            phase_dict[(k, n, p_no)] = lst
+        kr = 2.0 * np.pi * (r @ kvec)
+        if quadrature:
+            phase_dict[(k, n)] = np.sin(kr) if n == "cos" else -np.cos(kr)
+        else:
+            phase_dict[(k, n)] = np.cos(kr) if n == "cos" else np.sin(kr)
     grid = grid.astype(int).tolist()
 
     return phase_dict, grid
 
 
 # ==================================================
-def create_samb_modulation(group, modulation, phase_dict, igrid, pset, samb, samb_list, wp, site):
-    igrid = np.asarray(igrid)
+def monomial_coefficient(obj, exact=False):
+    """
+    Coefficients of polynomials in (x,y,z).
 
-    ns = len(site)
-    n_pset = len(pset)
-    n_prim = ns // n_pset
-    n_grid = len(igrid)
+    Args:
+        obj (ndarray): polynomials in sympy.
+        exact (bool, optional): keep coefficients in sympy ?
+
+    Returns:
+        - (dict) -- {(a,b,c): coefficient of x**a*y**b*z**c for each polynomial (ndarray(float), or ndarray(object) for exact)}.
+    """
+    x, y, z = sp.symbols("x y z", real=True)
+    coeff = {}
+    for i, ex in enumerate(obj):
+        for mono, c in sp.Poly(sp.sympify(ex), x, y, z).terms():
+            if mono not in coeff:
+                coeff[mono] = np.zeros(len(obj), dtype=object if exact else float)
+            coeff[mono][i] = c if exact else float(c)
+
+    return coeff
+
+
+# ==================================================
+def polynomial_str(mono, coeff, exact=None):
+    """
+    Polynomial string from coefficients.
+
+    Args:
+        mono (list): monomials, [(a,b,c)].
+        coeff (ndarray): coefficients, (polynomial, monomial).
+        exact (ndarray, optional): exact coefficients in sympy, (polynomial, monomial).
+
+    Returns:
+        - (list) -- polynomial string in sympy form, e.g., "sqrt(2)*x/2" (0 for vanishing polynomial).
+
+    Note:
+        - vanishing terms are given by numeric coefficients.
+        - without exact coefficients, numeric ones are simplified by sympy, e.g., 0.7071.. => sqrt(2)/2.
+    """
+    x, y, z = sp.symbols("x y z", real=True)
+    mono_ex = [x**a * y**b * z**c for a, b, c in mono]
+
+    number = {}  # float => sympy.
+    memo = {}  # nonzero terms => string.
+    poly = []
+    for i, c in enumerate(coeff):
+        idx = np.flatnonzero(np.abs(c) > CHOP).tolist()
+        if exact is None:
+            key = tuple((j, round(float(c[j]), 12)) for j in idx)
+        else:
+            key = tuple((j, exact[i, j]) for j in idx)
+        if not key:
+            poly.append(0)
+            continue
+
+        s = memo.get(key)
+        if s is None:
+            if exact is None:
+                terms = [number.setdefault(v, sp.nsimplify(v)) * mono_ex[j] for j, v in key]
+            else:
+                terms = [v * mono_ex[j] for j, v in key]
+            s = str(sp.expand(sp.Add(*terms))).replace(" ", "")
+            memo[key] = s
+        poly.append(s)
+
+    return poly
+
+
+# ==================================================
+def monomial_vector(mono, coeff):
+    """
+    Vector from coefficients of (x,y,z).
+
+    Args:
+        mono (list): monomials, [(a,b,c)].
+        coeff (ndarray): coefficients, (vector, monomial).
+
+    Returns:
+        - (ndarray) -- vectors, (vector, 3).
+    """
+    vec = np.zeros((len(coeff), 3))
+    for m, c in zip(mono, coeff.T):
+        if sum(m) == 1:
+            vec[:, m.index(1)] += c
+
+    return vec
+
+
+# ==================================================
+def _modulation_term(group, modulation, phase_dict, n_pset, samb, samb_list, wp):
+    """
+    Terms of modulated SAMB.
+
+    Args:
+        group (Group): group.
+        modulation (list): modulation info. [(basis, coeff, k, n)].
+        phase_dict (dict): phase factor, given by phase_factor.
+        n_pset (int): number of plus_set.
+        samb (dict): SAMB for each type.
+        samb_list (dict): SAMB (index, comp) list for each type.
+        wp (str): wyckoff position.
 
-    obj = np.full((n_grid, ns), sp.S(0), dtype=object)
+    Returns:
+        - (generator) -- (coeff (sympy), phase at each (grid, site) (ndarray), SAMB at each site (ndarray)).
+    """
     for basis, coeff, k, n in modulation:
         tp = basis[0]
         idx = int(basis[1:]) - 1
-        coeff = str_to_sympy(coeff)
         samb1, comp = samb_list[tp][idx]
         samb2 = samb[tp][samb1][0][comp]
         m_obj = group.combined_object(wp, tp, samb2)
+        n_prim = len(m_obj)
         m_obj = np.tile(m_obj, n_pset)
-        phase_all = np.empty((n_grid, n_pset), dtype=object)
-        for p_no in range(n_pset):
-            phase_all[:, p_no] = phase_dict[(k, n, p_no)]
-        m = m_obj.reshape(n_pset, -1)
-        obj += coeff * (phase_all[:, :, None] * m[None, :, :]).reshape(n_grid, ns)
-    obj = obj.reshape(-1)
-
-    fs_no = np.tile(np.arange(ns), n_grid)
+        phase = np.repeat(phase_dict[(k, n)], n_prim, axis=1)  # (grid, site).
+        yield str_to_sympy(coeff), phase, m_obj
+
+
+# ==================================================
+def _modulation_coefficient(group, modulation, phase_dict, n_pset, samb, samb_list, wp):
+    """
+    Coefficients of (x,y,z) monomials of modulated SAMB.
+
+    Args:
+        group (Group): group.
+        modulation (list): modulation info. [(basis, coeff, k, n)].
+        phase_dict (dict): phase factor, given by phase_factor.
+        n_pset (int): number of plus_set.
+        samb (dict): SAMB for each type.
+        samb_list (dict): SAMB (index, comp) list for each type.
+        wp (str): wyckoff position.
+
+    Returns:
+        - (list) -- monomials, [(a,b,c)].
+        - (ndarray) -- coefficients, (grid*site, monomial).
+    """
+    obj = {}  # {monomial: (grid, site)}.
+    n = 0
+    for coeff, phase, m_obj in _modulation_term(group, modulation, phase_dict, n_pset, samb, samb_list, wp):
+        n = phase.size
+        coeff = float(coeff)
+        for mono, c in monomial_coefficient(m_obj).items():
+            v = coeff * np.einsum("gs,s->gs", phase, c)
+            obj[mono] = obj[mono] + v if mono in obj else v
+
+    mono = list(obj.keys())
+    coeff = np.stack([obj[m].reshape(-1) for m in mono], axis=1) if mono else np.zeros((n, 0))
+
+    return mono, coeff
+
+
+# ==================================================
+def _supercell_site(igrid, site, n_pset):
+    """
+    Sites in supercell.
+
+    Args:
+        igrid (list): cell grid, given by phase_factor.
+        site (ndarray): sites in primitive cell.
+        n_pset (int): number of plus_set.
+
+    Returns:
+        - (list) -- site index.
+        - (ndarray) -- sites in supercell.
+    """
+    igrid = np.asarray(igrid)
+    ns = len(site)
+    n_prim = ns // n_pset
+
+    fs_no = np.tile(np.arange(ns), len(igrid))
     p_no = fs_no // n_prim
     s_no = fs_no % n_prim
     site_idx = np.column_stack((p_no, s_no))
     site_idx = [f"(p{i[0]+1},s{i[1]+1})" for i in site_idx]
     full_site = (igrid[:, None] + site[None, :]).reshape(-1, site.shape[1])
 
+    return site_idx, full_site
+
+
+# ==================================================
+def create_samb_modulation(group, modulation, phase_dict, igrid, pset, samb, samb_list, wp, site, vector=False, exact=False):
+    """
+    Create modulated SAMB.
+
+    Args:
+        group (Group): group.
+        modulation (list): modulation info. [(basis, coeff, k, n)].
+        phase_dict (dict): phase factor, given by phase_factor.
+        igrid (list): cell grid, given by phase_factor.
+        pset (ndarray): plus_set.
+        samb (dict): SAMB for each type.
+        samb_list (dict): SAMB (index, comp) list for each type.
+        wp (str): wyckoff position.
+        site (ndarray): sites in primitive cell.
+        vector (bool, optional): vector object ?
+        exact (bool, optional): use sympy ?
+
+    Returns:
+        - (ndarray or list) -- modulated SAMB, vector [[float]] or polynomial [str], (in sympy for exact).
+        - (list) -- site index.
+        - (ndarray) -- sites in supercell.
+    """
+    n_pset = len(pset)
+
+    if exact:
+        obj = np.full((len(igrid), len(site)), sp.S(0), dtype=object)
+        for coeff, phase, m_obj in _modulation_term(group, modulation, phase_dict, n_pset, samb, samb_list, wp):
+            obj += coeff * phase * m_obj[None, :]
+        obj = obj.reshape(-1)
+    else:
+        mono, coeff = _modulation_coefficient(group, modulation, phase_dict, n_pset, samb, samb_list, wp)
+        obj = monomial_vector(mono, coeff) if vector else polynomial_str(mono, coeff)
+
+    site_idx, full_site = _supercell_site(igrid, site, n_pset)
+
     return obj, site_idx, full_site
 
 
+# ==================================================
+def create_samb_modulation_amplitude(group, modulation, repeat, pset, samb, samb_list, wp, site):
+    """
+    Create amplitudes of time-dependent modulated SAMB.
+
+    Args:
+        group (Group): group.
+        modulation (list): modulation info. [(basis, coeff, k, n)].
+        repeat (list): repeat.
+        pset (ndarray): plus_set.
+        samb (dict): SAMB for each type.
+        samb_list (dict): SAMB (index, comp) list for each type.
+        wp (str): wyckoff position.
+        site (ndarray): sites in primitive cell.
+
+    Returns:
+        - (list) -- monomials, [(a,b,c)].
+        - (ndarray) -- coefficients of cos(wt), (grid*site, monomial).
+        - (ndarray) -- coefficients of sin(wt), (grid*site, monomial).
+        - (list) -- site index.
+        - (ndarray) -- sites in supercell.
+
+    Note:
+        - phase k.r is replaced by k.r-wt, i.e., X(t) = X_c cos(wt) + X_s sin(wt).
+    """
+    n_pset = len(pset)
+
+    phase_c, igrid = phase_factor(modulation, repeat, pset)
+    phase_s, _ = phase_factor(modulation, repeat, pset, quadrature=True)
+    mono_c, coeff_c = _modulation_coefficient(group, modulation, phase_c, n_pset, samb, samb_list, wp)
+    mono_s, coeff_s = _modulation_coefficient(group, modulation, phase_s, n_pset, samb, samb_list, wp)
+    coeff_s = coeff_s[:, [mono_s.index(m) for m in mono_c]]  # same monomials in the same order.
+
+    site_idx, full_site = _supercell_site(igrid, site, n_pset)
+
+    return mono_c, coeff_c, coeff_s, site_idx, full_site
+
+
 # ==================================================
 def convert_vector_object(obj):
     x, y, z = sp.symbols("x y z", real=True)
@@ -87,6 +315,63 @@ def convert_vector_object(obj):
     return obj
 
 
+# ==================================================
+@lru_cache(maxsize=128)
+def linear_combination_coefficient(ex, exact=False):
+    """
+    Compile linear combination into numeric coefficients.
+
+    Args:
+        ex (sympy): linear combination of basis variables.
+        exact (bool, optional): keep coefficients in sympy ?
+
+    Returns:
+        - (list) -- basis variables, [str].
+        - (ndarray or None) -- coefficient of each variable (object for exact), None for non-linear combination or non-real coefficient.
+
+    Note:
+        - linear combination is given by np.tensordot(coeff, basis, axes=1) for stacked basis arrays.
+    """
+    var = sorted(ex.free_symbols, key=str)
+    if not var:
+        return [], None
+
+    poly = sp.Poly(ex, *var)
+    if not (poly.is_linear and poly.is_homogeneous):
+        return list(map(str, var)), None
+
+    coeff = [poly.coeff_monomial(v) for v in var]
+    if not all(c.is_real for c in coeff):  # complex coefficient, e.g., I*Q01.
+        return list(map(str, var)), None
+    coeff = np.array(coeff, dtype=object) if exact else np.array([float(c) for c in coeff])
+
+    return list(map(str, var)), coeff
+
+
+# ==================================================
+def stack_monomial_coefficient(obj_list, n, dtype=float):
+    """
+    Stack coefficients of (x,y,z) monomials with common monomials.
+
+    Args:
+        obj_list (list): list of {(a,b,c): coefficient for each polynomial (ndarray)}, given by monomial_coefficient.
+        n (int): number of polynomials.
+        dtype (type, optional): type of coefficients, float or object (sympy).
+
+    Returns:
+        - (list) -- monomials, [(a,b,c)].
+        - (ndarray) -- coefficients, (obj, polynomial, monomial).
+    """
+    mono = list(dict.fromkeys(m for obj in obj_list for m in obj.keys()))
+    coeff = np.zeros((len(obj_list), n, len(mono)), dtype=dtype)
+    for i, obj in enumerate(obj_list):
+        for j, m in enumerate(mono):
+            if m in obj:
+                coeff[i, :, j] = obj[m]
+
+    return mono, coeff
+
+
 # ==================================================
 def check_linear_combination(ex, basis_var):
     var_e = set(basis_var["Q"] + basis_var["G"])
@@ -5,7 +5,7 @@ This module provides basis tab in MultiPie dialog.
 """
 
 from PySide6.QtWidgets import QWidget
-from PySide6.QtCore import Qt
+from PySide6.QtCore import Qt, QThread, Signal, QCoreApplication
 
 from qtdraw.widget.custom_widget import Label, Layout, Button, Combo, VSpacer, HBar, LineEdit
 from qtdraw.multipie.multipie_modulation_dialog import ModulationDialog
@@ -17,6 +17,42 @@ from qtdraw.multipie.multipie_info_dialog import (
 )
 
 
+# ==================================================
+class SambWorker(QThread):
+    computed = Signal(str, object)  # kind, result.
+    failed = Signal(str, object)  # kind, exception.
+
+    # ==================================================
+    def __init__(self, parent, kind, func, *args):
+        """
+        Worker to compute SAMB.
+
+        Args:
+            parent (QWidget): parent.
+            kind (str): site/bond/vector/orbital.
+            func (function): compute function.
+            *args (Any): arguments of func.
+
+        Note:
+            - func cannot be interrupted, cancellation (requestInterruption) only discards the result.
+        """
+        super().__init__(parent)
+        self.kind = kind
+        self.args = args
+        self._func = func
+
+    # ==================================================
+    def run(self):
+        try:
+            result = self._func(*self.args)
+        except Exception as e:
+            if not self.isInterruptionRequested():
+                self.failed.emit(self.kind, e)
+            return
+        if not self.isInterruptionRequested():
+            self.computed.emit(self.kind, result)
+
+
 # ==================================================
 class TabBasis(QWidget):
     # ==================================================
@@ -32,6 +68,11 @@ class TabBasis(QWidget):
 
         # comment.
         label_comment = Label(parent, text="This panel is only for SG/PG", bold=True)
+        self.label_progress = Label(parent, text="")
+        self.label_progress.setVisible(False)  # shown only while computing.
+        self._worker = {}  # kind: running worker.
+        self._running = set()  # all running workers including cancelled ones, until finished.
+        QCoreApplication.instance().aboutToQuit.connect(self.wait_samb)
 
         # definition of bond.
         label_def_bond = Label(
@@ -43,8 +84,9 @@ class TabBasis(QWidget):
         panel1 = QWidget(parent)
         layout1 = Layout(panel1)
         layout1.addWidget(label_comment, 0, 0, 1, 1, Qt.AlignRight)
-        layout1.addWidget(label_def_bond, 1, 0, 1, 1)
-        layout1.addWidget(self.edit_def_bond, 2, 0, 1, 1)
+        layout1.addWidget(self.label_progress, 1, 0, 1, 1, Qt.AlignRight)
+        layout1.addWidget(label_def_bond, 2, 0, 1, 1)
+        layout1.addWidget(self.edit_def_bond, 3, 0, 1, 1)
 
         # site samb.
         label_site = Label(
@@ -187,12 +229,85 @@ class TabBasis(QWidget):
         self.button_vector_modulation.released.connect(self.create_vector_modulation)
         self.button_orbital_modulation.released.connect(self.create_orbital_modulation)
 
+    # ==================================================
+    def _start_samb(self, kind, func, *args):
+        self._cancel_samb(kind)
+
+        worker = SambWorker(self, kind, func, *args)
+        worker.computed.connect(self._set_samb)
+        worker.failed.connect(self._fail_samb)
+        worker.finished.connect(lambda: self._running.discard(worker))
+        worker.finished.connect(worker.deleteLater)
+        self._worker[kind] = worker
+        self._running.add(worker)
+        worker.start()
+        self._show_busy()
+
+    # ==================================================
+    def _cancel_samb(self, kind):
+        worker = self._worker.pop(kind, None)
+        if worker is not None:
+            # computation cannot be interrupted, it runs to the end and only its result is discarded.
+            worker.requestInterruption()
+            worker.computed.disconnect(self._set_samb)
+            worker.failed.disconnect(self._fail_samb)
+            self._show_busy()
+
+    # ==================================================
+    def cancel_samb(self):
+        for kind in list(self._worker.keys()):
+            self._cancel_samb(kind)
+
+    # ==================================================
+    def wait_samb(self):
+        """
+        Cancel all computations, and wait for running workers to finish (before destruction).
+        """
+        self.cancel_samb()
+        for worker in list(self._running):
+            worker.wait()
+        self._running.clear()
+
+    # ==================================================
+    def _show_busy(self):
+        kind = ", ".join(self._worker.keys())
+        self.label_progress.setText(f"computing {kind} basis ..." if kind else "")
+        self.label_progress.setVisible(bool(kind))
+
+    # ==================================================
+    def _fail_samb(self, kind, error):
+        if self._worker.get(kind) is not self.sender():
+            return
+        del self._worker[kind]
+        self._show_busy()
+        raise error  # report in GUI thread.
+
+    # ==================================================
+    def _set_samb(self, kind, result):
+        if self._worker.get(kind) is not self.sender():
+            return
+        args = self._worker.pop(kind).args
+        self._show_busy()
+
+        if kind == "site":
+            lst = self.data.set_site_samb(*args, result)
+            self.combo_site_samb.set_item(lst)
+            self.combo_site_samb.setCurrentIndex(0)
+        elif kind == "bond":
+            lst = self.data.set_bond_samb(*args, result)
+            self.combo_bond_samb.set_item(lst)
+            self.combo_bond_samb.setCurrentIndex(0)
+        elif kind == "vector":
+            self.data.set_vector_samb(*args, result)
+            self.set_vector_list()
+        elif kind == "orbital":
+            self.data.set_orbital_samb(*args, result)
+            self.set_orbital_list()
+
     # ==================================================
     def set_site(self):
         site = self.edit_site.raw_text()
-        lst = self.data.site_samb_list(site)
-        self.combo_site_samb.set_item(lst)
-        self.combo_site_samb.setCurrentIndex(0)
+        self._start_samb("site", self.data.compute_site_samb, site)
 
     # ==================================================
     def show_site_info(self):
@@ -209,9 +324,7 @@ class TabBasis(QWidget):
     # ==================================================
     def set_bond(self):
         bond = self.edit_bond.raw_text()
-        lst = self.data.bond_samb_list(bond)
-        self.combo_bond_samb.set_item(lst)
-        self.combo_bond_samb.setCurrentIndex(0)
+        self._start_samb("bond", self.data.compute_bond_samb, bond)
 
     # ==================================================
     def show_bond_info(self):
@@ -229,8 +342,7 @@ class TabBasis(QWidget):
     def set_vector(self):
         site_bond = self.edit_vector.raw_text()
         vector_type = self.combo_vector_type.currentText()
-        self.data.vector_samb_list(site_bond, vector_type)
-        self.set_vector_list()
+        self._start_samb("vector", self.data.compute_vector_samb, site_bond, vector_type)
 
     # ==================================================
     def show_vector_info(self):
@@ -262,8 +374,7 @@ class TabBasis(QWidget):
         site_bond = self.edit_orbital.raw_text()
         orbital_type = self.combo_orbital_type.currentText()
         orbital_rank = self.combo_orbital_rank.currentText()
-        self.data.orbital_samb_list(site_bond, orbital_type, orbital_rank)
-        self.set_orbital_list()
+        self._start_samb("orbital", self.data.compute_orbital_samb, site_bond, orbital_type, orbital_rank)
 
     # ==================================================
     def show_orbital_info(self):
@@ -344,12 +455,12 @@ class TabBasis(QWidget):
             self._orbital_modulation_dialog = ModulationDialog(self, modulation, self.data._orbital_samb_var, vec=False)
 
     # ==================================================
-    def show_vector_samb_modulation(self, modulation_range):
-        self.data.add_vector_samb_modulation(modulation_range)
+    def show_vector_samb_modulation(self, modulation_range, animate=False):
+        self.data.add_vector_samb_modulation(modulation_range, animate=animate)
 
     # ==================================================
-    def show_orbital_samb_modulation(self, modulation_range):
-        self.data.add_orbital_samb_modulation(modulation_range)
+    def show_orbital_samb_modulation(self, modulation_range, animate=False):
+        self.data.add_orbital_samb_modulation(modulation_range, animate=animate)
 
     # ==================================================
     def closeEvent(self, event):
@@ -387,6 +498,8 @@ class TabBasis(QWidget):
 
     # ==================================================
     def clear_data(self):
+        self.cancel_samb()
+
         if self._vector_modulation_dialog is not None:
             self._vector_modulation_dialog.close()
         if self._orbital_modulation_dialog is not None:
@@ -2,26 +2,118 @@
 Execute QtDraw.
 """
 
+import os
+import sys
+import time
+import subprocess
 import click
 from pathlib import Path
-from qtdraw.core.qtdraw_app import QtDraw
+
+_PROFILE_ENV = "QTDRAW_PROFILE"
+_PROFILE_TAG = "qtdraw-first-paint:"
+
+
+# ==================================================
+def _import_profile(log, top=20):
+    """
+    Summarize -X importtime log.
+
+    Args:
+        log (str): stderr of python -X importtime.
+        top (int, optional): number of modules to show.
+
+    Returns:
+        - (str) -- report of import time per package and per module.
+    """
+    package = {}
+    module = {}
+    for line in log.splitlines():
+        if not line.startswith("import time:") or "[us]" in line:
+            continue
+        self_us, cumulative_us, name = line.split(":", 1)[1].split("|")
+        name = name.strip()
+        top_name = name.split(".")[0]
+        package[top_name] = package.get(top_name, 0) + int(self_us)
+        module[name] = int(cumulative_us)
+
+    s = "* import time per package [ms] (self time summed):\n"
+    for name, t in sorted(package.items(), key=lambda i: -i[1])[:top]:
+        s += f"    {t / 1000:9.1f}  {name}\n"
+    s += "* import time per module [ms] (cumulative):\n"
+    for name, t in sorted(module.items(), key=lambda i: -i[1])[:top]:
+        s += f"    {t / 1000:9.1f}  {name}\n"
+    return s
+
+
+# ==================================================
+def _run_profile(filename):
+    """
+    Run QtDraw with -X importtime, and print startup profile.
+
+    Args:
+        filename (tuple): argument of cmd.
+    """
+    env = os.environ | {_PROFILE_ENV: "1"}
+    command = [sys.executable, "-X", "importtime", "-m", "qtdraw.scripts.qtdraw", "--profile", *filename]
+    start = time.perf_counter()
+    proc = subprocess.run(command, env=env, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True)
+    total = time.perf_counter() - start
+
+    # stderr is redirected to null by PyVistaWidget, so first paint is given in stdout.
+    paint = [line.split(_PROFILE_TAG)[1].split() for line in proc.stdout.splitlines() if line.startswith(_PROFILE_TAG)]
+
+    print(_import_profile(proc.stderr), end="")
+    if paint:
+        t_import, t_paint = map(float, paint[0])
+        print(f"* import of QtDraw [s]: {t_import:.3f}")
+        print(f"* first paint after import [s]: {t_paint - t_import:.3f}")
+    else:
+        print("* QtDraw did not reach first paint.")
+    print(f"* total (incl. interpreter start and exit) [s]: {total:.3f}")
 
 
 # ================================================== execute QtDraw
 @click.command()
 @click.argument("filename", nargs=-1)
-def cmd(filename):
+@click.option("--profile", is_flag=True, help="show startup profile (import time per module and time to first paint).")
+def cmd(filename, profile):
     """
     execute QtDraw.
 
         filename : `.qtdw` file without extension.
     """
+    if profile and os.environ.get(_PROFILE_ENV) is None:
+        _run_profile(filename)
+        exit()
+
+    start = time.perf_counter()
+    from qtdraw.core.qtdraw_app import QtDraw
+
+    t_import = time.perf_counter() - start
+
     n = len(filename)
-    if n < 1:
-        QtDraw().exec()
+    if n > 1:
         exit()
-    elif n > 1:
+
+    if n < 1:
+        app = QtDraw()
+    else:
+        app = QtDraw(filename=Path(filename[0]).resolve())
+
+    if profile:  # report first paint, and quit.
+        from PySide6.QtCore import QTimer
+
+        def first_paint():
+            print(f"{_PROFILE_TAG} {t_import} {time.perf_counter() - start}", flush=True)
+            app.app.quit()
+
+        QTimer.singleShot(0, first_paint)
+
+    app.exec()
+    if n < 1:
         exit()
 
-    filename = Path(filename[0]).resolve()
-    QtDraw(filename=filename).exec()
+
+# ==================================================
+if __name__ == "__main__":
+    cmd()
@@ -16,6 +16,7 @@ The following objects are available.
 - ellipsoid
 - toroid
 - box
+- outline (of bounding boxes)
 - polygon
 - text3d
 - text2d (math)
@@ -24,8 +25,8 @@ The following objects are available.
 - isosurface
 """
 
+from collections import OrderedDict
 import numpy as np
-import sympy as sp
 import vtk
 import pyvista as pv
 from PIL import Image
@@ -63,6 +64,8 @@ def _str_poly_array(poly, xyz, var=["x", "y", "z"], size=1.0):
         - if size is positive, max. value is equivalent to size.
         - if size is negative, abs. value is scaled by size.
     """
+    import sympy as sp
+
     xyz = np.array(xyz, dtype=np.float64)
     r = sp.symbols(" ".join(var), real=True)
     poly = poly.replace("sqrt", "SQ")
@@ -145,7 +148,7 @@ def _svg_to_qimage(latex, mathjax, size=1024, color="black"):
 
 
 # ==================================================
-def _create_image(np_img, x=0, y=0, size=None):
+def _create_image_data(np_img, size=None):
     np_img = np_img.astype(np.uint8)
 
     np_img = np_img[::-1, :, :]  # up-side down.
@@ -163,6 +166,13 @@ def _create_image(np_img, x=0, y=0, size=None):
     vtk_arr = numpy_support.numpy_to_vtk(np_img.reshape(-1, 4), array_type=vtk.VTK_UNSIGNED_CHAR, deep=True)
     vtk_img.GetPointData().SetScalars(vtk_arr)
 
+    return vtk_img
+
+
+# ==================================================
+def _create_image(vtk_img, x=0, y=0):
+    w, h, _ = vtk_img.GetDimensions()
+
     mapper = vtkImageMapper()
     mapper.SetInputData(vtk_img)
     mapper.SetColorWindow(255)
@@ -176,11 +186,112 @@ def _create_image(np_img, x=0, y=0, size=None):
     return actor
 
 
+# ==================================================
+_IMAGE_CACHE_SIZE = 256
+_image_cache = OrderedDict()  # (latex, color, size) => vtkImageData.
+
+
+# ==================================================
+_SHARED_CACHE_SIZE = 256
+_shared_cache = OrderedDict()  # (object type, args) => object.
+
+
+# ==================================================
+def _shared_object(key, create):
+    """
+    Shared object (LRU cache).
+
+    Args:
+        key (tuple): (object type, args).
+        create (function): create object, create().
+
+    Returns:
+        - (vtk.PolyData) -- shared object (must not be modified).
+    """
+    obj = _shared_cache.get(key)
+    if obj is None:
+        obj = create()
+        _shared_cache[key] = obj
+        if len(_shared_cache) > _SHARED_CACHE_SIZE:
+            _shared_cache.popitem(last=False)
+    else:
+        _shared_cache.move_to_end(key)
+
+    return obj
+
+
+# ==================================================
+def rotation_from_x(direction):
+    """
+    Rotation matrices which map x axis to given directions.
+
+    Args:
+        direction (numpy.ndarray): directions (cartesian), (n, 3).
+
+    Returns:
+        - (numpy.ndarray) -- rotation matrices, (n, 3, 3).
+
+    Note:
+        - rotation around the direction is arbitrary.
+    """
+    d = direction / np.linalg.norm(direction, axis=1)[:, None]
+    h = np.where((np.abs(d[:, 0]) < 0.9)[:, None], [1.0, 0.0, 0.0], [0.0, 1.0, 0.0])
+    e1 = np.cross(d, h)
+    e1 /= np.linalg.norm(e1, axis=1)[:, None]
+    e2 = np.cross(d, e1)
+
+    return np.stack([d, e1, e2], axis=2)
+
+
+# ==================================================
+def vector_matrix(direction, length=1.0):
+    """
+    Transform matrix of vector object.
+
+    Args:
+        direction (list or numpy.ndarray): direction (cartesian), [float].
+        length (float, optional): length.
+
+    Returns:
+        - (numpy.ndarray) -- 3x3 matrix M, create_vector(direction, length, ...) = M.create_vector([1,0,0], 1.0, ...).
+
+    Note:
+        - if length is negative, norm of direction multiplied by |length| is used.
+    """
+    direction = np.array(direction, dtype=np.float64)
+    if length < CHOP:
+        length = abs(length) * np.linalg.norm(direction)
+
+    m = rotation_from_x(direction[None])[0]
+    m[:, 0] *= length
+
+    return m
+
+
+# ==================================================
+def _latex_image(latex, mathjax, size, color):
+    key = (latex, color, size)
+    vtk_img = _image_cache.get(key)
+    if vtk_img is not None:
+        _image_cache.move_to_end(key)
+        return vtk_img
+
+    np_img = _svg_to_qimage(latex, mathjax, color=color)
+    vtk_img = _create_image_data(np_img, size)
+
+    _image_cache[key] = vtk_img
+    if len(_image_cache) > _IMAGE_CACHE_SIZE:
+        _image_cache.popitem(last=False)
+
+    return vtk_img
+
+
 # ==================================================
 def create_sphere(
     radius,
     theta_phi_range=None,
     theta_phi_resolution=None,
+    shared=False,
 ):
     """
     Create sphere object.
@@ -189,12 +300,14 @@ def create_sphere(
         radius (float): radius.
         theta_phi_range (list or numpy.ndarray, optional): theta and phi range, [[float]].
         theta_phi_resolution (list): theta and phi resolution, [int].
+        shared (bool, optional): share object among the same arguments ?
 
     Returns:
         - (vtk.PolyData) -- sphere object.
 
     Note:
         - if theta_phi_range/theta_phi_resolution is None, default is used.
+        - if shared, cached object is returned, which must not be modified (use user matrix of actor for translation etc.).
     """
     if theta_phi_range is None:
         theta_phi_range = detail["theta_phi_range"]
@@ -202,6 +315,15 @@ def create_sphere(
     if theta_phi_resolution is None:
         theta_phi_resolution = detail["theta_phi_resolution"]
 
+    if shared:
+        key = (
+            "sphere",
+            float(radius),
+            tuple(map(tuple, np.asarray(theta_phi_range, dtype=float).tolist())),
+            tuple(theta_phi_resolution),
+        )
+        return _shared_object(key, lambda: create_sphere(radius, theta_phi_range, theta_phi_resolution))
+
     # note that notation (theta, phi) are opposite as usual.
     obj = pv.Sphere(
         radius=radius,
@@ -270,6 +392,7 @@ def create_vector(
     shaft_radius=1.0,
     tip_radius=2.0,
     tip_length=0.25,
+    shared=False,
 ):
     """
     Create vector object.
@@ -282,13 +405,20 @@ def create_vector(
         shaft_radius (float, optional) :shaft radius.
         tip_radius (float, optional): tip radius.
         tip_length (float, optional): tip length.
+        shared (bool, optional): share object among the same arguments ?
 
     Returns:
         - (vtk.PolyData) -- arrow object.
 
     Note:
         - if length is negative, norm of direction multiplied by |length| is used.
+        - if shared, cached object is returned, which must not be modified (use user matrix of actor for rotation etc.).
     """
+    if shared:
+        key = ("vector", *map(float, direction), float(length), float(width), float(offset))
+        key += (float(shaft_radius), float(tip_radius), float(tip_length))
+        return _shared_object(key, lambda: create_vector(direction, length, width, offset, shaft_radius, tip_radius, tip_length))
+
     shaft_resolution = detail["shaft_resolution"]
     tip_resolution = detail["tip_resolution"]
 
@@ -319,6 +449,7 @@ def create_orbital(
     size=1.0,
     theta_phi_range=None,
     theta_phi_resolution=None,
+    shared=False,
 ):
     """
     Create orbital object.
@@ -329,6 +460,7 @@ def create_orbital(
         size (float, optional): size.
         theta_phi_range (list or numpy.ndarray, optional): theta and phi range, [[float]].
         theta_phi_resolution (list): theta and phi resolution, [int].
+        shared (bool, optional): share object among the same arguments ?
 
     Returns:
         - (vtk.PolyData) -- orbital object with "surface".
@@ -339,6 +471,7 @@ def create_orbital(
         - if size is negative, abs. value is scaled by size.
         - if theta_phi_range is None, default is used.
         - if theta_phi_resolution is None, default is used.
+        - if shared, cached object is returned, which must not be modified (use user matrix of actor for translation etc.).
     """
     shape = str(shape)
     surface = str(surface)
@@ -349,6 +482,17 @@ def create_orbital(
     if theta_phi_range is None:
         theta_phi_range = detail["theta_phi_range"]
 
+    if shared:
+        key = (
+            "orbital",
+            shape.replace(" ", ""),
+            surface.replace(" ", ""),
+            float(size),
+            tuple(map(tuple, np.asarray(theta_phi_range, dtype=float).tolist())),
+            None if theta_phi_resolution is None else tuple(theta_phi_resolution),
+        )
+        return _shared_object(key, lambda: create_orbital(shape, surface, size, theta_phi_range, theta_phi_resolution))
+
     obj = create_sphere(1.0, theta_phi_range=theta_phi_range, theta_phi_resolution=theta_phi_resolution)
     sp = obj.points
     fs = np.abs(_str_poly_array(shape, sp, size=size))
@@ -630,6 +774,34 @@ def create_box(a1=None, a2=None, a3=None):
     return obj
 
 
+# ==================================================
+def create_outline(bounds):
+    """
+    Create outline object of bounding boxes (merged in one object).
+
+    Args:
+        bounds (numpy.ndarray): bounds of boxes, (xmin,xmax,ymin,ymax,zmin,zmax), (n, 6).
+
+    Returns:
+        - (vtk.PolyData) -- outline object.
+    """
+    bounds = np.asarray(bounds, dtype=float).reshape(-1, 6)
+    n = len(bounds)
+
+    # 8 corners and 12 edges of each box.
+    corner = np.array([[i, j, k] for k in range(2) for j in range(2) for i in range(2)])
+    edge = np.array([[0, 1], [2, 3], [4, 5], [6, 7], [0, 2], [1, 3], [4, 6], [5, 7], [0, 4], [1, 5], [2, 6], [3, 7]])
+
+    point = bounds[:, [[0, 2, 4], [1, 3, 5]]]  # (n, min/max, xyz).
+    point = point[:, corner, [0, 1, 2]].reshape(-1, 3)
+    line = (edge[None, :, :] + 8 * np.arange(n)[:, None, None]).reshape(-1, 2)
+
+    obj = pv.PolyData(point)
+    obj.lines = np.hstack([np.full((len(line), 1), 2), line]).ravel()
+
+    return obj
+
+
 # ==================================================
 def create_polygon(point, connectivity):
     """
@@ -707,8 +879,8 @@ def create_text2d(latex, mathjax, x, y, size, color):
     Returns:
         - (vtkActor2D) -- actor.
     """
-    np_img = _svg_to_qimage(latex, mathjax, color=color)
-    actor = _create_image(np_img, x, y, size)
+    vtk_img = _latex_image(latex, mathjax, size, color)
+    actor = _create_image(vtk_img, x, y)
 
     return actor
 
@@ -827,6 +999,8 @@ def create_spline_t(
     point = text_to_list(point)
     tp = np.arange(t_range[0], t_range[1], t_range[2])
 
+    import sympy as sp
+
     t = sp.symbols("t", real=True)
     ex = [str_to_sympy(i, subs={"t": t}) for i in point]
 
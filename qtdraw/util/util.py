@@ -4,10 +4,8 @@ For versatile utility.
 
 import re
 import ast
+import importlib.util
 import numpy as np
-import sympy as sp
-from sympy import SympifyError
-from sympy.parsing.sympy_parser import parse_expr, standard_transformations, implicit_multiplication, rationalize
 import pyvista as pv
 
 
@@ -51,6 +49,10 @@ def str_to_sympy(s, check_var=None, check_shape=None, rational=True, subs=None,
         - if format error occurs, raise ValueError.
         - if s cannot be converted to a sympy, raise ValueError.
     """
+    import sympy as sp
+    from sympy import SympifyError
+    from sympy.parsing.sympy_parser import parse_expr, standard_transformations, implicit_multiplication, rationalize
+
     # reserved words in sympy (functions, constants, etc.).
     reserved = set(sp.__all__) | {"pi", "E", "I", "oo", "zoo"}
 
@@ -102,6 +104,8 @@ def to_latex(a, style="scalar"):
     Returns:
         - (ndarray or str) -- (list of) LaTeX string without "$".
     """
+    import sympy as sp
+
     a = np.array(a, dtype=object)
 
     if style == "scalar":
@@ -149,13 +153,11 @@ def check_multipie():
 
     Returns:
         - (bool) -- installed ?
-    """
-    try:
-        import multipie
 
-        return True
-    except ImportError:
-        return False
+    Note:
+        - multipie itself is not imported.
+    """
+    return importlib.util.find_spec("multipie") is not None
 
 
 # ==================================================
@@ -2,9 +2,6 @@
 Color palette : matplotlib CSS colors, mpl_colors = mcolors.CSS4_COLORS, apple colors
 """
 
-from matplotlib.colors import ListedColormap
-
-
 # ==================================================
 # Apple Crayon Palette, name : (hex, RGB)
 apple_colors = {
@@ -387,6 +384,9 @@ def custom_colormap(color_list, name="custom"):
         ]
     except KeyError:
         raise ValueError(f"unknown color name, {color_list} is given.")
+
+    from matplotlib.colors import ListedColormap
+
     cmap = ListedColormap(rgbs, name)
     return cmap
 
@@ -4,8 +4,8 @@ Color selector widget.
 This module provides color selector widget.
 """
 
+from functools import lru_cache
 import numpy as np
-from matplotlib import cm
 from PySide6.QtGui import QPixmap, QColor, QImage, QPalette
 from PySide6.QtCore import Qt
 
@@ -27,6 +27,8 @@ def _colormap2pixmap(colormap, step=50):
     if colormap not in all_colormaps:
         raise ValueError(f"unknown colormap, {colormap} is given.")
 
+    from matplotlib import cm
+
     sm = cm.ScalarMappable(cmap=colormap.strip("*"))
     sm.norm.vmin = 0.0
     sm.norm.vmax = 1.0
@@ -92,6 +94,25 @@ def color2pixmap(color_type, size, aspect_ratio=4, step=50):
     return pixmap_dict, sep
 
 
+# ==================================================
+@lru_cache(maxsize=1024)
+def color_swatch(color, color_type, size):
+    """
+    Color/colormap pixmap (cached).
+
+    Args:
+        color (str): color or colormap.
+        color_type (str): color type, "color/colormap/color_both".
+        size (int): vertical size (pixel).
+
+    Returns:
+        - (QPixmap) -- color pixmap, None for unknown color.
+    """
+    if not check_color(color) and color not in all_colormaps:
+        return None
+    return _color2pixmap(color, color_type, size)
+
+
 # ==================================================
 def color_palette(name):
     """
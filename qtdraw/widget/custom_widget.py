@@ -25,19 +25,8 @@ from PySide6.QtSvg import QSvgRenderer
 from xml.etree import ElementTree as ET
 
 from qtdraw.widget.color_selector_util import color2pixmap, color_palette
-from qtdraw.widget.validator import (
-    validator_int,
-    validator_float,
-    validator_list_int,
-    validator_list_float,
-    validator_math,
-    validator_site,
-    validator_bond,
-    validator_site_bond,
-    validator_vector_site_bond,
-    validator_orbital_site_bond,
-)
-from qtdraw.widget.mathjax import MathJaxSVG
+from qtdraw.widget.validator import get_validator
+from qtdraw.widget.mathjax import shared_mathjax
 
 
 # ==================================================
@@ -137,7 +126,7 @@ class MathWidget(QWidget):
         self._wsize = (0, 0)
 
         if mathjax is None:
-            self.mathjax = MathJaxSVG(clear_cache=False)
+            self.mathjax = shared_mathjax()
         else:
             self.mathjax = mathjax
 
@@ -478,20 +467,7 @@ class LineEdit(QLineEdit):
 
     # ==================================================
     def set_validator(self, validator):
-        vtype, option = validator
-        VALIDATORS = {
-            "int": validator_int,
-            "float": validator_float,
-            "list_float": validator_list_float,
-            "list_int": validator_list_int,
-            "math": validator_math,
-            "site": validator_site,
-            "bond": validator_bond,
-            "site_bond": validator_site_bond,
-            "vector_site_bond": validator_vector_site_bond,
-            "orbital_site_bond": validator_orbital_site_bond,
-        }
-        self._validator_func = lambda t: VALIDATORS[vtype](t, **option)
+        self._validator_func = get_validator(validator)
 
     # ==================================================
     def setText(self, text):
@@ -2,12 +2,18 @@
 Delegate for GroupModel and GroupView.
 
 This module provides delegate for color selector, combo, and editor.
+Cells without editor are painted by delegate (paint-only), and editor is created only for focused cell.
 """
 
 from PySide6.QtWidgets import QStyledItemDelegate, QStyle
 from PySide6.QtCore import Qt, QSize, QRect
+from PySide6.QtGui import QColor, QFont, QFontMetrics
 
 from qtdraw.widget.custom_widget import Combo, Editor, ColorSelector
+from qtdraw.widget.color_selector_util import color_swatch
+from qtdraw.widget.validator import get_validator
+
+_DISPLAY_CACHE_SIZE = 4096
 
 
 # ==================================================
@@ -33,6 +39,37 @@ class Delegate(QStyledItemDelegate):
             if value:
                 option.displayAlignment = Qt.AlignHCenter | Qt.AlignVCenter
                 self.parent().style().drawControl(QStyle.CE_ItemViewItem, option, painter, self.parent())
+                if self.parent().indexWidget(index) is None:
+                    self.paint_content(painter, option, value)
+
+    # ==================================================
+    def paint_content(self, painter, option, value):
+        """
+        Paint cell content without editor.
+
+        Args:
+            painter (QPainter): painter.
+            option (QStyleOptionViewItem): style option.
+            value (str): cell data.
+        """
+        painter.drawText(option.rect, Qt.AlignCenter, value)
+
+    # ==================================================
+    def uniform_size(self, size, index):
+        """
+        Size with uniform row height (paint-only view).
+
+        Args:
+            size (QSize): size hint.
+            index (QModelIndex): index.
+
+        Returns:
+            - (QSize) -- size hint.
+        """
+        view = self.parent()
+        if not view.paint_only:
+            return size
+        return QSize(size.width(), view.row_height_hint(index.row()))
 
 
 # ==================================================
@@ -67,7 +104,7 @@ class ComboDelegate(Delegate):
     def sizeHint(self, option, index):
         sz = super().sizeHint(option, index)
         w, h = sz.width() + 6 * self.padding, sz.height() + 2 * self.padding
-        return QSize(w, h)
+        return self.uniform_size(QSize(w, h), index)
 
 
 # ==================================================
@@ -98,11 +135,31 @@ class ColorDelegate(Delegate):
 
         editor.setGeometry(QRect(x, y, width, height))
 
+    # ==================================================
+    def paint_content(self, painter, option, value):
+        swatch = color_swatch(value, self.option, self.parent().font().pointSize())
+        if swatch is None:
+            super().paint_content(painter, option, value)
+            return
+
+        rect = option.rect
+        sw = swatch.width() / swatch.devicePixelRatio()
+        sh = swatch.height() / swatch.devicePixelRatio()
+        tw = option.fontMetrics.horizontalAdvance(value)
+        x = rect.x() + int((rect.width() - sw - self.padding - tw) / 2)
+        painter.drawPixmap(x, rect.y() + int((rect.height() - sh) / 2), swatch)
+        text_rect = QRect(x + int(sw) + self.padding, rect.y(), tw + self.padding, rect.height())
+        painter.drawText(text_rect, Qt.AlignLeft | Qt.AlignVCenter, value)
+
     # ==================================================
     def sizeHint(self, option, index):
         sz = super().sizeHint(option, index)
         w, h = sz.width() + 6 * self.padding, sz.height() + 2 * self.padding
-        return QSize(w, h)
+        if self.parent().paint_only:  # room for swatch.
+            swatch = color_swatch(index.data(Qt.DisplayRole), self.option, self.parent().font().pointSize())
+            if swatch is not None:
+                w += int(swatch.width() / swatch.devicePixelRatio()) + self.padding
+        return self.uniform_size(QSize(w, h), index)
 
 
 # ==================================================
@@ -116,6 +173,10 @@ class EditorDelegate(Delegate):
         self.color = color
         self.size = size
         self.mathjax = mathjax
+        self._validator = get_validator((t, option))
+        self._display = {}  # cell data => (displayed text, valid).
+        self._font = QFont()
+        self._font.setPointSize(size)
 
     # ==================================================
     def createEditor(self, parent, option, index):
@@ -145,11 +206,83 @@ class EditorDelegate(Delegate):
 
         editor.setGeometry(QRect(x, y, width, height))
 
+    # ==================================================
+    def display_text(self, value):
+        """
+        Displayed text of cell (validated text as shown by Editor).
+
+        Args:
+            value (str): cell data.
+
+        Returns:
+            - (str) -- displayed text (LaTeX for math).
+            - (bool) -- valid ?
+        """
+        text = self._display.get(value)
+        if text is None:
+            try:
+                validated = self._validator(value)
+            except Exception:
+                validated = None
+            text = (value, False) if validated is None else (validated, True)
+            if len(self._display) >= _DISPLAY_CACHE_SIZE:
+                self._display.clear()
+            self._display[value] = text
+
+        return text
+
+    # ==================================================
+    def is_math(self, value):
+        """
+        Is cell shown by LaTeX ?
+
+        Args:
+            value (str): cell data.
+
+        Returns:
+            - (bool) -- shown by LaTeX ?
+        """
+        return self.type == "math" and self.display_text(value)[1]
+
+    # ==================================================
+    def paint_content(self, painter, option, value):
+        text, _ = self.display_text(value)
+        rect = option.rect
+
+        if self.is_math(value):
+            view = self.parent()
+            pixmap = view.math_cell_pixmap(text)
+            if pixmap is None:
+                view.request_render()
+                return
+            if pixmap.isNull():  # failed to typeset.
+                return
+            ratio = pixmap.devicePixelRatio()
+            w, h = pixmap.width() / ratio, pixmap.height() / ratio
+            if h > rect.height():  # fit in uniform row.
+                w, h = w * rect.height() / h, rect.height()
+            target = QRect(rect.x() + int((rect.width() - w) / 2), rect.y() + int((rect.height() - h) / 2), int(w), int(h))
+            painter.drawPixmap(target, pixmap)
+        else:
+            painter.save()
+            painter.setFont(self._font)
+            painter.setPen(QColor(self.color))
+            painter.drawText(rect, Qt.AlignCenter, text)
+            painter.restore()
+
     # ==================================================
     def sizeHint(self, option, index):
         view = self.parent()
         h = view.row_height_hint(index.row())
         if h is not None:
-            w = super().sizeHint(option, index).width() + 2 * self.padding
-            return QSize(w, h)
+            w = super().sizeHint(option, index).width()
+            value = index.data(Qt.DisplayRole)
+            if view.paint_only and value:  # displayed content.
+                text, _ = self.display_text(value)
+                pixmap = view.math_cell_pixmap(text) if self.is_math(value) else None
+                if pixmap is not None:
+                    w = max(w, int(pixmap.width() / pixmap.devicePixelRatio()))
+                else:
+                    w = max(w, QFontMetrics(self._font).horizontalAdvance(text))
+            return QSize(w + 2 * self.padding, h)
         return super().sizeHint(option, index)
@@ -0,0 +1,320 @@
+"""
+Filter for GroupModel.
+
+This module provides query filter of rows in GroupModel.
+Query is compiled once, and it is evaluated on column indexes
+of the model snapshot (unique strings and numeric arrays), so that
+the cost per row is a few numpy operations.
+
+- query: term, or terms combined by and/or/not and parentheses.
+- term: field op value, e.g., name~"Fe*", z>0.5, color=red, opacity<=0.5.
+    - field: column header (space is replaced by "_"), or x/y/z (position+cell in crystal coordinate).
+    - op: ~ (glob match), = or == (equal), != (not equal), <, <=, >, >= (numeric comparison).
+    - value: word or quoted string.
+- word only: name containing the word (case insensitive), e.g., Fe.
+"""
+
+import re
+import ast
+import numpy as np
+from fnmatch import fnmatchcase
+
+from qtdraw.util.util import str_to_sympy
+
+_TOKEN = re.compile(
+    r"""\s*(?:
+    (?P<paren>[()])|
+    (?P<term>(?P<field>[A-Za-z_]\w*)\s*(?P<op>~|==|=|!=|<=|>=|<|>)\s*(?P<value>"[^"]*"|'[^']*'|[^\s()]+))|
+    (?P<word>"[^"]*"|'[^']*'|[^\s()]+)
+    )""",
+    re.VERBOSE,
+)
+_COORDINATE = {"x": 0, "y": 1, "z": 2}
+
+
+# ==================================================
+def _parse_vector(vector):
+    """
+    Parse 3-component vectors.
+
+    Args:
+        vector (numpy.ndarray): vectors, str([float]).
+
+    Returns:
+        - (numpy.ndarray) -- vectors, NaN for error, (n, 3).
+    """
+    try:  # plain numbers at once.
+        text = ",".join(vector).replace("[", "").replace("]", "")
+        return np.array(text.split(","), dtype=float).reshape(len(vector), 3)
+    except ValueError:
+        pass
+
+    v = np.full((len(vector), 3), np.nan)
+    for i, s in enumerate(vector):
+        try:
+            try:
+                v[i] = np.asarray(ast.literal_eval(s), dtype=float).reshape(3)
+            except (ValueError, SyntaxError, TypeError):
+                v[i] = str_to_sympy(s, rational=False).astype(float).reshape(3)
+        except Exception:
+            pass
+    return v
+
+
+# ==================================================
+def _to_float(value):
+    """
+    Convert to float.
+
+    Args:
+        value (str): value.
+
+    Returns:
+        - (float) -- value, NaN for non-numeric value.
+    """
+    try:
+        return float(value)
+    except (ValueError, TypeError):
+        return np.nan
+
+
+# ==================================================
+class GroupIndex:
+    # ==================================================
+    def __init__(self, value, header):
+        """
+        Column indexes of model snapshot (built lazily).
+
+        Args:
+            value (numpy.ndarray): snapshot of model, (row, column).
+            header (list): header.
+        """
+        self.value = value
+        self.field = {h.replace(" ", "_"): c for c, h in enumerate(header)}
+        self._unique = {}
+        self._numeric = {}
+
+    # ==================================================
+    def __len__(self):
+        return len(self.value)
+
+    # ==================================================
+    def column(self, field):
+        """
+        Column number of field.
+
+        Args:
+            field (str): field name.
+
+        Returns:
+            - (int) -- column.
+        """
+        if field not in self.field:
+            raise ValueError(f"unknown field, '{field}'.")
+        return self.field[field]
+
+    # ==================================================
+    def unique(self, field):
+        """
+        Interned strings of column.
+
+        Args:
+            field (str): field name.
+
+        Returns:
+            - (numpy.ndarray) -- unique strings.
+            - (numpy.ndarray) -- code of each row.
+        """
+        if field not in self._unique:
+            column = self.value[:, self.column(field)].astype(str)
+            self._unique[field] = np.unique(column, return_inverse=True)
+        return self._unique[field]
+
+    # ==================================================
+    def numeric(self, field):
+        """
+        Numeric array of column.
+
+        Args:
+            field (str): field name, or x/y/z.
+
+        Returns:
+            - (numpy.ndarray) -- values, NaN for non-numeric value.
+        """
+        if field not in self._numeric:
+            if field in _COORDINATE:
+                position, pcode = self.unique("position")
+                cell, ccode = self.unique("cell")
+                vec = _parse_vector(position)[pcode] + _parse_vector(cell)[ccode]
+                for f, i in _COORDINATE.items():
+                    self._numeric[f] = vec[:, i]
+            else:
+                u, code = self.unique(field)
+                self._numeric[field] = np.array([_to_float(i) for i in u], dtype=float)[code]
+        return self._numeric[field]
+
+
+# ==================================================
+class GroupFilter:
+    # ==================================================
+    def __init__(self, query):
+        """
+        Compiled query.
+
+        Args:
+            query (str): query string.
+
+        Raises:
+            ValueError: syntax error.
+        """
+        self.query = query.strip()
+        self.field = set()  # fields used in query.
+        self._token = self._tokenize(self.query)
+        self._pos = 0
+        self._func = self._parse_or() if self._token else None
+        if self._pos != len(self._token):
+            raise ValueError(f"unexpected '{self._token[self._pos][1]}'.")
+
+    # ==================================================
+    def is_empty(self):
+        """
+        Is empty query ?
+
+        Returns:
+            - (bool) -- empty ?
+        """
+        return self._func is None
+
+    # ==================================================
+    def check_field(self, header):
+        """
+        Check fields used in query.
+
+        Args:
+            header (list): header.
+
+        Raises:
+            ValueError: unknown field.
+        """
+        field = {h.replace(" ", "_") for h in header}
+        if {"position", "cell"} <= field:
+            field |= set(_COORDINATE)
+        unknown = sorted(self.field - field)
+        if unknown:
+            raise ValueError(f"unknown field, '{unknown[0]}'.")
+
+    # ==================================================
+    def mask(self, index):
+        """
+        Evaluate query.
+
+        Args:
+            index (GroupIndex): column indexes.
+
+        Returns:
+            - (numpy.ndarray) -- matched rows, (row,) bool.
+        """
+        if self._func is None or len(index) == 0:
+            return np.ones(len(index), dtype=bool)
+        return self._func(index)
+
+    # ==================================================
+    @staticmethod
+    def _tokenize(query):
+        token = []
+        pos = 0
+        while pos < len(query):
+            m = _TOKEN.match(query, pos)
+            if m is None or m.end() == pos:
+                break
+            pos = m.end()
+            if m.group("paren"):
+                token.append(("paren", m.group("paren")))
+            elif m.group("term"):
+                token.append(("term", (m.group("field"), m.group("op"), m.group("value").strip("\"'"))))
+            else:
+                word = m.group("word")
+                if word.lower() in ["and", "or", "not"]:
+                    token.append(("bool", word.lower()))
+                else:
+                    token.append(("word", word.strip("\"'")))
+        return token
+
+    # ==================================================
+    def _peek(self):
+        return self._token[self._pos] if self._pos < len(self._token) else (None, None)
+
+    # ==================================================
+    def _parse_or(self):
+        left = self._parse_and()
+        while self._peek() == ("bool", "or"):
+            self._pos += 1
+            right = self._parse_and()
+            left = (lambda a, b: lambda i: a(i) | b(i))(left, right)
+        return left
+
+    # ==================================================
+    def _parse_and(self):
+        left = self._parse_not()
+        while True:
+            token = self._peek()
+            if token == ("bool", "and"):
+                self._pos += 1
+            elif token[0] not in ["term", "word"] and token not in [("paren", "("), ("bool", "not")]:
+                return left
+            right = self._parse_not()  # juxtaposition is also and.
+            left = (lambda a, b: lambda i: a(i) & b(i))(left, right)
+
+    # ==================================================
+    def _parse_not(self):
+        if self._peek() == ("bool", "not"):
+            self._pos += 1
+            f = self._parse_not()
+            return lambda i: ~f(i)
+        return self._parse_atom()
+
+    # ==================================================
+    def _parse_atom(self):
+        kind, value = self._peek()
+        self._pos += 1
+        if kind == "paren" and value == "(":
+            f = self._parse_or()
+            if self._peek() != ("paren", ")"):
+                raise ValueError("missing ')'.")
+            self._pos += 1
+            return f
+        elif kind == "term":
+            return self._term(*value)
+        elif kind == "word":
+            self.field.add("name")
+            word = value.lower()
+            return lambda i: self._match_unique(i, "name", lambda s: word in s.lower())
+        raise ValueError("incomplete query." if kind is None else f"unexpected '{value}'.")
+
+    # ==================================================
+    @staticmethod
+    def _match_unique(index, field, func):
+        u, code = index.unique(field)
+        return np.array([func(s) for s in u], dtype=bool)[code]
+
+    # ==================================================
+    def _term(self, field, op, value):
+        self.field.add(field)
+        if op == "~":
+            return lambda i: self._match_unique(i, field, lambda s: fnmatchcase(s, value))
+        elif op in ["=", "=="]:
+            if field in _COORDINATE:
+                v = _to_float(value)
+                return lambda i: i.numeric(field) == v
+            return lambda i: self._match_unique(i, field, lambda s: s == value)
+        elif op == "!=":
+            if field in _COORDINATE:
+                v = _to_float(value)
+                return lambda i: i.numeric(field) != v
+            return lambda i: self._match_unique(i, field, lambda s: s != value)
+
+        v = _to_float(value)
+        if np.isnan(v):
+            raise ValueError(f"numeric value is required for '{op}', '{value}' is given.")
+        compare = {"<": np.less, "<=": np.less_equal, ">": np.greater, ">=": np.greater_equal}[op]
+        return lambda i: compare(i.numeric(field), v)
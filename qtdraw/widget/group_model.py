@@ -11,11 +11,17 @@ the first row of the child tree.
 The raw data is maintained by dict, and the index model
 is just to keep the relation between parent and child,
 which is necessary to use other Qt functionalities.
+
+Group name and actor name are indexed (hash), and the indexes
+are updated by insert/remove/change signals of the model.
+Snapshot of all rows is cached, and it is invalidated by
+the same signals.
 """
 
 import copy
+import numpy as np
 from PySide6.QtGui import QStandardItemModel, QStandardItem
-from PySide6.QtCore import Signal, Qt, QModelIndex, QTimer
+from PySide6.QtCore import Signal, Qt, QModelIndex, QPersistentModelIndex, QTimer
 
 from qtdraw.core.pyvista_widget_setting import CUSTOM_WIDGET, COLUMN_NAME_ACTOR, COLUMN_LABEL_ACTOR
 
@@ -63,7 +69,23 @@ class GroupModel(QStandardItemModel):
 
         self.column_widget = [i for i, c in enumerate(self.column_type) if c in CUSTOM_WIDGET]
 
+        # indexes for O(1) lookup.
+        self._group_item = {}  # group name => parent item.
+        self._actor_index = {}  # actor name => persistent index (column 0), child has priority over parent.
+
+        # snapshot of all rows, None for dirty.
+        self._snapshot = None
+        self._snapshot_array = None
+
+        changed = [self.dataChanged, self.rowsInserted, self.rowsRemoved, self.rowsMoved, self.modelReset, self.layoutChanged]
+        for signal in changed:
+            signal.connect(self._invalidate_snapshot)  # connect first, before other slots read snapshot.
         self.dataChanged.connect(self.update_check_state)  # to modify bool data in column+1.
+        self.dataChanged.connect(self._index_changed)
+        self.rowsInserted.connect(self._index_inserted)
+        self.rowsAboutToBeRemoved.connect(self._unindex_removed)
+        self.rowsRemoved.connect(self._purge_index)
+        self.modelReset.connect(self._rebuild_index)
         self.updateData.connect(self.emit_update_data)
 
     # ==================================================
@@ -153,9 +175,14 @@ class GroupModel(QStandardItemModel):
             column (int): column.
             data (str): data.
         """
+        if column == COLUMN_NAME_ACTOR:
+            self._unindex_actor(index)
         self.blockSignals(True)
         super().setData(index.siblingAtColumn(column), data, Qt.EditRole)
         self.blockSignals(False)
+        self._invalidate_snapshot()
+        if column == COLUMN_NAME_ACTOR:
+            self._index_actor(index)
 
     # ==================================================
     def set_check(self, index, column, data):
@@ -170,49 +197,105 @@ class GroupModel(QStandardItemModel):
         index_c = index.siblingAtColumn(column)
         self.setData(index_c, data, Qt.CheckStateRole)
 
+    # ==================================================
+    def _invalidate_snapshot(self, *args):
+        """
+        Invalidate snapshot.
+
+        :meta private:
+        """
+        self._snapshot = None
+        self._snapshot_array = None
+
     # ==================================================
     def tolist(self):
         """
         Convert to list.
 
-        Args:
-            raw (bool, optional): raw data ?
-
         Returns:
             - (list) -- list data.
+
+        Note:
+            - cached snapshot is returned until data is changed, so that it must not be modified.
         """
+        if self._snapshot is not None:
+            return self._snapshot
+
+        # read items directly, same as get_row_data.
+        role = Qt.EditRole
+        column = range(self.columnCount())
+        bool_column = [c for c, t in enumerate(self.column_type) if t == "bool"]
+
+        def row_data(parent_item, row):
+            data = [parent_item.child(row, c).data(role) for c in column]
+            for c in bool_column:
+                data[c] = str(data[c]) == "True"
+            return data
+
         root_item = self.invisibleRootItem()
         data = []
         for parent_row in range(root_item.rowCount()):
             item = root_item.child(parent_row)
             if item.hasChildren():
                 for row in range(item.rowCount()):
-                    row_data = self.get_row_data(item.child(row).index())
-                    data.append(row_data)
+                    data.append(row_data(item, row))
             else:
-                row_data = self.get_row_data(root_item.child(parent_row).index())
-                data.append(row_data)
+                data.append(row_data(root_item, parent_row))
 
+        self._snapshot = data
         return data
 
     # ==================================================
-    def emit_update_all(self):
+    def toarray(self):
         """
-        Emit update for all data.
+        Convert to array.
+
+        Returns:
+            - (ndarray) -- array data (object), (row, column).
+
+        Note:
+            - cached snapshot (read only) is returned until data is changed, use copy() to modify it.
         """
-        name = self.group_name
+        if self._snapshot_array is not None:
+            return self._snapshot_array
+
+        data = self.tolist()
+        array = np.empty((len(data), self.columnCount()), dtype=object)
+        for i, row_data in enumerate(data):
+            array[i, :] = row_data
+        array.setflags(write=False)
+
+        self._snapshot_array = array
+        return array
+
+    # ==================================================
+    def data_index(self):
+        """
+        Indices of all data rows (children, or parent without child).
+
+        Returns:
+            - (list) -- indices, [QModelIndex].
+        """
+        index = []
         root_item = self.invisibleRootItem()
         for parent_row in range(root_item.rowCount()):
             item = root_item.child(parent_row)
             if item.hasChildren():
-                for row in range(item.rowCount()):
-                    index = item.child(row).index()
-                    row_data = self.get_row_data(index)
-                    self.dataModified.emit(name, row_data, index)
+                index += [item.child(row).index() for row in range(item.rowCount())]
             else:
-                index = root_item.child(parent_row).index()
-                row_data = self.get_row_data(index)
-                self.dataModified.emit(name, row_data, index)
+                index.append(item.index())
+
+        return index
+
+    # ==================================================
+    def emit_update_all(self):
+        """
+        Emit update for all data.
+        """
+        name = self.group_name
+        for index in self.data_index():
+            row_data = self.get_row_data(index)
+            self.dataModified.emit(name, row_data, index)
 
     # ==================================================
     def find_item(self, text, column=0, child=True):
@@ -244,6 +327,178 @@ class GroupModel(QStandardItemModel):
 
         return found
 
+    # ==================================================
+    def find_group(self, name):
+        """
+        Find parent item of group.
+
+        Args:
+            name (str): group name.
+
+        Returns:
+            - (QStandardItem) -- parent item (column 0), None for no group.
+        """
+        return self._group_item.get(name)
+
+    # ==================================================
+    def find_actor(self, actor_name):
+        """
+        Find index of row with actor.
+
+        Args:
+            actor_name (str): actor name.
+
+        Returns:
+            - (QModelIndex) -- index (column 0), invalid index for no actor.
+
+        Note:
+            - when parent is the same as the first child, child index is returned.
+        """
+        index = self._actor_index.get(actor_name)
+        if index is not None and index.isValid():
+            index = QModelIndex(index)
+            if index.siblingAtColumn(COLUMN_NAME_ACTOR).data(Qt.EditRole) == actor_name:
+                return index
+
+        # not indexed (stale index), find by scan.
+        found = self.find_item(actor_name, COLUMN_NAME_ACTOR)
+        if len(found) == 0:
+            self._actor_index.pop(actor_name, None)
+            return QModelIndex()
+        index = found[-1].index().siblingAtColumn(0)
+        self._actor_index[actor_name] = QPersistentModelIndex(index)
+        return index
+
+    # ==================================================
+    def _index_actor(self, index):
+        """
+        Add actor of row to index.
+
+        Args:
+            index (QModelIndex): index.
+
+        :meta private:
+        """
+        index = index.siblingAtColumn(0)
+        actor_name = index.siblingAtColumn(COLUMN_NAME_ACTOR).data(Qt.EditRole)
+        if not actor_name:
+            return
+
+        current = self._actor_index.get(actor_name)
+        if current is not None and current.isValid() and current.parent() == index:  # child has priority.
+            return
+        self._actor_index[actor_name] = QPersistentModelIndex(index)
+
+    # ==================================================
+    def _unindex_actor(self, index):
+        """
+        Remove actor of row from index.
+
+        Args:
+            index (QModelIndex): index.
+
+        :meta private:
+        """
+        index = index.siblingAtColumn(0)
+        actor_name = index.siblingAtColumn(COLUMN_NAME_ACTOR).data(Qt.EditRole)
+        if not actor_name:
+            return
+
+        current = self._actor_index.get(actor_name)
+        if current is not None and current == index:
+            del self._actor_index[actor_name]
+            parent = index.parent()  # parent may have the same actor.
+            if parent.isValid() and parent.siblingAtColumn(COLUMN_NAME_ACTOR).data(Qt.EditRole) == actor_name:
+                self._actor_index[actor_name] = QPersistentModelIndex(parent)
+
+    # ==================================================
+    def _index_inserted(self, parent, first, last):
+        """
+        Update indexes for inserted rows.
+
+        Args:
+            parent (QModelIndex): parent index.
+            first (int): first row.
+            last (int): last row.
+
+        :meta private:
+        """
+        for row in range(first, last + 1):
+            index = self.index(row, 0, parent)
+            if not parent.isValid():
+                self._group_item[index.data(Qt.EditRole)] = self.itemFromIndex(index)
+            self._index_actor(index)
+            for crow in range(self.rowCount(index)):
+                self._index_actor(self.index(crow, 0, index))
+
+    # ==================================================
+    def _unindex_removed(self, parent, first, last):
+        """
+        Update indexes for rows to be removed.
+
+        Args:
+            parent (QModelIndex): parent index.
+            first (int): first row.
+            last (int): last row.
+
+        :meta private:
+        """
+        for row in range(first, last + 1):
+            index = self.index(row, 0, parent)
+            for crow in range(self.rowCount(index)):
+                self._unindex_actor(self.index(crow, 0, index))
+            self._unindex_actor(index)
+            if not parent.isValid():
+                self._group_item.pop(index.data(Qt.EditRole), None)
+
+    # ==================================================
+    def _purge_index(self, parent, first, last):
+        """
+        Purge indexes when all rows are removed.
+
+        Args:
+            parent (QModelIndex): parent index.
+            first (int): first row.
+            last (int): last row.
+
+        Note:
+            - parent row may keep stale actor name of its first child, which is dropped here.
+
+        :meta private:
+        """
+        if self.rowCount() == 0:
+            self._group_item = {}
+            self._actor_index = {}
+
+    # ==================================================
+    def _index_changed(self, topLeft, bottomRight, roles=None):
+        """
+        Update actor index for changed data.
+
+        Args:
+            topLeft (QModelIndex): top left index.
+            bottomRight (QModelIndex): bottom right index.
+            roles (list, optional): list of roles.
+
+        :meta private:
+        """
+        if not topLeft.column() <= COLUMN_NAME_ACTOR <= bottomRight.column():
+            return
+
+        for row in range(topLeft.row(), bottomRight.row() + 1):
+            self._index_actor(self.index(row, 0, topLeft.parent()))
+
+    # ==================================================
+    def _rebuild_index(self):
+        """
+        Rebuild indexes.
+
+        :meta private:
+        """
+        self._group_item = {}
+        self._actor_index = {}
+        self._index_inserted(QModelIndex(), 0, self.rowCount() - 1)
+
     # ==================================================
     def set_check_state(self, item, row_data):
         """
@@ -280,11 +535,12 @@ class GroupModel(QStandardItemModel):
         Note:
             - bool string is replaced by bool.
         """
+        role = Qt.EditRole  # enum lookup is slow, once per row.
         if column is None:
-            row_data = [self.itemFromIndex(index.siblingAtColumn(c)).data(Qt.EditRole) for c in range(self.columnCount())]
+            row_data = [self.itemFromIndex(index.siblingAtColumn(c)).data(role) for c in range(self.columnCount())]
             row_data = [str(i) == "True" if self.column_type[c] == "bool" else i for c, i in enumerate(row_data)]
         else:
-            row_data = self.itemFromIndex(index.siblingAtColumn(column)).data(Qt.EditRole)
+            row_data = self.itemFromIndex(index.siblingAtColumn(column)).data(role)
             if self.column_type[column] == "bool":
                 row_data = str(row_data) == "True"
         return row_data
@@ -338,11 +594,7 @@ class GroupModel(QStandardItemModel):
                 row_data[0] = self.get_row_data(index, 0)
 
         name = row_data[0]  # assume tuple at first column.
-        parent_item = self.find_item(name, child=False)
-        if len(parent_item) > 0:
-            parent_item = parent_item[0]
-        else:
-            parent_item = None
+        parent_item = self._group_item.get(name)
 
         if parent_item is None:  #  new group.
             item = [QStandardItem(str(i)) for i in row_data]
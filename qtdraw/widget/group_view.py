@@ -3,16 +3,30 @@ View panel for GroupModel.
 
 This module provides a view class to show object data.
 By clicking right button of mouse, the context menu appears.
+Rows can be filtered by query (see group_filter), and matched rows can be selected at once.
 """
 
-from PySide6.QtWidgets import QMenu, QTreeView, QHeaderView, QSizePolicy
-from PySide6.QtCore import Qt, Signal, QPoint, QModelIndex, QItemSelection, QItemSelectionModel
+import numpy as np
+from PySide6.QtWidgets import QMenu, QTreeView, QHeaderView, QSizePolicy, QLineEdit, QComboBox
+from PySide6.QtCore import (
+    Qt,
+    Signal,
+    QPoint,
+    QModelIndex,
+    QPersistentModelIndex,
+    QItemSelection,
+    QItemSelectionModel,
+    QTimer,
+)
 
 from qtdraw.core.pyvista_widget_setting import COLOR_WIDGET, COMBO_WIDGET, EDITOR_WIDGET, HIDE_TYPE
 
 from qtdraw.widget.delegate import ColorDelegate, ComboDelegate, EditorDelegate
 from qtdraw.widget.group_model import GroupModel
-from qtdraw.widget.mathjax import MathJaxSVG
+from qtdraw.widget.group_filter import GroupFilter, GroupIndex
+from qtdraw.widget.custom_widget import Editor
+from qtdraw.widget.mathjax import shared_mathjax
+from qtdraw.widget.table_view import cached_math_pixmap, math_pixmap
 
 
 # ==================================================
@@ -20,7 +34,7 @@ class GroupView(QTreeView):
     selectionChanged = Signal(str, list, list)  # name, deselect, select.
 
     # ==================================================
-    def __init__(self, parent=None, model=None, use_delegate=True, mathjax=None):
+    def __init__(self, parent=None, model=None, use_delegate=True, mathjax=None, paint_only=True):
         """
         Group view.
 
@@ -28,13 +42,34 @@ class GroupView(QTreeView):
             parent (QWidget, optional): parent.
             model (GroupModel, optional): group model.
             use_delegate (bool, optional): use delegate or plain text ?
+            mathjax (MathJaxSVG, optional): MathJax converter.
+            paint_only (bool, optional): paint cells by delegate, and open editor only for current cell ?
+
+        Note:
+            - in paint-only mode, rows have uniform height, and only visible rows are painted and sized.
+            - otherwise, persistent editors are opened for all cells.
         """
         super().__init__(parent)
         self._needs_widget_update = False
         self._row_heights = {}
+        self._paint_only = paint_only
+        self._editor_index = QPersistentModelIndex()
+        self._pending = False
+        self._math_color = "black"
+        self._math_size = self.font().pointSize() + 5
+        self._ratio = self.devicePixelRatioF()
+        self._row_height = max(int(1.8 * self.font().pointSize()), QLineEdit().sizeHint().height()) + 10
+        self._filter = GroupFilter("")
+        self._filter_cache = None
+        self._filter_timer = QTimer(self)
+        self._filter_timer.setSingleShot(True)
+        self._filter_timer.setInterval(100)
+        self._filter_timer.timeout.connect(self.apply_filter)
+        self._bulk_selection = False
+        self._filtered = False  # some rows may be hidden ?
 
         if mathjax is None:
-            self._mathjax = MathJaxSVG()
+            self._mathjax = shared_mathjax()
         else:
             self._mathjax = mathjax
 
@@ -101,19 +136,39 @@ class GroupView(QTreeView):
         # set properties.
         self.setAlternatingRowColors(True)
         self.header().setSectionsMovable(False)
-        self.setUniformRowHeights(False)
+        self.setUniformRowHeights(self._paint_only)
 
         self.header().setDefaultAlignment(Qt.AlignHCenter | Qt.AlignVCenter)
         for column in range(self.model().columnCount()):
             self.header().setSectionResizeMode(column, QHeaderView.ResizeToContents)
+        if self._paint_only:  # size by visible rows.
+            self.header().setResizeContentsPrecision(0)
+            self.verticalScrollBar().valueChanged.connect(self.request_render)
 
         self.selectionModel().selectionChanged.connect(self.selection_changed)
         self.model().selectionClear.connect(self.clear_selection)
+        for signal in [model.rowsInserted, model.rowsRemoved, model.dataChanged, model.modelReset]:
+            signal.connect(self._schedule_filter)
 
         self.clear_selection()
 
+    # ==================================================
+    @property
+    def paint_only(self):
+        """
+        Paint-only mode ?
+
+        Returns:
+            - (bool) -- paint-only mode ?
+        """
+        return self._paint_only
+
     # ==================================================
     def update_widget(self, index):
+        if self._paint_only:  # open editor is updated by dataChanged.
+            self.viewport().update()
+            return
+
         if not self.isVisible() or self.window().isMinimized():
             self._needs_widget_update = True
             return
@@ -147,6 +202,9 @@ class GroupView(QTreeView):
         Args:
             item (QStandardItem, optional): item.
         """
+        if self._paint_only:
+            return
+
         if item is None:
             item = self.model().invisibleRootItem()
 
@@ -157,6 +215,84 @@ class GroupView(QTreeView):
                 self._open_editors_for_row(child_index)
                 self.set_widget(child_item)
 
+    # ==================================================
+    def currentChanged(self, current, previous):
+        """
+        Move editor to current cell (paint-only mode).
+
+        :meta private:
+        """
+        super().currentChanged(current, previous)
+        if not self._paint_only:
+            return
+
+        if self._editor_index.isValid():
+            self.closePersistentEditor(QModelIndex(self._editor_index))
+        self._editor_index = QPersistentModelIndex()
+
+        if current.isValid() and current.column() in self.model().column_widget:
+            self.openPersistentEditor(current)
+            self._editor_index = QPersistentModelIndex(current)
+
+    # ==================================================
+    def math_cell_pixmap(self, latex):
+        """
+        Cached pixmap of LaTeX cell.
+
+        Args:
+            latex (str): LaTeX code w/o "$".
+
+        Returns:
+            - (QPixmap) -- pixmap, None for uncached cell.
+        """
+        return cached_math_pixmap(latex, self._math_color, self._math_size, self._ratio)
+
+    # ==================================================
+    def request_render(self, *args):
+        """
+        Request rendering of LaTeX cells in visible rows (coalesced).
+        """
+        if self._paint_only and not self._pending:
+            self._pending = True
+            QTimer.singleShot(0, self._render_visible)
+
+    # ==================================================
+    def _render_visible(self):
+        """
+        Render LaTeX cells in visible rows at once.
+
+        :meta private:
+        """
+        self._pending = False
+        delegate = {}
+        for column in self.model().column_widget:
+            d = self.itemDelegateForColumn(column)
+            if isinstance(d, EditorDelegate) and d.type == "math":
+                delegate[column] = d
+        if not delegate:
+            return
+
+        latex = []
+        height = self.viewport().height()
+        index = self.indexAt(QPoint(0, 0))
+        while index.isValid() and self.visualRect(index).top() < height:
+            for column, d in delegate.items():
+                value = index.siblingAtColumn(column).data(Qt.DisplayRole)
+                if value and d.is_math(value):
+                    latex.append(d.display_text(value)[0])
+            index = self.indexBelow(index)
+
+        rest = [i for i in dict.fromkeys(latex) if self.math_cell_pixmap(i) is None]
+        if rest:
+            math_pixmap(rest, self._math_color, self._math_size, self._ratio, self._mathjax)
+            self.scheduleDelayedItemsLayout()
+        self.viewport().update()
+
+    # ==================================================
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        self.request_render()
+
     # ==================================================
     def clear_selection(self):
         """
@@ -181,6 +317,25 @@ class GroupView(QTreeView):
             self.clear_selection()
         super().mousePressEvent(event)
 
+        # open popup of editor created by this click.
+        if self._paint_only and index.isValid() and event.button() == Qt.LeftButton:
+            editor = self.indexWidget(index)
+            if isinstance(editor, QComboBox):
+                editor.showPopup()
+
+    # ==================================================
+    def mouseDoubleClickEvent(self, event):
+        """
+        Mouse double click event to start editing (paint-only mode).
+        """
+        if self._paint_only:
+            position = event.position()
+            editor = self.indexWidget(self.indexAt(QPoint(int(position.x()), int(position.y()))))
+            if isinstance(editor, Editor):
+                editor.mouseDoubleClickEvent(event)
+                return
+        super().mouseDoubleClickEvent(event)
+
     # ==================================================
     def keyPressEvent(self, event):
         """
@@ -268,35 +423,34 @@ class GroupView(QTreeView):
             selected (list): selected indexes.
             deselected (list): deselected indexes.
         """
-        model = self.model()
+        if self._bulk_selection:  # emitted by select_matches.
+            return
 
         deselected = [i for i in deselected.indexes() if i.column() == 0]
-        if deselected:
-            index0 = deselected[0]
-            row_data0 = []
-            if model.rowCount(index0) == 0:
-                row_data0.append(model.get_row_data(index0))
-            else:
-                for row in range(model.rowCount(index0)):
-                    cindex0 = model.index(row, 0, index0)
-                    row_data0.append(model.get_row_data(cindex0))
-        else:
-            row_data0 = []
+        row_data0 = self._row_data(deselected[0]) if deselected else []
 
         selected = [i for i in selected.indexes() if i.column() == 0]
-        if selected:
-            index1 = selected[0]
-            row_data1 = []
-            if model.rowCount(index1) == 0:
-                row_data1.append(model.get_row_data(index1))
-            else:
-                for row in range(model.rowCount(index1)):
-                    cindex1 = model.index(row, 0, index1)
-                    row_data1.append(model.get_row_data(cindex1))
-        else:
-            row_data1 = []
+        row_data1 = self._row_data(selected[0]) if selected else []
 
-        self.selectionChanged.emit(model.group_name, row_data0, row_data1)
+        self.selectionChanged.emit(self.model().group_name, row_data0, row_data1)
+
+    # ==================================================
+    def _row_data(self, index):
+        """
+        Row data of row (children for parent).
+
+        Args:
+            index (QModelIndex): index.
+
+        Returns:
+            - (list) -- row data, [[data]].
+
+        :meta private:
+        """
+        model = self.model()
+        if model.rowCount(index) == 0:
+            return [model.get_row_data(index)]
+        return [model.get_row_data(model.index(row, 0, index)) for row in range(model.rowCount(index))]
 
     # ==================================================
     def select_row(self, index):
@@ -313,6 +467,151 @@ class GroupView(QTreeView):
         selection = QItemSelection(index, index1)  # all columns.
         self.selectionModel().select(selection, QItemSelectionModel.ClearAndSelect)
 
+    # ==================================================
+    def set_filter(self, query):
+        """
+        Set filter to show matched rows only.
+
+        Args:
+            query (str): query, "" for all rows.
+
+        Raises:
+            ValueError: invalid query or unknown field (current filter is kept).
+        """
+        query = GroupFilter(query)
+        query.check_field(self.model().header)
+        self._filter = query
+        self._filter_timer.stop()
+        self.apply_filter()
+
+    # ==================================================
+    def filter_mask(self):
+        """
+        Matched rows of filter.
+
+        Returns:
+            - (numpy.ndarray) -- matched rows in order of GroupModel.tolist(), (row,) bool.
+        """
+        return self._filter.mask(self._filter_layout()["index"])
+
+    # ==================================================
+    def apply_filter(self):
+        """
+        Apply filter to rows (only changed rows are shown or hidden).
+        """
+        if self._filter.is_empty() and not self._filtered:
+            return
+
+        cache = self._filter_layout()
+        top, child, start = cache["top"], cache["child"], cache["start"]
+        mask = self.filter_mask()
+        visible = np.logical_or.reduceat(mask, start) if len(mask) > 0 else mask
+        group = child >= 0
+
+        if cache["mask"] is None:  # new layout, all rows.
+            changed = np.ones(len(mask), dtype=bool)
+            changed_top = np.ones(len(visible), dtype=bool)
+        else:
+            changed = mask != cache["mask"]
+            changed_top = visible != cache["visible"]
+
+        model = self.model()
+        root = QModelIndex()
+        for i in np.flatnonzero(changed_top):
+            self.setRowHidden(int(top[start[i]]), root, not visible[i])
+        for i in np.flatnonzero(changed & group):
+            self.setRowHidden(int(child[i]), model.index(int(top[i]), 0), not mask[i])
+
+        cache["mask"] = mask
+        cache["visible"] = visible
+        self._filtered = not self._filter.is_empty()
+
+    # ==================================================
+    def select_matches(self):
+        """
+        Select all rows matched with filter, and emit selectionChanged at once.
+        """
+        self._filter_timer.stop()
+        self.apply_filter()
+        cache = self._filter_layout()
+        top, child = cache["top"], cache["child"]
+        model = self.model()
+        last = model.columnCount() - 1
+        row = np.flatnonzero(self.filter_mask())
+
+        deselect = []
+        for index in self.selectionModel().selectedRows():
+            deselect += self._row_data(index)
+
+        # contiguous rows in the same parent are selected as one range.
+        selection = QItemSelection()
+        if len(row) > 0:
+            group = child[row] >= 0
+            same = np.where(group[:-1], np.diff(top[row]) == 0, np.diff(top[row]) == 1)  # same parent, next row.
+            brk = np.flatnonzero((np.diff(row) != 1) | (group[:-1] != group[1:]) | ~same) + 1
+            for first, end in zip(np.r_[0, brk], np.r_[brk, len(row)]):
+                i, j = row[first], row[end - 1]
+                if child[i] < 0:
+                    parent = QModelIndex()
+                    r0, r1 = int(top[i]), int(top[j])
+                else:
+                    parent = model.index(int(top[i]), 0)
+                    r0, r1 = int(child[i]), int(child[j])
+                selection.select(model.index(r0, 0, parent), model.index(r1, last, parent))
+
+        self._bulk_selection = True
+        try:
+            self.selectionModel().select(selection, QItemSelectionModel.ClearAndSelect)
+        finally:
+            self._bulk_selection = False
+
+        data = model.tolist()
+        self.selectionChanged.emit(model.group_name, deselect, [data[i] for i in row])
+
+    # ==================================================
+    def _filter_layout(self):
+        """
+        Column indexes and tree position of snapshot rows (cached until data is changed).
+
+        Returns:
+            - (dict) -- index: GroupIndex, top/child: top-level/child row (-1 for no child), start: first row of top-level row.
+
+        :meta private:
+        """
+        model = self.model()
+        value = model.toarray()
+        if self._filter_cache is not None and self._filter_cache["snapshot"] is value:
+            return self._filter_cache
+
+        root = model.invisibleRootItem()
+        n = [root.child(row).rowCount() for row in range(root.rowCount())]
+        size = np.maximum(n, 1)
+        start = np.cumsum(size) - size
+        top = np.repeat(np.arange(len(n)), size)
+        child = np.arange(len(top)) - start[top]
+        child[np.repeat(np.asarray(n) == 0, size)] = -1
+
+        self._filter_cache = {
+            "snapshot": value,
+            "index": GroupIndex(value, model.header),
+            "top": top,
+            "child": child,
+            "start": start,
+            "mask": None,
+            "visible": None,
+        }
+        return self._filter_cache
+
+    # ==================================================
+    def _schedule_filter(self, *args):
+        """
+        Re-apply filter after data is changed.
+
+        :meta private:
+        """
+        if self._filtered:
+            self._filter_timer.start()
+
     # ==================================================
     def closeEvent(self, event):
         self.clear_selection()
@@ -320,6 +619,8 @@ class GroupView(QTreeView):
 
     # ==================================================
     def set_row_height_hint(self, row, height):
+        if self._paint_only:
+            return
         prev = self._row_heights.get(row, 0)
         if height > prev:
             self._row_heights[row] = height
@@ -327,6 +628,8 @@ class GroupView(QTreeView):
 
     # ==================================================
     def row_height_hint(self, row):
+        if self._paint_only:
+            return self._row_height
         return self._row_heights.get(row)
 
     # ==================================================
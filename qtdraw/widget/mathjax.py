@@ -4,12 +4,13 @@ MathJaxSVG converter.
 This module provides mathjax to SVG converter.
 """
 
+import os
 import re
 import hashlib
 from pathlib import Path
 import asyncio
 import threading
-from playwright.async_api import async_playwright
+import atexit
 import xml.etree.ElementTree as ET
 
 from qtdraw.core.qtdraw_info import __top_dir__
@@ -24,26 +25,47 @@ _HTML_TEMPLATE = """
 <head>
     <meta charset="utf-8">
     <script>
-        window.MathJax={{
-            tex: {{ inlineMath: [['$','$'],['\\\\(','\\\\)']] }},
-            svg: {{ fontCache: 'none' }}
-        }};
+        window.MathJax={
+            tex: { inlineMath: [['$','$'],['\\\\(','\\\\)']] },
+            svg: { fontCache: 'none' },
+            startup: { typeset: false }
+        };
     </script>
     <style>
-        body {{
+        body {
             margin: 0;
             display: flex;
             justify-content: center;
             align-items: center;
             font-size: 10pt;
-        }}
+        }
     </style>
 </head>
 <body>
-    <div id="math">{latex}</div>
+    <div id="math"></div>
 </body>
 </html>
 """
+# typeset all texts in one pass, and return outerHTML of SVG (null for failure).
+_TYPESET_SCRIPT = """
+async (texts) => {
+    const root = document.getElementById("math");
+    const nodes = texts.map((t) => {
+        const d = document.createElement("div");
+        d.textContent = t;
+        root.appendChild(d);
+        return d;
+    });
+    await MathJax.typesetPromise(nodes);
+    const svg = nodes.map((d) => {
+        const e = d.querySelector("mjx-container svg");
+        return e ? e.outerHTML : null;
+    });
+    MathJax.typesetClear(nodes);
+    root.replaceChildren();
+    return svg;
+}
+"""
 
 
 # ===============================
@@ -51,15 +73,17 @@ class MathJaxSVG:
     _SVG_NS = "http://www.w3.org/2000/svg"
 
     # ===============================
-    def __init__(self, cache_dir=None, clear_cache=False):
+    def __init__(self, cache_dir=None, clear_cache=False, pool_size=2):
         """
         MathJax converter.
 
         Args:
             cache_dir (str, optional): cache directory.
             clear_cache (bool, optional): clear disk cache ?
+            pool_size (int, optional): number of warm pages with MathJax loaded.
         """
         self._svg_cache = {}  # memory cache.
+        self._pool_size = max(1, pool_size)
 
         # disk cache.
         self._cache_dir = cache_dir or (Path.home() / ".qtdraw" / "svg_cache")
@@ -75,14 +99,13 @@ class MathJaxSVG:
 
         ET.register_namespace("", self._SVG_NS)
 
-        # run event loop in independent thread.
+        # run event loop in independent thread, playwright is warmed up in background.
+        self._ready = threading.Event()
+        self._error = None
+        self._closed = False
         self._thread = threading.Thread(target=self._thread_main, daemon=True)
         self._thread.start()
 
-        # wait for execution of playwright.
-        self._ready = threading.Event()
-        self._ready.wait()
-
     # =============================== event loop in thread.
     def _thread_main(self):
         self._loop = asyncio.new_event_loop()
@@ -92,9 +115,37 @@ class MathJaxSVG:
 
     # ===============================
     async def _async_init(self):
-        self._playwright = await async_playwright().start()
-        self._browser = await self._playwright.chromium.launch(headless=True)
-        self._ready.set()  # complete execution.
+        try:
+            from playwright.async_api import async_playwright
+
+            self._playwright = await async_playwright().start()
+            self._browser = await self._playwright.chromium.launch(headless=True)
+
+            # warm page pool.
+            self._pages = await asyncio.gather(*[self._new_page() for _ in range(self._pool_size)])
+            self._pool = asyncio.Queue()
+            for page in self._pages:
+                self._pool.put_nowait(page)
+        except Exception as e:
+            self._error = e
+        finally:
+            self._ready.set()  # complete execution.
+
+    # ===============================
+    def _wait_ready(self):
+        # wait for execution of playwright.
+        self._ready.wait()
+        if self._error is not None:
+            raise RuntimeError(f"failed to start MathJax converter, {self._error}.")
+
+    # ===============================
+    async def _new_page(self):
+        page = await self._browser.new_page()
+        await page.set_content(_HTML_TEMPLATE)
+        await page.add_script_tag(path=_MATHJAX_PATH)
+        await page.wait_for_function("() => window.MathJax && MathJax.startup && MathJax.startup.promise")
+        await page.evaluate("() => MathJax.startup.promise")
+        return page
 
     # ===============================
     def convert(self, latex, color="black", size=10):
@@ -110,35 +161,92 @@ class MathJaxSVG:
             - (str) -- SVG string.
             - (tuple) -- width and height.
         """
+        self._wait_ready()
         return asyncio.run_coroutine_threadsafe(self._convert_async(latex, color, size), self._loop).result()
 
-    # =============================== implementaion for convert with async for Jupyter.
-    async def _convert_async(self, latex, color, size):
-        if latex in self._svg_cache:  # use memory cache.
-            svg_str = self._svg_cache[latex]
-        else:
-            cache_path = self._get_cache_path(latex)  # use disk cache.
-            if cache_path.exists():
-                svg_str = cache_path.read_text()
-            else:  # create SVG.
-                page = await self._browser.new_page()
-                html = _HTML_TEMPLATE.format(latex=latex)
+    # ===============================
+    def convert_many(self, latex_list, color="black", size=10):
+        """
+        Convert list of latex to SVG strings at once.
+
+        Args:
+            latex_list (list): list of LaTeX code w/o $.
+            color (str, optional): color name.
+            size (int, optional): point.
+
+        Returns:
+            - (list) -- list of (SVG string, (width, height)), None for string failed to typeset.
+
+        Note:
+            - uncached strings are typeset in one pass per page, and pages in the pool work concurrently.
+        """
+        self._wait_ready()
+        return asyncio.run_coroutine_threadsafe(self._convert_many_async(latex_list, color, size), self._loop).result()
 
-                await page.set_content(html)
-                await page.add_script_tag(path=_MATHJAX_PATH)
-                await asyncio.sleep(0.05)
+    # ===============================
+    def submit_many(self, latex_list, color="black", size=10):
+        """
+        Convert list of latex to SVG strings in background.
 
-                svg_elem = await page.query_selector("mjx-container svg")
-                if not svg_elem:
-                    await page.close()
-                    raise RuntimeError("Failed to get SVG element.")
+        Args:
+            latex_list (list): list of LaTeX code w/o $.
+            color (str, optional): color name.
+            size (int, optional): point.
 
-                svg_str = await svg_elem.evaluate("el => el.outerHTML")
-                await page.close()
+        Returns:
+            - (Future) -- future of list of (SVG string, (width, height)), None for string failed to typeset.
 
-                svg_str = self._flatten_svg_string(svg_str)
-                self._svg_cache[latex] = svg_str
+        Note:
+            - result is given by result() or add_done_callback() of future, the callback is called in converter thread.
+        """
+        self._wait_ready()
+        return asyncio.run_coroutine_threadsafe(self._convert_many_async(latex_list, color, size), self._loop)
+
+    # =============================== implementaion for convert with async for Jupyter.
+    async def _convert_async(self, latex, color, size):
+        result = (await self._convert_many_async([latex], color, size))[0]
+        if result is None:
+            raise RuntimeError("Failed to get SVG element.")
+        return result
+
+    # ===============================
+    async def _convert_many_async(self, latex_list, color, size):
+        # collect strings without memory cache.
+        rest = []
+        for latex in dict.fromkeys(latex_list):
+            if latex not in self._svg_cache:
+                cache_path = self._get_cache_path(latex)  # use disk cache.
+                if cache_path.exists():
+                    self._svg_cache[latex] = cache_path.read_text()
+                else:
+                    rest.append(latex)
+
+        # create SVG, split into chunks for each page.
+        if rest:
+            n = min(self._pool_size, len(rest))
+            chunks = [rest[i::n] for i in range(n)]
+            results = await asyncio.gather(*[self._typeset_async(chunk) for chunk in chunks])
+            for chunk, svg_list in zip(chunks, results):
+                for latex, svg_str in zip(chunk, svg_list):
+                    if not svg_str:  # failed string is not cached, and the others are kept.
+                        continue
+                    svg_str = self._flatten_svg_string(svg_str)
+                    self._svg_cache[latex] = svg_str
+                    self._write_cache(latex, svg_str)
+
+        svg = self._svg_cache
+        return [self._scale_color(svg[latex], color, size) if latex in svg else None for latex in latex_list]
 
+    # ===============================
+    async def _typeset_async(self, latex_list):
+        page = await self._pool.get()
+        try:
+            return await page.evaluate(_TYPESET_SCRIPT, latex_list)
+        finally:
+            self._pool.put_nowait(page)
+
+    # ===============================
+    def _scale_color(self, svg_str, color, size):
         # get scaled size.
         x, y, w, h = map(float, self._get_attribute(svg_str, "viewBox").split())
         scale = size / 1000.0
@@ -151,21 +259,34 @@ class MathJaxSVG:
 
     # ===============================
     def close(self):
-        # write memory cache to disk cache.
-        for latex, svg_str in self._svg_cache.items():
-            cache_path = self._get_cache_path(latex)
-            if not cache_path.exists():
-                cache_path.write_text(svg_str)
+        if self._closed:
+            return
+        self._closed = True
 
         # close browser and playwright.
-        asyncio.run_coroutine_threadsafe(self._async_close(), self._loop).result()
+        self._ready.wait()
+        if self._error is None:
+            asyncio.run_coroutine_threadsafe(self._async_close(), self._loop).result()
         self._loop.call_soon_threadsafe(self._loop.stop)
 
     # ===============================
     async def _async_close(self):
+        for page in self._pages:
+            await page.close()
         await self._browser.close()
         await self._playwright.stop()
 
+    # ===============================
+    def _write_cache(self, latex, svg_str):
+        # write through to disk cache, atomic by rename.
+        cache_path = self._get_cache_path(latex)
+        tmp_path = cache_path.with_suffix(f".{os.getpid()}.tmp")
+        try:
+            tmp_path.write_text(svg_str)
+            tmp_path.replace(cache_path)
+        except OSError:
+            pass
+
     # ===============================
     def _get_cache_path(self, latex):
         hash_key = hashlib.sha256(f"{latex}".encode("utf-8")).hexdigest()
@@ -212,3 +333,27 @@ class MathJaxSVG:
                 elem.attrib["fill"] = "currentColor"
 
         return ET.tostring(root, encoding="unicode")
+
+
+# ===============================
+_shared_mathjax = None
+_shared_lock = threading.Lock()
+
+
+# ===============================
+def shared_mathjax():
+    """
+    Shared MathJax converter in process.
+
+    Returns:
+        - (MathJaxSVG) -- converter shared by all widgets and dialogs.
+
+    Note:
+        - browser is launched in background at the first call, and closed at exit.
+    """
+    global _shared_mathjax
+    with _shared_lock:
+        if _shared_mathjax is None:
+            _shared_mathjax = MathJaxSVG()
+            atexit.register(_shared_mathjax.close)
+    return _shared_mathjax
@@ -6,7 +6,6 @@ This module provides functions to control Qt event loop.
 
 import sys
 import logging
-from IPython.core import ultratb
 from PySide6.QtCore import QObject, Signal, Qt
 from PySide6.QtGui import QFont, QPalette, QColor
 from PySide6.QtWidgets import QApplication
@@ -21,12 +20,11 @@ def gui_qt():
     """
     Execute Qt GUI mode in IPython (if available).
     """
-    try:
-        from IPython import get_ipython
-    except ImportError:
-        get_ipython = lambda: False
+    ipython = sys.modules.get("IPython")
+    if ipython is None:  # not in IPython, avoid importing it.
+        return
 
-    shell = get_ipython()
+    shell = ipython.get_ipython()
 
     if shell and getattr(shell, "enable_gui", None):
         if shell.active_eventloop != "qt6":
@@ -118,6 +116,8 @@ class ExceptionHook(QObject):
         if issubclass(type, KeyboardInterrupt):
             sys.__excepthook__(type, value, traceback)  # ignore keyboard interrupt for console applications.
         else:
+            from IPython.core import ultratb
+
             bar = "---------------------------------------------------------------------------"
             handler = ultratb.VerboseTB(color_scheme="NoColor", long_header=False)
             log_msg = handler.text(type, value, traceback)
@@ -2,18 +2,23 @@
 Tab of GroupView.
 
 This module provides a set of group view classes in tab format.
+Each group view is created when its tab is shown at first.
+Rows of current tab are filtered by query in filter bar, e.g., name~"Fe*" and z>0.5.
 """
 
-from PySide6.QtWidgets import QTabWidget, QDialog
+from PySide6.QtWidgets import QTabWidget, QDialog, QLineEdit
 from PySide6.QtGui import QFont
+from PySide6.QtCore import Signal, QTimer
 
 from qtdraw.widget.group_view import GroupView
-from qtdraw.widget.custom_widget import Layout
-from qtdraw.widget.mathjax import MathJaxSVG
+from qtdraw.widget.custom_widget import Layout, Panel, Button
+from qtdraw.widget.mathjax import shared_mathjax
 
 
 # ==================================================
 class TabGroupView(QDialog):
+    selectionChanged = Signal(str, list, list)  # name, deselect, select (from any view).
+
     # ==================================================
     def __init__(self, parent=None, models=None, title="Data", mathjax=None):
         """
@@ -23,10 +28,13 @@ class TabGroupView(QDialog):
             parent (QWidget, optional): parent.
             models (dict, optional): set of models, {object_type: GroupModel}.
             title (str, optional): window title.
+
+        Note:
+            - group view of each tab is created lazily, use get_view() to access it.
         """
         super().__init__(parent)
         if mathjax is None:
-            self._mathjax = MathJaxSVG()
+            self._mathjax = shared_mathjax()
         else:
             self._mathjax = mathjax
 
@@ -41,20 +49,87 @@ class TabGroupView(QDialog):
         bold.setBold(True)
         self.tab.tabBar().setFont(bold)
 
-        self.view = {}
-        for object_type, model in models.items():
-            item = GroupView(parent=self, model=model, mathjax=self._mathjax)
-            self.tab.addTab(item, object_type)
-            self.view[object_type] = item
+        self._models = models
+        self._page = {}
+        self.view = {}  # created views, {object_type: GroupView}.
+        for object_type in models.keys():
+            page = Panel(self)
+            page.layout.setContentsMargins(0, 0, 0, 0)
+            self.tab.addTab(page, object_type)
+            self._page[object_type] = page
+
+        # filter bar.
+        self.filter = QLineEdit(self)
+        self.filter.setPlaceholderText('filter: Fe, name~"Fe*" and z>0.5, not color=red, ...')
+        self.filter.setClearButtonEnabled(True)
+        self.filter.textChanged.connect(lambda: self._filter_timer.start())
+        self.filter.returnPressed.connect(self.apply_filter)
+        self._filter_timer = QTimer(self)
+        self._filter_timer.setSingleShot(True)
+        self._filter_timer.setInterval(200)
+        self._filter_timer.timeout.connect(self.apply_filter)
+        self.select_button = Button(self, "select all")
+        self.select_button.setToolTip("select all matched rows.")
+        self.select_button.clicked.connect(self.select_matches)
 
         layout = Layout(self)
-        layout.addWidget(self.tab)
+        layout.addWidget(self.filter, 0, 0)
+        layout.addWidget(self.select_button, 0, 1)
+        layout.addWidget(self.tab, 1, 0, 1, 2)
 
         self.setLayout(layout)
 
         self._tabname = self.tab.tabText(self.tab.currentIndex())
         self.tab.currentChanged.connect(self.tab_change)
 
+    # ==================================================
+    def get_view(self, object_type):
+        """
+        Get group view (created if necessary).
+
+        Args:
+            object_type (str): object type.
+
+        Returns:
+            - (GroupView) -- group view.
+        """
+        view = self.view.get(object_type)
+        if view is None:
+            page = self._page[object_type]
+            view = GroupView(parent=page, model=self._models[object_type], mathjax=self._mathjax)
+            view.selectionChanged.connect(self.selectionChanged)
+            page.layout.addWidget(view, 0, 0)
+            self.view[object_type] = view
+
+        return view
+
+    # ==================================================
+    def apply_filter(self):
+        """
+        Apply query in filter bar to current view.
+        """
+        self._filter_timer.stop()
+        if self._tabname not in self._page:
+            return
+
+        try:
+            self.get_view(self._tabname).set_filter(self.filter.text())
+            self.filter.setStyleSheet("")
+        except ValueError as e:
+            self.filter.setStyleSheet("QLineEdit { background: pink; }")
+            self.filter.setToolTip(str(e))
+        else:
+            self.filter.setToolTip("")
+
+    # ==================================================
+    def select_matches(self):
+        """
+        Select all matched rows in current view.
+        """
+        self.apply_filter()
+        if self._tabname in self._page:
+            self.get_view(self._tabname).select_matches()
+
     # ==================================================
     def select_tab(self, object_type):
         """
@@ -63,7 +138,7 @@ class TabGroupView(QDialog):
         Args:
             object_type (str): object type.
         """
-        idx = list(self.view.keys()).index(object_type)
+        idx = list(self._models.keys()).index(object_type)
         self.tab.setCurrentIndex(idx)
 
     # ==================================================
@@ -80,18 +155,20 @@ class TabGroupView(QDialog):
     # ==================================================
     def showEvent(self, event):
         super().showEvent(event)
-        self._refresh_view_logic(self.tab.currentWidget())
+        self._refresh_view_logic(self._tabname)
 
     # ==================================================
     def tab_change(self, idx):
         if self._tabname in self.view:
             self.view[self._tabname].clear_selection()
         self._tabname = self.tab.tabText(idx)
-        current_view = self.tab.widget(idx)
-        self._refresh_view_logic(current_view)
+        if self.isVisible():
+            self._refresh_view_logic(self._tabname)
+            self.apply_filter()
 
     # ==================================================
-    def _refresh_view_logic(self, view):
-        if view:
+    def _refresh_view_logic(self, object_type):
+        if object_type in self._page:
+            view = self.get_view(object_type)
             view.force_refresh_widgets()
             view.viewport().update()
@@ -4,15 +4,198 @@ TableView widget.
 This module provides table view widget.
 """
 
-from PySide6.QtWidgets import QTableWidget, QWidget, QSizePolicy, QHeaderView
-from PySide6.QtCore import Qt, QTimer
+from collections import OrderedDict
+import numpy as np
+from PySide6.QtWidgets import QTableView, QHeaderView, QAbstractItemView, QStyledItemDelegate
+from PySide6.QtCore import Qt, QTimer, QByteArray, QAbstractTableModel, QSize, Signal
+from PySide6.QtGui import QPixmap, QPainter
+from PySide6.QtSvg import QSvgRenderer
 
-from qtdraw.widget.custom_widget import MathWidget, Layout
-from qtdraw.widget.mathjax import MathJaxSVG
+from qtdraw.widget.mathjax import shared_mathjax
+
+_PIXMAP_CACHE_SIZE = 8192
+_pixmap_cache = OrderedDict()  # (latex, color, size, ratio) => QPixmap.
+_CELL_MARGIN = 10
+
+
+# ==================================================
+def _add_pixmap(latex_list, svg_list, color, size, ratio):
+    """
+    Render SVG strings to pixmaps, and add them to cache.
+
+    Args:
+        latex_list (list): list of LaTeX code w/o "$".
+        svg_list (list): list of (SVG string, (width, height)) or None for failure.
+        color (str): color name.
+        size (int): point.
+        ratio (float): device pixel ratio.
+
+    Note:
+        - failed string is cached as null pixmap, so that it is skipped without retry.
+
+    :meta private:
+    """
+    for latex, item in zip(latex_list, svg_list):
+        if item is None:
+            _pixmap_cache[(latex, color, size, ratio)] = QPixmap()
+            continue
+        svg, (w, h) = item
+        pixmap = QPixmap(max(1, int(w * ratio)), max(1, int(h * ratio)))
+        pixmap.setDevicePixelRatio(ratio)
+        pixmap.fill(Qt.transparent)
+        painter = QPainter(pixmap)
+        QSvgRenderer(QByteArray(svg.encode("utf-8"))).render(painter)
+        painter.end()
+        _pixmap_cache[(latex, color, size, ratio)] = pixmap
+
+    while len(_pixmap_cache) > _PIXMAP_CACHE_SIZE:
+        _pixmap_cache.popitem(last=False)
+
+
+# ==================================================
+def cached_math_pixmap(latex, color="black", size=10, ratio=1.0):
+    """
+    Cached pixmap of LaTeX string.
+
+    Args:
+        latex (str): LaTeX code w/o "$".
+        color (str, optional): color name.
+        size (int, optional): point.
+        ratio (float, optional): device pixel ratio.
+
+    Returns:
+        - (QPixmap) -- pixmap, None for uncached string.
+    """
+    return _pixmap_cache.get((latex, color, size, ratio))
+
+
+# ==================================================
+def math_pixmap(latex_list, color="black", size=10, ratio=1.0, mathjax=None):
+    """
+    Rendered pixmaps of LaTeX strings (cached).
+
+    Args:
+        latex_list (list): list of LaTeX code w/o "$".
+        color (str, optional): color name.
+        size (int, optional): point.
+        ratio (float, optional): device pixel ratio.
+        mathjax (MathJaxSVG, optional): MathJax converter.
+
+    Returns:
+        - (list) -- list of QPixmap, null pixmap for string failed to typeset.
+
+    Note:
+        - uncached strings are converted at once, and pixmaps are shared in process (bounded by LRU).
+    """
+    rest = [i for i in dict.fromkeys(latex_list) if (i, color, size, ratio) not in _pixmap_cache]
+    if rest:
+        if mathjax is None:
+            mathjax = shared_mathjax()
+        _add_pixmap(rest, mathjax.convert_many(["$$" + i + "$$" for i in rest], color, size), color, size, ratio)
+
+    for latex in dict.fromkeys(latex_list):
+        _pixmap_cache.move_to_end((latex, color, size, ratio))
+
+    return [_pixmap_cache[(i, color, size, ratio)] for i in latex_list]
+
+
+# ==================================================
+class MathTableModel(QAbstractTableModel):
+    # ==================================================
+    def __init__(self, parent=None, data=None, header=None):
+        """
+        Table model of LaTeX strings.
+
+        Args:
+            parent (QObject, optional): parent.
+            data (list, optional): table data in LaTeX code without "$", [[str]].
+            header (list, optional): header string.
+
+        Note:
+            - LaTeX string is given by Qt.UserRole, and no text is given for display.
+        """
+        super().__init__(parent)
+        self._data = data if data is not None else []
+        self._header = header
+        self._row = len(self._data)
+        self._column = len(self._data[0]) if self._data else 0
+
+    # ==================================================
+    def rowCount(self, parent=None):
+        return self._row
+
+    # ==================================================
+    def columnCount(self, parent=None):
+        return self._column
+
+    # ==================================================
+    def data(self, index, role=Qt.DisplayRole):
+        if role == Qt.UserRole and index.isValid():
+            return self._data[index.row()][index.column()]
+        return None
+
+    # ==================================================
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role != Qt.DisplayRole:
+            return None
+        if orientation == Qt.Horizontal:
+            return self._header[section] if self._header is not None else None
+        return str(section + 1)
+
+    # ==================================================
+    def flags(self, index):
+        return Qt.ItemIsEnabled | Qt.ItemIsSelectable
 
 
 # ==================================================
-class TableView(QTableWidget):
+class MathDelegate(QStyledItemDelegate):
+    # ==================================================
+    def __init__(self, view):
+        """
+        Delegate to paint LaTeX cell by cached pixmap.
+
+        Args:
+            view (TableView): table view.
+
+        Note:
+            - uncached cell is painted empty, and rendering is requested to view.
+        """
+        super().__init__(view)
+        self._view = view
+
+    # ==================================================
+    def paint(self, painter, option, index):
+        super().paint(painter, option, index)
+
+        latex = index.data(Qt.UserRole)
+        if not latex:
+            return
+
+        pixmap = self._view.cell_pixmap(latex)
+        if pixmap is None:
+            self._view.request_render()
+            return
+        if pixmap.isNull():  # failed to typeset.
+            return
+
+        rect = option.rect
+        h = pixmap.height() / pixmap.devicePixelRatio()
+        painter.drawPixmap(rect.left() + _CELL_MARGIN, rect.top() + int((rect.height() - h) / 2), pixmap)
+
+    # ==================================================
+    def sizeHint(self, option, index):
+        latex = index.data(Qt.UserRole)
+        pixmap = self._view.cell_pixmap(latex) if latex else None
+        if pixmap is None:
+            return super().sizeHint(option, index)
+        size = pixmap.size() / pixmap.devicePixelRatio()
+        return QSize(size.width() + 2 * _CELL_MARGIN, size.height() + 2 * _CELL_MARGIN)
+
+
+# ==================================================
+class TableView(QTableView):
+    prefetched = Signal(object)
+
     # ==================================================
     def __init__(self, parent=None, data=None, header=None, vertical=False, color="black", size=12, mathjax=None):
         """
@@ -25,19 +208,26 @@ class TableView(QTableWidget):
             vertical (bool, optional): show vertical number header ?
             color (str, optional): color name.
             size (int, optional): font size.
+            mathjax (MathJaxSVG, optional): MathJax converter.
+
+        Note:
+            - only visible cells are rendered, and the next viewport is prefetched in background.
+            - rendered pixmaps are cached in process, and section sizes are given as cells are rendered.
         """
         super().__init__(parent)
         if mathjax is None:
-            self._mathjax = MathJaxSVG()
+            self._mathjax = shared_mathjax()
         else:
             self._mathjax = mathjax
 
         if data is None:
             data = [[""]]
 
+        self._pending = False
+        self._prefetching = False
+
         if not data or not data[0]:
-            self.setRowCount(0)
-            self.setColumnCount(0)
+            self.setModel(MathTableModel(self))
             return
 
         row = len(data)
@@ -46,43 +236,204 @@ class TableView(QTableWidget):
         if header is not None and len(header) != column:
             raise ValueError("Header length must match number of columns.")
 
-        self.setRowCount(row)
-        self.setColumnCount(column)
+        data = [[str(r[j]) if j < len(r) else "" for j in range(column)] for r in data]
+        self._color = color
+        self._size = size + 5
+        self._ratio = self.devicePixelRatioF()
+        self._sized = np.array([[item == "" for item in r] for r in data], dtype=bool).reshape(row, column)
+
+        self.setModel(MathTableModel(self, data, header))
+        self.setItemDelegate(MathDelegate(self))
+        self.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        self.setHorizontalScrollMode(QAbstractItemView.ScrollPerPixel)
+        self.setVerticalScrollMode(QAbstractItemView.ScrollPerPixel)
 
         if header is not None:
-            self.setHorizontalHeaderLabels(header)
             self.horizontalHeader().setStyleSheet("font-weight: bold;")
         else:
             self.horizontalHeader().setVisible(False)
         self.verticalHeader().setVisible(vertical)
 
-        for i, r in enumerate(data):
-            for j, item in enumerate(r):
-                item = str(item)
-                if item:
-                    math = MathWidget(self.viewport(), text=item, color=color, size=size, mathjax=self._mathjax)
-
-                    wrapper = QWidget(self)
-                    layout = Layout(wrapper)
-                    layout.setContentsMargins(10, 10, 10, 10)
-                    layout.addWidget(math)
-                    layout.setAlignment(Qt.AlignLeft | Qt.AlignVCenter)
-
-                    math.setSizePolicy(QSizePolicy.Minimum, QSizePolicy.Minimum)
-                    wrapper.setSizePolicy(QSizePolicy.Minimum, QSizePolicy.Minimum)
-                    self.setCellWidget(i, j, wrapper)
-
-        self.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeToContents)
-
-        QTimer.singleShot(0, self.resizeColumnsToContents)
-        QTimer.singleShot(0, self.resizeRowsToContents)
-
+        # section sizes are given by rendered cells, (ResizeToContents scans all cells).
+        self.horizontalHeader().setSectionResizeMode(QHeaderView.Interactive)
+        self.verticalHeader().setSectionResizeMode(QHeaderView.Interactive)
         self.horizontalHeader().setMinimumSectionSize(30)
+        self.horizontalHeader().setDefaultSectionSize(60)
+        self.verticalHeader().setDefaultSectionSize(2 * _CELL_MARGIN + self._size)
+
+        self.verticalScrollBar().valueChanged.connect(self.request_render)
+        self.horizontalScrollBar().valueChanged.connect(self.request_render)
+        self.prefetched.connect(self._add_prefetched)
 
         self.setStyleSheet(
             """
-            QTableWidget::item:selected {
+            QTableView::item:selected {
                 background-color: LemonChiffon;
             }
         """
         )
+
+        self._render_visible()
+
+    # ==================================================
+    def cell_pixmap(self, latex):
+        """
+        Cached pixmap of cell.
+
+        Args:
+            latex (str): LaTeX code w/o "$".
+
+        Returns:
+            - (QPixmap) -- pixmap, None for uncached cell.
+        """
+        return cached_math_pixmap(latex, self._color, self._size, self._ratio)
+
+    # ==================================================
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        self.request_render()
+
+    # ==================================================
+    def request_render(self, *args):
+        """
+        Request rendering of visible cells (coalesced).
+        """
+        if self.model().rowCount() > 0 and not self._pending:
+            self._pending = True
+            QTimer.singleShot(0, self._render_visible)
+
+    # ==================================================
+    def _visible_range(self):
+        """
+        Range of visible cells.
+
+        Returns:
+            - (tuple) -- (first row, last row, first column, last column).
+
+        :meta private:
+        """
+        vp = self.viewport()
+        r0, r1 = self.rowAt(0), self.rowAt(vp.height() - 1)
+        c0, c1 = self.columnAt(0), self.columnAt(vp.width() - 1)
+        r0 = max(r0, 0)
+        c0 = max(c0, 0)
+        r1 = self.model().rowCount() - 1 if r1 < 0 else r1
+        c1 = self.model().columnCount() - 1 if c1 < 0 else c1
+        return r0, r1, c0, c1
+
+    # ==================================================
+    def _uncached(self, r0, r1, c0, c1):
+        """
+        Uncached LaTeX strings in range.
+
+        Args:
+            r0 (int): first row.
+            r1 (int): last row.
+            c0 (int): first column.
+            c1 (int): last column.
+
+        Returns:
+            - (list) -- list of LaTeX strings (unique).
+
+        :meta private:
+        """
+        data = self.model()._data
+        cells = (data[i][j] for i in range(r0, r1 + 1) for j in range(c0, c1 + 1))
+        return [i for i in dict.fromkeys(cells) if i and self.cell_pixmap(i) is None]
+
+    # ==================================================
+    def _render_visible(self):
+        """
+        Render visible cells, and set section sizes of newly rendered cells.
+
+        :meta private:
+        """
+        self._pending = False
+        data = self.model()._data
+        hh = self.horizontalHeader()
+        vh = self.verticalHeader()
+
+        # sections grow by rendered cells, so that repeat until visible cells are all sized.
+        for _ in range(10):
+            r0, r1, c0, c1 = self._visible_range()
+            rest = self._uncached(r0, r1, c0, c1)
+            if rest:
+                math_pixmap(rest, self._color, self._size, self._ratio, self._mathjax)
+
+            cells = np.argwhere(~self._sized[r0 : r1 + 1, c0 : c1 + 1]) + (r0, c0)
+            if len(cells) == 0:
+                break
+
+            width = {}
+            height = {}
+            for i, j in cells.tolist():
+                p = self.cell_pixmap(data[i][j])
+                w, h = p.width() / self._ratio, p.height() / self._ratio
+                width[j] = max(width.get(j, 0), w)
+                height[i] = max(height.get(i, 0), h)
+                self._sized[i, j] = True
+
+            for j, w in width.items():
+                w = int(w) + 2 * _CELL_MARGIN
+                if w > hh.sectionSize(j):
+                    hh.resizeSection(j, w)
+            for i, h in height.items():
+                h = int(h) + 2 * _CELL_MARGIN
+                if h > vh.sectionSize(i):
+                    vh.resizeSection(i, h)
+
+        self.viewport().update()
+        self._prefetch(r0, r1, c0, c1)
+
+    # ==================================================
+    def _prefetch(self, r0, r1, c0, c1):
+        """
+        Convert cells in the next viewport (below and right) in background.
+
+        Args:
+            r0 (int): first visible row.
+            r1 (int): last visible row.
+            c0 (int): first visible column.
+            c1 (int): last visible column.
+
+        :meta private:
+        """
+        if self._prefetching or not hasattr(self._mathjax, "submit_many"):
+            return
+
+        n_row, n_column = self.model().rowCount(), self.model().columnCount()
+        dr, dc = r1 - r0 + 1, c1 - c0 + 1
+        below = self._uncached(r1 + 1, min(r1 + dr, n_row - 1), c0, c1)
+        right = self._uncached(r0, r1, c1 + 1, min(c1 + dc, n_column - 1))
+        rest = list(dict.fromkeys(below + right))
+        if not rest:
+            return
+
+        self._prefetching = True
+        future = self._mathjax.submit_many(["$$" + i + "$$" for i in rest], self._color, self._size)
+
+        def done(f):  # in converter thread, the signal is queued to the GUI thread.
+            result = None if f.cancelled() or f.exception() is not None else f.result()
+            try:
+                self.prefetched.emit((rest, result))
+            except RuntimeError:  # view is deleted.
+                pass
+
+        future.add_done_callback(done)
+
+    # ==================================================
+    def _add_prefetched(self, result):
+        """
+        Add prefetched cells to pixmap cache.
+
+        Args:
+            result (tuple): (list of LaTeX strings, list of (SVG string, (width, height)) or None for failure).
+
+        :meta private:
+        """
+        self._prefetching = False
+        latex_list, svg_list = result
+        if svg_list is None:
+            return
+        _add_pixmap(latex_list, svg_list, self._color, self._size, self._ratio)
+        self.request_render()
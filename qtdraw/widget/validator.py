@@ -340,3 +340,31 @@ def validator_orbital_site_bond(s, use_var=False):
     sb = validator_site_bond(sb, use_var)
 
     return None if v is None or sb is None else v + "#" + sb
+
+
+# ==================================================
+def get_validator(validator):
+    """
+    Get validator function.
+
+    Args:
+        validator (tuple): (validator_type, option).
+
+    Returns:
+        - (function) -- validator, f(text) returns validated str or None.
+    """
+    VALIDATORS = {
+        "int": validator_int,
+        "float": validator_float,
+        "list_float": validator_list_float,
+        "list_int": validator_list_int,
+        "math": validator_math,
+        "site": validator_site,
+        "bond": validator_bond,
+        "site_bond": validator_site_bond,
+        "vector_site_bond": validator_vector_site_bond,
+        "orbital_site_bond": validator_orbital_site_bond,
+    }
+    vtype, option = validator
+    func = VALIDATORS[vtype]
+    return lambda t: func(t, **option)